@@ -1,9 +1,16 @@
+import asyncio
 from datetime import date
 
 import pytest
+import requests
 import responses
 
-from unique_six.client import API_URL, SixApiClient, split_cert_chain
+from unique_six.client import (
+    API_URL,
+    AsyncSixApiClient,
+    SixApiClient,
+    split_cert_chain,
+)
 from unique_six.exception import SixApiException, raise_errors_from_api_response
 from unique_six.schema import ListingIdentifierScheme
 from unique_six.schema.common.base.response import (
@@ -126,3 +133,58 @@ def test_client_end_of_day_history_returns_typed_response(six_cert_and_key):
     assert isinstance(result, EndOfDayHistoryResponsePayload)
     assert result.data is not None
     assert result.data.listings == []
+
+
+# --- AsyncSixApiClient (mocked HTTP) ---
+
+
+@pytest.mark.ai
+@responses.activate
+async def test_async_client_end_of_day_history_returns_typed_response(
+    six_cert_and_key,
+):
+    cert, key = six_cert_and_key
+    responses.add(
+        responses.GET,
+        f"{API_URL}v1/listings/marketData/endOfDayHistory",
+        json={"data": {"listings": []}},
+        status=200,
+    )
+    async with AsyncSixApiClient(cert, key) as client:
+        result = await client.end_of_day_history(
+            scheme=ListingIdentifierScheme.ISIN_BC,
+            ids="CH001",
+            date_from=date(2025, 1, 1),
+        )
+    assert isinstance(result, EndOfDayHistoryResponsePayload)
+    assert result.data is not None
+    assert result.data.listings == []
+    assert len(responses.calls) == 1
+    assert "dateFrom=2025-01-01" in responses.calls[0].request.url
+
+
+@pytest.mark.ai
+@responses.activate
+async def test_async_client_request_raises_on_http_error(six_cert_and_key):
+    cert, key = six_cert_and_key
+    path = "v1/listings/marketData/endOfDayHistory"
+    responses.add(responses.GET, f"{API_URL}{path}", status=500)
+    async with AsyncSixApiClient(cert, key) as client:
+        with pytest.raises(requests.HTTPError):
+            await client.request(path, {"ids": "X"})
+
+
+@pytest.mark.ai
+@responses.activate
+def test_async_client_is_usable_from_several_event_loops(six_cert_and_key):
+    cert, key = six_cert_and_key
+    path = "v1/listings/marketData/endOfDayHistory"
+    responses.add(responses.GET, f"{API_URL}{path}", json={"data": {"listings": []}})
+    client = AsyncSixApiClient(cert, key)
+    try:
+        for _ in range(2):
+            out = asyncio.run(client.request(path, {"ids": "X"}))
+            assert out == {"data": {"listings": []}}
+    finally:
+        client.close()
+    assert len(responses.calls) == 2
@@ -0,0 +1,138 @@
+from datetime import date, timedelta
+from unittest.mock import AsyncMock
+
+import pytest
+
+from unique_six.end_of_day_history_cache import EndOfDayHistoryCache
+from unique_six.schema import ListingIdentifierScheme
+from unique_six.schema.end_of_day_history import EndOfDayHistoryResponsePayload
+
+TODAY = date.today()
+
+
+def _payload(sessions_by_id: dict[str, list[date]]) -> EndOfDayHistoryResponsePayload:
+    return EndOfDayHistoryResponsePayload.model_validate(
+        {
+            "data": {
+                "listings": [
+                    {
+                        "requestedId": id,
+                        "requestedScheme": "VALOR_BC",
+                        "lookupStatus": "FOUND",
+                        "marketData": {
+                            "endOfDayHistory": [
+                                {"sessionDate": d.isoformat(), "close": 1.0}
+                                for d in sessions
+                            ]
+                        },
+                    }
+                    for id, sessions in sessions_by_id.items()
+                ]
+            }
+        }
+    )
+
+
+def _fake_client(days_back: int = 10) -> AsyncMock:
+    """Client returning one session per day of the requested range."""
+
+    async def end_of_day_history(*, ids, date_from, date_to, **kwargs):
+        date_to = date_to or TODAY
+        sessions = [
+            date_from + timedelta(days=i) for i in range((date_to - date_from).days + 1)
+        ]
+        return _payload({id: sessions for id in ids.split(",")})
+
+    client = AsyncMock()
+    client.end_of_day_history = AsyncMock(side_effect=end_of_day_history)
+    return client
+
+
+@pytest.mark.ai
+async def test_cache_requests_only_missing_tail_on_second_call():
+    client = _fake_client()
+    cache = EndOfDayHistoryCache()
+    start = TODAY - timedelta(days=10)
+
+    first = await cache.get_history(
+        client, ListingIdentifierScheme.VALOR_BC, ["A", "B"], start
+    )
+    second = await cache.get_history(
+        client, ListingIdentifierScheme.VALOR_BC, ["A", "B"], start
+    )
+
+    assert first == second
+    assert [item.session_date for item in second[0]] == [
+        start + timedelta(days=i) for i in range(11)
+    ]
+    assert client.end_of_day_history.await_count == 2
+    tail_call = client.end_of_day_history.await_args_list[1].kwargs
+    assert tail_call["ids"] == "A,B"
+    assert tail_call["date_from"] == TODAY
+
+
+@pytest.mark.ai
+async def test_cache_does_not_request_fully_cached_past_range():
+    client = _fake_client()
+    cache = EndOfDayHistoryCache()
+    start = TODAY - timedelta(days=10)
+    end = TODAY - timedelta(days=3)
+
+    await cache.get_history(client, ListingIdentifierScheme.VALOR_BC, ["A"], start)
+    result = await cache.get_history(
+        client,
+        ListingIdentifierScheme.VALOR_BC,
+        ["A"],
+        start + timedelta(days=2),
+        end,
+    )
+
+    assert client.end_of_day_history.await_count == 1
+    assert result[0] is not None
+    assert result[0][0].session_date == start + timedelta(days=2)
+    assert result[0][-1].session_date == end
+
+
+@pytest.mark.ai
+async def test_cache_batches_missing_listings_per_request():
+    client = _fake_client()
+    cache = EndOfDayHistoryCache(max_ids_per_request=2)
+    start = TODAY - timedelta(days=5)
+
+    await cache.get_history(client, ListingIdentifierScheme.VALOR_BC, ["A"], start)
+    await cache.get_history(
+        client, ListingIdentifierScheme.VALOR_BC, ["A", "B", "C", "D"], start
+    )
+
+    calls = [call.kwargs for call in client.end_of_day_history.await_args_list[1:]]
+    assert sorted((call["ids"], call["date_from"]) for call in calls) == [
+        ("A", TODAY),
+        ("B,C", start),
+        ("D", start),
+    ]
+
+
+@pytest.mark.ai
+async def test_cache_returns_none_for_unknown_listing():
+    client = AsyncMock()
+    client.end_of_day_history = AsyncMock(return_value=_payload({"A": [TODAY]}))
+    cache = EndOfDayHistoryCache()
+
+    result = await cache.get_history(
+        client, ListingIdentifierScheme.VALOR_BC, ["A", "B"], TODAY
+    )
+
+    assert result[0] is not None
+    assert result[1] is None
+
+
+@pytest.mark.ai
+async def test_cache_downloads_again_when_entry_expired():
+    client = _fake_client()
+    cache = EndOfDayHistoryCache(max_age=timedelta(0))
+    start = TODAY - timedelta(days=5)
+
+    await cache.get_history(client, ListingIdentifierScheme.VALOR_BC, ["A"], start)
+    await cache.get_history(client, ListingIdentifierScheme.VALOR_BC, ["A"], start)
+
+    assert client.end_of_day_history.await_args_list[1].kwargs["date_from"] == start
@@ -1,12 +1,16 @@
 from unique_six.client import (
+    AsyncSixApiClient,
     SixApiClient,
 )
+from unique_six.end_of_day_history_cache import EndOfDayHistoryCache
 from unique_six.exception import (
     SixApiException,
     raise_errors_from_api_response,
 )
 
 __all__ = [
+    "AsyncSixApiClient",
+    "EndOfDayHistoryCache",
     "SixApiClient",
     "SixApiException",
     "raise_errors_from_api_response",
@@ -1,7 +1,8 @@
+import asyncio
 import re
 import urllib.parse
 import urllib.request
-from typing import Any, Callable, ParamSpec, TypeVar
+from typing import Any, Awaitable, Callable, ParamSpec, TypeVar
 
 import requests
 
@@ -42,20 +43,26 @@ def split_cert_chain(cert: str) -> list[str]:
     return re.findall(".*?-----END CERTIFICATE-----", cert, re.DOTALL)
 
 
+def _create_session(cert: str, key: str, **adapter_kwargs: Any) -> requests.Session:
+    session = requests.Session()
+    session.headers = {"accept": "application/json"}
+
+    certs = [c.encode("utf-8") for c in split_cert_chain(cert)]
+    cert_adapter = InMemoryCertAdapter(
+        certs[0],
+        key.encode("utf-8"),
+        certs[1:],
+        **adapter_kwargs,
+    )
+    session.mount(API_URL, cert_adapter)
+    return session
+
+
 class SixApiClient:
     def __init__(self, cert: str, key: str) -> None:
-        self._session = requests.Session()
-        self._session.headers = {"accept": "application/json"}
+        self._session = _create_session(cert, key)
         self._url = API_URL
 
-        certs = [c.encode("utf-8") for c in split_cert_chain(cert)]
-        cert_adapter = InMemoryCertAdapter(
-            certs[0],
-            key.encode("utf-8"),
-            certs[1:],
-        )
-        self._session.mount(self._url, cert_adapter)
-
         # Endpoints
         self.end_of_day_history = endpoint(
             self,
@@ -107,11 +114,106 @@ class SixApiClient:
         return response.json()
 
 
+class AsyncSixApiClient:
+    """
+    Asynchronous variant of :class:`SixApiClient` with the same endpoints.
+
+    Requests run in worker threads on the same in-memory mTLS session as
+    :class:`SixApiClient`, so the private key is never written to disk and the
+    client is not bound to an event loop. All requests share one pool of
+    ``max_connections`` connections, so create the client once and reuse it
+    instead of creating one per request.
+    """
+
+    def __init__(self, cert: str, key: str, *, max_connections: int = 10) -> None:
+        self._session = _create_session(
+            cert,
+            key,
+            pool_maxsize=max_connections,
+            pool_block=True,
+        )
+        self._url = API_URL
+
+        # Endpoints
+        self.end_of_day_history = async_endpoint(
+            self,
+            "v1/listings/marketData/endOfDayHistory",
+            EndOfDayHistoryRequestParams,
+            EndOfDayHistoryResponsePayload,
+        )
+        self.free_text_search_instruments = async_endpoint(
+            self,
+            "v1/search/freeTextSearch/instruments",
+            FreeTextSearchInstrumentsRequestParams,
+            FreeTextInstrumentsSearchResponsePayload,
+        )
+        self.free_text_search_entities = async_endpoint(
+            self,
+            "v1/search/freeTextSearch/entities",
+            FreeTextSearchEntitiesRequestParams,
+            FreeTextEntitiesSearchResponsePayload,
+        )
+        self.free_text_search_markets = async_endpoint(
+            self,
+            "v1/search/freeTextSearch/markets",
+            FreeTextSearchMarketsRequestParams,
+            FreeTextMarketsSearchResponsePayload,
+        )
+        self.intraday_history_summary = async_endpoint(
+            self,
+            "v1/listings/marketData/intradayHistory/summary",
+            IntradayHistorySummaryRequestParams,
+            IntradayHistorySummaryResponsePayload,
+        )
+        self.intraday_snapshot = async_endpoint(
+            self,
+            "v1/listings/marketData/intradaySnapshot",
+            IntradaySnapshotRequestParams,
+            IntradaySnapshotResponsePayload,
+        )
+        self.entity_base_by_listing = async_endpoint(
+            self,
+            "v1/listings/referenceData/entityBase",
+            EntityBaseByListingRequestParams,
+            EntityBaseByListingResponsePayload,
+        )
+
+    async def request(self, end_point: str, params: dict[str, Any]) -> dict[str, Any]:
+        return await asyncio.to_thread(self._request, end_point, params)
+
+    def _request(self, end_point: str, params: dict[str, Any]) -> dict[str, Any]:
+        complete_url = f"{self._url}{end_point}?{urllib.parse.urlencode(params)}"
+        response = self._session.get(complete_url)
+        response.raise_for_status()
+        return response.json()
+
+    def close(self) -> None:
+        self._session.close()
+
+    async def aclose(self) -> None:
+        self.close()
+
+    async def __aenter__(self) -> "AsyncSixApiClient":
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.aclose()
+
+
 ResponseType = TypeVar("ResponseType", bound=BaseResponsePayload)
 RequestType = TypeVar("RequestType", bound=BaseRequestParams)
 RequestConstructorSpec = ParamSpec("RequestConstructorSpec")
 
 
+def _dump_params(params: BaseRequestParams) -> dict[str, Any]:
+    return params.model_dump(
+        exclude_unset=True,
+        by_alias=True,
+        exclude_defaults=True,
+        mode="json",
+    )
+
+
 def endpoint(
     client: SixApiClient,
     url: str,
@@ -123,15 +225,24 @@ def endpoint(
         **kwargs: RequestConstructorSpec.kwargs,
     ) -> ResponseType:
         return response_type.model_validate(
-            client.request(
-                url,
-                params(*args, **kwargs).model_dump(
-                    exclude_unset=True,
-                    by_alias=True,
-                    exclude_defaults=True,
-                    mode="json",
-                ),
-            )
+            client.request(url, _dump_params(params(*args, **kwargs)))
+        )
+
+    return endpoint_f
+
+
+def async_endpoint(
+    client: AsyncSixApiClient,
+    url: str,
+    params: Callable[RequestConstructorSpec, RequestType],
+    response_type: type[ResponseType],
+) -> Callable[RequestConstructorSpec, Awaitable[ResponseType]]:
+    async def endpoint_f(
+        *args: RequestConstructorSpec.args,
+        **kwargs: RequestConstructorSpec.kwargs,
+    ) -> ResponseType:
+        return response_type.model_validate(
+            await client.request(url, _dump_params(params(*args, **kwargs)))
         )
 
     return endpoint_f
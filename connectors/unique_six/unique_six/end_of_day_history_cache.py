@@ -0,0 +1,217 @@
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+
+from unique_six.client import AsyncSixApiClient
+from unique_six.exception import raise_errors_from_api_response
+from unique_six.schema import ListingIdentifierScheme, PriceAdjustment
+from unique_six.schema.end_of_day_history.response import EndOfDayHistoryItem
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_LISTINGS = 1000
+DEFAULT_MAX_IDS_PER_REQUEST = 10
+DEFAULT_MAX_AGE = timedelta(days=1)
+
+_ListingKey = tuple[ListingIdentifierScheme, str, PriceAdjustment]
+
+
+@dataclass
+class _ListingHistory:
+    """Final sessions of a listing, complete between the two covered dates."""
+
+    covered_from: date
+    covered_until: date
+    created_at: float = field(default_factory=time.monotonic)
+    sessions: dict[date, EndOfDayHistoryItem] = field(default_factory=dict)
+
+
+class EndOfDayHistoryCache:
+    """
+    Cache of end-of-day history keyed by listing and session date.
+
+    Sessions before today are final, so once the history of a listing is known
+    up to yesterday only the missing tail of a requested range is fetched;
+    today's session is always requested and never cached. Listings missing
+    the same range are requested together, ``max_ids_per_request`` at a time.
+
+    Adjusted prices of past sessions change when a corporate action (e.g. a
+    split) is applied, so a listing's history is downloaded again once it is
+    older than ``max_age``.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_listings: int = DEFAULT_MAX_LISTINGS,
+        max_ids_per_request: int = DEFAULT_MAX_IDS_PER_REQUEST,
+        max_age: timedelta = DEFAULT_MAX_AGE,
+    ) -> None:
+        self._max_listings = max_listings
+        self._max_ids_per_request = max_ids_per_request
+        self._max_age = max_age.total_seconds()
+        self._entries: OrderedDict[_ListingKey, _ListingHistory] = OrderedDict()
+
+    async def get_history(
+        self,
+        client: AsyncSixApiClient,
+        scheme: ListingIdentifierScheme,
+        ids: list[str],
+        date_from: date,
+        date_to: date | None = None,
+        price_adjustment: PriceAdjustment = PriceAdjustment.ADJUSTED,
+    ) -> list[list[EndOfDayHistoryItem] | None]:
+        """
+        Return the sessions of each listing between ``date_from`` and
+        ``date_to`` (today if unset) in date order, or None for listings SIX
+        has no data for.
+        """
+        today = date.today()
+        date_until = date_to if date_to is not None else today
+        # Last session that is final and can be cached
+        last_final = min(date_until, today - timedelta(days=1))
+
+        entries: dict[str, _ListingHistory | None] = {}
+        ids_by_fetch_from: dict[date, list[str]] = {}
+        for id in dict.fromkeys(ids):
+            entry = self._get_entry((scheme, id, price_adjustment), date_from)
+            entries[id] = entry
+            fetch_from = (
+                date_from
+                if entry is None
+                else max(date_from, entry.covered_until + timedelta(days=1))
+            )
+            if fetch_from <= date_until:
+                ids_by_fetch_from.setdefault(fetch_from, []).append(id)
+
+        requests = [
+            (fetch_from, batch)
+            for fetch_from, missing_ids in ids_by_fetch_from.items()
+            for batch in _batched(missing_ids, self._max_ids_per_request)
+        ]
+        if requests:
+            logger.info(
+                "Requesting end of day history for %d of %d listings in %d requests",
+                sum(len(batch) for _, batch in requests),
+                len(ids),
+                len(requests),
+            )
+        responses = await asyncio.gather(
+            *(
+                self._fetch(
+                    client, scheme, batch, fetch_from, date_to, price_adjustment
+                )
+                for fetch_from, batch in requests
+            )
+        )
+
+        fetched: dict[str, list[EndOfDayHistoryItem] | None] = {}
+        for (fetch_from, batch), history_by_id in zip(requests, responses):
+            for id in batch:
+                history = history_by_id.get(id)
+                fetched[id] = history
+                if history is not None:
+                    entries[id] = self._store(
+                        (scheme, id, price_adjustment),
+                        fetch_from=fetch_from,
+                        last_final=last_final,
+                        history=history,
+                    )
+
+        result = []
+        for id in ids:
+            entry = entries[id]
+            history = fetched.get(id)
+            if entry is None:
+                if history is None:
+                    logger.warning("No history data found for listing %s", id)
+                result.append(history)
+                continue
+
+            sessions = {
+                session_date: item
+                for session_date, item in entry.sessions.items()
+                if date_from <= session_date <= date_until
+            }
+            # Today's session is not cached but part of the response
+            for item in history or []:
+                sessions.setdefault(item.session_date, item)
+            result.append([sessions[d] for d in sorted(sessions)])
+        return result
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def _get_entry(self, key: _ListingKey, date_from: date) -> _ListingHistory | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if (
+            time.monotonic() - entry.created_at >= self._max_age
+            or date_from < entry.covered_from
+        ):
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def _store(
+        self,
+        key: _ListingKey,
+        *,
+        fetch_from: date,
+        last_final: date,
+        history: list[EndOfDayHistoryItem],
+    ) -> _ListingHistory | None:
+        entry = self._entries.get(key)
+        if entry is not None and fetch_from > entry.covered_until + timedelta(days=1):
+            # The fetched range does not connect to the cached one
+            del self._entries[key]
+            entry = None
+        if entry is None:
+            if last_final < fetch_from:
+                return None
+            entry = _ListingHistory(covered_from=fetch_from, covered_until=last_final)
+            self._entries[key] = entry
+            while len(self._entries) > self._max_listings:
+                self._entries.popitem(last=False)
+        else:
+            entry.covered_until = max(entry.covered_until, last_final)
+
+        for item in history:
+            if entry.covered_from <= item.session_date <= last_final:
+                entry.sessions[item.session_date] = item
+        return entry
+
+    async def _fetch(
+        self,
+        client: AsyncSixApiClient,
+        scheme: ListingIdentifierScheme,
+        ids: list[str],
+        date_from: date,
+        date_to: date | None,
+        price_adjustment: PriceAdjustment,
+    ) -> dict[str, list[EndOfDayHistoryItem]]:
+        resp = await client.end_of_day_history(
+            scheme=scheme,
+            ids=",".join(ids),
+            date_from=date_from,
+            date_to=date_to,
+            price_adjustment=price_adjustment,
+        )
+        raise_errors_from_api_response(resp)
+
+        if resp.data is None or resp.data.listings is None:
+            return {}
+        return {
+            listing.requested_id: listing.market_data.end_of_day_history
+            for listing in resp.data.listings
+            if listing.market_data is not None
+        }
+
+
+def _batched(ids: list[str], size: int) -> list[list[str]]:
+    return [ids[i : i + size] for i in range(0, len(ids), size)]
@@ -1,3 +1,11 @@
-from unique_stock_ticker.clients.six.client import get_six_api_client
+from unique_stock_ticker.clients.six.client import (
+    close_six_api_clients,
+    get_end_of_day_history_cache,
+    get_six_api_client,
+)
 
-__all__ = ["get_six_api_client"]
+__all__ = [
+    "close_six_api_clients",
+    "get_end_of_day_history_cache",
+    "get_six_api_client",
+]
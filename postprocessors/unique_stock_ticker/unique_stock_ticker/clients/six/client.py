@@ -1,12 +1,59 @@
-from unique_six import SixApiClient
+import atexit
+import hashlib
+
+from unique_six import AsyncSixApiClient, EndOfDayHistoryCache
 
 from unique_stock_ticker.clients.six.exception import NoCredentialsException
 
+# One client per company, so all postprocessor runs share its mTLS connection
+# pool, and one end-of-day history cache per company. The clients run requests
+# in worker threads, so they are not bound to the event loop of the run that
+# created them. Each client is stored with the fingerprint of the credentials
+# it was created from, so rotated credentials replace it on the next run.
+_clients: dict[str, tuple[str, AsyncSixApiClient]] = {}
+_end_of_day_history_caches: dict[str, EndOfDayHistoryCache] = {}
+
+
+def _credentials_fingerprint(cert: str, key: str) -> str:
+    return hashlib.sha256(f"{cert}\n{key}".encode()).hexdigest()
+
 
-def get_six_api_client(company_id: str) -> SixApiClient:
-    from unique_stock_ticker.clients.six.settings import six_api_settings
+def get_six_api_client(company_id: str) -> AsyncSixApiClient:
+    from unique_stock_ticker.clients.six.settings import get_six_api_settings
 
-    creds = six_api_settings.creds_for_company(company_id)
+    # Settings are read on every call so that rotated credentials take effect
+    # without a restart.
+    creds = get_six_api_settings().creds_for_company(company_id)
     if creds is None:
         raise NoCredentialsException(company_id)
-    return SixApiClient(creds.cert, creds.key)
+
+    fingerprint = _credentials_fingerprint(creds.cert, creds.key)
+    cached = _clients.get(company_id)
+    if cached is not None and cached[0] == fingerprint:
+        return cached[1]
+
+    if cached is not None:
+        # Requests still in flight on the old pool finish; its connections are
+        # closed once they are released.
+        cached[1].close()
+        _end_of_day_history_caches.pop(company_id, None)
+
+    client = AsyncSixApiClient(creds.cert, creds.key)
+    _clients[company_id] = (fingerprint, client)
+    return client
+
+
+def close_six_api_clients() -> None:
+    """Close the connection pools of all cached clients, e.g. on shutdown."""
+    while _clients:
+        _, (_, client) = _clients.popitem()
+        client.close()
+
+
+atexit.register(close_six_api_clients)
+
+
+def get_end_of_day_history_cache(company_id: str) -> EndOfDayHistoryCache:
+    if company_id not in _end_of_day_history_caches:
+        _end_of_day_history_caches[company_id] = EndOfDayHistoryCache()
+    return _end_of_day_history_caches[company_id]
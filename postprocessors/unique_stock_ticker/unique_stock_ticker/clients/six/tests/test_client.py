@@ -0,0 +1,105 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from unique_stock_ticker.clients.six import client as six_client
+from unique_stock_ticker.clients.six.exception import NoCredentialsException
+from unique_stock_ticker.clients.six.settings import CertificateCredentials
+
+
+@pytest.fixture
+def creds_by_company(monkeypatch: pytest.MonkeyPatch) -> dict:
+    creds: dict[str, CertificateCredentials] = {}
+    settings = MagicMock()
+    settings.creds_for_company.side_effect = creds.get
+    monkeypatch.setattr(
+        "unique_stock_ticker.clients.six.settings.get_six_api_settings",
+        lambda: settings,
+    )
+    monkeypatch.setattr(
+        six_client, "AsyncSixApiClient", MagicMock(side_effect=lambda *a: MagicMock())
+    )
+    monkeypatch.setattr(six_client, "_clients", {})
+    monkeypatch.setattr(six_client, "_end_of_day_history_caches", {})
+    return creds
+
+
+@pytest.mark.ai
+def test_get_six_api_client__same_credentials__reuses_client(
+    creds_by_company: dict,
+) -> None:
+    """
+    Purpose: Verify runs of the same company share one client while its credentials are unchanged.
+    Why this matters: Each client owns an mTLS connection pool; recreating it per run defeats the pooling.
+    Setup summary: Request the client twice with the same credentials and assert the same instance.
+    """
+    # Arrange
+    creds_by_company["company"] = CertificateCredentials(cert="cert", key="key")
+
+    # Act
+    first = six_client.get_six_api_client("company")
+    second = six_client.get_six_api_client("company")
+
+    # Assert
+    assert first is second
+    six_client.AsyncSixApiClient.assert_called_once_with("cert", "key")
+
+
+@pytest.mark.ai
+def test_get_six_api_client__rotated_credentials__replaces_and_closes_client(
+    creds_by_company: dict,
+) -> None:
+    """
+    Purpose: Verify rotated credentials replace the cached client and its history cache.
+    Why this matters: A cached client would otherwise keep using the old certificate until the process restarts.
+    Setup summary: Rotate the credentials between two calls and assert a new client and the old one closed.
+    """
+    # Arrange
+    creds_by_company["company"] = CertificateCredentials(cert="cert", key="key")
+    first = six_client.get_six_api_client("company")
+    first_cache = six_client.get_end_of_day_history_cache("company")
+    creds_by_company["company"] = CertificateCredentials(cert="cert", key="new-key")
+
+    # Act
+    second = six_client.get_six_api_client("company")
+
+    # Assert
+    assert second is not first
+    first.close.assert_called_once()
+    six_client.AsyncSixApiClient.assert_called_with("cert", "new-key")
+    assert six_client.get_end_of_day_history_cache("company") is not first_cache
+
+
+@pytest.mark.ai
+def test_get_six_api_client__no_credentials__raises(creds_by_company: dict) -> None:
+    """
+    Purpose: Verify a company without credentials gets NoCredentialsException.
+    Why this matters: The postprocessor relies on this to skip companies that are not activated.
+    Setup summary: Request a client for an unknown company and assert the exception.
+    """
+    # Act / Assert
+    with pytest.raises(NoCredentialsException):
+        six_client.get_six_api_client("unknown")
+
+
+@pytest.mark.ai
+def test_close_six_api_clients__closes_and_forgets_all_clients(
+    creds_by_company: dict,
+) -> None:
+    """
+    Purpose: Verify closing releases every cached client's connection pool.
+    Why this matters: It runs at interpreter exit to close the mTLS connections cleanly.
+    Setup summary: Create clients for two companies, close them and assert both closed and forgotten.
+    """
+    # Arrange
+    creds_by_company["a"] = CertificateCredentials(cert="cert-a", key="key-a")
+    creds_by_company["b"] = CertificateCredentials(cert="cert-b", key="key-b")
+    clients = [six_client.get_six_api_client("a"), six_client.get_six_api_client("b")]
+
+    # Act
+    six_client.close_six_api_clients()
+
+    # Assert
+    for client in clients:
+        client.close.assert_called_once()
+    assert six_client._clients == {}
@@ -2,7 +2,10 @@ from unique_six.schema.common.instrument import InstrumentType
 from unique_toolkit.language_model.invocation_stats import LanguageModelInvocationStats
 from unique_toolkit.language_model.service import LanguageModelService
 
-from unique_stock_ticker.clients.six import get_six_api_client
+from unique_stock_ticker.clients.six import (
+    get_end_of_day_history_cache,
+    get_six_api_client,
+)
 from unique_stock_ticker.config import StockTickerConfig
 from unique_stock_ticker.detection.service import get_stock_ticker_service
 from unique_stock_ticker.plot.backend.utils import get_plotting_backend
@@ -71,4 +74,5 @@ async def retrieve_tickers_and_plot_history(
         instrument_types=instrument_types,
         start_date=stock_ticker_config.data_retrieval_config.effective_start_date,
         period=stock_ticker_config.data_retrieval_config.period,
+        end_of_day_history_cache=get_end_of_day_history_cache(company_id),
     )
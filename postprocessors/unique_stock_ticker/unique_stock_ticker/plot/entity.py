@@ -1,6 +1,6 @@
 import logging
 
-from unique_six import SixApiClient, raise_errors_from_api_response
+from unique_six import AsyncSixApiClient, raise_errors_from_api_response
 from unique_six.schema import ListingIdentifierScheme
 from unique_six.schema.entity_base.listing.response import (
     EntityBaseByListingEntityBase,
@@ -10,10 +10,10 @@ logger = logging.getLogger(__name__)
 
 
 async def get_entity_info_for_listings(
-    client: SixApiClient, scheme: ListingIdentifierScheme, ids: list[str]
+    client: AsyncSixApiClient, scheme: ListingIdentifierScheme, ids: list[str]
 ) -> list[EntityBaseByListingEntityBase | None]:
     logger.info(f"Getting entity info for listings: {ids}")
-    resp = client.entity_base_by_listing(scheme=scheme, ids=",".join(ids))
+    resp = await client.entity_base_by_listing(scheme=scheme, ids=",".join(ids))
 
     raise_errors_from_api_response(resp)
 
@@ -1,7 +1,11 @@
 from datetime import date, timedelta
 from logging import getLogger
 
-from unique_six import SixApiClient, raise_errors_from_api_response
+from unique_six import (
+    AsyncSixApiClient,
+    EndOfDayHistoryCache,
+    raise_errors_from_api_response,
+)
 from unique_six.schema.common.listing import (
     ListingIdentifierScheme,
 )
@@ -20,7 +24,7 @@ logger = getLogger(__name__)
 
 
 async def get_pricing_history_for_listings_with_period(
-    client: SixApiClient,
+    client: AsyncSixApiClient,
     scheme: ListingIdentifierScheme,
     ids: list[str],
     start_date: date,
@@ -38,7 +42,7 @@ async def get_pricing_history_for_listings_with_period(
     if period is None:
         period = timedelta(minutes=5)
 
-    resp = client.intraday_history_summary(
+    resp = await client.intraday_history_summary(
         scheme=scheme,
         ids=",".join(ids),
         date_from=start_date,
@@ -85,15 +89,21 @@ def _check_response_data(
 
 
 async def get_pricing_history_for_listings(
-    client: SixApiClient,
+    client: AsyncSixApiClient,
     scheme: ListingIdentifierScheme,
     ids: list[str],
     start_date: date,
     end_date: date | None = None,
+    end_of_day_history_cache: EndOfDayHistoryCache | None = None,
 ) -> list[list[EndOfDayHistoryItem] | None]:
     logger.info("Getting pricing history for listings %s", ids)
 
-    resp = client.end_of_day_history(
+    if end_of_day_history_cache is not None:
+        return await end_of_day_history_cache.get_history(
+            client, scheme, ids, start_date, end_date
+        )
+
+    resp = await client.end_of_day_history(
         scheme=scheme,
         ids=",".join(ids),
         date_from=start_date,
@@ -145,13 +155,14 @@ def should_use_intraday_history_endpoint(
 
 
 async def get_pricing_history_general(
-    client: SixApiClient,
+    client: AsyncSixApiClient,
     scheme: ListingIdentifierScheme,
     ids: list[str],
     start_date: date,
     end_date: date | None = None,
     period: timedelta | None = None,
     use_intraday_history_endpoint: bool = False,
+    end_of_day_history_cache: EndOfDayHistoryCache | None = None,
 ) -> (
     list[list[EndOfDayHistoryItem] | None]
     | list[list[IntradayHistorySummaryItem] | None]
@@ -165,5 +176,5 @@ async def get_pricing_history_general(
     else:
         logger.debug("Using end of day history endpoint to retrieve pricing history")
         return await get_pricing_history_for_listings(
-            client, scheme, ids, start_date, end_date
+            client, scheme, ids, start_date, end_date, end_of_day_history_cache
         )
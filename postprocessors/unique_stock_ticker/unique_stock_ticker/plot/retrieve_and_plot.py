@@ -2,7 +2,7 @@ import asyncio
 import logging
 from datetime import date, timedelta
 
-from unique_six.client import SixApiClient
+from unique_six import AsyncSixApiClient, EndOfDayHistoryCache
 from unique_six.schema.common.instrument import InstrumentType
 from unique_six.schema.common.listing import (
     ListingIdentifierScheme,
@@ -50,7 +50,7 @@ logger = logging.getLogger(__name__)
 
 
 async def _par_free_text_instrument_search(
-    client: SixApiClient,
+    client: AsyncSixApiClient,
     tickers: list[str],
     instrument_types: list[InstrumentType],
     search_size: int = 5,
@@ -112,7 +112,7 @@ def _extract_last_datapoint_per_day(
 
 
 async def _complete_missing_days_prices_with_intraday_endpoint(
-    client: SixApiClient,
+    client: AsyncSixApiClient,
     scheme: ListingIdentifierScheme,
     ids: list[str],
     price_history: list[list[EndOfDayHistoryItem] | None],
@@ -184,12 +184,13 @@ async def _complete_missing_days_prices_with_intraday_endpoint(
 
 
 async def _par_get_data_for_plots(
-    client: SixApiClient,
+    client: AsyncSixApiClient,
     scheme: ListingIdentifierScheme,
     ids: list[str],
     start_date: date,
     end_date: date | None = None,
     period: timedelta | None = None,
+    end_of_day_history_cache: EndOfDayHistoryCache | None = None,
 ) -> list[
     tuple[
         list[IntradayHistorySummaryItem | EndOfDayHistoryItem],
@@ -213,6 +214,7 @@ async def _par_get_data_for_plots(
                 end_date,
                 period,
                 use_intraday_history_endpoint,
+                end_of_day_history_cache,
             ),
         )
 
@@ -267,13 +269,14 @@ async def _par_get_data_for_plots(
 
 
 async def find_history_for_tickers(
-    client: SixApiClient,
+    client: AsyncSixApiClient,
     tickers: list[str],
     instrument_types: list[InstrumentType],
     start_date: date,
     end_date: date | None = None,
     search_size: int = 5,
     period: timedelta | None = None,
+    end_of_day_history_cache: EndOfDayHistoryCache | None = None,
 ) -> list[StockHistoryPlotPayload]:
     valid_tickers_search_info = []
     valid_tickers = []
@@ -306,6 +309,7 @@ async def find_history_for_tickers(
         start_date=start_date,
         end_date=end_date,
         period=period,
+        end_of_day_history_cache=end_of_day_history_cache,
     )
 
     # 3. Prepare payload for plotting backend
@@ -367,7 +371,7 @@ async def find_history_for_tickers(
 
 
 async def find_and_plot_history_for_tickers(
-    client: SixApiClient,
+    client: AsyncSixApiClient,
     plotting_backend: PlottingBackend,
     tickers: list[str],
     instrument_types: list[InstrumentType],
@@ -375,6 +379,7 @@ async def find_and_plot_history_for_tickers(
     end_date: date | None = None,
     search_size: int = 5,
     period: timedelta | None = None,
+    end_of_day_history_cache: EndOfDayHistoryCache | None = None,
 ) -> str:
     payload = await find_history_for_tickers(
         client=client,
@@ -384,5 +389,6 @@ async def find_and_plot_history_for_tickers(
         end_date=end_date,
         search_size=search_size,
         period=period,
+        end_of_day_history_cache=end_of_day_history_cache,
     )
     return plotting_backend.plot(payload)
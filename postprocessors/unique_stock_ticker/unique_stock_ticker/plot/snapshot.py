@@ -1,7 +1,7 @@
 import datetime
 from logging import getLogger
 
-from unique_six.client import SixApiClient
+from unique_six.client import AsyncSixApiClient
 from unique_six.exception import raise_errors_from_api_response
 from unique_six.schema.common.listing import (
     ListingIdentifierScheme,
@@ -50,13 +50,13 @@ def extract_metrics_from_snapshot(
 
 
 async def get_snapshot_information_for_listings(
-    client: SixApiClient,
+    client: AsyncSixApiClient,
     scheme: ListingIdentifierScheme,
     ids: list[str],
 ) -> list[IntradaySnapshotValues | None]:
     logger.info("Getting snapshot information for listings %s", ids)
 
-    resp = client.intraday_snapshot(
+    resp = await client.intraday_snapshot(
         scheme=scheme,
         ids=",".join(ids),
     )
@@ -0,0 +1,151 @@
+from datetime import date, timedelta
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from unique_six import EndOfDayHistoryCache
+from unique_six.schema.common.listing import ListingIdentifierScheme
+from unique_six.schema.end_of_day_history import EndOfDayHistoryResponsePayload
+
+from unique_stock_ticker.plot.history import get_pricing_history_general
+
+TODAY = date.today()
+
+
+def _payload(sessions_by_id: dict[str, list[date]]) -> EndOfDayHistoryResponsePayload:
+    return EndOfDayHistoryResponsePayload.model_validate(
+        {
+            "data": {
+                "listings": [
+                    {
+                        "requestedId": id,
+                        "requestedScheme": "VALOR_BC",
+                        "lookupStatus": "FOUND",
+                        "marketData": {
+                            "endOfDayHistory": [
+                                {"sessionDate": d.isoformat(), "close": 1.0}
+                                for d in sessions
+                            ]
+                        },
+                    }
+                    for id, sessions in sessions_by_id.items()
+                ]
+            }
+        }
+    )
+
+
+def _fake_client() -> AsyncMock:
+    """Client returning one session per day of the requested range."""
+
+    async def end_of_day_history(*, ids, date_from, date_to, **kwargs):
+        date_to = date_to or TODAY
+        sessions = [
+            date_from + timedelta(days=i) for i in range((date_to - date_from).days + 1)
+        ]
+        return _payload({id: sessions for id in ids.split(",")})
+
+    client = AsyncMock()
+    client.end_of_day_history = AsyncMock(side_effect=end_of_day_history)
+    return client
+
+
+@pytest.mark.ai
+@pytest.mark.asyncio
+async def test_get_pricing_history_general__awaits_end_of_day_endpoint__in_requested_order() -> (
+    None
+):
+    """
+    Purpose: Verify the end-of-day path awaits the async client and returns one entry per requested id.
+    Why this matters: The SIX client is async; a missing await or a reordering would plot the wrong listing.
+    Setup summary: Return listings out of order plus one unknown id and assert the ordered result.
+    """
+    # Arrange
+    client = AsyncMock()
+    client.end_of_day_history = AsyncMock(
+        return_value=_payload({"B": [TODAY], "A": [TODAY - timedelta(days=1)]})
+    )
+
+    # Act
+    result = await get_pricing_history_general(
+        client,
+        ListingIdentifierScheme.VALOR_BC,
+        ["A", "B", "C"],
+        TODAY - timedelta(days=1),
+    )
+
+    # Assert
+    client.end_of_day_history.assert_awaited_once()
+    assert client.end_of_day_history.await_args.kwargs["ids"] == "A,B,C"
+    assert result[0] is not None
+    assert result[0][0].session_date == TODAY - timedelta(days=1)
+    assert result[1] is not None
+    assert result[1][0].session_date == TODAY
+    assert result[2] is None
+
+
+@pytest.mark.ai
+@pytest.mark.asyncio
+async def test_get_pricing_history_general__with_cache__requests_only_missing_tail() -> (
+    None
+):
+    """
+    Purpose: Verify the end-of-day path goes through the history cache when one is passed.
+    Why this matters: Without the cache every postprocessor run downloads the full history window again.
+    Setup summary: Run the same request twice with one cache and assert the second call only asks for today.
+    """
+    # Arrange
+    client = _fake_client()
+    cache = EndOfDayHistoryCache()
+    start = TODAY - timedelta(days=10)
+
+    # Act
+    first = await get_pricing_history_general(
+        client,
+        ListingIdentifierScheme.VALOR_BC,
+        ["A"],
+        start,
+        end_of_day_history_cache=cache,
+    )
+    second = await get_pricing_history_general(
+        client,
+        ListingIdentifierScheme.VALOR_BC,
+        ["A"],
+        start,
+        end_of_day_history_cache=cache,
+    )
+
+    # Assert
+    assert first == second
+    assert client.end_of_day_history.await_count == 2
+    assert client.end_of_day_history.await_args_list[1].kwargs["date_from"] == TODAY
+
+
+@pytest.mark.ai
+@pytest.mark.asyncio
+async def test_get_pricing_history_general__intraday_endpoint__bypasses_cache() -> None:
+    """
+    Purpose: Verify recent short windows use the intraday endpoint and leave the end-of-day cache untouched.
+    Why this matters: Intraday data is not final and must not be served from the end-of-day cache.
+    Setup summary: Request with the intraday flag and a cache and assert only the intraday endpoint is awaited.
+    """
+    # Arrange
+    client = AsyncMock()
+    client.intraday_history_summary = AsyncMock(
+        return_value=MagicMock(errors=None, data=None)
+    )
+    cache = AsyncMock(spec=EndOfDayHistoryCache)
+
+    # Act
+    result = await get_pricing_history_general(
+        client,
+        ListingIdentifierScheme.VALOR_BC,
+        ["A"],
+        TODAY,
+        use_intraday_history_endpoint=True,
+        end_of_day_history_cache=cache,
+    )
+
+    # Assert
+    client.intraday_history_summary.assert_awaited_once()
+    cache.get_history.assert_not_awaited()
+    assert result == [None]
@@ -1,6 +1,6 @@
 from logging import getLogger
 
-from unique_six.client import SixApiClient
+from unique_six.client import AsyncSixApiClient
 from unique_six.exception import raise_errors_from_api_response
 from unique_six.schema.common.instrument import InstrumentType
 from unique_six.schema.free_text_search.instruments.response import (
@@ -17,7 +17,7 @@ def prepare_ticker(ticker: str) -> str:
 
 
 async def find_instrument_from_ticker(
-    client: SixApiClient,
+    client: AsyncSixApiClient,
     ticker: str,
     search_size: int = 10,
     instrument_type: InstrumentType | None = None,
@@ -29,7 +29,7 @@ async def find_instrument_from_ticker(
 
     logger.info("Searching for instrument %s", ticker)
 
-    resp = client.free_text_search_instruments(
+    resp = await client.free_text_search_instruments(
         text=ticker, size=search_size, instrument_type=instrument_type
     )
 
@@ -85,7 +85,7 @@ async def find_instrument_from_ticker(
 
 
 async def find_instrument_market_from_ticker(
-    client: SixApiClient,
+    client: AsyncSixApiClient,
     ticker: str,
     search_size: int = 10,
     intrument_type: InstrumentType = InstrumentType.EQUITY,
@@ -1,4 +1,5 @@
 import asyncio
+from datetime import datetime, timezone
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
@@ -10,6 +11,7 @@ from unique_toolkit.app.schemas import (
     EventName,
 )
 from unique_toolkit.chat.schemas import MessageLogStatus
+from unique_toolkit.content.schemas import Content
 from unique_toolkit.language_model.default_language_model import (
     DEFAULT_LANGUAGE_MODEL,
 )
@@ -28,6 +30,7 @@ from unique_user_memory.user_memory import (
     _gate_max_tokens,
     _is_well_formed_profile,
     _sanitize_for_xml_context,
+    clear_user_memory_cache,
     condense_user_memory,
     consolidate_user_memory,
     count_tokens,
@@ -35,6 +38,7 @@ from unique_user_memory.user_memory import (
     enforce_token_cap,
     ensure_user_memory_folder,
     fit_user_memory,
+    load_user_memory,
     profile_body,
     should_consolidate_memory,
     upload_user_memory,
@@ -51,6 +55,13 @@ from unique_user_memory.user_memory_prompts import (
 _TEST_LANGUAGE_MODEL = LanguageModelInfo.from_name(DEFAULT_LANGUAGE_MODEL)
 
 
+@pytest.fixture(autouse=True)
+def _clear_user_memory_cache():
+    clear_user_memory_cache()
+    yield
+    clear_user_memory_cache()
+
+
 def _complete_profile_body(
     identity: str = "- Prefers concise answers",
     *,
@@ -1368,6 +1379,182 @@ async def test_upload_user_memory_writes_hidden_skip_ingestion_file(
     }
 
 
+def _memory_content(content_id: str, updated_at: datetime) -> Content:
+    return Content(id=content_id, key="memory.md", updated_at=updated_at)
+
+
+def _patch_memory_io(
+    monkeypatch: pytest.MonkeyPatch,
+    *,
+    contents: list[Content],
+    downloaded: bytes = b"- Prefers concise answers",
+) -> dict[str, AsyncMock]:
+    mocks = {
+        "get_info": AsyncMock(
+            side_effect=lambda **kwargs: (
+                {"id": "scope_root"}
+                if kwargs["folderPath"] == "/user-memory"
+                else {"id": "scope_user"}
+            )
+        ),
+        "search_contents": AsyncMock(return_value=contents),
+        "download_content": AsyncMock(return_value=downloaded),
+        "count_tokens": MagicMock(return_value=10),
+    }
+    monkeypatch.setattr(
+        "unique_user_memory.user_memory.unique_sdk.Folder.get_info_async",
+        mocks["get_info"],
+    )
+    monkeypatch.setattr(
+        "unique_user_memory.user_memory.search_contents_async",
+        mocks["search_contents"],
+    )
+    monkeypatch.setattr(
+        "unique_user_memory.user_memory.download_content_to_bytes_async",
+        mocks["download_content"],
+    )
+    monkeypatch.setattr(
+        "unique_user_memory.user_memory.count_tokens",
+        mocks["count_tokens"],
+    )
+    return mocks
+
+
+@pytest.mark.ai
+@pytest.mark.asyncio
+async def test_load_user_memory_reuses_folder_and_profile_when_unchanged(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """
+    Purpose: Verify a warm turn only lists the user folder to validate the cache.
+    Why this matters: Every turn resolved folders and downloaded the profile again.
+    Setup summary: Load twice with an unchanged listing, count the remote calls.
+    """
+    # Arrange
+    updated_at = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    mocks = _patch_memory_io(
+        monkeypatch, contents=[_memory_content("content_1", updated_at)]
+    )
+    config = UserMemoryConfig(root_folder="user-memory")
+
+    # Act
+    states = [
+        await load_user_memory(
+            event=_chat_event(),
+            config=config,
+            language_model=_TEST_LANGUAGE_MODEL,
+            logger=MagicMock(),
+        )
+        for _ in range(2)
+    ]
+
+    # Assert
+    assert states[0] == states[1]
+    assert states[1] == UserMemoryState(
+        scope_id="scope_user", text="- Prefers concise answers"
+    )
+    assert mocks["get_info"].await_count == 2
+    assert mocks["search_contents"].await_count == 2
+    mocks["download_content"].assert_awaited_once()
+    mocks["count_tokens"].assert_called_once()
+
+
+@pytest.mark.ai
+@pytest.mark.asyncio
+async def test_load_user_memory_downloads_again_when_profile_changed(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """
+    Purpose: Verify a profile changed elsewhere is downloaded again.
+    Why this matters: The cache must never serve a stale profile.
+    Setup summary: Load, bump updated_at in the listing, load again.
+    """
+    # Arrange
+    mocks = _patch_memory_io(
+        monkeypatch,
+        contents=[
+            _memory_content("content_1", datetime(2026, 1, 1, tzinfo=timezone.utc))
+        ],
+    )
+    config = UserMemoryConfig(root_folder="user-memory")
+    await load_user_memory(
+        event=_chat_event(),
+        config=config,
+        language_model=_TEST_LANGUAGE_MODEL,
+        logger=MagicMock(),
+    )
+    mocks["search_contents"].return_value = [
+        _memory_content("content_1", datetime(2026, 1, 2, tzinfo=timezone.utc))
+    ]
+    mocks["download_content"].return_value = b"- Prefers long answers"
+
+    # Act
+    state = await load_user_memory(
+        event=_chat_event(),
+        config=config,
+        language_model=_TEST_LANGUAGE_MODEL,
+        logger=MagicMock(),
+    )
+
+    # Assert
+    assert state is not None
+    assert state.text == "- Prefers long answers"
+    assert mocks["download_content"].await_count == 2
+    assert mocks["count_tokens"].call_count == 2
+
+
+@pytest.mark.ai
+@pytest.mark.asyncio
+async def test_upload_user_memory_writes_through_to_cache(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """
+    Purpose: Verify the next turn serves the uploaded profile without downloading it.
+    Why this matters: The postprocessor writes the profile the next turn loads.
+    Setup summary: Load, upload a new profile, list the uploaded content, load again.
+    """
+    # Arrange
+    mocks = _patch_memory_io(
+        monkeypatch,
+        contents=[
+            _memory_content("content_1", datetime(2026, 1, 1, tzinfo=timezone.utc))
+        ],
+    )
+    uploaded = _memory_content("content_1", datetime(2026, 1, 2, tzinfo=timezone.utc))
+    monkeypatch.setattr(
+        "unique_user_memory.user_memory.upload_content_from_bytes_async",
+        AsyncMock(return_value=uploaded),
+    )
+    config = UserMemoryConfig(root_folder="user-memory")
+    await load_user_memory(
+        event=_chat_event(),
+        config=config,
+        language_model=_TEST_LANGUAGE_MODEL,
+        logger=MagicMock(),
+    )
+    await upload_user_memory(
+        scope_id="scope_user",
+        content="- Prefers tables",
+        user_id="user_1",
+        company_id="company_1",
+        logger=MagicMock(),
+    )
+    mocks["search_contents"].return_value = [uploaded]
+
+    # Act
+    state = await load_user_memory(
+        event=_chat_event(),
+        config=config,
+        language_model=_TEST_LANGUAGE_MODEL,
+        logger=MagicMock(),
+    )
+
+    # Assert
+    assert state is not None
+    assert state.text == "- Prefers tables"
+    mocks["download_content"].assert_awaited_once()
+
+
 @pytest.mark.asyncio
 async def test_user_memory_postprocessor_logs_success_when_upload_succeeds(
     monkeypatch: pytest.MonkeyPatch,
@@ -1,11 +1,13 @@
 import re
+from collections import OrderedDict
 from collections.abc import Awaitable, Callable
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from logging import Logger
 
 import unique_sdk
 from unique_toolkit.app import ChatEvent
+from unique_toolkit.content import Content
 from unique_toolkit.content.functions import (
     download_content_to_bytes_async,
     search_contents_async,
@@ -43,6 +45,7 @@ from unique_user_memory.user_memory_prompts import (
 MEMORY_FILENAME = "memory.md"
 MIME_TYPE = "text/markdown"
 _LLM_OUTPUT_HEADROOM_TOKENS = 200
+_USER_MEMORY_CACHE_SIZE = 1024
 
 
 async def noop_update_callback() -> None:
@@ -120,6 +123,69 @@ class UserMemoryState:
     load_invocation_stats: tuple[LanguageModelInvocationStats, ...] = ()
 
 
+@dataclass
+class _CachedUserMemory:
+    """What the previous turns of a user learned about their memory profile.
+
+    ``text`` is the profile as stored in ``content_id``; it is only trusted
+    while the listed content still has the same id and ``updated_at``.
+    """
+
+    root_folder: str
+    scope_id: str
+    content_id: str | None = None
+    updated_at: datetime | None = None
+    text: str = ""
+    token_counts: dict[str, int] = field(default_factory=dict)
+
+    def matches(self, content: Content) -> bool:
+        return (
+            self.content_id == content.id
+            and self.updated_at is not None
+            and self.updated_at == content.updated_at
+        )
+
+    def store(self, *, content: Content, text: str) -> None:
+        self.content_id = content.id
+        self.updated_at = content.updated_at
+        self.text = text
+        self.token_counts = {}
+
+
+# Per-process cache keyed by (company_id, user_id). Loading the memory at the
+# start of a turn used to resolve the root and user folders, list the folder
+# and download the profile every time; with a warm entry an unchanged profile
+# costs a single listing of the user folder.
+_user_memory_cache: OrderedDict[tuple[str, str], _CachedUserMemory] = OrderedDict()
+
+
+def _get_cached_user_memory(
+    *, user_id: str, company_id: str
+) -> _CachedUserMemory | None:
+    cached = _user_memory_cache.get((company_id, user_id))
+    if cached is not None:
+        _user_memory_cache.move_to_end((company_id, user_id))
+    return cached
+
+
+def _cache_user_memory(
+    *, user_id: str, company_id: str, cached: _CachedUserMemory
+) -> None:
+    _user_memory_cache[(company_id, user_id)] = cached
+    _user_memory_cache.move_to_end((company_id, user_id))
+    while len(_user_memory_cache) > _USER_MEMORY_CACHE_SIZE:
+        _user_memory_cache.popitem(last=False)
+
+
+def _forget_user_memory(*, user_id: str, company_id: str) -> None:
+    _user_memory_cache.pop((company_id, user_id), None)
+
+
+def clear_user_memory_cache() -> None:
+    """Drop every cached memory folder and profile of this process."""
+    _user_memory_cache.clear()
+
+
 def _gate_max_tokens(*, language_model: LanguageModelInfo) -> int:
     if ModelCapabilities.REASONING in language_model.capabilities:
         return _GATE_MAX_TOKENS_REASONING
@@ -384,25 +450,44 @@ async def load_user_memory(
         logger.warning("[user-memory] empty user_id/company_id - skipping memory load")
         return None
 
-    scope_id = await ensure_user_memory_folder(
+    cached = _get_cached_user_memory(user_id=user_id, company_id=company_id)
+    if cached is None or cached.root_folder != config.root_folder:
+        scope_id = await ensure_user_memory_folder(
+            user_id=user_id,
+            company_id=company_id,
+            root_folder=config.root_folder,
+            logger=logger,
+        )
+        if scope_id is None:
+            logger.info("[user-memory] folder ensure failed - running without memory")
+            return None
+        cached = _CachedUserMemory(root_folder=config.root_folder, scope_id=scope_id)
+        _cache_user_memory(user_id=user_id, company_id=company_id, cached=cached)
+
+    text = await _load_cached_user_memory(
+        cached=cached,
         user_id=user_id,
         company_id=company_id,
-        root_folder=config.root_folder,
         logger=logger,
     )
-    if scope_id is None:
-        logger.info("[user-memory] folder ensure failed - running without memory")
-        return None
 
-    text = await download_user_memory(
-        scope_id=scope_id,
-        user_id=user_id,
-        company_id=company_id,
-        logger=logger,
-    )
+    if not text:
+        return UserMemoryState(scope_id=cached.scope_id, text=text)
+
+    # The token count of an unchanged profile is remembered, so a profile
+    # within budget is neither downloaded nor re-tokenized.
+    model_key = str(language_model.name)
+    token_count = cached.token_counts.get(model_key)
+    if token_count is None:
+        token_count = count_tokens(content=text, language_model=language_model)
+        if text == cached.text:
+            cached.token_counts[model_key] = token_count
+    if token_count <= config.max_tokens:
+        return UserMemoryState(scope_id=cached.scope_id, text=text)
+
     invocation_stats: list[LanguageModelInvocationStats] = []
     return UserMemoryState(
-        scope_id=scope_id,
+        scope_id=cached.scope_id,
         text=await fit_user_memory(
             content=text,
             max_tokens=config.max_tokens,
@@ -416,6 +501,62 @@ async def load_user_memory(
     )
 
 
+async def _load_cached_user_memory(
+    *,
+    cached: _CachedUserMemory,
+    user_id: str,
+    company_id: str,
+    logger: Logger,
+) -> str:
+    """Return the stored profile, downloading it only if it changed."""
+    try:
+        memory_content = await _find_user_memory_content(
+            scope_id=cached.scope_id, user_id=user_id, company_id=company_id
+        )
+    except Exception as exc:
+        logger.warning(
+            "[user-memory] failed to list contents in scope %s: [%s] %s",
+            cached.scope_id,
+            type(exc).__name__,
+            exc,
+        )
+        # The folder may be gone; resolve it again on the next turn.
+        _forget_user_memory(user_id=user_id, company_id=company_id)
+        return ""
+
+    if memory_content is None:
+        logger.debug(
+            "[user-memory] no %s in scope %s - first turn for this user",
+            MEMORY_FILENAME,
+            cached.scope_id,
+        )
+        cached.content_id = None
+        cached.updated_at = None
+        cached.text = ""
+        cached.token_counts = {}
+        return ""
+
+    if cached.matches(memory_content):
+        logger.debug(
+            "[user-memory] %s in scope %s unchanged - using cached profile",
+            MEMORY_FILENAME,
+            cached.scope_id,
+        )
+        return cached.text
+
+    text = await _download_user_memory_content(
+        memory_content=memory_content,
+        scope_id=cached.scope_id,
+        user_id=user_id,
+        company_id=company_id,
+        logger=logger,
+    )
+    if text is None:
+        return ""
+    cached.store(content=memory_content, text=text)
+    return text
+
+
 async def ensure_user_memory_folder(
     *,
     user_id: str,
@@ -552,11 +693,8 @@ async def download_user_memory(
     logger: Logger,
 ) -> str:
     try:
-        contents = await search_contents_async(
-            user_id=user_id,
-            company_id=company_id,
-            chat_id=None,
-            where={"ownerId": {"equals": scope_id}},
+        memory_content = await _find_user_memory_content(
+            scope_id=scope_id, user_id=user_id, company_id=company_id
         )
     except Exception as exc:
         logger.warning(
@@ -567,10 +705,6 @@ async def download_user_memory(
         )
         return ""
 
-    memory_content = next(
-        (content for content in contents if (content.key or "") == MEMORY_FILENAME),
-        None,
-    )
     if memory_content is None:
         logger.debug(
             "[user-memory] no %s in scope %s - first turn for this user",
@@ -579,6 +713,42 @@ async def download_user_memory(
         )
         return ""
 
+    text = await _download_user_memory_content(
+        memory_content=memory_content,
+        scope_id=scope_id,
+        user_id=user_id,
+        company_id=company_id,
+        logger=logger,
+    )
+    return text or ""
+
+
+async def _find_user_memory_content(
+    *,
+    scope_id: str,
+    user_id: str,
+    company_id: str,
+) -> Content | None:
+    contents = await search_contents_async(
+        user_id=user_id,
+        company_id=company_id,
+        chat_id=None,
+        where={"ownerId": {"equals": scope_id}},
+    )
+    return next(
+        (content for content in contents if (content.key or "") == MEMORY_FILENAME),
+        None,
+    )
+
+
+async def _download_user_memory_content(
+    *,
+    memory_content: Content,
+    scope_id: str,
+    user_id: str,
+    company_id: str,
+    logger: Logger,
+) -> str | None:
     try:
         content_bytes = await download_content_to_bytes_async(
             user_id=user_id,
@@ -602,7 +772,7 @@ async def download_user_memory(
             type(exc).__name__,
             exc,
         )
-        return ""
+        return None
 
 
 async def upload_user_memory(
@@ -621,7 +791,7 @@ async def upload_user_memory(
         return False
 
     try:
-        await upload_content_from_bytes_async(
+        uploaded = await upload_content_from_bytes_async(
             user_id=user_id,
             company_id=company_id,
             content=content.encode("utf-8"),
@@ -639,8 +809,9 @@ async def upload_user_memory(
             len(content.encode("utf-8")),
             scope_id,
         )
-        return True
     except Exception as exc:
+        # Resolve the folder and download the profile again on the next turn.
+        _forget_user_memory(user_id=user_id, company_id=company_id)
         logger.error(
             "[user-memory] upload failed for scope %s: [%s] %s",
             scope_id,
@@ -650,6 +821,12 @@ async def upload_user_memory(
         )
         return False
 
+    # Write through so the next turn does not download what was just uploaded.
+    cached = _get_cached_user_memory(user_id=user_id, company_id=company_id)
+    if cached is not None and cached.scope_id == scope_id:
+        cached.store(content=uploaded, text=content)
+    return True
+
 
 async def should_consolidate_memory(
     *,
@@ -6,8 +6,10 @@ from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 from langchain_core.runnables import RunnableConfig
+from unique_toolkit.content.schemas import ContentChunk
 
 from unique_deep_research.config import UniqueEngine
+from unique_deep_research.unique_custom.document_cache import ResearchDocumentCache
 from unique_deep_research.unique_custom.tools import (
     _get_internal_data_citation,
     _get_internal_data_title,
@@ -19,8 +21,10 @@ from unique_deep_research.unique_custom.tools import (
     get_supervisor_tools,
     get_title,
     get_today_str,
+    internal_fetch,
     research_complete,
     research_complete_tool_called,
+    web_fetch,
     web_search,
 )
 
@@ -808,3 +812,151 @@ async def test_web_search__uses_snippet_label__not_content_label() -> None:
     # Assert
     assert "Snippet: This is the snippet text" in result
     assert "content: This is the snippet text" not in result
+
+
+@pytest.mark.ai
+@pytest.mark.asyncio
+async def test_web_fetch__crawls_page_once__when_reading_further_windows() -> None:
+    """
+    Purpose: Verify paginated web_fetch calls crawl the page once and slice the cache.
+    Why this matters: Reading a long page in windows used to re-download and
+        re-markdownify it for every window.
+    Setup summary: Fetch two windows of a 25k character page, assert one crawl and a hit.
+    """
+    # Arrange
+    document_cache = ResearchDocumentCache()
+    config = RunnableConfig(configurable={"document_cache": document_cache})
+    page = "a" * 10_000 + "b" * 15_000
+
+    mock_citation = Mock()
+    mock_citation.number = 1
+    mock_citation_manager = AsyncMock()
+    mock_citation_manager.register_source = AsyncMock(return_value=mock_citation)
+
+    # Act
+    with (
+        patch(
+            "unique_deep_research.unique_custom.tools.crawl_url",
+            AsyncMock(return_value=(page, "Long Page", True)),
+        ) as mock_crawl_url,
+        patch(
+            "unique_deep_research.unique_custom.tools.get_citation_manager",
+            return_value=mock_citation_manager,
+        ),
+        patch(
+            "unique_deep_research.unique_custom.tools.write_tool_message_log",
+        ),
+    ):
+        first = await web_fetch.ainvoke({"url": "https://test.com"}, config)
+        second = await web_fetch.ainvoke(
+            {"url": "https://test.com", "offset": 10_000}, config
+        )
+
+    # Assert
+    mock_crawl_url.assert_awaited_once()
+    assert "15,000 characters remaining" in first
+    assert "b" * 10_000 in second
+    assert document_cache.stats().hits == 1
+    assert document_cache.stats().misses == 1
+
+
+@pytest.mark.ai
+@pytest.mark.asyncio
+async def test_web_fetch__retries_crawl__when_previous_crawl_failed() -> None:
+    """
+    Purpose: Verify failed crawls are not cached.
+    Why this matters: A transient failure must not hide the page for the whole session.
+    Setup summary: Fail the first crawl, succeed the second, assert two crawls.
+    """
+    # Arrange
+    config = RunnableConfig(configurable={"document_cache": ResearchDocumentCache()})
+
+    mock_citation = Mock()
+    mock_citation.number = 1
+    mock_citation_manager = AsyncMock()
+    mock_citation_manager.register_source = AsyncMock(return_value=mock_citation)
+
+    # Act
+    with (
+        patch(
+            "unique_deep_research.unique_custom.tools.crawl_url",
+            AsyncMock(
+                side_effect=[
+                    ("Unable to crawl URL in web_fetch", None, False),
+                    ("Page content", "Title", True),
+                ]
+            ),
+        ) as mock_crawl_url,
+        patch(
+            "unique_deep_research.unique_custom.tools.get_citation_manager",
+            return_value=mock_citation_manager,
+        ),
+        patch(
+            "unique_deep_research.unique_custom.tools.write_tool_message_log",
+        ),
+    ):
+        first = await web_fetch.ainvoke({"url": "https://test.com"}, config)
+        second = await web_fetch.ainvoke({"url": "https://test.com"}, config)
+
+    # Assert
+    assert mock_crawl_url.await_count == 2
+    assert first == "Unable to fetch content from URL: https://test.com"
+    assert "Page content" in second
+
+
+@pytest.mark.ai
+@pytest.mark.asyncio
+async def test_internal_fetch__slices_cached_chunks__when_reading_next_page() -> None:
+    """
+    Purpose: Verify internal_fetch serves a later page from the cached chunk list.
+    Why this matters: Every page used to re-run the chunk search for the document.
+    Setup summary: Return all 5 chunks from one search, read pages of 2, assert one search.
+    """
+    # Arrange
+    document_cache = ResearchDocumentCache()
+    config = RunnableConfig(configurable={"document_cache": document_cache})
+    chunks = [
+        ContentChunk(id="cont_1", chunk_id=f"chunk_{i}", text=f"text {i}", order=i)
+        for i in range(5)
+    ]
+
+    mock_content_service = Mock()
+    mock_content_service._metadata_filter = {"key": "value"}
+    mock_content_service.search_content_chunks_async = AsyncMock(return_value=chunks)
+
+    mock_citation = Mock()
+    mock_citation.number = 1
+    mock_citation.name = "Document"
+    mock_citation_manager = AsyncMock()
+    mock_citation_manager.register_source_from_content_reference = AsyncMock(
+        return_value=mock_citation
+    )
+
+    # Act
+    with (
+        patch(
+            "unique_deep_research.unique_custom.tools.get_content_service_from_config",
+            return_value=mock_content_service,
+        ),
+        patch(
+            "unique_deep_research.unique_custom.tools.get_citation_manager",
+            return_value=mock_citation_manager,
+        ),
+        patch(
+            "unique_deep_research.unique_custom.tools.write_tool_message_log",
+        ),
+    ):
+        first = await internal_fetch.ainvoke(
+            {"content_id": "cont_1", "limit": 2}, config
+        )
+        second = await internal_fetch.ainvoke(
+            {"content_id": "cont_1", "offset": 2, "limit": 2}, config
+        )
+
+    # Assert
+    mock_content_service.search_content_chunks_async.assert_awaited_once()
+    assert "use offset 2 to continue" in first
+    assert "text 2" in second and "text 3" in second
+    assert "use offset 4 to continue" in second
+    assert mock_content_service._metadata_filter == {"key": "value"}
+    assert document_cache.stats().hits == 1
@@ -0,0 +1,126 @@
+"""
+Tests for unique_deep_research.unique_custom.document_cache module.
+"""
+
+import pytest
+from unique_toolkit.content.schemas import ContentChunk
+
+from unique_deep_research.unique_custom.document_cache import (
+    CachedInternalDocument,
+    CachedWebPage,
+    ResearchDocumentCache,
+)
+
+
+@pytest.mark.ai
+def test_document_cache__evicts_least_recently_used__when_over_byte_budget() -> None:
+    """
+    Purpose: Verify the cache evicts the least recently used document once full.
+    Why this matters: Long research sessions read many pages; memory must stay bounded.
+    Setup summary: Fill a 25-byte cache with 10-byte pages, touch the first, add a third.
+    """
+    # Arrange
+    cache = ResearchDocumentCache(max_bytes=25)
+    cache.put("web:a", CachedWebPage(content="a" * 10))
+    cache.put("web:b", CachedWebPage(content="b" * 10))
+    cache.get("web:a")
+
+    # Act
+    cache.put("web:c", CachedWebPage(content="c" * 10))
+
+    # Assert
+    assert cache.get("web:b") is None
+    assert cache.get("web:a") is not None
+    assert cache.get("web:c") is not None
+    stats = cache.stats()
+    assert stats.evictions == 1
+    assert stats.entries == 2
+    assert stats.size_bytes == 20
+
+
+@pytest.mark.ai
+def test_document_cache__skips_document__when_larger_than_budget() -> None:
+    """
+    Purpose: Verify a single document larger than the budget is not cached.
+    Why this matters: One huge page must not flush every other cached document.
+    Setup summary: Put a small and an oversized page, assert only the small one remains.
+    """
+    # Arrange
+    cache = ResearchDocumentCache(max_bytes=10)
+    cache.put("web:small", CachedWebPage(content="small"))
+
+    # Act
+    cache.put("web:huge", CachedWebPage(content="x" * 11))
+
+    # Assert
+    assert cache.get("web:huge") is None
+    assert cache.get("web:small") is not None
+    assert cache.stats().evictions == 0
+
+
+@pytest.mark.ai
+def test_document_cache__sizes_internal_documents__by_chunk_text() -> None:
+    """
+    Purpose: Verify internal documents are accounted by the bytes of their chunk texts.
+    Why this matters: The byte budget must cover both web pages and chunk lists.
+    Setup summary: Put a two-chunk document, assert size and replacement accounting.
+    """
+    # Arrange
+    cache = ResearchDocumentCache()
+    document = CachedInternalDocument(
+        chunks=[ContentChunk(text="abc"), ContentChunk(text="ü")], complete=True
+    )
+
+    # Act
+    cache.put("internal:cont_1", document)
+    cache.put("internal:cont_1", document)
+
+    # Assert
+    assert cache.stats().size_bytes == 5
+    assert cache.stats().entries == 1
+
+
+@pytest.mark.ai
+def test_document_cache_stats__reports_hit_rate__in_debug_info() -> None:
+    """
+    Purpose: Verify the stats debug info contains the counters and the hit rate.
+    Why this matters: The hit rate is reported in the deep research tool debug info.
+    Setup summary: Record three hits and one miss, assert debug info values.
+    """
+    # Arrange
+    cache = ResearchDocumentCache()
+    for hit in (True, True, True, False):
+        cache.record_lookup(hit=hit)
+
+    # Act
+    debug_info = cache.stats().to_debug_info()
+
+    # Assert
+    assert debug_info["hits"] == 3
+    assert debug_info["misses"] == 1
+    assert debug_info["hit_rate"] == 0.75
+
+
+@pytest.mark.ai
+@pytest.mark.asyncio
+async def test_document_cache__reuses_http_client__until_closed() -> None:
+    """
+    Purpose: Verify all fetches of a session share one HTTP client that aclose releases.
+    Why this matters: A new client per fetch leaked connections and skipped keep-alive.
+    Setup summary: Read the client twice, close the cache, assert a new client afterwards.
+    """
+    # Arrange
+    cache = ResearchDocumentCache()
+    client = cache.http_client
+    cache.put("web:a", CachedWebPage(content="a"))
+
+    # Act
+    same_client = cache.http_client
+    await cache.aclose()
+
+    # Assert
+    assert same_client is client
+    assert client.is_closed
+    assert cache.get("web:a") is None
+    assert cache.http_client is not client
+    await cache.aclose()
@@ -69,6 +69,7 @@ from .markdown_utils import (
 )
 from .unique_custom.agents import custom_agent
 from .unique_custom.citation import GlobalCitationManager
+from .unique_custom.document_cache import DocumentCacheStats, ResearchDocumentCache
 from .unique_custom.utils import (
     create_message_log_entry,
     get_next_message_order,
@@ -159,6 +160,7 @@ class DeepResearchTool(Tool[DeepResearchToolConfig]):
         )
         self.env = TEMPLATE_ENV
         self.execution_id = event.payload.message_execution_id
+        self.document_cache_stats: DocumentCacheStats | None = None
 
     def takes_control(self) -> bool:
         """
@@ -389,6 +391,7 @@ class DeepResearchTool(Tool[DeepResearchToolConfig]):
                 id=tool_call.id or "",
                 name=self.name,
                 content=processed_result,
+                debug_info=self._get_research_debug_info(),
                 content_chunks=content_chunks,
             )
 
@@ -443,6 +446,7 @@ class DeepResearchTool(Tool[DeepResearchToolConfig]):
                     "is_forced": True,
                     "is_exclusive": True,
                     "loop_iteration": 0,
+                    **self._get_research_debug_info(),
                 },
             }
         ]
@@ -458,6 +462,12 @@ class DeepResearchTool(Tool[DeepResearchToolConfig]):
         }
         return debug_info_event
 
+    def _get_research_debug_info(self) -> dict[str, Any]:
+        """Document cache usage of the last custom research session, if any."""
+        if self.document_cache_stats is None:
+            return {}
+        return {"document_cache": self.document_cache_stats.to_debug_info()}
+
     def write_message_log_text_message(self, text: str):
         create_message_log_entry(
             self.chat_service,
@@ -514,8 +524,9 @@ class DeepResearchTool(Tool[DeepResearchToolConfig]):
         Run Custom research using LangGraph multi-agent orchestration.
         Returns a tuple of (processed_result, content_chunks)
         """
-        # Create citation manager for this research session
+        # Create citation manager and document cache for this research session
         citation_manager = GlobalCitationManager()
+        document_cache = ResearchDocumentCache()
 
         # Initialize LangGraph state with required services
         initial_state = {
@@ -544,6 +555,7 @@ class DeepResearchTool(Tool[DeepResearchToolConfig]):
                 "content_service": self.content_service,
                 "message_id": self.chat_service.assistant_message_id,
                 "citation_manager": citation_manager,
+                "document_cache": document_cache,
                 "additional_openai_proxy_headers": additional_openai_proxy_headers,
             },
         }
@@ -560,6 +572,8 @@ class DeepResearchTool(Tool[DeepResearchToolConfig]):
                 # scope even if the graph raises, so tokens already spent before the
                 # failure aren't dropped from the failure ToolCallResponse.
                 collector.record_invocation_stats(web_search_invocation_stats)
+                self.document_cache_stats = document_cache.stats()
+                await document_cache.aclose()
 
         research_result = result.get("final_report", "")
 
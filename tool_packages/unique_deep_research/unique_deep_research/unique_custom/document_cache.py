@@ -0,0 +1,159 @@
+"""
+Research-session cache for documents read by the fetch tools.
+
+Researcher agents read long documents in windows: ``web_fetch`` with an
+increasing ``offset`` and ``internal_fetch`` with an increasing result offset.
+Without a cache every window crawls and markdownifies the page again, or
+re-runs the chunk search for the document. The cache keeps the fetched
+markdown and chunk lists for the duration of one research session, so further
+windows are sliced from memory, and it owns the HTTP client every web fetch of
+the session shares.
+"""
+
+import asyncio
+import logging
+from collections import OrderedDict
+from typing import Any
+
+from httpx import AsyncClient
+from pydantic import BaseModel, ConfigDict, Field
+from unique_toolkit.content.schemas import ContentChunk
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+
+class CachedWebPage(BaseModel):
+    """Markdown of a crawled web page."""
+
+    content: str
+    title: str | None = None
+
+
+class CachedInternalDocument(BaseModel):
+    """Chunks of an internal document, in search order."""
+
+    chunks: list[ContentChunk]
+    complete: bool = Field(
+        description="Whether the search returned fewer chunks than requested, "
+        "i.e. the list holds every chunk of the document",
+    )
+
+
+CachedDocument = CachedWebPage | CachedInternalDocument
+
+
+class DocumentCacheStats(BaseModel):
+    """Counters reported in the tool debug info."""
+
+    model_config = ConfigDict(frozen=True)
+
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    size_bytes: int
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def to_debug_info(self) -> dict[str, Any]:
+        return {**self.model_dump(), "hit_rate": round(self.hit_rate, 3)}
+
+
+def _document_size(document: CachedDocument) -> int:
+    if isinstance(document, CachedWebPage):
+        return len(document.content.encode("utf-8"))
+    return sum(len(chunk.text.encode("utf-8")) for chunk in document.chunks)
+
+
+class ResearchDocumentCache:
+    """
+    LRU cache of fetched documents, bounded by their size in bytes.
+
+    One instance is shared by all researchers of a research session through
+    the ``document_cache`` entry of the RunnableConfig. Loads of the same key
+    are serialized with a per-key lock, so parallel researchers opening the
+    same document fetch it once.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[str, tuple[CachedDocument, int]] = OrderedDict()
+        self._size_bytes = 0
+        self._key_locks: dict[str, asyncio.Lock] = {}
+        self._http_client: AsyncClient | None = None
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @staticmethod
+    def web_key(url: str) -> str:
+        return f"web:{url}"
+
+    @staticmethod
+    def internal_key(content_id: str) -> str:
+        return f"internal:{content_id}"
+
+    @property
+    def http_client(self) -> AsyncClient:
+        """HTTP client shared by all web fetches of the session."""
+        if self._http_client is None:
+            self._http_client = AsyncClient(follow_redirects=True)
+        return self._http_client
+
+    def lock(self, key: str) -> asyncio.Lock:
+        """Lock to hold while loading ``key`` so it is only fetched once."""
+        return self._key_locks.setdefault(key, asyncio.Lock())
+
+    def get(self, key: str) -> CachedDocument | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        self._entries.move_to_end(key)
+        return entry[0]
+
+    def record_lookup(self, hit: bool) -> None:
+        if hit:
+            self._hits += 1
+        else:
+            self._misses += 1
+
+    def put(self, key: str, document: CachedDocument) -> None:
+        size = _document_size(document)
+        self._discard(key)
+        if size > self.max_bytes:
+            _LOGGER.info(f"Document {key} of {size} bytes exceeds the cache size")
+            return
+
+        self._entries[key] = (document, size)
+        self._size_bytes += size
+        while self._size_bytes > self.max_bytes:
+            evicted_key, _ = next(iter(self._entries.items()))
+            self._discard(evicted_key)
+            self._evictions += 1
+
+    def _discard(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._size_bytes -= entry[1]
+
+    def stats(self) -> DocumentCacheStats:
+        return DocumentCacheStats(
+            hits=self._hits,
+            misses=self._misses,
+            evictions=self._evictions,
+            entries=len(self._entries),
+            size_bytes=self._size_bytes,
+        )
+
+    async def aclose(self) -> None:
+        """Release the cached documents and close the HTTP client."""
+        self._entries.clear()
+        self._size_bytes = 0
+        if self._http_client is not None:
+            await self._http_client.aclose()
+            self._http_client = None
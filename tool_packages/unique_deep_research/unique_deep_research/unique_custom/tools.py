@@ -22,11 +22,18 @@ from unique_toolkit.chat.schemas import (
 )
 from unique_toolkit.content import ContentReference
 from unique_toolkit.content.schemas import ContentChunk, ContentSearchType
+from unique_toolkit.content.service import ContentService
 from unique_web_search.services.search_engine import get_search_engine_service
 
+from .document_cache import (
+    CachedInternalDocument,
+    CachedWebPage,
+    ResearchDocumentCache,
+)
 from .utils import (
     get_citation_manager,
     get_content_service_from_config,
+    get_document_cache,
     get_engine_config,
     write_tool_message_log,
 )
@@ -229,12 +236,12 @@ async def web_fetch(
     that were found through search or are known to contain relevant content.
     """
 
-    content, title, success = await crawl_url(AsyncClient(), url)
-
-    # Crawl the URL
-    if not success:
+    # Crawl the URL, or reuse the page if another window of it was read before
+    page = await fetch_web_page(get_document_cache(config), url)
+    if page is None:
         _LOGGER.info(f"Unable to fetch content from: {url}")
         return f"Unable to fetch content from URL: {url}"
+    content, title = page.content, page.title
 
     # Register citation and get metadata
     citation_manager = get_citation_manager(config)
@@ -291,6 +298,76 @@ async def web_fetch(
     )
 
 
+async def fetch_web_page(
+    document_cache: ResearchDocumentCache, url: str
+) -> CachedWebPage | None:
+    """Crawl ``url`` once per research session and return its markdown.
+
+    Returns None if the page could not be crawled; failures are not cached.
+    """
+    key = document_cache.web_key(url)
+    async with document_cache.lock(key):
+        page = document_cache.get(key)
+        document_cache.record_lookup(hit=isinstance(page, CachedWebPage))
+        if isinstance(page, CachedWebPage):
+            return page
+
+        content, title, success = await crawl_url(document_cache.http_client, url)
+        if not success:
+            return None
+        page = CachedWebPage(content=content, title=title)
+        document_cache.put(key, page)
+        return page
+
+
+async def _fetch_internal_document(
+    content_service: ContentService,
+    document_cache: ResearchDocumentCache,
+    content_id: str,
+    min_chunks: int,
+) -> CachedInternalDocument:
+    """Return the chunks of a document, searching only if the cache has too few.
+
+    The cached list is complete or holds at least ``min_chunks`` chunks, so a
+    page that ends before the cached list does is a pure slice.
+    """
+    key = document_cache.internal_key(content_id)
+    async with document_cache.lock(key):
+        document = document_cache.get(key)
+        if isinstance(document, CachedInternalDocument) and (
+            document.complete or len(document.chunks) >= min_chunks
+        ):
+            document_cache.record_lookup(hit=True)
+            return document
+        document_cache.record_lookup(hit=False)
+
+        # Grow geometrically so reading a long document page by page needs
+        # only a logarithmic number of searches.
+        limit = min_chunks
+        if isinstance(document, CachedInternalDocument):
+            limit = max(limit, 2 * len(document.chunks))
+
+        temp_metadata_filter = content_service._metadata_filter
+        content_service._metadata_filter = None
+        try:
+            search_results = await content_service.search_content_chunks_async(
+                search_string=" ",  # Dummy search string
+                search_type=ContentSearchType.COMBINED,
+                limit=limit,
+                score_threshold=0,
+                content_ids=[content_id],
+            )
+        finally:
+            content_service._metadata_filter = temp_metadata_filter
+
+        document = CachedInternalDocument(
+            chunks=search_results, complete=len(search_results) < limit
+        )
+        if search_results:
+            document_cache.put(key, document)
+        return document
+
+
 def _get_internal_data_title(result: ContentChunk) -> str:
     """Get the title of the internal data."""
     return (
@@ -385,16 +462,14 @@ async def internal_fetch(
     _LOGGER.info("**Reading internal document**")
     content_service = get_content_service_from_config(config)
 
-    temp_metadata_filter = content_service._metadata_filter
-    content_service._metadata_filter = None
-    search_results = await content_service.search_content_chunks_async(
-        search_string=" ",  # Dummy search string
-        search_type=ContentSearchType.COMBINED,
-        limit=limit,  # Get enough results to support offset
-        score_threshold=0,
-        content_ids=[content_id],
+    # One chunk beyond the requested page tells whether more results follow
+    document = await _fetch_internal_document(
+        content_service,
+        get_document_cache(config),
+        content_id,
+        min_chunks=offset + limit + 1,
     )
-    content_service._metadata_filter = temp_metadata_filter
+    search_results = document.chunks
 
     if not search_results:
         _LOGGER.info("No internal results found")
@@ -410,7 +485,7 @@ async def internal_fetch(
     paginated_results = search_results[offset : offset + limit]
 
     # Check if we're at the end of results
-    is_at_end = offset + len(paginated_results) >= total_results
+    is_at_end = document.complete and offset + len(paginated_results) >= total_results
 
     if len(paginated_results) == 0 and offset >= total_results:
         return f"No more results for content ID: {content_id}\n\n<END_OF_CONTENT>\n\nNote: Offset {offset} is at or beyond total results ({total_results:,})"
@@ -430,6 +505,8 @@ async def internal_fetch(
 
     if is_at_end:
         formatted_results += "\n\n<END_OF_CONTENT>"
+    elif not document.complete:
+        formatted_results += f"\n\n[More results available - use offset {offset + len(paginated_results)} to continue]"
     else:
         remaining_results = total_results - (offset + len(paginated_results))
         if remaining_results > 0:
@@ -31,6 +31,7 @@ from unique_toolkit.language_model.infos import LanguageModelInfo
 from ..config import UniqueEngine
 from ..invocation_stats import collector
 from .citation import GlobalCitationManager
+from .document_cache import ResearchDocumentCache
 from .state import AgentState, ResearcherState, SupervisorState
 
 _LOGGER = logging.getLogger(__name__)
@@ -237,6 +238,38 @@ def get_citation_manager(config: RunnableConfig) -> GlobalCitationManager:
     return citation_manager
 
 
+def get_document_cache(config: RunnableConfig) -> ResearchDocumentCache:
+    """
+    Extract ResearchDocumentCache from RunnableConfig.
+
+    The document cache is provided by the service layer and shared across
+    all subgraphs so paginated fetches of a document are served from memory.
+
+    Args:
+        config: LangChain RunnableConfig containing the document cache
+
+    Returns:
+        ResearchDocumentCache instance (guaranteed to exist)
+
+    Raises:
+        KeyError: If document_cache is missing (indicates system error)
+        TypeError: If document_cache is wrong type (indicates system error)
+    """
+    if not config or "configurable" not in config:
+        raise KeyError("RunnableConfig missing 'configurable' section")
+
+    document_cache = config["configurable"].get("document_cache")
+    if document_cache is None:
+        raise KeyError("document_cache missing from RunnableConfig")
+
+    if not isinstance(document_cache, ResearchDocumentCache):
+        raise TypeError(
+            f"document_cache is {type(document_cache)}, expected ResearchDocumentCache"
+        )
+
+    return document_cache
+
+
 def create_message_log_entry(
     chat_service: ChatService,
     message_id: str,
@@ -1,11 +1,14 @@
 import json
 from typing import Any
-from unittest.mock import AsyncMock, MagicMock, Mock, PropertyMock, patch
+from unittest.mock import AsyncMock, Mock, PropertyMock, patch
 
 import pytest
 from unique_toolkit._common.chunk_relevancy_sorter.exception import (
     ChunkRelevancySorterException,
 )
+from unique_toolkit._common.chunk_relevancy_sorter.schemas import (
+    ChunkRelevancySorterResult,
+)
 from unique_toolkit.agentic.tools.schemas import ToolCallResponse
 from unique_toolkit.content.schemas import ContentChunk
 from unique_toolkit.content.service import ContentService
@@ -19,6 +22,7 @@ from unique_internal_search.service import (
     InternalSearchService,
     InternalSearchTool,
 )
+from unique_internal_search.utils import SearchStringResult
 
 
 def _build_content_chunks(prefix: str, count: int) -> list[ContentChunk]:
@@ -520,9 +524,10 @@ class TestInternalSearchService:
         mock_content_service.search_content_chunks_async = AsyncMock(
             return_value=sample_content_chunks
         )
-        resort_result = Mock()
-        resort_result.content_chunks = sample_content_chunks[::-1]
-        mock_chunk_relevancy_sorter.run = AsyncMock(return_value=resort_result)
+        resort_result = ChunkRelevancySorterResult.from_chunks(
+            sample_content_chunks[::-1]
+        )
+        mock_chunk_relevancy_sorter.run_batch = AsyncMock(return_value=[resort_result])
         service.post_progress_message = AsyncMock()
 
         # Act
@@ -530,7 +535,7 @@ class TestInternalSearchService:
 
         # Assert
         assert len(result) == 2
-        mock_chunk_relevancy_sorter.run.assert_called_once()
+        mock_chunk_relevancy_sorter.run_batch.assert_called_once()
 
     @pytest.mark.ai
     @pytest.mark.asyncio
@@ -563,7 +568,7 @@ class TestInternalSearchService:
         error = ChunkRelevancySorterException(
             error_message="Sorting failed", user_message="Sorting failed"
         )
-        mock_chunk_relevancy_sorter.run = AsyncMock(side_effect=error)
+        mock_chunk_relevancy_sorter.run_batch = AsyncMock(return_value=[error])
         service.post_progress_message = AsyncMock()
 
         # Act
@@ -750,8 +755,8 @@ class TestInternalSearchService:
         mock_content_service.search_content_chunks_async = AsyncMock(
             return_value=sample_content_chunks
         )
-        mock_chunk_relevancy_sorter.run = AsyncMock(
-            return_value=MagicMock(content_chunks=sample_content_chunks)
+        mock_chunk_relevancy_sorter.run_batch = AsyncMock(
+            return_value=[ChunkRelevancySorterResult.from_chunks(sample_content_chunks)]
         )
         log_progress_mock = AsyncMock()
 
@@ -1062,7 +1067,7 @@ class TestInternalSearchService:
 
     @pytest.mark.ai
     @pytest.mark.asyncio
-    async def test_resort_found_chunks_if_enabled__returns_sorted_chunks__on_success(
+    async def test_resort_found_chunks_if_enabled__resorts_all_search_strings__in_one_batch(
         self,
         base_internal_search_config: InternalSearchConfig,
         mock_content_service: ContentService,
@@ -1071,9 +1076,9 @@ class TestInternalSearchService:
         sample_content_chunks: list[ContentChunk],
     ) -> None:
         """
-        Purpose: Verify _resort_found_chunks_if_enabled returns sorted chunks on success.
-        Why this matters: Ensures chunk relevancy sorting works correctly.
-        Setup summary: Mock successful sort, verify sorted chunks returned.
+        Purpose: Verify _resort_found_chunks_if_enabled resorts every search string in one sorter call.
+        Why this matters: Resorting search strings one after another multiplies the LLM latency.
+        Setup summary: Two search results, one resort fails; verify one batch call and per-result outcome.
         """
         # Arrange
         service = InternalSearchService(
@@ -1084,18 +1089,31 @@ class TestInternalSearchService:
             logger=mock_logger,
         )
         sorted_chunks = sample_content_chunks[::-1]
-        resort_result = Mock()
-        resort_result.content_chunks = sorted_chunks
-        mock_chunk_relevancy_sorter.run = AsyncMock(return_value=resort_result)
+        error = ChunkRelevancySorterException(
+            error_message="Sorting failed", user_message="Sorting failed"
+        )
+        mock_chunk_relevancy_sorter.run_batch = AsyncMock(
+            return_value=[ChunkRelevancySorterResult.from_chunks(sorted_chunks), error]
+        )
+        search_results = [
+            SearchStringResult(query="query 1", chunks=sample_content_chunks),
+            SearchStringResult(query="query 2", chunks=sample_content_chunks),
+        ]
 
         # Act
-        result = await service._resort_found_chunks_if_enabled(
-            found_chunks=sample_content_chunks, search_string="test query"
-        )
+        await service._resort_found_chunks_if_enabled(search_results)
 
         # Assert
-        assert result == sorted_chunks
-        mock_chunk_relevancy_sorter.run.assert_called_once()
+        assert search_results[0].chunks == sorted_chunks
+        assert search_results[1].chunks == sample_content_chunks
+        mock_chunk_relevancy_sorter.run_batch.assert_called_once_with(
+            inputs=[
+                ("query 1", sample_content_chunks),
+                ("query 2", sample_content_chunks),
+            ],
+            config=base_internal_search_config.chunk_relevancy_sort_config,
+        )
+        mock_logger.warning.assert_called_once()
 
     @pytest.mark.ai
     @pytest.mark.asyncio
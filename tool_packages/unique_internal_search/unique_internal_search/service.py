@@ -201,11 +201,7 @@ class InternalSearchService:
         # Apply chunk relevancy sorter if enabled
         if self.config.chunk_relevancy_sort_config.enabled:
             await log_progress("_Resorting search results_")
-            for result in found_chunks_per_search_string:
-                result.chunks = await self._resort_found_chunks_if_enabled(
-                    found_chunks=result.chunks,
-                    search_string=result.query,
-                )
+            await self._resort_found_chunks_if_enabled(found_chunks_per_search_string)
 
         ###
         # 3. Pick a subset of the search results
@@ -308,28 +304,35 @@ class InternalSearchService:
         return successful_results
 
     async def _resort_found_chunks_if_enabled(
-        self, found_chunks: list[ContentChunk], search_string: str
-    ) -> list[ContentChunk]:
-        try:
-            total_chunks = len(found_chunks)
-            self.logger.info(f"Resorting {total_chunks} search result...")
-            chunk_relevancy_sorter_result = await self.chunk_relevancy_sorter.run(
-                input_text=search_string,
-                chunks=found_chunks,
-                config=self.config.chunk_relevancy_sort_config,
-            )
-            if isinstance(chunk_relevancy_sorter_result.relevancies, list):
-                collector.record_invocation_stats(
-                    invocation
-                    for relevancy in chunk_relevancy_sorter_result.relevancies
-                    if relevancy.relevancy is not None
-                    for invocation in relevancy.relevancy.invocation_stats
+        self, search_results: list[SearchStringResult]
+    ) -> None:
+        """
+        Resort the chunks of all search strings in one batch, in place.
+
+        Search strings whose resort fails keep their original order.
+        """
+        total_chunks = sum(len(result.chunks) for result in search_results)
+        self.logger.info(
+            f"Resorting {total_chunks} search results of "
+            f"{len(search_results)} search strings..."
+        )
+        sorter_results = await self.chunk_relevancy_sorter.run_batch(
+            inputs=[(result.query, result.chunks) for result in search_results],
+            config=self.config.chunk_relevancy_sort_config,
+        )
+        for result, sorter_result in zip(search_results, sorter_results):
+            if isinstance(sorter_result, ChunkRelevancySorterException):
+                self.logger.warning(
+                    f"Error while sorting chunks: {sorter_result.error_message}"
                 )
-            found_chunks = chunk_relevancy_sorter_result.content_chunks
-        except ChunkRelevancySorterException as e:
-            self.logger.warning(f"Error while sorting chunks: {e.error_message}")
-        finally:
-            return found_chunks
+                continue
+            collector.record_invocation_stats(
+                invocation
+                for relevancy in sorter_result.relevancies
+                if relevancy.relevancy is not None
+                for invocation in relevancy.relevancy.invocation_stats
+            )
+            result.chunks = sorter_result.content_chunks
 
     def _get_max_tokens(self) -> int:
         if self.config.language_model_max_input_tokens is not None:
@@ -1,3 +1,4 @@
+import asyncio
 import json
 from collections import defaultdict
 from logging import getLogger
@@ -12,12 +13,19 @@ from unique_swot.services.generation.agentic.config import AgenticGeneratorConfi
 from unique_swot.services.generation.agentic.exceptions import (
     FailedToExtractFactsException,
 )
-from unique_swot.services.generation.agentic.executor import AgenticPlanExecutor
+from unique_swot.services.generation.agentic.executor import (
+    AgenticPlanExecutor,
+    ExecutionMode,
+)
 from unique_swot.services.generation.agentic.operations import (
     extract_facts,
     handle_accumulated_generate_operation,
     handle_generate_operation,
 )
+from unique_swot.services.generation.agentic.scheduler import (
+    ExtractionScheduler,
+    get_model_rate_limiter,
+)
 from unique_swot.services.generation.agentic.utils import (
     batch_sequence_generator,
     create_batch_notification,
@@ -182,96 +190,77 @@ class GenerationAgent:
         progress_notifier.step_size = step_size
 
         components_step = plan.convert_plan_to_list_of_steps()
-        accumulated_facts: dict[SWOTComponent, list[str]] = defaultdict(list)
-
-        # Phase 1 — extract facts from every source
-        async for content in tqdm(
-            source_iterator, total=total_steps, desc="Extracting facts"
-        ):
-            await progress_notifier.update(progress=next(progress_sequence))
-
-            source_selection_result = await source_selector.select(
-                company_name=self._company_name,
-                content=content,
-                step_notifier=step_notifier,
-            )
-
-            if not source_selection_result.should_select:
-                _LOGGER.info("Skipping source because it is not selected")
-                continue
-
-            _LOGGER.info("Selecting source for extraction")
-
-            source_batches = self._prepare_source_batches(
-                content=content, source_registry=source_registry
-            )
-
-            document_title = get_content_chunk_title(content)
-            self.notification_title = f"**Extracting from `{document_title}`**"
-
-            document_reference = convert_content_chunk_to_reference(
-                content_or_chunk=content,
-            )
-            await step_notifier.notify(
-                title=self.notification_title,
-                sources=[document_reference],
-                progress=0,
-            )
-
-            batches = list(
-                batch_sequence_generator(
-                    language_model=self._llm,
-                    source_batches=source_batches,
-                    max_tokens_per_extraction_batch=self._config.max_tokens_per_extraction_batch,
-                    serializer=json.dumps,
-                )
-            )
-
-            if len(batches) > 1:
-                await step_notifier.notify(
-                    title=self.notification_title,
-                    description=f"This document is too large to extract. It will be split into {len(batches)} batches.",
+        requested_components = [
+            comp
+            for comp, step in components_step
+            if step.operation != SWOTOperation.NOT_REQUESTED
+        ]
+        scheduler = self._get_extraction_scheduler()
+
+        # Phase 1 — extract facts from every source. Sources are selected one
+        # after another; the extractions of a selected source run in the
+        # background while the next sources are selected.
+        extractions: list[asyncio.Task[dict[SWOTComponent, list[str]]]] = []
+        try:
+            async for content in tqdm(
+                source_iterator, total=total_steps, desc="Extracting facts"
+            ):
+                await progress_notifier.update(progress=next(progress_sequence))
+
+                source_selection_result = await source_selector.select(
+                    company_name=self._company_name,
+                    content=content,
+                    step_notifier=step_notifier,
                 )
 
-            for component, step in components_step:
-                if step.operation == SWOTOperation.NOT_REQUESTED:
+                if not source_selection_result.should_select:
+                    _LOGGER.info("Skipping source because it is not selected")
                     continue
 
-                for i, batch in enumerate(batches, start=1):
-                    await step_notifier.notify(
-                        title=self.notification_title,
-                        description=create_batch_notification(
-                            component=component.value,
-                            batch_index=i,
-                            total_batches=len(batches),
-                        ),
+                _LOGGER.info("Selecting source for extraction")
+
+                # Chunks are registered here, in source order, so citation ids
+                # do not depend on the order in which extractions finish.
+                source_batches = self._prepare_source_batches(
+                    content=content, source_registry=source_registry
+                )
+                batches = list(
+                    batch_sequence_generator(
+                        language_model=self._llm,
+                        source_batches=source_batches,
+                        max_tokens_per_extraction_batch=self._config.max_tokens_per_extraction_batch,
+                        serializer=json.dumps,
                     )
-                    try:
-                        facts = await extract_facts(
-                            company_name=self._company_name,
-                            component=component,
-                            source_batches=batch,
+                )
+                extractions.append(
+                    asyncio.create_task(
+                        self._extract_document_facts(
+                            content=content,
+                            batches=batches,
+                            components=requested_components,
+                            scheduler=scheduler,
                             step_notifier=step_notifier,
-                            llm=self._llm,
-                            llm_service=self._llm_service,
-                            notification_title=self.notification_title,
-                            prompts_config=self._config.prompts_config.extraction_prompt_config,
-                            component_definition_prompt_config=self._config.prompts_config.definition_prompt_config,
-                        )
-                        accumulated_facts[component].extend(facts)
-                    except FailedToExtractFactsException:
-                        _LOGGER.warning(
-                            f"Extraction failed for {component} from {document_title}, batch {i}. Continuing."
                         )
+                    )
+                )
 
-            await step_notifier.notify(
-                title=self.notification_title,
-                progress=100,
-                description=f"Completed extracting from {document_title}!",
-                completed=True,
-            )
+            document_facts = await asyncio.gather(*extractions)
+        except BaseException:
+            for extraction in extractions:
+                extraction.cancel()
+            raise
+
+        # Merge in source order so the facts of a component do not depend on
+        # which extraction finished first.
+        accumulated_facts: dict[SWOTComponent, list[str]] = defaultdict(list)
+        for facts_by_component in document_facts:
+            for component in requested_components:
+                accumulated_facts[component].extend(
+                    facts_by_component.get(component, [])
+                )
 
-        # Phase 2 — cluster and generate per component
+        # Phase 2 — cluster and generate the components, concurrently unless
+        # the executor is sequential
         self.notification_title = "**Generating SWOT report sections**"
         await step_notifier.notify(
             title=self.notification_title,
@@ -279,29 +268,21 @@ class GenerationAgent:
             progress=0,
         )
 
-        requested_components = [
-            comp
-            for comp, step in components_step
-            if step.operation != SWOTOperation.NOT_REQUESTED
-        ]
         total_components = len(requested_components)
+        completed_components = 0
 
-        for idx, component in enumerate(requested_components):
-            facts = accumulated_facts.get(component, [])
-            if not facts:
-                _LOGGER.warning(
-                    f"No facts accumulated for component {component}. Skipping."
-                )
-                continue
-
+        async def _generate_component(component: SWOTComponent, facts: list[str]):
+            nonlocal completed_components
             fact_id_map = {generate_unique_id("fact_"): f for f in facts}
 
             await step_notifier.notify(
                 title=self.notification_title,
                 description=f"Clustering and generating sections for {component.value}...",
-                progress=int(idx / total_components * 100),
             )
 
+            # Each component gets its own executor: the queue of a shared one
+            # would mix the commands of components generated at the same time.
+            # Forks share the concurrency limit of the agent's executor.
             await handle_accumulated_generate_operation(
                 component=component,
                 fact_id_map=fact_id_map,
@@ -311,13 +292,42 @@ class GenerationAgent:
                 llm_service=self._llm_service,
                 notification_title=self.notification_title,
                 swot_report_registry=self._swot_report_registry,
-                executor=self._executor,
+                executor=self._executor.fork(),
                 config=self._config,
             )
 
-            await progress_notifier.increment(
-                fraction=1 / total_components if total_components else 1,
+            completed_components += 1
+            await step_notifier.notify(
+                title=self.notification_title,
+                description=f"Generated sections for {component.value}.",
+                progress=int(completed_components / total_components * 100),
             )
+            await progress_notifier.increment(fraction=1 / total_components)
+
+        component_facts: list[tuple[SWOTComponent, list[str]]] = []
+        for component in requested_components:
+            facts = accumulated_facts.get(component, [])
+            if not facts:
+                _LOGGER.warning(
+                    f"No facts accumulated for component {component}. Skipping."
+                )
+                continue
+            component_facts.append((component, facts))
+
+        if self._executor.execution_mode == ExecutionMode.SEQUENTIAL:
+            for component, facts in component_facts:
+                await _generate_component(component, facts)
+        else:
+            generations = [
+                asyncio.create_task(_generate_component(component, facts))
+                for component, facts in component_facts
+            ]
+            try:
+                await asyncio.gather(*generations)
+            except BaseException:
+                for generation in generations:
+                    generation.cancel()
+                raise
 
         await step_notifier.notify(
             title=self.notification_title,
@@ -328,6 +338,106 @@ class GenerationAgent:
 
         return self._get_swot_report_components()
 
+    async def _extract_document_facts(
+        self,
+        *,
+        content: Content,
+        batches: list[list[dict[str, str]]],
+        components: list[SWOTComponent],
+        scheduler: ExtractionScheduler,
+        step_notifier: StepNotifier,
+    ) -> dict[SWOTComponent, list[str]]:
+        """
+        Extract the facts of every component from every batch of one document.
+
+        All (component, batch) extractions are submitted to the scheduler at
+        once; the facts of a component are returned in batch order.
+        """
+        document_title = get_content_chunk_title(content)
+        notification_title = f"**Extracting from `{document_title}`**"
+
+        document_reference = convert_content_chunk_to_reference(
+            content_or_chunk=content,
+        )
+        await step_notifier.notify(
+            title=notification_title,
+            sources=[document_reference],
+            progress=0,
+        )
+
+        if len(batches) > 1:
+            await step_notifier.notify(
+                title=notification_title,
+                description=f"This document is too large to extract. It will be split into {len(batches)} batches.",
+            )
+
+        jobs = [
+            (component, index, batch)
+            for component in components
+            for index, batch in enumerate(batches, start=1)
+        ]
+        completed_jobs = 0
+
+        async def _extract(
+            component: SWOTComponent, index: int, batch: list[dict[str, str]]
+        ) -> list[str]:
+            nonlocal completed_jobs
+            try:
+                facts = await scheduler.run(
+                    extract_facts,
+                    company_name=self._company_name,
+                    component=component,
+                    source_batches=batch,
+                    step_notifier=step_notifier,
+                    llm=self._llm,
+                    llm_service=self._llm_service,
+                    notification_title=notification_title,
+                    prompts_config=self._config.prompts_config.extraction_prompt_config,
+                    component_definition_prompt_config=self._config.prompts_config.definition_prompt_config,
+                )
+            except FailedToExtractFactsException:
+                _LOGGER.warning(
+                    f"Extraction failed for {component} from {document_title}, batch {index}. Continuing."
+                )
+                facts = []
+
+            completed_jobs += 1
+            await step_notifier.notify(
+                title=notification_title,
+                progress=int(completed_jobs / len(jobs) * 100),
+                description=create_batch_notification(
+                    component=component.value,
+                    batch_index=index,
+                    total_batches=len(batches),
+                ),
+            )
+            return facts
+
+        results = await asyncio.gather(*(_extract(*job) for job in jobs))
+
+        facts_by_component: dict[SWOTComponent, list[str]] = defaultdict(list)
+        for (component, _, _), facts in zip(jobs, results):
+            facts_by_component[component].extend(facts)
+
+        await step_notifier.notify(
+            title=notification_title,
+            progress=100,
+            description=f"Completed extracting from {document_title}!",
+            completed=True,
+        )
+        return facts_by_component
+
+    def _get_extraction_scheduler(self) -> ExtractionScheduler:
+        rate_limiter = None
+        if self._config.max_extraction_requests_per_minute is not None:
+            rate_limiter = get_model_rate_limiter(
+                str(self._llm.name), self._config.max_extraction_requests_per_minute
+            )
+        return ExtractionScheduler(
+            max_concurrent_jobs=self._config.max_concurrent_extractions,
+            rate_limiter=rate_limiter,
+        )
+
     async def _generation_step(
         self,
         *,
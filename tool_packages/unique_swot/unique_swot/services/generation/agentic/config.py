@@ -16,6 +16,16 @@ class AgenticGeneratorConfig(BaseModel):
         default=10,
         description="The maximum number of concurrent tasks to use for the agentic generator. Only used if execution mode is concurrent.",
     )
+    max_concurrent_extractions: int = Field(
+        default=8,
+        ge=1,
+        description="The maximum number of fact extractions (document, component and batch) to run concurrently in extract-first mode.",
+    )
+    max_extraction_requests_per_minute: int | None = Field(
+        default=None,
+        ge=1,
+        description="The maximum number of fact extraction requests per minute sent to the language model. Unlimited if not set.",
+    )
     max_tokens_per_extraction_batch: int = Field(
         default=262_144,
         description="The maximum number of tokens to use for the extraction batch. Only used if execution mode is sequential.",
@@ -20,10 +20,31 @@ class AgenticPlanExecutor:
     ):
         self._execution_mode = execution_mode
         self._max_concurrent_tasks = max_concurrent_tasks or 10
+        # Shared with forks so executors running at the same time stay within
+        # one budget of max_concurrent_tasks.
+        self._semaphore = asyncio.Semaphore(self._max_concurrent_tasks)
         self._queue: list[
             tuple[Callable[..., Awaitable[Any]], tuple[Any, ...], dict[str, Any]]
         ] = []
 
+    @property
+    def execution_mode(self) -> ExecutionMode:
+        return self._execution_mode
+
+    def fork(self) -> "AgenticPlanExecutor":
+        """
+        Return an executor with the same settings and its own, empty queue.
+
+        The fork shares the concurrency limit of this executor, so concurrent
+        runs of both never exceed max_concurrent_tasks tasks in total.
+        """
+        forked = AgenticPlanExecutor(
+            execution_mode=self._execution_mode,
+            max_concurrent_tasks=self._max_concurrent_tasks,
+        )
+        forked._semaphore = self._semaphore
+        return forked
+
     def add(self, fn: Callable[..., Awaitable[Any]], /, *args: Any, **kwargs: Any):
         """Register an awaitable function with its arguments."""
         self._queue.append((fn, args, kwargs))
@@ -54,7 +75,7 @@ class AgenticPlanExecutor:
         return results
 
     async def _run_concurrent(self) -> Sequence[Exception | Any]:
-        semaphore = asyncio.Semaphore(self._max_concurrent_tasks)
+        semaphore = self._semaphore
 
         async def _runner(
             fn: Callable[..., Awaitable[Any]],
@@ -0,0 +1,66 @@
+import asyncio
+import time
+from typing import Awaitable, Callable, TypeVar
+
+T = TypeVar("T")
+
+
+class ModelRateLimiter:
+    """
+    Space out request starts so a model receives at most
+    ``requests_per_minute`` requests per minute.
+
+    Slots are reserved without awaiting, so the limiter needs no lock and can
+    be shared by every scheduler that calls the same model.
+    """
+
+    def __init__(self, requests_per_minute: int):
+        self._interval = 60 / requests_per_minute
+        self._next_slot = 0.0
+
+    async def acquire(self) -> None:
+        now = time.monotonic()
+        slot = max(now, self._next_slot)
+        self._next_slot = slot + self._interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+
+_MODEL_RATE_LIMITERS: dict[tuple[str, int], ModelRateLimiter] = {}
+
+
+def get_model_rate_limiter(
+    model_name: str, requests_per_minute: int
+) -> ModelRateLimiter:
+    """Return the process-wide rate limiter of a model."""
+    key = (model_name, requests_per_minute)
+    if key not in _MODEL_RATE_LIMITERS:
+        _MODEL_RATE_LIMITERS[key] = ModelRateLimiter(requests_per_minute)
+    return _MODEL_RATE_LIMITERS[key]
+
+
+class ExtractionScheduler:
+    """
+    Run independent extraction jobs concurrently.
+
+    Jobs are submitted as soon as they are known (one per document, component
+    and token batch) and share one concurrency limit and, optionally, the rate
+    limit of the model they call. Unlike ``AgenticPlanExecutor`` it does not
+    queue jobs: callers await each job and decide how to combine the results.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_concurrent_jobs: int,
+        rate_limiter: ModelRateLimiter | None = None,
+    ):
+        self._semaphore = asyncio.Semaphore(max_concurrent_jobs)
+        self._rate_limiter = rate_limiter
+
+    async def run(self, fn: Callable[..., Awaitable[T]], /, *args, **kwargs) -> T:
+        """Run ``fn`` once a concurrency slot and a rate-limit slot are free."""
+        async with self._semaphore:
+            if self._rate_limiter is not None:
+                await self._rate_limiter.acquire()
+            return await fn(*args, **kwargs)
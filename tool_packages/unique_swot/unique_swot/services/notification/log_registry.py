@@ -1,3 +1,4 @@
+import asyncio
 from typing import Self
 
 from pydantic import BaseModel
@@ -89,8 +90,18 @@ class MessageLogRegistryItem(BaseModel):
 
 
 class LogRegistry:
+    """
+    Message logs keyed by title.
+
+    Steps may notify concurrently. Notifications with the same title are
+    applied one at a time, so a log is created once and its updates are sent
+    in the order the notifications were made.
+    """
+
     def __init__(self):
         self._log_registry: dict[str, MessageLogRegistryItem] = {}
+        self._locks: dict[str, asyncio.Lock] = {}
+        self._orders: dict[str, int] = {}
         self._total_number_of_references: int = 0
 
     async def add(
@@ -106,26 +117,31 @@ class LogRegistry:
         if sources:
             for index, source in enumerate(sources):
                 source.sequence_number = index + self._total_number_of_references
-
-        if title not in self._log_registry:
-            if progress is None:
-                progress = 0
-            self._log_registry[title] = await MessageLogRegistryItem.create(
-                chat_service=chat_service,
-                order=len(self._log_registry) + 99,
-                message_id=message_id,
-                title=title,
-                description=description,
-                sources=sources,
-                progress=progress,
-                completed=completed,
-            )
-        else:
-            await self._log_registry[title].update(
-                chat_service=chat_service,
-                description=description,
-                sources=sources,
-                progress=progress,
-                completed=completed,
-            )
         self._total_number_of_references += len(sources)
+
+        # Reserve the position before awaiting the creation so logs that are
+        # created concurrently keep the order they were notified in.
+        order = self._orders.setdefault(title, len(self._orders) + 99)
+
+        async with self._locks.setdefault(title, asyncio.Lock()):
+            if title not in self._log_registry:
+                if progress is None:
+                    progress = 0
+                self._log_registry[title] = await MessageLogRegistryItem.create(
+                    chat_service=chat_service,
+                    order=order,
+                    message_id=message_id,
+                    title=title,
+                    description=description,
+                    sources=sources,
+                    progress=progress,
+                    completed=completed,
+                )
+            else:
+                await self._log_registry[title].update(
+                    chat_service=chat_service,
+                    description=description,
+                    sources=sources,
+                    progress=progress,
+                    completed=completed,
+                )
@@ -0,0 +1,72 @@
+"""Tests for the ExtractionScheduler and ModelRateLimiter."""
+
+import asyncio
+import time
+
+import pytest
+
+from unique_swot.services.generation.agentic.scheduler import (
+    ExtractionScheduler,
+    ModelRateLimiter,
+    get_model_rate_limiter,
+)
+
+
+@pytest.mark.asyncio
+@pytest.mark.ai
+async def test_extraction_scheduler__limits_concurrent_jobs() -> None:
+    """
+    Purpose: Verify the scheduler never runs more jobs at once than its limit.
+    Why this matters: The limit protects the language model from bursts of requests.
+    Setup summary: Run 10 jobs with a limit of 3, track the peak number of running jobs.
+    """
+    scheduler = ExtractionScheduler(max_concurrent_jobs=3)
+    running = 0
+    peak = 0
+
+    async def _job(value: int) -> int:
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return value
+
+    results = await asyncio.gather(*(scheduler.run(_job, i) for i in range(10)))
+
+    assert results == list(range(10))
+    assert peak == 3
+
+
+@pytest.mark.asyncio
+@pytest.mark.ai
+async def test_extraction_scheduler__spaces_job_starts__with_rate_limiter() -> None:
+    """
+    Purpose: Verify jobs start no faster than the model's requests per minute.
+    Why this matters: Concurrent extraction must not exceed the model's rate limit.
+    Setup summary: 1200 requests per minute (50ms apart), run 3 jobs, check the spacing.
+    """
+    scheduler = ExtractionScheduler(
+        max_concurrent_jobs=10, rate_limiter=ModelRateLimiter(1200)
+    )
+    starts: list[float] = []
+
+    async def _job() -> None:
+        starts.append(time.monotonic())
+
+    await asyncio.gather(*(scheduler.run(_job) for _ in range(3)))
+
+    assert starts[2] - starts[0] >= 0.09
+
+
+@pytest.mark.ai
+def test_get_model_rate_limiter__shares_limiter__per_model() -> None:
+    """
+    Purpose: Verify one limiter is shared by all callers of the same model.
+    Why this matters: Concurrent reports on one model must share its request budget.
+    Setup summary: Request limiters for two models, compare identities.
+    """
+    limiter = get_model_rate_limiter("model_a", 60)
+
+    assert get_model_rate_limiter("model_a", 60) is limiter
+    assert get_model_rate_limiter("model_b", 60) is not limiter
@@ -1,11 +1,16 @@
 """Tests for the GenerationAgent."""
 
+import asyncio
 from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 from unique_toolkit.content import Content, ContentChunk
 
 from unique_swot.services.generation.agentic.agent import GenerationAgent
+from unique_swot.services.generation.agentic.executor import (
+    AgenticPlanExecutor,
+    ExecutionMode,
+)
 from unique_swot.services.generation.config import GenerationMode
 from unique_swot.services.generation.context import SWOTComponent
 from unique_swot.services.generation.models.base import (
@@ -96,6 +101,8 @@ def _make_agent(
     """Helper to create a GenerationAgent with standard mocks."""
     config = Mock()
     config.max_tokens_per_extraction_batch = 1000
+    config.max_concurrent_extractions = 4
+    config.max_extraction_requests_per_minute = None
 
     return GenerationAgent(
         company_name="ACME Corp",
@@ -859,3 +866,217 @@ async def test_generation_agent__extract_first__skips_component_with_no_facts(
         )
 
         mock_accumulated.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+@pytest.mark.ai
+async def test_generation_agent__extract_first__extracts_concurrently__merges_in_source_order(
+    mock_llm,
+    mock_language_model_service,
+    mock_swot_report_registry,
+    mock_agentic_executor,
+    mock_step_notifier,
+    mock_progress_notifier,
+) -> None:
+    """
+    Purpose: Verify extractions of all sources run concurrently and facts merge in source order.
+    Why this matters: Serialized extraction made large reports slow; the report must not
+        depend on which extraction finished first.
+    Setup summary: Two sources whose extractions wait for each other and finish in reverse
+        order, verify both run at once and facts keep the source order.
+    """
+    source_registry = Mock()
+    source_registry.register.return_value = "chunk_id"
+    source_selector = _make_source_selector(should_select=True)
+
+    agent = _make_agent(
+        mock_llm,
+        mock_language_model_service,
+        mock_swot_report_registry,
+        mock_agentic_executor,
+        generation_mode=GenerationMode.EXTRACT_FIRST,
+    )
+
+    both_started = asyncio.Event()
+    started: list[str] = []
+
+    async def _extract_facts(**kwargs):
+        title = kwargs["notification_title"]
+        started.append(title)
+        if len(started) == 2:
+            both_started.set()
+        await asyncio.wait_for(both_started.wait(), timeout=1)
+        # The first source finishes last
+        if "First" in title:
+            await asyncio.sleep(0.01)
+        return [f"fact from {title}"]
+
+    with (
+        patch(
+            "unique_swot.services.generation.agentic.agent.extract_facts",
+            new=_extract_facts,
+        ),
+        patch(
+            "unique_swot.services.generation.agentic.agent.handle_accumulated_generate_operation",
+            new_callable=AsyncMock,
+        ) as mock_accumulated,
+    ):
+        await agent.generate(
+            plan=_make_plan(),
+            total_steps=2,
+            source_iterator=_async_content_iter(
+                _make_content("content_1", "First"),
+                _make_content("content_2", "Second"),
+            ),
+            source_selector=source_selector,
+            source_registry=source_registry,
+            step_notifier=mock_step_notifier,
+            progress_notifier=mock_progress_notifier,
+        )
+
+    fact_id_map = mock_accumulated.call_args.kwargs["fact_id_map"]
+    assert list(fact_id_map.values()) == [
+        "fact from **Extracting from `First`**",
+        "fact from **Extracting from `Second`**",
+    ]
+
+
+def _make_two_component_plan():
+    """Helper to create a SWOTPlan generating strengths and weaknesses."""
+    return SWOTPlan(
+        objective="Test analysis",
+        strengths=SWOTStepPlan(
+            operation=SWOTOperation.GENERATE, modify_instruction=None
+        ),
+        weaknesses=SWOTStepPlan(
+            operation=SWOTOperation.GENERATE, modify_instruction=None
+        ),
+        opportunities=SWOTStepPlan(
+            operation=SWOTOperation.NOT_REQUESTED, modify_instruction=None
+        ),
+        threats=SWOTStepPlan(
+            operation=SWOTOperation.NOT_REQUESTED, modify_instruction=None
+        ),
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.ai
+async def test_generation_agent__extract_first__generates_components_one_by_one__when_sequential(
+    mock_llm,
+    mock_language_model_service,
+    mock_swot_report_registry,
+    mock_step_notifier,
+    mock_progress_notifier,
+) -> None:
+    """
+    Purpose: Verify a sequential executor generates the components one after another.
+    Why this matters: execution_mode=SEQUENTIAL must hold for the whole report, not
+        only within one component.
+    Setup summary: Two requested components with a sequential executor, record how
+        many generations run at once.
+    """
+    source_registry = Mock()
+    source_registry.register.return_value = "chunk_id"
+    agent = _make_agent(
+        mock_llm,
+        mock_language_model_service,
+        mock_swot_report_registry,
+        AgenticPlanExecutor(execution_mode=ExecutionMode.SEQUENTIAL),
+        generation_mode=GenerationMode.EXTRACT_FIRST,
+    )
+
+    running = 0
+    max_running = 0
+
+    async def _generate(**kwargs):
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+
+    with (
+        patch(
+            "unique_swot.services.generation.agentic.agent.extract_facts",
+            new_callable=AsyncMock,
+            return_value=["fact"],
+        ),
+        patch(
+            "unique_swot.services.generation.agentic.agent.handle_accumulated_generate_operation",
+            new=_generate,
+        ),
+    ):
+        await agent.generate(
+            plan=_make_two_component_plan(),
+            total_steps=1,
+            source_iterator=_async_content_iter(_make_content()),
+            source_selector=_make_source_selector(should_select=True),
+            source_registry=source_registry,
+            step_notifier=mock_step_notifier,
+            progress_notifier=mock_progress_notifier,
+        )
+
+    assert max_running == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.ai
+async def test_generation_agent__extract_first__cancels_other_components__when_one_fails(
+    mock_llm,
+    mock_language_model_service,
+    mock_swot_report_registry,
+    mock_step_notifier,
+    mock_progress_notifier,
+) -> None:
+    """
+    Purpose: Verify a failing component generation cancels the ones still running.
+    Why this matters: Siblings left running keep calling the LLM after the report
+        has already failed.
+    Setup summary: Concurrent executor, strengths fails while weaknesses waits,
+        verify the error propagates and weaknesses is cancelled.
+    """
+    source_registry = Mock()
+    source_registry.register.return_value = "chunk_id"
+    agent = _make_agent(
+        mock_llm,
+        mock_language_model_service,
+        mock_swot_report_registry,
+        AgenticPlanExecutor(execution_mode=ExecutionMode.CONCURRENT),
+        generation_mode=GenerationMode.EXTRACT_FIRST,
+    )
+
+    sibling_cancelled = asyncio.Event()
+
+    async def _generate(**kwargs):
+        if kwargs["component"] == SWOTComponent.STRENGTHS:
+            raise RuntimeError("generation failed")
+        try:
+            await asyncio.sleep(5)
+        except asyncio.CancelledError:
+            sibling_cancelled.set()
+            raise
+
+    with (
+        patch(
+            "unique_swot.services.generation.agentic.agent.extract_facts",
+            new_callable=AsyncMock,
+            return_value=["fact"],
+        ),
+        patch(
+            "unique_swot.services.generation.agentic.agent.handle_accumulated_generate_operation",
+            new=_generate,
+        ),
+        pytest.raises(RuntimeError, match="generation failed"),
+    ):
+        await agent.generate(
+            plan=_make_two_component_plan(),
+            total_steps=1,
+            source_iterator=_async_content_iter(_make_content()),
+            source_selector=_make_source_selector(should_select=True),
+            source_registry=source_registry,
+            step_notifier=mock_step_notifier,
+            progress_notifier=mock_progress_notifier,
+        )
+
+    await asyncio.wait_for(sibling_cancelled.wait(), timeout=1)
@@ -202,3 +202,42 @@ async def test_executor_default_max_concurrent_tasks():
 
     # All tasks should complete
     assert len(results) == 15
+
+
+@pytest.mark.asyncio
+async def test_executor_fork_has_own_queue():
+    """Test that a forked executor runs only its own tasks."""
+    executor = AgenticPlanExecutor(execution_mode=ExecutionMode.CONCURRENT)
+    forked = executor.fork()
+
+    executor.add(_success_task, 1)
+    forked.add(_success_task, 2)
+
+    assert await forked.run() == [4]
+    assert await executor.run() == [2]
+
+
+@pytest.mark.asyncio
+async def test_executor_forks_share_max_concurrent_tasks():
+    """Test that forks running at the same time share one concurrency limit."""
+    running = 0
+    max_running = 0
+
+    async def _tracked_task():
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+
+    executor = AgenticPlanExecutor(
+        execution_mode=ExecutionMode.CONCURRENT, max_concurrent_tasks=2
+    )
+    forks = [executor.fork(), executor.fork()]
+    for forked in forks:
+        for _ in range(3):
+            forked.add(_tracked_task)
+
+    await asyncio.gather(*(forked.run() for forked in forks))
+
+    assert max_running == 2
@@ -1,5 +1,6 @@
 """Tests for the LogRegistry and MessageLogRegistryItem."""
 
+import asyncio
 from unittest.mock import AsyncMock, Mock
 
 import pytest
@@ -556,3 +557,40 @@ async def test_log_registry_text_formatting(mock_chat_service):
     assert "_66%_" in updated_text
     assert "First step" in updated_text
     assert "Second step" in updated_text
+
+
+@pytest.mark.asyncio
+async def test_log_registry_concurrent_notifications_create_log_once(
+    mock_chat_service,
+):
+    """Test that concurrent notifications with one title create a single log."""
+
+    async def _slow_create(**kwargs):
+        await asyncio.sleep(0.01)
+        return Mock(message_log_id=f"log_{kwargs['order']}")
+
+    mock_chat_service.create_message_log_async = AsyncMock(side_effect=_slow_create)
+    registry = LogRegistry()
+
+    await asyncio.gather(
+        *(
+            registry.add(
+                chat_service=mock_chat_service,
+                message_id="msg_123",
+                title=title,
+                description=f"Step {index}",
+            )
+            for index, title in enumerate(["Task A", "Task B", "Task A", "Task A"])
+        )
+    )
+
+    assert mock_chat_service.create_message_log_async.call_count == 2
+    assert registry._log_registry["Task A"].order == 99
+    assert registry._log_registry["Task B"].order == 100
+    assert registry._log_registry["Task A"].description == [
+        "Step 0",
+        "Step 2",
+        "Step 3",
+    ]
+    last_text = mock_chat_service.update_message_log_async.call_args.kwargs["text"]
+    assert "Step 3" in last_text
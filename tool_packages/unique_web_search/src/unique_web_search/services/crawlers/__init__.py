@@ -13,7 +13,7 @@ from unique_web_search.services.crawlers.registry import (
 CRAWLER_REGISTRY.autodiscover(
     __path__,
     __name__,
-    exclude=frozenset({"url_safety", "utils", "registry"}),
+    exclude=frozenset({"url_safety", "utils", "registry", "markdown_pool"}),
 )
 
 from unique_web_search.services.crawlers.basic import (  # noqa: E402
@@ -3,9 +3,7 @@ import logging
 import re
 from typing import Annotated
 
-import timeout_decorator
 from httpx import AsyncClient, Timeout
-from markdownify import markdownify
 from pydantic import Field
 from typing_extensions import override
 from unique_search_proxy_core.context import LOCAL_REQUEST_CONTEXT, RequestContext
@@ -20,6 +18,10 @@ from unique_toolkit._common.pydantic.rjsf_tags import RJSFMetaTag
 
 from unique_web_search.services.client.proxy_config import async_client
 from unique_web_search.services.crawlers.base import BaseCrawler
+from unique_web_search.services.crawlers.markdown_pool import (
+    MarkdownConversionError,
+    markdownify_html,
+)
 from unique_web_search.services.crawlers.registry import register_crawler
 from unique_web_search.services.crawlers.url_safety import (
     CrawlTargetValidationError,
@@ -143,11 +145,13 @@ class BasicCrawler(BaseCrawler[BasicConfig]):
         if self._content_type_not_allowed(content_type):
             return f"Content type {content_type} is not allowed"
 
-        content = response.text
-
-        markdown = _markdownify_html_with_timeout(content, self.config.timeout)
-
-        return markdown
+        try:
+            return await markdownify_html(response.text, self.config.timeout)
+        except MarkdownConversionError as e:
+            _LOGGER.warning(
+                "Error markdownifying HTML of %s: %s", target.normalized_url, e
+            )
+            return "Unable to markdownify HTML"
 
     def _is_url_blocked(self, url: str) -> bool:
         return any(
@@ -161,20 +165,3 @@ class BasicCrawler(BaseCrawler[BasicConfig]):
             if getattr(self.config.content_types, field_name)
         }
         return content_type not in allowed_mimes
-
-
-def _markdownify_html_with_timeout(content: str, timeout: float) -> str:
-    @timeout_decorator.timeout(timeout)
-    def _markdownify_html(content: str) -> str:
-        markdown = markdownify(
-            content,
-            heading_style="ATX",
-        )
-
-        return markdown
-
-    try:
-        return _markdownify_html(content)
-    except Exception:
-        _LOGGER.exception("Error markdownifying HTML")
-        return "Unable to markdownify HTML"
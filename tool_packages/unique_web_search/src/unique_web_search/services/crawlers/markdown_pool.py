@@ -0,0 +1,119 @@
+"""Process pool that converts crawled HTML to Markdown off the event loop.
+
+``markdownify`` is pure Python and CPU bound: converting a multi-megabyte page
+inline blocks the event loop for seconds and stalls every other request served
+by the process. Conversions are submitted to a shared process pool instead, so
+pages are converted in parallel across cores while the loop keeps serving.
+
+* Each job has a hard timeout enforced inside its worker process (signals work
+  there because the job runs on the worker's main thread), so a pathological
+  page frees its worker instead of occupying it.
+* Pages longer than ``markdown_conversion_max_html_length`` characters are
+  rejected before they are sent to a worker.
+* At most ``markdown_conversion_max_pending`` conversions per event loop are
+  queued or running; further callers wait for a slot (back-pressure).
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import threading
+import weakref
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+import timeout_decorator
+from markdownify import markdownify
+
+from unique_web_search.settings import env_settings
+
+_LOGGER = logging.getLogger(__name__)
+
+_lock = threading.Lock()
+_executor: ProcessPoolExecutor | None = None
+_pending_slots: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, asyncio.Semaphore
+] = weakref.WeakKeyDictionary()
+
+
+class MarkdownConversionError(Exception):
+    """Raised when HTML could not be converted to Markdown."""
+
+
+def _markdownify_html(content: str, timeout: float) -> str:
+    @timeout_decorator.timeout(timeout, timeout_exception=TimeoutError)
+    def _convert(content: str) -> str:
+        return markdownify(content, heading_style="ATX")
+
+    return _convert(content)
+
+
+def _get_executor() -> ProcessPoolExecutor:
+    global _executor
+    with _lock:
+        if _executor is None:
+            # Workers are spawned rather than forked: forking a process that
+            # runs an event loop and HTTP client threads is not safe.
+            _executor = ProcessPoolExecutor(
+                max_workers=env_settings.markdown_conversion_max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return _executor
+
+
+def _discard_executor(executor: ProcessPoolExecutor) -> None:
+    global _executor
+    with _lock:
+        if _executor is executor:
+            _executor = None
+    executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _get_pending_slots() -> asyncio.Semaphore:
+    loop = asyncio.get_running_loop()
+    with _lock:
+        slots = _pending_slots.get(loop)
+        if slots is None:
+            slots = _pending_slots[loop] = asyncio.Semaphore(
+                env_settings.markdown_conversion_max_pending
+            )
+        return slots
+
+
+async def markdownify_html(content: str, timeout: float) -> str:
+    """Convert ``content`` to Markdown in the shared conversion pool.
+
+    Raises:
+        MarkdownConversionError: If the page exceeds the size cap, the
+            conversion timed out or the worker failed.
+    """
+    max_length = env_settings.markdown_conversion_max_html_length
+    if len(content) > max_length:
+        raise MarkdownConversionError(
+            f"HTML of {len(content)} characters exceeds the limit of {max_length}"
+        )
+
+    async with _get_pending_slots():
+        executor = _get_executor()
+        try:
+            return await asyncio.wrap_future(
+                executor.submit(_markdownify_html, content, timeout)
+            )
+        except TimeoutError as e:
+            raise MarkdownConversionError(
+                f"Conversion timed out after {timeout} seconds"
+            ) from e
+        except BrokenProcessPool as e:
+            _LOGGER.warning("Markdown conversion pool broke, starting a new one")
+            _discard_executor(executor)
+            raise MarkdownConversionError("Conversion worker died") from e
+        except Exception as e:
+            raise MarkdownConversionError(f"Conversion failed: {e}") from e
+
+
+def shutdown_markdown_pool() -> None:
+    """Stop the conversion workers; the next conversion starts a new pool."""
+    with _lock:
+        executor = _executor
+    if executor is not None:
+        _discard_executor(executor)
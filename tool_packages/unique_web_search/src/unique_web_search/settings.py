@@ -114,6 +114,11 @@ class Base(BaseSettings):
     # LLM processor config override (JSON string matching LLMProcessorConfig schema)
     llm_process_config: str | None = None
 
+    # HTML to Markdown conversion pool of the basic crawler
+    markdown_conversion_max_workers: int | None = None  # None: one per CPU
+    markdown_conversion_max_pending: int = 64
+    markdown_conversion_max_html_length: int = 5_000_000
+
     @property
     def active_crawlers(self) -> list[str]:
         "Dynamically determine the active crawlers based on the API keys provided"
@@ -7,6 +7,7 @@ from unique_search_proxy_core.crawlers.basic.schema import BasicConfig
 
 from unique_web_search.services.crawlers import get_crawler_service
 from unique_web_search.services.crawlers.basic import BasicCrawler
+from unique_web_search.services.crawlers.markdown_pool import MarkdownConversionError
 from unique_web_search.services.crawlers.registry import CRAWLER_REGISTRY
 from unique_web_search.services.crawlers.url_safety import (
     BlockedCrawlTarget,
@@ -315,6 +316,41 @@ class TestBasicCrawlerCrawlUrl:
         assert "not allowed" in result
         client.get.assert_called_once()
 
+    @pytest.mark.ai
+    @pytest.mark.asyncio
+    async def test_crawl_url__returns_fallback__when_markdown_conversion_fails(
+        self,
+        basic_crawler: BasicCrawler,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """
+        Purpose: Verify a failed off-loop conversion yields the legacy fallback text.
+        Why this matters: Oversized or slow pages must not fail the whole crawl batch.
+        Setup summary: Make the conversion pool raise and assert the fallback string is returned.
+        """
+        response = httpx.Response(
+            200,
+            text="<html><body><p>Hello</p></body></html>",
+            headers={"content-type": "text/html"},
+            request=httpx.Request("GET", "https://example.com"),
+        )
+        client = AsyncMock(spec=httpx.AsyncClient)
+        client.get.return_value = response
+        monkeypatch.setattr(
+            "unique_web_search.services.crawlers.basic.markdownify_html",
+            AsyncMock(side_effect=MarkdownConversionError("timed out")),
+        )
+        target = ResolvedCrawlTarget(
+            normalized_url="https://example.com",
+            hostname="example.com",
+            resolved_ip="",
+            used_dns_resolution=False,
+        )
+
+        result = await basic_crawler._crawl_url_with_client(client, target)
+
+        assert result == "Unable to markdownify HTML"
+
     @pytest.mark.ai
     @pytest.mark.asyncio
     async def test_validate_urls__returns_bypass_targets__when_safety_disabled(
@@ -0,0 +1,89 @@
+import asyncio
+
+import pytest
+
+from unique_web_search.services.crawlers import markdown_pool
+from unique_web_search.services.crawlers.markdown_pool import (
+    MarkdownConversionError,
+    markdownify_html,
+    shutdown_markdown_pool,
+)
+
+
+@pytest.fixture(autouse=True)
+def _shutdown_pool():
+    yield
+    shutdown_markdown_pool()
+
+
+@pytest.mark.ai
+async def test_markdownify_html__converts_in_worker_process() -> None:
+    """
+    Purpose: Verify HTML is converted to ATX Markdown by the conversion pool.
+    Why this matters: Crawled pages must keep their structure after moving off the event loop.
+    Setup summary: Convert a small page through the pool and assert heading and text.
+    """
+    result = await markdownify_html("<h1>Title</h1><p>Body</p>", timeout=30)
+
+    assert "# Title" in result
+    assert "Body" in result
+
+
+@pytest.mark.ai
+async def test_markdownify_html__keeps_event_loop_responsive() -> None:
+    """
+    Purpose: Verify the event loop keeps running while large pages are converted.
+    Why this matters: Inline conversion of multi-megabyte pages stalled every concurrent request.
+    Setup summary: Convert several large pages while a ticker task runs, assert the ticker advanced.
+    """
+    html = "<p>" + "word " * 200_000 + "</p>"
+    ticks = 0
+
+    async def ticker() -> None:
+        nonlocal ticks
+        while True:
+            await asyncio.sleep(0.01)
+            ticks += 1
+
+    ticker_task = asyncio.create_task(ticker())
+    try:
+        results = await asyncio.gather(
+            *(markdownify_html(html, timeout=60) for _ in range(3))
+        )
+    finally:
+        ticker_task.cancel()
+
+    assert all(result.startswith("word") for result in results)
+    assert ticks > 0
+
+
+@pytest.mark.ai
+async def test_markdownify_html__raises__when_html_exceeds_size_cap(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """
+    Purpose: Verify oversized pages are rejected before reaching a worker.
+    Why this matters: Shipping huge pages to workers wastes CPU and memory on content the LLM cannot use.
+    Setup summary: Lower the size cap, convert a longer page and assert MarkdownConversionError.
+    """
+    monkeypatch.setattr(
+        markdown_pool.env_settings, "markdown_conversion_max_html_length", 10
+    )
+
+    with pytest.raises(MarkdownConversionError, match="exceeds the limit"):
+        await markdownify_html("<p>longer than ten</p>", timeout=30)
+
+
+@pytest.mark.ai
+async def test_markdownify_html__raises__when_conversion_times_out() -> None:
+    """
+    Purpose: Verify a slow conversion is aborted inside its worker.
+    Why this matters: The previous signal-based timeout only worked on the main thread.
+    Setup summary: Convert a large page with a tiny timeout, then assert a small page still converts.
+    """
+    html = "<div>" * 2000 + "<p>" + "a " * 500_000 + "</p>" + "</div>" * 2000
+
+    with pytest.raises(MarkdownConversionError, match="timed out"):
+        await markdownify_html(html, timeout=0.05)
+
+    assert await markdownify_html("<b>ok</b>", timeout=30) == "**ok**"
@@ -0,0 +1,114 @@
+"""In-process cache for Zitadel ``/userinfo`` lookups.
+
+Tools resolve the caller's identity on every invocation, so without a cache a
+chatty MCP session costs one userinfo round trip per tool call. Entries are
+keyed by a SHA-256 hash of the bearer token (the token itself is never kept),
+live until the token expires or ``max_ttl_seconds`` pass, whichever is first,
+and are evicted least-recently-used beyond ``max_entries``. Concurrent lookups
+for the same token share one request.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from typing import Generic, TypeVar
+
+from pydantic import Field
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+from unique_mcp.util.find_env_file import find_env_file
+
+T = TypeVar("T")
+
+
+class UserinfoCacheSettings(BaseSettings):
+    model_config = SettingsConfigDict(
+        env_file=find_env_file(filenames=["zitadel.env", ".env"], required=False),
+        env_prefix="ZITADEL_USERINFO_CACHE_",
+        extra="allow",
+    )
+
+    max_ttl_seconds: float = Field(
+        default=300.0,
+        ge=0,
+        description=(
+            "Upper bound on how long a userinfo response is reused, also for "
+            "tokens that expire later. 0 disables caching."
+        ),
+    )
+    max_entries: int = Field(
+        default=1024,
+        gt=0,
+        description="Number of tokens kept; the least recently used are evicted.",
+    )
+
+
+class UserinfoCache(Generic[T]):
+    """TTL + LRU cache of userinfo results with request coalescing."""
+
+    def __init__(self, settings: UserinfoCacheSettings | None = None) -> None:
+        self.settings = settings or UserinfoCacheSettings()
+        self._entries: OrderedDict[str, tuple[float, T]] = OrderedDict()
+        self._inflight: dict[str, asyncio.Task[T]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def get_or_fetch(
+        self,
+        token: str,
+        fetch: Callable[[], Awaitable[T]],
+        *,
+        scope: str = "",
+        expires_at: float | None = None,
+    ) -> T:
+        """Return the cached result for ``token`` or ``await fetch()``.
+
+        ``scope`` separates tokens used against different endpoints;
+        ``expires_at`` is the token's expiry as a Unix timestamp, if known.
+        Failed lookups are not cached.
+        """
+        ttl = self.settings.max_ttl_seconds
+        if expires_at is not None:
+            ttl = min(ttl, expires_at - time.time())
+        if ttl <= 0:
+            return await fetch()
+
+        key = _hash_token(scope, token)
+        entry = self._entries.get(key)
+        if entry is not None:
+            deadline, value = entry
+            if time.monotonic() < deadline:
+                self._entries.move_to_end(key)
+                return value
+            del self._entries[key]
+
+        task = self._inflight.get(key)
+        if task is None or task.get_loop() is not asyncio.get_running_loop():
+            task = asyncio.ensure_future(fetch())
+            self._inflight[key] = task
+            task.add_done_callback(lambda t: self._store(key, ttl, t))
+        # Shielded: one caller giving up must not cancel the lookup the other
+        # callers for the same token are waiting on.
+        return await asyncio.shield(task)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def _store(self, key: str, ttl: float, task: asyncio.Task[T]) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if task.cancelled() or task.exception() is not None:
+            return
+        self._entries[key] = (time.monotonic() + ttl, task.result())
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.settings.max_entries:
+            self._entries.popitem(last=False)
+
+
+def _hash_token(scope: str, token: str) -> str:
+    return hashlib.sha256(f"{scope}\0{token}".encode()).hexdigest()
@@ -20,6 +20,7 @@ except ImportError:
 
 from pydantic import BaseModel, SecretStr
 from typing_extensions import deprecated
+from unique_sdk import get_async_http_client
 from unique_toolkit.agentic.feature_flags.feature_flags import feature_flags
 from unique_toolkit.app.unique_settings import (
     AuthContext,
@@ -29,6 +30,10 @@ from unique_toolkit.app.unique_settings import (
 from unique_toolkit.services.factory import UniqueServiceFactory
 
 from unique_mcp.auth.zitadel.oauth_proxy import ZitadelOAuthProxySettings
+from unique_mcp.auth.zitadel.userinfo_cache import (
+    UserinfoCache,
+    UserinfoCacheSettings,
+)
 from unique_mcp.meta.keys import META_FLAT_ALIASES, MetaKeys
 
 _LOGGER = logging.getLogger(__name__)
@@ -36,7 +41,7 @@ _LOGGER = logging.getLogger(__name__)
 _CLAIM_USER_ID = "sub"
 _CLAIM_COMPANY_ID = "urn:zitadel:iam:user:resourceowner:id"
 _MCP_CHAT_CONTEXT_SENTINEL = "mcp-unknown"
-_HTTP_CLIENT = httpx.AsyncClient(timeout=10.0)
+_USERINFO_TIMEOUT_S = 10.0
 
 
 def _fastmcp_read_meta_dict() -> dict[str, Any] | None:
@@ -132,33 +137,66 @@ class UniqueUserInfo(BaseModel):
     email: str | None = None
 
 
+@lru_cache(maxsize=1)
+def get_userinfo_cache() -> UserinfoCache[UniqueUserInfo]:
+    """Process-wide userinfo cache, configured from ``ZITADEL_USERINFO_CACHE_*``."""
+    return UserinfoCache(UserinfoCacheSettings())
+
+
+async def _fetch_unique_userinfo(
+    access_token: str,
+    userinfo_endpoint: str,
+    http_client: httpx.AsyncClient | None,
+) -> UniqueUserInfo:
+    # Default to the SDK's shared keep-alive pool; a caller-supplied
+    # client keeps its own timeout configuration.
+    request_kwargs: dict[str, Any] = {}
+    if http_client is None:
+        http_client = get_async_http_client()
+        request_kwargs["timeout"] = _USERINFO_TIMEOUT_S
+    resp = await http_client.get(
+        userinfo_endpoint,
+        headers={"Authorization": f"Bearer {access_token}"},
+        **request_kwargs,
+    )
+    resp.raise_for_status()
+
+    info = resp.json()
+    uid = info.get(_CLAIM_USER_ID)
+    cid = info.get(_CLAIM_COMPANY_ID)
+    if not uid or not isinstance(uid, str) or not cid or not isinstance(cid, str):
+        raise ValueError(
+            f"Zitadel userinfo incomplete: sub={uid!r}, company_id={cid!r}"
+        )
+    _LOGGER.debug("Auth from userinfo (user=%s)", uid)
+    return UniqueUserInfo(email=info.get("email"), user_id=uid, company_id=cid)
+
+
 async def get_unique_userinfo(
-    http_client: httpx.AsyncClient = _HTTP_CLIENT,
+    http_client: httpx.AsyncClient | None = None,
 ) -> UniqueUserInfo | None:
+    """Resolve the access token's identity via Zitadel ``/userinfo``.
+
+    Results are cached per token (see :func:`get_userinfo_cache`) until the
+    token expires or the cache's max TTL passes, so repeated tool calls of one
+    session share a single lookup.
+    """
     token = get_access_token()
     zitadel_settings = get_zitadel_settings()
     if token:
-        resp = await http_client.get(
-            zitadel_settings.userinfo_endpoint,
-            headers={"Authorization": f"Bearer {token.token}"},
+        endpoint = zitadel_settings.userinfo_endpoint
+        return await get_userinfo_cache().get_or_fetch(
+            token.token,
+            lambda: _fetch_unique_userinfo(token.token, endpoint, http_client),
+            scope=endpoint,
+            expires_at=token.expires_at,
         )
-        resp.raise_for_status()
-
-        info = resp.json()
-        uid = info.get(_CLAIM_USER_ID)
-        cid = info.get(_CLAIM_COMPANY_ID)
-        if not uid or not isinstance(uid, str) or not cid or not isinstance(cid, str):
-            raise ValueError(
-                f"Zitadel userinfo incomplete: sub={uid!r}, company_id={cid!r}"
-            )
-        _LOGGER.debug("Auth from userinfo (user=%s)", uid)
-        return UniqueUserInfo(email=info.get("email"), user_id=uid, company_id=cid)
 
     return None
 
 
 async def _userinfo_to_auth_context(
-    http_client: httpx.AsyncClient = _HTTP_CLIENT,
+    http_client: httpx.AsyncClient | None = None,
 ) -> AuthContext | None:
     userinfo = await get_unique_userinfo(http_client)
     if userinfo:
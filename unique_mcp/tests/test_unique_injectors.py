@@ -28,6 +28,7 @@ from unique_mcp.unique_injectors import (
     get_unique_settings,
     get_unique_settings_async,
     get_unique_userinfo,
+    get_userinfo_cache,
     get_zitadel_settings,
 )
 
@@ -36,8 +37,10 @@ _MOD = "unique_mcp.unique_injectors"
 
 @pytest.fixture(autouse=True)
 def _clear_base_settings_cache() -> None:
-    """Prevent the lru_cache on _base_settings from leaking state between tests."""
+    """Prevent the lru_caches on _base_settings and the userinfo cache from
+    leaking state between tests."""
     _base_settings.cache_clear()
+    get_userinfo_cache.cache_clear()
 
 
 # Fixed ZitadelOAuthProxySettings fields — tests do not depend on repo .env.
@@ -73,6 +76,7 @@ def _token(claims: dict) -> MagicMock:
     t = MagicMock()
     t.claims = claims
     t.token = "mock-bearer"
+    t.expires_at = None
     return t
 
 
@@ -492,6 +496,38 @@ async def test_get_unique_userinfo__returns_model__when_response_complete(
     )
 
 
+@pytest.mark.ai
+@pytest.mark.asyncio
+async def test_get_unique_userinfo__uses_shared_pool__when_no_client_given(
+    zitadel_settings: ZitadelOAuthProxySettings,
+) -> None:
+    """
+    Purpose: Without an explicit client, userinfo is fetched through the SDK's
+      pooled client.
+    Why this matters: Reusing keep-alive connections avoids a TLS handshake per lookup;
+      the userinfo timeout must still apply.
+    Setup summary: Patch get_async_http_client; assert the GET carries the 10 s timeout.
+    """
+    tok = _token({})
+    resp = _userinfo_response({"sub": "u1", _CLAIM_COMPANY_ID: "c1"})
+    pooled_client = AsyncMock()
+    pooled_client.get = AsyncMock(return_value=resp)
+
+    with (
+        patch(f"{_MOD}.get_access_token", return_value=tok),
+        patch(f"{_MOD}.get_zitadel_settings", return_value=zitadel_settings),
+        patch(f"{_MOD}.get_async_http_client", return_value=pooled_client),
+    ):
+        info = await get_unique_userinfo()
+
+    pooled_client.get.assert_called_once_with(
+        zitadel_settings.userinfo_endpoint,
+        headers={"Authorization": "Bearer mock-bearer"},
+        timeout=10.0,
+    )
+    assert info is not None and info.user_id == "u1"
+
+
 @pytest.mark.ai
 @pytest.mark.asyncio
 async def test_get_unique_userinfo__returns_none__when_no_token() -> None:
@@ -0,0 +1,199 @@
+"""Tests for the Zitadel userinfo cache and its use by get_unique_userinfo."""
+
+import asyncio
+import json
+import threading
+import time
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import MagicMock, patch
+
+import httpx
+import pytest
+
+from unique_mcp.auth.zitadel.oauth_proxy import ZitadelOAuthProxySettings
+from unique_mcp.auth.zitadel.userinfo_cache import (
+    UserinfoCache,
+    UserinfoCacheSettings,
+)
+from unique_mcp.unique_injectors import (
+    _CLAIM_COMPANY_ID,
+    get_unique_userinfo,
+    get_userinfo_cache,
+)
+
+_MOD = "unique_mcp.unique_injectors"
+
+
+class _StubUserinfoServer(ThreadingHTTPServer):
+    """Local stand-in for Zitadel's ``/oidc/v1/userinfo``.
+
+    Maps ``Bearer user-<id>`` to a userinfo document for ``<id>`` and counts
+    requests; responses are delayed so concurrent lookups overlap.
+    """
+
+    def __init__(self) -> None:
+        self.requests: list[str] = []
+        super().__init__(("127.0.0.1", 0), _StubUserinfoHandler)
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+
+class _StubUserinfoHandler(BaseHTTPRequestHandler):
+    server: _StubUserinfoServer
+
+    def do_GET(self) -> None:  # noqa: N802
+        auth = self.headers.get("Authorization", "")
+        self.server.requests.append(auth)
+        time.sleep(0.05)
+        if self.path != "/oidc/v1/userinfo" or not auth.startswith("Bearer user-"):
+            self.send_response(401)
+            self.end_headers()
+            return
+        user_id = auth.removeprefix("Bearer user-")
+        body = json.dumps({"sub": user_id, _CLAIM_COMPANY_ID: "c1"}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+
+
+@pytest.fixture
+def userinfo_server() -> Iterator[_StubUserinfoServer]:
+    server = _StubUserinfoServer()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+    thread.join(timeout=5)
+
+
+@pytest.fixture(autouse=True)
+def _clear_userinfo_cache() -> None:
+    get_userinfo_cache.cache_clear()
+
+
+def _token(value: str, expires_at: float | None = None) -> MagicMock:
+    t = MagicMock()
+    t.claims = {}
+    t.token = value
+    t.expires_at = expires_at
+    return t
+
+
+async def _userinfo_as(
+    server: _StubUserinfoServer, token: MagicMock, client: httpx.AsyncClient
+):
+    with (
+        patch(f"{_MOD}.get_access_token", return_value=token),
+        patch(
+            f"{_MOD}.get_zitadel_settings",
+            return_value=ZitadelOAuthProxySettings(base_url=server.base_url),
+        ),
+    ):
+        return await get_unique_userinfo(http_client=client)
+
+
+@pytest.mark.ai
+@pytest.mark.asyncio
+async def test_get_unique_userinfo__reuses_lookup__for_same_token(
+    userinfo_server: _StubUserinfoServer,
+) -> None:
+    """
+    Purpose: Repeated and concurrent tool calls with one token hit /userinfo once.
+    Why this matters: One identity round trip per tool call caps MCP throughput.
+    Setup summary: Resolve one token five times concurrently and once more,
+    then a second token.
+    """
+    async with httpx.AsyncClient() as client:
+        token = _token("user-u1")
+        infos = await asyncio.gather(
+            *(_userinfo_as(userinfo_server, token, client) for _ in range(5))
+        )
+        again = await _userinfo_as(userinfo_server, token, client)
+        other = await _userinfo_as(userinfo_server, _token("user-u2"), client)
+
+    assert {info.user_id for info in infos} == {"u1"}
+    assert again.user_id == "u1"
+    assert other.user_id == "u2"
+    assert userinfo_server.requests == ["Bearer user-u1", "Bearer user-u2"]
+
+
+@pytest.mark.ai
+@pytest.mark.asyncio
+async def test_get_unique_userinfo__does_not_cache__expired_token_or_errors(
+    userinfo_server: _StubUserinfoServer,
+) -> None:
+    """
+    Purpose: Expired tokens and failed lookups always go to /userinfo.
+    Why this matters: A cached identity must never outlive its token or mask a
+    rejection.
+    Setup summary: Resolve an already expired token twice and a rejected token twice.
+    """
+    async with httpx.AsyncClient() as client:
+        expired = _token("user-u1", expires_at=time.time() - 1)
+        await _userinfo_as(userinfo_server, expired, client)
+        await _userinfo_as(userinfo_server, expired, client)
+        for _ in range(2):
+            with pytest.raises(httpx.HTTPStatusError):
+                await _userinfo_as(userinfo_server, _token("bogus"), client)
+
+    assert len(userinfo_server.requests) == 4
+
+
+@pytest.mark.ai
+@pytest.mark.asyncio
+async def test_userinfo_cache__expires_entries__at_token_expiry() -> None:
+    """
+    Purpose: An entry lives until the token expires even if max_ttl is longer.
+    Why this matters: Identity must be re-validated once the token is no longer valid.
+    Setup summary: Cache a token expiring in 50 ms, wait past it, assert a second fetch.
+    """
+    cache: UserinfoCache[str] = UserinfoCache(UserinfoCacheSettings(max_ttl_seconds=60))
+    calls: list[int] = []
+
+    async def fetch() -> str:
+        calls.append(1)
+        return "info"
+
+    expires_at = time.time() + 0.05
+    await cache.get_or_fetch("t", fetch, expires_at=expires_at)
+    await cache.get_or_fetch("t", fetch, expires_at=expires_at)
+    await asyncio.sleep(0.1)
+    await cache.get_or_fetch("t", fetch, expires_at=time.time() + 60)
+
+    assert len(calls) == 2
+
+
+@pytest.mark.ai
+@pytest.mark.asyncio
+async def test_userinfo_cache__evicts_least_recently_used() -> None:
+    """
+    Purpose: The cache holds at most max_entries tokens, dropping the least
+    recently used.
+    Why this matters: Memory stays bounded however many sessions a server sees.
+    Setup summary: Fill a two-entry cache, touch the first token, add a third,
+    assert the second was evicted.
+    """
+    cache: UserinfoCache[str] = UserinfoCache(UserinfoCacheSettings(max_entries=2))
+    fetched: list[str] = []
+
+    def fetcher(token: str):
+        async def fetch() -> str:
+            fetched.append(token)
+            return token
+
+        return fetch
+
+    for token in ("a", "b", "a", "c", "a", "b"):
+        await cache.get_or_fetch(token, fetcher(token))
+
+    assert fetched == ["a", "b", "c", "b"]
+    assert len(cache) == 2
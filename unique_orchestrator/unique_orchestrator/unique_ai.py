@@ -4,9 +4,9 @@ from datetime import datetime, timezone
 from logging import Logger
 from typing import Any, cast, overload
 
-import jinja2
 from typing_extensions import deprecated
 from unique_skill_tool.service import SkillTool
+from unique_toolkit._common.utils.jinja.render import get_compiled_template
 from unique_toolkit.agentic.debug_info_manager.debug_info_manager import (
     AnalyticsLanguageModel,
     DebugInfoManager,
@@ -233,6 +233,9 @@ class UniqueAI:
         self._context_memory_updated: bool | None = None
         self._invocation_stats: list[LanguageModelInvocationStats] = []
         self._invocation_stats_finalized = False
+        # Prompt inputs that do not change during a turn; resolved on first render.
+        self._prompt_model_info: dict[str, Any] | None = None
+        self._prompt_user_metadata: dict[str, str] | None = None
 
     async def _on_cancellation(self, _event: CancellationEvent) -> None:
         """Subscriber called by the cancellation event bus."""
@@ -721,13 +724,14 @@ class UniqueAI:
         return messages
 
     async def _render_user_prompt(self) -> str:
-        user_message_template = jinja2.Template(
+        user_message_template = get_compiled_template(
             self._config.agent.prompt_config.user_message_prompt_template
         )
 
+        tool_descriptions = self._tool_manager.get_tool_prompts()
+
         tool_descriptions_with_user_prompts = [
-            prompts.tool_user_prompt
-            for prompts in self._tool_manager.get_tool_prompts()
+            prompts.tool_user_prompt for prompts in tool_descriptions
         ]
 
         used_tools = [t.name for t in self._history_manager.get_tool_calls()]
@@ -739,9 +743,7 @@ class UniqueAI:
             mcp_server.user_prompt for mcp_server in self._mcp_servers
         ]
 
-        user_metadata = self._get_filtered_user_metadata()
-
-        tool_descriptions = self._tool_manager.get_tool_prompts()
+        user_metadata = self._get_prompt_user_metadata()
 
         query = self._event.payload.user_message.text
 
@@ -777,13 +779,13 @@ class UniqueAI:
             self._history_manager.get_tool_calls(), ["subagent"]
         )
 
-        system_prompt_template = jinja2.Template(
+        system_prompt_template = get_compiled_template(
             self._config.agent.prompt_config.system_prompt_template
         )
 
         date_string = datetime.now().strftime("%A %B %d, %Y")
 
-        user_metadata = self._get_filtered_user_metadata()
+        user_metadata = self._get_prompt_user_metadata()
 
         mcp_server_system_prompts = [
             mcp_server.system_prompt for mcp_server in self._mcp_servers
@@ -813,7 +815,7 @@ class UniqueAI:
             )
 
         system_message = system_prompt_template.render(
-            model_info=self._config.space.language_model.model_dump(mode="json"),
+            model_info=self._get_prompt_model_info(),
             date_string=date_string,
             tool_descriptions=tool_descriptions,
             used_tools=used_tools,
@@ -1092,6 +1094,20 @@ class UniqueAI:
             )
         )
 
+    def _get_prompt_model_info(self) -> dict[str, Any]:
+        """Serialized model info for the system prompt, computed once per turn."""
+        if self._prompt_model_info is None:
+            self._prompt_model_info = self._config.space.language_model.model_dump(
+                mode="json"
+            )
+        return self._prompt_model_info
+
+    def _get_prompt_user_metadata(self) -> dict[str, str]:
+        """Filtered user metadata for the prompts, computed once per turn."""
+        if self._prompt_user_metadata is None:
+            self._prompt_user_metadata = self._get_filtered_user_metadata()
+        return self._prompt_user_metadata
+
     def _get_filtered_user_metadata(self) -> dict[str, str]:
         """
         Filter user metadata to only include keys specified in the agent's prompt config.
@@ -70,6 +70,11 @@ def _folder_info(
     }
 
 
+@pytest.fixture(autouse=True)
+def _isolate_cwd(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.chdir(tmp_path)
+
+
 class TestIsPermissionDeniedOutput:
     def test_denial_lines_detected(self) -> None:
         from unique_sdk.cli.commands.files import is_permission_denied_output
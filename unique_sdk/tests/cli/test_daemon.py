@@ -0,0 +1,227 @@
+"""Tests for unique_sdk.cli.daemon (warm unique-cli server and thin client)."""
+
+from __future__ import annotations
+
+import os
+import shutil
+import tempfile
+import threading
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+import unique_sdk
+from unique_sdk.cli.config import Config
+from unique_sdk.cli.daemon import (
+    CliDaemon,
+    _WarmStates,
+    is_forwardable,
+    run_via_daemon,
+)
+from unique_sdk.cli.state import ShellState
+
+ENV = {
+    "UNIQUE_USER_ID": "user_test",
+    "UNIQUE_COMPANY_ID": "company_test",
+    "UNIQUE_API_KEY": "ukey_test",
+    "UNIQUE_APP_ID": "app_test",
+}
+
+
+@pytest.fixture
+def socket_path() -> Iterator[str]:
+    # Unix socket paths are limited to ~100 bytes, too short for tmp_path.
+    directory = tempfile.mkdtemp(prefix="ucd", dir="/tmp")
+    yield os.path.join(directory, "cli.sock")
+    shutil.rmtree(directory, ignore_errors=True)
+
+
+@pytest.fixture
+def daemon(socket_path: str) -> Iterator[CliDaemon]:
+    server = CliDaemon(socket_path, idle_timeout=30)
+    server.bind()
+    thread = threading.Thread(target=server.serve, daemon=True)
+    thread.start()
+    yield server
+    server.close()
+    thread.join(timeout=5)
+
+
+class TestIsForwardable:
+    def test_one_shot_commands_are_forwarded(self) -> None:
+        assert is_forwardable(["search", "revenue", "--limit", "5"])
+        assert is_forwardable(["read", "cont_abc"])
+        assert is_forwardable(["--version"])
+
+    def test_interactive_and_blocking_commands_run_locally(self) -> None:
+        assert not is_forwardable([])
+        assert not is_forwardable(["daemon"])
+        assert not is_forwardable(["elicit", "ask", "Which region?"])
+        assert not is_forwardable(["subagent", "space_1", "hello"])
+        assert not is_forwardable(["web-search", "crawl", "--stdin"])
+
+
+class TestCliDaemonRun:
+    def test_output_and_exit_code_match_a_fresh_process(
+        self, socket_path: str, tmp_path: Path
+    ) -> None:
+        server = CliDaemon(socket_path)
+
+        exit_code, stdout, stderr = server.run(["pwd"], cwd=str(tmp_path), env=ENV)
+
+        assert (exit_code, stdout, stderr) == (0, b"/\n", b"")
+
+    def test_missing_config_reports_error_on_stderr(
+        self, socket_path: str, tmp_path: Path
+    ) -> None:
+        server = CliDaemon(socket_path)
+
+        exit_code, stdout, stderr = server.run(["pwd"], cwd=str(tmp_path), env={})
+
+        assert exit_code == 1
+        assert stdout == b""
+        assert b"missing required environment variables" in stderr
+
+    def test_usage_error_exits_2(self, socket_path: str, tmp_path: Path) -> None:
+        server = CliDaemon(socket_path)
+
+        exit_code, _, stderr = server.run(["nosuch"], cwd=str(tmp_path), env=ENV)
+
+        assert exit_code == 2
+        assert b"Usage: unique-cli" in stderr
+
+    def test_restores_process_cwd_and_environment(
+        self, socket_path: str, tmp_path: Path
+    ) -> None:
+        server = CliDaemon(socket_path)
+        cwd, env = os.getcwd(), dict(os.environ)
+
+        server.run(["pwd"], cwd=str(tmp_path), env=ENV)
+
+        assert os.getcwd() == cwd
+        assert dict(os.environ) == env
+
+    def test_does_not_carry_api_base_into_the_next_call(
+        self, socket_path: str, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        server = CliDaemon(socket_path)
+        api_base_before = unique_sdk.api_base
+        states: list[ShellState] = []
+        init = ShellState.__init__
+
+        def recording_init(state: ShellState, config: Config) -> None:
+            init(state, config)
+            states.append(state)
+
+        monkeypatch.setattr(ShellState, "__init__", recording_init)
+
+        server.run(
+            ["pwd"],
+            cwd=str(tmp_path),
+            env={**ENV, "UNIQUE_API_BASE": "http://tenant-a"},
+        )
+        server.run(["pwd"], cwd=str(tmp_path), env=ENV)
+
+        assert [state.config.api_base for state in states] == [
+            "http://tenant-a",
+            "https://gateway.unique.app/public/chat-gen2",
+        ]
+        assert unique_sdk.api_base == api_base_before
+
+    def test_reports_title_renamed_by_an_earlier_call(
+        self, socket_path: str, tmp_path: Path
+    ) -> None:
+        server = CliDaemon(socket_path)
+        title = "Old.pdf"
+
+        def get_info(**kwargs: Any) -> dict[str, Any]:
+            return {"contentInfo": [{"id": "cont_abc", "title": title}]}
+
+        def update(**kwargs: Any) -> dict[str, Any]:
+            nonlocal title
+            title = kwargs["title"]
+            return {"id": "cont_abc", "title": title}
+
+        with (
+            patch.object(unique_sdk.Content, "get_info", side_effect=get_info),
+            patch.object(unique_sdk.Content, "update", side_effect=update),
+        ):
+            cite = ["cite", "cont_abc", "--read-method", "text", "--pages"]
+            first = server.run([*cite, "1"], cwd=str(tmp_path), env=ENV)
+            server.run(["mv", "cont_abc", "New.pdf"], cwd=str(tmp_path), env=ENV)
+            second = server.run([*cite, "2"], cwd=str(tmp_path), env=ENV)
+
+        assert b"Old.pdf page 1" in first[1]
+        assert b"New.pdf page 2" in second[1]
+
+
+class TestWarmStates:
+    @pytest.fixture(autouse=True)
+    def _workspace(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.chdir(tmp_path)
+        for key, value in ENV.items():
+            monkeypatch.setenv(key, value)
+
+    def test_reuses_state_reset_to_root(self) -> None:
+        states = _WarmStates(ttl=60)
+        state = states.get()
+        state._path = "/Reports"
+
+        again = states.get()
+
+        assert again is state
+        assert again.cwd == "/"
+
+    def test_rebuilds_state_when_workspace_config_changes(self, tmp_path: Path) -> None:
+        states = _WarmStates(ttl=60)
+        state = states.get()
+
+        (tmp_path / ".unique-search.json").write_text('{"scopeIds": ["scope_a"]}')
+        rebuilt = states.get()
+
+        assert rebuilt is not state
+        assert rebuilt.workspace_scope_ids == ["scope_a"]
+
+    def test_rebuilds_state_after_ttl(self) -> None:
+        states = _WarmStates(ttl=0)
+
+        assert states.get() is not states.get()
+
+    def test_reused_state_drops_cached_resolutions(self) -> None:
+        states = _WarmStates(ttl=60)
+        state = states.get()
+        state._content_info_cache["cont_abc"] = None
+        state._scope_path_cache["scope_a"] = "/Reports"
+        state._workspace_scope_paths = ["/Reports"]
+
+        again = states.get()
+
+        assert again is state
+        assert again._content_info_cache == {}
+        assert again._scope_path_cache == {}
+        assert again._workspace_scope_paths is None
+
+
+class TestRunViaDaemon:
+    def test_returns_none_without_daemon(self, socket_path: str) -> None:
+        assert run_via_daemon(socket_path, ["pwd"]) is None
+
+    def test_replays_output_and_exit_code(
+        self,
+        daemon: CliDaemon,
+        monkeypatch: pytest.MonkeyPatch,
+        capsysbinary: pytest.CaptureFixture[bytes],
+    ) -> None:
+        for key, value in ENV.items():
+            monkeypatch.setenv(key, value)
+
+        exit_code = run_via_daemon(daemon.socket_path, ["pwd"])
+
+        assert exit_code == 0
+        assert capsysbinary.readouterr().out == b"/\n"
+
+    def test_socket_is_private_to_owner(self, daemon: CliDaemon) -> None:
+        assert os.stat(daemon.socket_path).st_mode & 0o777 == 0o600
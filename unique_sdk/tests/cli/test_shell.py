@@ -3,8 +3,11 @@
 from __future__ import annotations
 
 from io import StringIO
+from pathlib import Path
 from unittest.mock import MagicMock, patch
 
+import pytest
+
 from unique_sdk.cli.config import Config
 from unique_sdk.cli.shell import UniqueShell
 from unique_sdk.cli.state import ShellState
@@ -36,6 +39,11 @@ def _capture(shell: UniqueShell, command: str) -> str:
     return buf.getvalue()
 
 
+@pytest.fixture(autouse=True)
+def _isolate_cwd(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.chdir(tmp_path)
+
+
 class TestShellBasics:
     def test_init_prompt(self) -> None:
         sh = _shell()
@@ -0,0 +1,84 @@
+"""Import-time budget for the ``unique-cli`` entry point.
+
+The CLI is spawned as a subprocess for every agent tool call, so its startup
+cost is paid over and over. Each test runs a fresh interpreter so modules
+already imported by the test session do not hide the real cost.
+"""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+
+# The entry point's cumulative ``-X importtime`` is compared with that of the
+# HTTP stack a command needs, measured in the same run, so a slow or busy
+# machine does not fail the test. The lazy entry point takes under a fifth of
+# it; importing the API resources and HTTP clients eagerly took more than it.
+BASELINE_MODULE = "unique_sdk._api_requestor"
+IMPORT_TIME_BUDGET_RATIO = 0.5
+
+HEAVY_MODULES = (
+    "aiohttp",
+    "httpx",
+    "requests",
+    "tiktoken",
+    "unique_sdk._api_requestor",
+    "unique_sdk.cli.commands.agentic_table",
+    "unique_sdk.cli.commands.browser",
+    "unique_sdk.cli.commands.mcp",
+    "unique_sdk.cli.commands.web_search",
+    "unique_sdk.cli.shell",
+)
+
+
+def _run(code: str, *flags: str) -> subprocess.CompletedProcess[str]:
+    return subprocess.run(
+        [sys.executable, *flags, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+def _cumulative_import_time_us(module: str) -> int:
+    """Return the best of three ``-X importtime`` measurements of ``module``."""
+    timings = []
+    for _ in range(3):
+        stderr = _run(f"import {module}", "-X", "importtime").stderr
+        for line in stderr.splitlines():
+            # "import time: self [us] | cumulative | imported package"
+            _, _, fields = line.partition("import time:")
+            parts = [part.strip() for part in fields.split("|")]
+            if len(parts) == 3 and parts[2] == module:
+                timings.append(int(parts[1]))
+    assert timings, f"no importtime entry for {module}"
+    return min(timings)
+
+
+class TestStartup:
+    def test_entry_point_does_not_import_command_dependencies(self) -> None:
+        code = (
+            "import sys, unique_sdk.cli.cli\n"
+            f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+        )
+        assert _run(code).stdout.strip() == ""
+
+    def test_sdk_attributes_are_imported_on_first_access(self) -> None:
+        code = (
+            "import sys, unique_sdk\n"
+            "before = 'unique_sdk.api_resources._content' in sys.modules\n"
+            "content = unique_sdk.Content\n"
+            "from unique_sdk import Content\n"
+            "print(before, content is Content, 'Content' in dir(unique_sdk))"
+        )
+        assert _run(code).stdout.split() == ["False", "True", "True"]
+
+    def test_entry_point_import_time_within_budget(self) -> None:
+        baseline = _cumulative_import_time_us(BASELINE_MODULE)
+        elapsed = _cumulative_import_time_us("unique_sdk.cli.cli")
+        budget = baseline * IMPORT_TIME_BUDGET_RATIO
+        assert elapsed < budget, (
+            f"importing unique_sdk.cli.cli took {elapsed / 1000:.0f} ms, "
+            f"budget is {budget / 1000:.0f} ms "
+            f"({IMPORT_TIME_BUDGET_RATIO:.0%} of {BASELINE_MODULE})"
+        )
@@ -1,5 +1,6 @@
 import calendar
 import datetime
+import json
 import time
 from collections import OrderedDict
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -14,7 +15,7 @@ from unique_sdk._api_requestor import (
     _encode_datetime,
     _encode_nested_dict,
 )
-from unique_sdk._error import APIError
+from unique_sdk._error import APIError, InvalidRequestError
 
 # Canonical fake gateway bases for URL composition tests (not real endpoints).
 _TEST_CHAT_API_BASE = "https://gateway.example/public/chat-gen2"
@@ -391,3 +392,64 @@ def test_api_requestor_handle_error_response_with_original_error():
         )
 
     assert "(Original error) TEST: Test error" in str(excinfo.value)
+
+
+class _MessagePage:
+    """Minimal typed response model, duck-typing pydantic's ``model_validate_json``."""
+
+    def __init__(self, ids: list[str]):
+        self.ids = ids
+
+    @classmethod
+    def model_validate_json(cls, json_data):
+        return cls([item["id"] for item in json.loads(json_data)["data"]])
+
+
+def _requestor_returning(rbody, rcode=200):
+    _client = MagicMock()
+    _client.name = "request_name"
+    _client.request.return_value = (rbody, rcode, {})
+    _client.request_async = AsyncMock(return_value=(rbody, rcode, {}))
+
+    requestor = APIRequestor(
+        user_id="user_id", company_id="company_id", key="api_key", app_id="app_id"
+    )
+    requestor._client = _client
+    return requestor
+
+
+@patch("unique_sdk._api_requestor.UniqueResponse")
+def test_request_typed_validates_raw_body_into_model(mock_unique_response):
+    requestor = _requestor_returning(b'{"object": "list", "data": [{"id": "m1"}]}')
+
+    page = requestor.request_typed("GET", "/messages", _MessagePage)
+
+    assert isinstance(page, _MessagePage)
+    assert page.ids == ["m1"]
+    # The body is not parsed into a generic response first.
+    mock_unique_response.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_request_typed_async_validates_raw_body_into_model():
+    requestor = _requestor_returning('{"data": [{"id": "m1"}, {"id": "m2"}]}')
+
+    page = await requestor.request_typed_async("get", "/messages", _MessagePage)
+
+    assert page.ids == ["m1", "m2"]
+
+
+def test_request_typed_raises_for_error_status():
+    requestor = _requestor_returning(
+        '{"error": {"message": "Chat not found", "cause": {"status": 404}}}', 404
+    )
+
+    with pytest.raises(InvalidRequestError, match="Chat not found"):
+        requestor.request_typed("get", "/messages", _MessagePage)
+
+
+def test_request_typed_raises_api_error_for_invalid_body():
+    requestor = _requestor_returning(b"<html>Bad gateway</html>")
+
+    with pytest.raises(APIError, match="Invalid response body from API"):
+        requestor.request_typed("get", "/messages", _MessagePage)
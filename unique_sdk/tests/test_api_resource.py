@@ -286,6 +286,36 @@ def test_static_request_sync_no_retry_on_different_error(mock_api_requestor):
     )  # Ensure it does not retry
 
 
+def test_static_request_typed_success(mock_api_requestor):
+    response_model = Mock()
+    mock_api_requestor.return_value.request_typed.return_value = "typed"
+
+    result = MessageResource._static_request_typed(
+        "get", "/messages", response_model, "user_1", "company_1", {"chatId": "c"}
+    )
+
+    assert result == "typed"
+    mock_api_requestor.assert_called_once_with(user_id="user_1", company_id="company_1")
+    mock_api_requestor.return_value.request_typed.assert_called_once_with(
+        "get", "/messages", response_model, {"chatId": "c"}, None
+    )
+
+
+@pytest.mark.asyncio
+@patch("asyncio.sleep", return_value=None)
+async def test_static_request_typed_async_retry_on_specific_error(
+    mock_asyncio_sleep, mock_api_requestor
+):
+    mock_api_requestor.return_value.request_typed_async = AsyncMock(
+        side_effect=APIError("There was a problem proxying the request")
+    )
+    with pytest.raises(APIError, match="Failed after 3 attempts"):
+        await MessageResource._static_request_typed_async(
+            "get", "/messages", Mock(), "user_1", "company_1"
+        )
+    assert mock_api_requestor.return_value.request_typed_async.call_count == 3
+
+
 def test_request(mock_unique_object):
     # Mock the synchronous request method
     resource = MessageResource()
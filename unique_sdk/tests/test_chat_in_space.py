@@ -123,7 +123,6 @@ async def test_send_message_and_wait_for_completion__calls_update_hook_for_chang
             new_callable=AsyncMock,
             return_value={"debugInfo": {"trace": "ok"}},
         ) as mock_message_retrieve,
-        patch("unique_sdk.utils.chat_in_space.asyncio.sleep", new_callable=AsyncMock),
     ):
         response = await send_message_and_wait_for_completion(
             user_id="user-1",
@@ -190,7 +189,6 @@ async def test_send_message_and_wait_for_completion__waits_for_invocations_to_co
                 },
             ],
         ) as mock_message_retrieve,
-        patch("unique_sdk.utils.chat_in_space.asyncio.sleep", new_callable=AsyncMock),
     ):
         response = await send_message_and_wait_for_completion(
             user_id="user-1",
@@ -250,7 +248,6 @@ async def test_send_message_and_wait_for_completion__debug_info_from_user_not_as
             "unique_sdk.utils.chat_in_space.Message.retrieve_async",
             side_effect=fake_retrieve,
         ),
-        patch("unique_sdk.utils.chat_in_space.asyncio.sleep", new_callable=AsyncMock),
     ):
         response = await send_message_and_wait_for_completion(
             user_id="user-1",
@@ -297,7 +294,6 @@ async def test_send_message_and_wait_for_completion__passes_auto_approve_elicita
             new_callable=AsyncMock,
             return_value={"debugInfo": None},
         ),
-        patch("unique_sdk.utils.chat_in_space.asyncio.sleep", new_callable=AsyncMock),
     ):
         await send_message_and_wait_for_completion(
             user_id="user-1",
@@ -343,7 +339,6 @@ async def test_send_message_and_wait_for_completion__passes_language_model() ->
             new_callable=AsyncMock,
             return_value={"debugInfo": None},
         ),
-        patch("unique_sdk.utils.chat_in_space.asyncio.sleep", new_callable=AsyncMock),
     ):
         await send_message_and_wait_for_completion(
             user_id="user-1",
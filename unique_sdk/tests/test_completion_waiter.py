@@ -0,0 +1,180 @@
+import asyncio
+import threading
+import time
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from unique_sdk.utils.completion_waiter import (
+    AdaptiveInterval,
+    fetch_ingestion_states,
+    get_completion_waiter,
+    ingestion_key,
+    notify_status_change,
+)
+from unique_sdk.utils.file_io import wait_for_ingestion_completion
+
+
+def _recording_fetch(results=None):
+    calls: list[list] = []
+
+    async def fetch(keys):
+        calls.append(sorted(keys))
+        return {key: (results or {}).get(key, f"status-{key}") for key in keys}
+
+    return fetch, calls
+
+
+def test_adaptive_interval_backs_off_and_snaps_back():
+    interval = AdaptiveInterval(1.0, 4.0, factor=2.0)
+
+    interval.observe("queued")
+    assert interval.current == 1.0
+    interval.observe("queued")
+    interval.observe("queued")
+    interval.observe("queued")
+    assert interval.current == 4.0
+
+    interval.observe("streaming")
+    assert interval.current == 1.0
+
+
+@pytest.mark.asyncio
+async def test_concurrent_waits_share_one_batched_fetch():
+    fetch, calls = _recording_fetch()
+    waiter = get_completion_waiter()
+
+    results = await asyncio.gather(
+        waiter.fetch(fetch, "a"),
+        waiter.fetch(fetch, "b"),
+        waiter.fetch(fetch, "a"),
+    )
+
+    assert results == ["status-a", "status-b", "status-a"]
+    assert calls == [["a", "b"]]
+
+
+@pytest.mark.asyncio
+async def test_exception_for_one_key_only_fails_its_waits():
+    fetch, _ = _recording_fetch({"bad": ValueError("boom")})
+    waiter = get_completion_waiter()
+
+    good, bad = await asyncio.gather(
+        waiter.fetch(fetch, "good"),
+        waiter.fetch(fetch, "bad"),
+        return_exceptions=True,
+    )
+
+    assert good == "status-good"
+    assert isinstance(bad, ValueError)
+
+
+@pytest.mark.asyncio
+async def test_watch_times_out_and_backs_off():
+    fetch, calls = _recording_fetch()
+    waiter = get_completion_waiter()
+    watch = waiter.watch(
+        fetch, "k", interval=AdaptiveInterval(0.01, 0.04, factor=2.0), max_wait=0.3
+    )
+
+    async with watch:
+        while not watch.expired:
+            watch.observe(await watch.poll())
+
+    assert watch.interval.current == 0.04
+    # A fixed 0.01s interval would have polled about 30 times.
+    assert 3 <= len(calls) < 15
+
+
+@pytest.mark.asyncio
+async def test_notify_short_circuits_a_backed_off_wait():
+    fetch, calls = _recording_fetch()
+    waiter = get_completion_waiter()
+    watch = waiter.watch(
+        fetch, "chat", interval=AdaptiveInterval(30.0, 30.0), max_wait=60
+    )
+
+    async with watch:
+        await watch.poll()
+        started = time.monotonic()
+        # Push signal from another thread, e.g. a webhook server.
+        threading.Timer(0.05, notify_status_change, args=("chat",)).start()
+        await watch.poll()
+
+    assert time.monotonic() - started < 5
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_fetch_ingestion_states_searches_each_chat_once():
+    keys = [
+        ingestion_key("u1", "c1", "chat1", "cont_a"),
+        ingestion_key("u1", "c1", "chat1", "cont_b"),
+        ingestion_key("u1", "c1", "chat2", "cont_c"),
+    ]
+
+    async def search_async(**params):
+        where = params["where"]["id"]
+        ids = where.get("in_") or [where["equals"]]
+        return [{"id": i, "ingestionState": "FINISHED"} for i in ids if i != "cont_b"]
+
+    with patch(
+        "unique_sdk.utils.completion_waiter.Content.search_async",
+        new_callable=AsyncMock,
+        side_effect=search_async,
+    ) as mock_search:
+        results = await fetch_ingestion_states(keys)
+
+    assert mock_search.await_count == 2
+    first_chat = mock_search.await_args_list[0].kwargs
+    assert first_chat["where"] == {"id": {"in_": ["cont_a", "cont_b"]}}
+    assert first_chat["chatId"] == "chat1"
+    assert results[keys[0]] == {"id": "cont_a", "ingestionState": "FINISHED"}
+    assert results[keys[1]] is None
+    assert results[keys[2]]["id"] == "cont_c"
+
+
+@pytest.mark.asyncio
+async def test_parallel_ingestion_waits_are_batched():
+    async def search_async(**params):
+        ids = params["where"]["id"].get("in_") or [params["where"]["id"]["equals"]]
+        return [{"id": i, "ingestionState": "FINISHED"} for i in ids]
+
+    with patch(
+        "unique_sdk.utils.completion_waiter.Content.search_async",
+        new_callable=AsyncMock,
+        side_effect=search_async,
+    ) as mock_search:
+        states = await asyncio.gather(
+            *(
+                wait_for_ingestion_completion(
+                    user_id="u1",
+                    company_id="c1",
+                    content_id=f"cont_{i}",
+                    chat_id="chat1",
+                    poll_interval=0.01,
+                    max_wait=1,
+                )
+                for i in range(5)
+            )
+        )
+
+    assert states == ["FINISHED"] * 5
+    assert mock_search.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_wait_for_ingestion_completion_times_out():
+    with patch(
+        "unique_sdk.utils.completion_waiter.Content.search_async",
+        new_callable=AsyncMock,
+        return_value=[{"ingestionState": "INGESTION_READING"}],
+    ):
+        with pytest.raises(TimeoutError):
+            await wait_for_ingestion_completion(
+                user_id="u1",
+                company_id="c1",
+                content_id="cont_1",
+                poll_interval=0.01,
+                max_wait=0.1,
+            )
@@ -5,7 +5,7 @@ Covers:
 * ``upload_file``'s blob PUT now raises on a failed status code instead
   of silently falling through to the finalize upsert (which would flip
   the Content row to "bytes on blob" over an empty/failed upload).
-* All four direct ``requests`` calls in this module (``upload_file``'s
+* All four direct blob transfer calls in this module (``upload_file``'s
   PUT, ``_put_preview_pdf``'s PUT, ``download_file``'s GET,
   ``download_content``'s GET) now pass a timeout.
 """
@@ -60,7 +60,7 @@ class TestUploadFilePutErrorHandling:
         with (
             patch.object(file_io.Content, "upsert", upsert_mock),
             patch.object(
-                file_io.requests,
+                file_io.get_http_session(),
                 "put",
                 MagicMock(return_value=_fake_response(status_code=500, text="oops")),
             ),
@@ -88,7 +88,7 @@ class TestUploadFilePutErrorHandling:
         with (
             patch.object(file_io.Content, "upsert", upsert_mock),
             patch.object(
-                file_io.requests,
+                file_io.get_http_session(),
                 "put",
                 MagicMock(return_value=_fake_response(status_code=201)),
             ),
@@ -114,7 +114,7 @@ class TestBlobTransferTimeouts:
 
         with (
             patch.object(file_io.Content, "upsert", return_value=created),
-            patch.object(file_io.requests, "put", put_mock),
+            patch.object(file_io.get_http_session(), "put", put_mock),
         ):
             file_io.upload_file(
                 userId="user-1",
@@ -132,7 +132,7 @@ class TestBlobTransferTimeouts:
         pdf_path.write_bytes(b"%PDF-1.4 fake")
         put_mock = MagicMock(return_value=_fake_response(status_code=200))
 
-        with patch.object(file_io.requests, "put", put_mock):
+        with patch.object(file_io.get_http_session(), "put", put_mock):
             file_io._put_preview_pdf(
                 "https://blob.example/write-preview?sig=1", str(pdf_path)
             )
@@ -144,7 +144,7 @@ class TestBlobTransferTimeouts:
             return_value=_fake_response(status_code=200, content=b"data")
         )
 
-        with patch.object(file_io.requests, "get", get_mock):
+        with patch.object(file_io.get_http_session(), "get", get_mock):
             file_io.download_file("https://blob.example/read?sig=1", "out.bin")
 
         assert get_mock.call_args.kwargs["timeout"] == unique_sdk.blob_transfer_timeout
@@ -154,7 +154,7 @@ class TestBlobTransferTimeouts:
             return_value=_fake_response(status_code=200, content=b"data")
         )
 
-        with patch.object(file_io.requests, "get", get_mock):
+        with patch.object(file_io.get_http_session(), "get", get_mock):
             file_io.download_content(
                 companyId="company-1",
                 userId="user-1",
@@ -30,6 +30,7 @@ def _fake_response(status_code: int = 200, content: bytes = b"hello") -> MagicMo
     response = MagicMock()
     response.status_code = status_code
     response.content = content
+    response.iter_content.return_value = [content]
     return response
 
 
@@ -61,14 +62,14 @@ class TestDownloadContentTargetPath:
             legacy ``/tmp/<rand>/<filename>`` fallback forced a second
             ``shutil.move`` step and was incompatible with sandboxed
             filesystems where ``/tmp`` is unavailable or unwritable.
-        Setup summary: Stub ``requests.get`` with a 200 response and
+        Setup summary: Stub the pooled session's ``get`` with a 200 response and
             assert the bytes land at the supplied path (and not in
             ``/tmp``).
         """
         get_mock = MagicMock(return_value=_fake_response(content=b"payload"))
         target = tmp_path / "out" / "report.pdf"
 
-        with patch.object(file_io.requests, "get", get_mock):
+        with patch.object(file_io.get_http_session(), "get", get_mock):
             result = file_io.download_content(
                 companyId="company-1",
                 userId="user-1",
@@ -95,7 +96,7 @@ class TestDownloadContentTargetPath:
         get_mock = MagicMock(return_value=_fake_response(content=b"x"))
         nested = tmp_path / "a" / "b" / "c" / "file.bin"
 
-        with patch.object(file_io.requests, "get", get_mock):
+        with patch.object(file_io.get_http_session(), "get", get_mock):
             result = file_io.download_content(
                 companyId="company-1",
                 userId="user-1",
@@ -124,7 +125,7 @@ class TestDownloadContentTargetPath:
         path_target = tmp_path / "as_path.bin"
         str_target = tmp_path / "as_str.bin"
 
-        with patch.object(file_io.requests, "get", get_mock):
+        with patch.object(file_io.get_http_session(), "get", get_mock):
             result_path = file_io.download_content(
                 companyId="company-1",
                 userId="user-1",
@@ -165,7 +166,7 @@ class TestDownloadContentLegacyFallback:
         (tmp_path / "rand").mkdir()
 
         with (
-            patch.object(file_io.requests, "get", get_mock),
+            patch.object(file_io.get_http_session(), "get", get_mock),
             patch.object(file_io.tempfile, "mkdtemp", mkdtemp_mock),
         ):
             result = file_io.download_content(
@@ -191,13 +192,13 @@ class TestDownloadContentErrors:
             silently coerce ``None`` into the string ``"None"``, hiding
             the bug behind an opaque 404 from the gateway.
         Setup summary: Pass an integer ``content_id`` and assert
-            ``ValueError`` is raised; ``requests.get`` must not be
+            ``ValueError`` is raised; the pooled session's ``get`` must not be
             called.
         """
         get_mock = MagicMock()
 
         with (
-            patch.object(file_io.requests, "get", get_mock),
+            patch.object(file_io.get_http_session(), "get", get_mock),
             pytest.raises(ValueError, match="content_id must be a string"),
         ):
             file_io.download_content(
@@ -227,7 +228,7 @@ class TestDownloadContentErrors:
         target = tmp_path / "should_not_exist" / "file.bin"
 
         with (
-            patch.object(file_io.requests, "get", get_mock),
+            patch.object(file_io.get_http_session(), "get", get_mock),
             pytest.raises(Exception, match="Status code 500"),
         ):
             file_io.download_content(
@@ -256,7 +257,7 @@ class TestDownloadContentErrors:
         mkdtemp_mock = MagicMock()
 
         with (
-            patch.object(file_io.requests, "get", get_mock),
+            patch.object(file_io.get_http_session(), "get", get_mock),
             patch.object(file_io.tempfile, "mkdtemp", mkdtemp_mock),
             pytest.raises(Exception, match="Status code 404"),
         ):
@@ -281,12 +282,12 @@ class TestDownloadContentRequestShape:
         Why this matters: The backend uses different ACLs for
             chat-scoped vs scope-scoped content; dropping ``chatId``
             would silently 404 on chat attachments.
-        Setup summary: Capture the URL passed to ``requests.get`` and
+        Setup summary: Capture the URL passed to the pooled session's ``get`` and
             assert it contains ``?chatId=chat-1``.
         """
         get_mock = MagicMock(return_value=_fake_response())
 
-        with patch.object(file_io.requests, "get", get_mock):
+        with patch.object(file_io.get_http_session(), "get", get_mock):
             file_io.download_content(
                 companyId="company-1",
                 userId="user-1",
@@ -306,13 +307,13 @@ class TestDownloadContentRequestShape:
             headers verbatim from ``unique_sdk`` globals + arguments.
         Why this matters: A regression here would surface as 401/403
             from the gateway and is hard to spot from a stack trace.
-        Setup summary: Inspect the kwargs passed to ``requests.get``
+        Setup summary: Inspect the kwargs passed to the pooled session's ``get``
             and assert each expected header is present with the value
             we'd expect from the test fixture.
         """
         get_mock = MagicMock(return_value=_fake_response())
 
-        with patch.object(file_io.requests, "get", get_mock):
+        with patch.object(file_io.get_http_session(), "get", get_mock):
             file_io.download_content(
                 companyId="company-1",
                 userId="user-1",
@@ -327,3 +328,71 @@ class TestDownloadContentRequestShape:
         assert headers["x-company-id"] == "company-1"
         assert headers["x-api-version"] == "2023-12-06"
         assert headers["Authorization"] == "Bearer ukey_test"
+
+    def test_body_is_streamed_in_chunks(self, tmp_path: Path) -> None:
+        """
+        Purpose: The download must request a streamed response and write
+            it chunk by chunk, closing the response afterwards.
+        Why this matters: Reading ``response.content`` buffers the whole
+            file in memory, which breaks on multi-GB Knowledge Base files.
+        Setup summary: Return a response whose ``iter_content`` yields
+            several chunks; assert ``stream=True``, the concatenated
+            file content and that the response was closed.
+        """
+        response = _fake_response()
+        response.iter_content.return_value = [b"ab", b"cd", b"e"]
+        get_mock = MagicMock(return_value=response)
+        target = tmp_path / "x.bin"
+
+        with patch.object(file_io.get_http_session(), "get", get_mock):
+            file_io.download_content(
+                companyId="company-1",
+                userId="user-1",
+                content_id="cont_test",
+                filename="x.bin",
+                target_path=target,
+            )
+
+        assert get_mock.call_args.kwargs["stream"] is True
+        assert target.read_bytes() == b"abcde"
+        response.close.assert_called_once()
+
+    def test_failed_stream_keeps_existing_file_and_leaves_no_partial(
+        self, tmp_path: Path
+    ) -> None:
+        """
+        Purpose: A download that breaks off mid-stream must not touch the
+            destination.
+        Why this matters: ``kb download`` writes many files through this
+            path; a reset connection must neither leave a truncated file
+            nor destroy the copy already on disk.
+        Setup summary: Pre-create the target, fail ``iter_content`` after
+            one chunk and assert the old content remains and no temporary
+            file is left in the directory.
+        """
+
+        def _dropping_stream(_chunk_size: int) -> Any:
+            yield b"partial"
+            raise ConnectionError("connection reset")
+
+        response = _fake_response()
+        response.iter_content.side_effect = _dropping_stream
+        get_mock = MagicMock(return_value=response)
+        target = tmp_path / "x.bin"
+        target.write_bytes(b"previous")
+
+        with (
+            patch.object(file_io.get_http_session(), "get", get_mock),
+            pytest.raises(ConnectionError),
+        ):
+            file_io.download_content(
+                companyId="company-1",
+                userId="user-1",
+                content_id="cont_test",
+                filename="x.bin",
+                target_path=target,
+            )
+
+        assert target.read_bytes() == b"previous"
+        assert list(tmp_path.iterdir()) == [target]
+        response.close.assert_called_once()
@@ -85,7 +85,7 @@ class TestUploadFilePreviewPdfPath:
         with (
             patch.object(file_io.Content, "upsert", side_effect=upsert),
             patch.object(file_io.unique_sdk.Content, "upsert", side_effect=upsert),
-            patch.object(file_io.requests, "put", put_mock),
+            patch.object(file_io.get_http_session(), "put", put_mock),
         ):
             file_io.upload_file(
                 userId="user-1",
@@ -136,7 +136,7 @@ class TestUploadFilePreviewPdfPath:
         with (
             patch.object(file_io.Content, "upsert", side_effect=upsert),
             patch.object(file_io.unique_sdk.Content, "upsert", side_effect=upsert),
-            patch.object(file_io.requests, "put", put_mock),
+            patch.object(file_io.get_http_session(), "put", put_mock),
         ):
             file_io.upload_file(
                 userId="user-1",
@@ -196,7 +196,7 @@ class TestUploadFilePreviewPdfPath:
             patch.object(file_io.Content, "upsert", side_effect=upsert),
             patch.object(file_io.unique_sdk.Content, "upsert", side_effect=upsert),
             patch.object(
-                file_io.requests,
+                file_io.get_http_session(),
                 "put",
                 MagicMock(return_value=MagicMock(status_code=200)),
             ),
@@ -233,7 +233,7 @@ class TestUploadFilePreviewPdfPath:
             patch.object(file_io.Content, "upsert", return_value=created),
             patch.object(file_io.unique_sdk.Content, "upsert", return_value=created),
             patch.object(
-                file_io.requests,
+                file_io.get_http_session(),
                 "put",
                 MagicMock(return_value=MagicMock(status_code=200)),
             ),
@@ -277,7 +277,7 @@ class TestUploadFilePreviewPdfPath:
             patch.object(file_io.Content, "upsert", return_value=created),
             patch.object(file_io.unique_sdk.Content, "upsert", return_value=created),
             patch.object(
-                file_io.requests,
+                file_io.get_http_session(),
                 "put",
                 MagicMock(return_value=MagicMock(status_code=200)),
             ),
@@ -340,7 +340,7 @@ class TestUploadFileVersioningEnabled:
             patch.object(file_io.Content, "upsert", side_effect=upsert),
             patch.object(file_io.unique_sdk.Content, "upsert", side_effect=upsert),
             patch.object(
-                file_io.requests,
+                file_io.get_http_session(),
                 "put",
                 MagicMock(return_value=MagicMock(status_code=200)),
             ),
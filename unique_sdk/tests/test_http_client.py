@@ -19,14 +19,23 @@ from unique_sdk._http_client import (
 @pytest.fixture
 def mock_requests():
     with patch("unique_sdk._http_client.requests") as mock_requests:
-        yield mock_requests
+        # Clients without an explicit session use the shared pooled session.
+        with patch(
+            "unique_sdk._http_client._http_pool.get_http_session",
+            return_value=mock_requests.Session.return_value,
+        ):
+            yield mock_requests
 
 
 @pytest.fixture
 def mock_httpx():
     with patch("unique_sdk._http_client.httpx") as mock_httpx:
         mock_httpx.AsyncClient.return_value.request = AsyncMock()
-        yield mock_httpx
+        with patch(
+            "unique_sdk._http_client._http_pool.get_async_http_client",
+            return_value=mock_httpx.AsyncClient.return_value,
+        ):
+            yield mock_httpx
 
 
 @pytest.fixture
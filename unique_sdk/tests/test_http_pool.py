@@ -0,0 +1,199 @@
+"""Unit tests for the shared keep-alive pool in ``unique_sdk._http_pool``.
+
+Requests go to a local threaded HTTP server so connection reuse and the
+per-host concurrency cap are observed on real sockets.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+import pytest
+
+import unique_sdk
+from unique_sdk import _http_pool
+
+_BODY = b"payload" * 100
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self) -> None:
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(_BODY)))
+        self.end_headers()
+        self.wfile.write(_BODY)
+
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+
+
+class _SetCookieHandler(_Handler):
+    """Answers like ``_Handler`` but sets a cookie and records the ``Cookie``
+    header of every request."""
+
+    received_cookies: list[str | None] = []
+
+    def do_GET(self) -> None:
+        self.received_cookies.append(self.headers.get("Cookie"))
+        self.send_response(200)
+        self.send_header("Set-Cookie", "session=tenant-a; Path=/")
+        self.send_header("Content-Length", str(len(_BODY)))
+        self.end_headers()
+        self.wfile.write(_BODY)
+
+
+@pytest.fixture
+def cookie_server_url() -> Iterator[str]:
+    _SetCookieHandler.received_cookies = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _SetCookieHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_port}/file"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+@pytest.fixture
+def server_url() -> Iterator[str]:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_port}/file"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+@pytest.fixture(autouse=True)
+def _fresh_pool() -> Iterator[None]:
+    _http_pool.close_http_pool()
+    _http_pool._async_stats.clear()
+    yield
+    _http_pool.close_http_pool()
+
+
+@pytest.mark.ai
+@pytest.mark.unit
+class TestSyncSession:
+    def test_session_is_shared_and_reuses_connection(self, server_url: str) -> None:
+        """Repeated downloads through the shared session must reuse one
+        keep-alive connection instead of reconnecting per request."""
+        assert unique_sdk.get_http_session() is unique_sdk.get_http_session()
+
+        for _ in range(5):
+            response = unique_sdk.get_http_session().get(server_url)
+            assert response.content == _BODY
+
+        stats = unique_sdk.http_pool_stats()["sync_hosts"]["127.0.0.1"]
+        assert stats == {"requests": 5, "connections_opened": 1}
+
+    def test_session_does_not_replay_cookies(self, cookie_server_url: str) -> None:
+        """The session is shared across users and tenants, so a cookie set
+        for one caller must not be sent with the next caller's request."""
+        session = unique_sdk.get_http_session()
+
+        session.get(cookie_server_url)
+        session.get(cookie_server_url)
+
+        assert _SetCookieHandler.received_cookies == [None, None]
+        assert len(session.cookies) == 0
+
+    def test_close_http_pool_creates_new_session_afterwards(self) -> None:
+        session = unique_sdk.get_http_session()
+        unique_sdk.close_http_pool()
+
+        assert unique_sdk.get_http_session() is not session
+        assert not _http_pool.is_shared_session(session)
+
+
+@pytest.mark.ai
+@pytest.mark.unit
+class TestAsyncClient:
+    async def test_client_is_shared_within_loop_and_reuses_connection(
+        self, server_url: str
+    ) -> None:
+        client = unique_sdk.get_async_http_client()
+        assert unique_sdk.get_async_http_client() is client
+
+        for _ in range(5):
+            response = await client.get(server_url)
+            assert response.content == _BODY
+
+        stats = unique_sdk.http_pool_stats()["async_hosts"]["127.0.0.1"]
+        assert stats == {"requests": 5, "connections_opened": 1}
+        await unique_sdk.close_http_pool_async()
+
+    async def test_client_does_not_replay_cookies(self, cookie_server_url: str) -> None:
+        """Like the sync session, the shared async client keeps no cookies."""
+        client = unique_sdk.get_async_http_client()
+
+        await client.get(cookie_server_url)
+        await client.get(cookie_server_url)
+
+        assert _SetCookieHandler.received_cookies == [None, None]
+        assert len(client.cookies) == 0
+        await unique_sdk.close_http_pool_async()
+
+    async def test_client_uses_api_timeout_by_default(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Blob transfers pass their long timeout per request; everything
+        else gets ``http_pool_timeout``."""
+        monkeypatch.setattr(unique_sdk, "http_pool_timeout", 7)
+
+        client = unique_sdk.get_async_http_client()
+
+        assert client.timeout == httpx.Timeout(7)
+        await unique_sdk.close_http_pool_async()
+
+    async def test_concurrent_requests_are_capped_per_host(
+        self, server_url: str, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A burst to one host may open at most
+        ``http_pool_max_connections_per_host`` connections."""
+        monkeypatch.setattr(unique_sdk, "http_pool_max_connections_per_host", 3)
+        client = unique_sdk.get_async_http_client()
+
+        responses = await asyncio.gather(*(client.get(server_url) for _ in range(12)))
+
+        assert all(response.content == _BODY for response in responses)
+        stats = unique_sdk.http_pool_stats()["async_hosts"]["127.0.0.1"]
+        assert stats["requests"] == 12
+        assert stats["connections_opened"] <= 3
+        await unique_sdk.close_http_pool_async()
+
+    async def test_streamed_response_releases_host_slot(
+        self, server_url: str, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Closing a streamed response must free its per-host slot, or a
+        limit of one would deadlock the next request."""
+        monkeypatch.setattr(unique_sdk, "http_pool_max_connections_per_host", 1)
+        client = unique_sdk.get_async_http_client()
+
+        for _ in range(3):
+            async with client.stream("GET", server_url) as response:
+                assert await response.aread() == _BODY
+
+        await asyncio.wait_for(client.get(server_url), timeout=5)
+        await unique_sdk.close_http_pool_async()
+
+
+@pytest.mark.ai
+@pytest.mark.unit
+def test_async_clients_are_separate_per_event_loop() -> None:
+    """httpx connections are bound to the loop that opened them, so each
+    ``asyncio.run`` must get its own client."""
+
+    async def current_client() -> object:
+        return unique_sdk.get_async_http_client()
+
+    assert asyncio.run(current_client()) is not asyncio.run(current_client())
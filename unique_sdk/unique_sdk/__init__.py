@@ -1,6 +1,7 @@
 # ruff: noqa: E402
 # ruff: noqa: I001
-from typing import Literal
+import importlib
+from typing import TYPE_CHECKING, Any, Literal
 
 # Unique SDK
 # Authors:
@@ -19,129 +20,254 @@ ingestion_upload_api_url_internal: str | None = None
 # which bypass _http_client. Defaults to match _http_client's own default.
 blob_transfer_timeout: float = 600
 
+# Shared keep-alive connection pool used by file transfers and the toolkit's
+# direct HTTP calls (see _http_pool.py). Read when the pool is created.
+http_pool_max_connections: int = 100
+http_pool_max_connections_per_host: int = 20
+http_pool_keepalive_expiry: float = 30
+# Default timeout (seconds) of the shared async client, httpx's own default.
+# Blob transfers pass ``blob_transfer_timeout`` per request instead.
+http_pool_timeout: float = 5
+# HTTP/2 for async requests; only used when the optional ``h2`` package is installed.
+http_pool_http2: bool = True
+
 # Set to either 'debug' or 'info', controls console logging
 log: Literal["debug", "info"] | None = None
 
-# Webhooks
-from unique_sdk._api_requestor import APIRequestor as APIRequestor
-
-# Infrastructure types
-from unique_sdk._api_resource import APIResource as APIResource
-
-# Error types
-from unique_sdk._error import UniqueError as UniqueError
-from unique_sdk._error import APIConnectionError as APIConnectionError
-from unique_sdk._error import APIError as APIError
-from unique_sdk._error import AuthenticationError as AuthenticationError
-from unique_sdk._error import InvalidRequestError as InvalidRequestError
-from unique_sdk._error import (
-    SignatureVerificationError as SignatureVerificationError,
-)
-from unique_sdk._error import UniqueErrorWithParamsCode as UniqueErrorWithParamsCode
-
-# HttpClient
-from unique_sdk._http_client import (
-    HTTPClient as HTTPClient,
-)
-from unique_sdk._http_client import (
-    RequestsClient as RequestsClient,
-    HTTPXClient as HTTPXClient,
-    AIOHTTPClient as AIOHTTPClient,
-)
-from unique_sdk._http_client import (
-    new_default_http_client as new_default_http_client,
-)
-from unique_sdk._list_object import ListObject as ListObject
-from unique_sdk._request_options import RequestOptions as RequestOptions
-from unique_sdk._unique_object import UniqueObject as UniqueObject
-
-# Response types
-from unique_sdk._unique_response import UniqueResponse as UniqueResponse
-from unique_sdk._unique_response import (
-    UniqueResponseBase as UniqueResponseBase,
-)
-
-# Util
-from unique_sdk._util import (
-    convert_to_unique_object as convert_to_unique_object,
-)
-from unique_sdk._webhook import (
-    Webhook as Webhook,
-)
-from unique_sdk._webhook import (
-    WebhookSignature as WebhookSignature,
-)
-from unique_sdk.api_resources._chat_completion import (
-    ChatCompletion as ChatCompletion,
-)
-
-# API resources
-from unique_sdk.api_resources._event import Event as Event
-from unique_sdk.api_resources._message import Message as Message
-from unique_sdk.api_resources._integrated import Integrated as Integrated
-from unique_sdk.api_resources._search import Search as Search
-from unique_sdk.api_resources._content import Content as Content
-from unique_sdk.api_resources._search_string import SearchString as SearchString
-from unique_sdk.api_resources._short_term_memory import (
-    ShortTermMemory as ShortTermMemory,
-)
-from unique_sdk.api_resources._folder import Folder as Folder
-from unique_sdk.api_resources._embedding import Embeddings as Embeddings
-from unique_sdk.api_resources._acronyms import Acronyms as Acronyms
-from unique_sdk.api_resources._llm_models import LLMModels as LLMModels
-from unique_sdk.api_resources._user import User as User
-from unique_sdk.api_resources._group import Group as Group
-from unique_sdk.api_resources._message_assessment import (
-    MessageAssessment as MessageAssessment,
-)
-from unique_sdk.api_resources._space import Space as Space
-from unique_sdk.api_resources._mcp import MCP as MCP
-from unique_sdk.api_resources._message_execution import (
-    MessageExecution as MessageExecution,
-)
-from unique_sdk.api_resources._message_log import MessageLog as MessageLog
-from unique_sdk.api_resources._message_tool import MessageTool as MessageTool
-from unique_sdk.api_resources._elicitation import Elicitation as Elicitation
-from unique_sdk.api_resources._benchmarking import (
-    Benchmarking as Benchmarking,
-)
-from unique_sdk.api_resources._scheduled_task import ScheduledTask as ScheduledTask
-from unique_sdk.api_resources._analytics_order import (
-    AnalyticsOrder as AnalyticsOrder,
-)
-from unique_sdk.api_resources._module import Module as Module
-from unique_sdk.api_resources._briefing import Briefing as Briefing
-from unique_sdk.api_resources._web_search import (
-    WebSearch as WebSearch,
-    WebCrawl as WebCrawl,
-    WebSearchResultItem as WebSearchResultItem,
-    WebCrawlResultItem as WebCrawlResultItem,
-)
-
-# Unique QL
-from unique_sdk._unique_ql import UQLOperator as UQLOperator
-from unique_sdk._unique_ql import UQLCombinator as UQLCombinator
-
-# Agentic Table
-from .api_resources._agentic_table import (
-    AgenticTable as AgenticTable,
-    AgenticTableCell as AgenticTableCell,
-    AgenticTableCellMetaData as AgenticTableCellMetaData,
-    AgenticTableSheet as AgenticTableSheet,
-    AgenticTableSheetState as AgenticTableSheetState,
-    LogEntry as LogEntry,
-    LogDetail as LogDetail,
-    FilterTypes as FilterTypes,
-    CellRendererTypes as CellRendererTypes,
-    SelectionMethod as SelectionMethod,
-    AgreementStatus as AgreementStatus,
-    RowVerificationStatus as RowVerificationStatus,
-    MagicTableAction as MagicTableAction,
-    MagicTableActionResult as MagicTableActionResult,
-    MagicTableActivityResponse as MagicTableActivityResponse,
-    MagicTableArtifact as MagicTableArtifact,
-    MagicTableArtifactState as MagicTableArtifactState,
-    MagicTableArtifactType as MagicTableArtifactType,
-    MagicTableMetadataEntry as MagicTableMetadataEntry,
-    CreatedAgenticTableSheet as CreatedAgenticTableSheet,
-)
+# Everything below is imported on first attribute access (PEP 562), so that
+# ``import unique_sdk`` stays cheap for short-lived processes such as the
+# ``unique-cli`` entry point, which does not pull in requests, httpx and
+# aiohttp unless a command actually talks to the API.
+if TYPE_CHECKING:
+    # Webhooks
+    from unique_sdk._api_requestor import APIRequestor as APIRequestor
+
+    # Infrastructure types
+    from unique_sdk._api_resource import APIResource as APIResource
+
+    # Error types
+    from unique_sdk._error import UniqueError as UniqueError
+    from unique_sdk._error import APIConnectionError as APIConnectionError
+    from unique_sdk._error import APIError as APIError
+    from unique_sdk._error import AuthenticationError as AuthenticationError
+    from unique_sdk._error import InvalidRequestError as InvalidRequestError
+    from unique_sdk._error import (
+        SignatureVerificationError as SignatureVerificationError,
+    )
+    from unique_sdk._error import UniqueErrorWithParamsCode as UniqueErrorWithParamsCode
+
+    # HttpClient
+    from unique_sdk._http_client import (
+        HTTPClient as HTTPClient,
+    )
+    from unique_sdk._http_client import (
+        RequestsClient as RequestsClient,
+        HTTPXClient as HTTPXClient,
+        AIOHTTPClient as AIOHTTPClient,
+    )
+    from unique_sdk._http_client import (
+        new_default_http_client as new_default_http_client,
+    )
+    from unique_sdk._http_pool import (
+        HTTPPoolStats as HTTPPoolStats,
+        close_http_pool as close_http_pool,
+        close_http_pool_async as close_http_pool_async,
+        get_async_http_client as get_async_http_client,
+        get_http_session as get_http_session,
+        http_pool_stats as http_pool_stats,
+    )
+    from unique_sdk._list_object import ListObject as ListObject
+    from unique_sdk._request_options import RequestOptions as RequestOptions
+    from unique_sdk._unique_object import UniqueObject as UniqueObject
+
+    # Response types
+    from unique_sdk._unique_response import (
+        TypedResponseModel as TypedResponseModel,
+    )
+    from unique_sdk._unique_response import UniqueResponse as UniqueResponse
+    from unique_sdk._unique_response import (
+        UniqueResponseBase as UniqueResponseBase,
+    )
+
+    # Util
+    from unique_sdk._util import (
+        convert_to_unique_object as convert_to_unique_object,
+    )
+    from unique_sdk._webhook import (
+        Webhook as Webhook,
+    )
+    from unique_sdk._webhook import (
+        WebhookSignature as WebhookSignature,
+    )
+    from unique_sdk.api_resources._chat_completion import (
+        ChatCompletion as ChatCompletion,
+    )
+
+    # API resources
+    from unique_sdk.api_resources._event import Event as Event
+    from unique_sdk.api_resources._message import Message as Message
+    from unique_sdk.api_resources._integrated import Integrated as Integrated
+    from unique_sdk.api_resources._search import Search as Search
+    from unique_sdk.api_resources._content import Content as Content
+    from unique_sdk.api_resources._search_string import SearchString as SearchString
+    from unique_sdk.api_resources._short_term_memory import (
+        ShortTermMemory as ShortTermMemory,
+    )
+    from unique_sdk.api_resources._folder import Folder as Folder
+    from unique_sdk.api_resources._embedding import Embeddings as Embeddings
+    from unique_sdk.api_resources._acronyms import Acronyms as Acronyms
+    from unique_sdk.api_resources._llm_models import LLMModels as LLMModels
+    from unique_sdk.api_resources._user import User as User
+    from unique_sdk.api_resources._group import Group as Group
+    from unique_sdk.api_resources._message_assessment import (
+        MessageAssessment as MessageAssessment,
+    )
+    from unique_sdk.api_resources._space import Space as Space
+    from unique_sdk.api_resources._mcp import MCP as MCP
+    from unique_sdk.api_resources._message_execution import (
+        MessageExecution as MessageExecution,
+    )
+    from unique_sdk.api_resources._message_log import MessageLog as MessageLog
+    from unique_sdk.api_resources._message_tool import MessageTool as MessageTool
+    from unique_sdk.api_resources._elicitation import Elicitation as Elicitation
+    from unique_sdk.api_resources._benchmarking import (
+        Benchmarking as Benchmarking,
+    )
+    from unique_sdk.api_resources._scheduled_task import ScheduledTask as ScheduledTask
+    from unique_sdk.api_resources._analytics_order import (
+        AnalyticsOrder as AnalyticsOrder,
+    )
+    from unique_sdk.api_resources._module import Module as Module
+    from unique_sdk.api_resources._briefing import Briefing as Briefing
+    from unique_sdk.api_resources._web_search import (
+        WebSearch as WebSearch,
+        WebCrawl as WebCrawl,
+        WebSearchResultItem as WebSearchResultItem,
+        WebCrawlResultItem as WebCrawlResultItem,
+    )
+
+    # Unique QL
+    from unique_sdk._unique_ql import UQLOperator as UQLOperator
+    from unique_sdk._unique_ql import UQLCombinator as UQLCombinator
+
+    # Agentic Table
+    from unique_sdk.api_resources._agentic_table import (
+        AgenticTable as AgenticTable,
+        AgenticTableCell as AgenticTableCell,
+        AgenticTableCellMetaData as AgenticTableCellMetaData,
+        AgenticTableSheet as AgenticTableSheet,
+        AgenticTableSheetState as AgenticTableSheetState,
+        LogEntry as LogEntry,
+        LogDetail as LogDetail,
+        FilterTypes as FilterTypes,
+        CellRendererTypes as CellRendererTypes,
+        SelectionMethod as SelectionMethod,
+        AgreementStatus as AgreementStatus,
+        RowVerificationStatus as RowVerificationStatus,
+        MagicTableAction as MagicTableAction,
+        MagicTableActionResult as MagicTableActionResult,
+        MagicTableActivityResponse as MagicTableActivityResponse,
+        MagicTableArtifact as MagicTableArtifact,
+        MagicTableArtifactState as MagicTableArtifactState,
+        MagicTableArtifactType as MagicTableArtifactType,
+        MagicTableMetadataEntry as MagicTableMetadataEntry,
+        CreatedAgenticTableSheet as CreatedAgenticTableSheet,
+    )
+
+_LAZY_ATTRIBUTES: dict[str, str] = {
+    "APIRequestor": "unique_sdk._api_requestor",
+    "APIResource": "unique_sdk._api_resource",
+    "UniqueError": "unique_sdk._error",
+    "APIConnectionError": "unique_sdk._error",
+    "APIError": "unique_sdk._error",
+    "AuthenticationError": "unique_sdk._error",
+    "InvalidRequestError": "unique_sdk._error",
+    "SignatureVerificationError": "unique_sdk._error",
+    "UniqueErrorWithParamsCode": "unique_sdk._error",
+    "HTTPClient": "unique_sdk._http_client",
+    "RequestsClient": "unique_sdk._http_client",
+    "HTTPXClient": "unique_sdk._http_client",
+    "AIOHTTPClient": "unique_sdk._http_client",
+    "new_default_http_client": "unique_sdk._http_client",
+    "HTTPPoolStats": "unique_sdk._http_pool",
+    "close_http_pool": "unique_sdk._http_pool",
+    "close_http_pool_async": "unique_sdk._http_pool",
+    "get_async_http_client": "unique_sdk._http_pool",
+    "get_http_session": "unique_sdk._http_pool",
+    "http_pool_stats": "unique_sdk._http_pool",
+    "ListObject": "unique_sdk._list_object",
+    "RequestOptions": "unique_sdk._request_options",
+    "UniqueObject": "unique_sdk._unique_object",
+    "TypedResponseModel": "unique_sdk._unique_response",
+    "UniqueResponse": "unique_sdk._unique_response",
+    "UniqueResponseBase": "unique_sdk._unique_response",
+    "convert_to_unique_object": "unique_sdk._util",
+    "Webhook": "unique_sdk._webhook",
+    "WebhookSignature": "unique_sdk._webhook",
+    "ChatCompletion": "unique_sdk.api_resources._chat_completion",
+    "Event": "unique_sdk.api_resources._event",
+    "Message": "unique_sdk.api_resources._message",
+    "Integrated": "unique_sdk.api_resources._integrated",
+    "Search": "unique_sdk.api_resources._search",
+    "Content": "unique_sdk.api_resources._content",
+    "SearchString": "unique_sdk.api_resources._search_string",
+    "ShortTermMemory": "unique_sdk.api_resources._short_term_memory",
+    "Folder": "unique_sdk.api_resources._folder",
+    "Embeddings": "unique_sdk.api_resources._embedding",
+    "Acronyms": "unique_sdk.api_resources._acronyms",
+    "LLMModels": "unique_sdk.api_resources._llm_models",
+    "User": "unique_sdk.api_resources._user",
+    "Group": "unique_sdk.api_resources._group",
+    "MessageAssessment": "unique_sdk.api_resources._message_assessment",
+    "Space": "unique_sdk.api_resources._space",
+    "MCP": "unique_sdk.api_resources._mcp",
+    "MessageExecution": "unique_sdk.api_resources._message_execution",
+    "MessageLog": "unique_sdk.api_resources._message_log",
+    "MessageTool": "unique_sdk.api_resources._message_tool",
+    "Elicitation": "unique_sdk.api_resources._elicitation",
+    "Benchmarking": "unique_sdk.api_resources._benchmarking",
+    "ScheduledTask": "unique_sdk.api_resources._scheduled_task",
+    "AnalyticsOrder": "unique_sdk.api_resources._analytics_order",
+    "Module": "unique_sdk.api_resources._module",
+    "Briefing": "unique_sdk.api_resources._briefing",
+    "WebSearch": "unique_sdk.api_resources._web_search",
+    "WebCrawl": "unique_sdk.api_resources._web_search",
+    "WebSearchResultItem": "unique_sdk.api_resources._web_search",
+    "WebCrawlResultItem": "unique_sdk.api_resources._web_search",
+    "UQLOperator": "unique_sdk._unique_ql",
+    "UQLCombinator": "unique_sdk._unique_ql",
+    "AgenticTable": "unique_sdk.api_resources._agentic_table",
+    "AgenticTableCell": "unique_sdk.api_resources._agentic_table",
+    "AgenticTableCellMetaData": "unique_sdk.api_resources._agentic_table",
+    "AgenticTableSheet": "unique_sdk.api_resources._agentic_table",
+    "AgenticTableSheetState": "unique_sdk.api_resources._agentic_table",
+    "LogEntry": "unique_sdk.api_resources._agentic_table",
+    "LogDetail": "unique_sdk.api_resources._agentic_table",
+    "FilterTypes": "unique_sdk.api_resources._agentic_table",
+    "CellRendererTypes": "unique_sdk.api_resources._agentic_table",
+    "SelectionMethod": "unique_sdk.api_resources._agentic_table",
+    "AgreementStatus": "unique_sdk.api_resources._agentic_table",
+    "RowVerificationStatus": "unique_sdk.api_resources._agentic_table",
+    "MagicTableAction": "unique_sdk.api_resources._agentic_table",
+    "MagicTableActionResult": "unique_sdk.api_resources._agentic_table",
+    "MagicTableActivityResponse": "unique_sdk.api_resources._agentic_table",
+    "MagicTableArtifact": "unique_sdk.api_resources._agentic_table",
+    "MagicTableArtifactState": "unique_sdk.api_resources._agentic_table",
+    "MagicTableArtifactType": "unique_sdk.api_resources._agentic_table",
+    "MagicTableMetadataEntry": "unique_sdk.api_resources._agentic_table",
+    "CreatedAgenticTableSheet": "unique_sdk.api_resources._agentic_table",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    # Cache on the package so later lookups bypass __getattr__.
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
@@ -10,7 +10,7 @@ from urllib.parse import urlencode, urlsplit, urlunsplit
 
 import unique_sdk
 from unique_sdk import _error, _http_client, _util, _version
-from unique_sdk._unique_response import UniqueResponse
+from unique_sdk._unique_response import TypedResponseModelT, UniqueResponse
 
 
 def _encode_datetime(dttime: datetime.datetime):
@@ -136,6 +136,32 @@ class APIRequestor(object):
         resp = self.interpret_response(rbody, rcode, rheaders)
         return resp
 
+    def request_typed(
+        self,
+        method: str,
+        url: str,
+        response_model: type[TypedResponseModelT],
+        params: Mapping[str, Any] | None = None,
+        headers: Mapping[str, str] | None = None,
+    ) -> TypedResponseModelT:
+        rbody, rcode, rheaders = self.request_raw(
+            method.lower(), url, params, headers, is_streaming=False
+        )
+        return self.interpret_response_typed(rbody, rcode, rheaders, response_model)
+
+    async def request_typed_async(
+        self,
+        method: str,
+        url: str,
+        response_model: type[TypedResponseModelT],
+        params: Mapping[str, Any] | None = None,
+        headers: Mapping[str, str] | None = None,
+    ) -> TypedResponseModelT:
+        rbody, rcode, rheaders = await self.request_raw_async(
+            method.lower(), url, params, headers, is_streaming=False
+        )
+        return self.interpret_response_typed(rbody, rcode, rheaders, response_model)
+
     def request_headers(self, api_key, app_id, method):
         user_agent = "Unique SDK/v1 PythonBindings/%s" % (_version.VERSION,)
 
@@ -374,6 +400,34 @@ class APIRequestor(object):
             self.handle_error_response(rbody, rcode, resp.data, rheaders)
         return resp
 
+    def interpret_response_typed(
+        self,
+        rbody: object,
+        rcode: int,
+        rheaders: Mapping[str, str],
+        response_model: type[TypedResponseModelT],
+    ) -> TypedResponseModelT:
+        """Validate a successful response body straight into ``response_model``.
+
+        The body is neither parsed into a ``UniqueResponse`` nor converted to
+        ``UniqueObject`` graphs first. Error responses are interpreted as in
+        ``interpret_response``, which raises.
+        """
+        if self._should_handle_code_as_error(rcode):
+            self.interpret_response(rbody, rcode, rheaders)
+        try:
+            return response_model.model_validate_json(cast(str | bytes, rbody))
+        except ValueError as e:
+            raise _error.APIError(
+                "Invalid response body from API: %s "
+                "(HTTP response code was %d)"
+                % (_util.redacted_body_for_error_message(rbody), rcode),
+                http_body=cast(bytes, rbody),
+                http_status=rcode,
+                headers=dict(rheaders),
+                original_error=e,
+            )
+
     def handle_error_response(self, rbody, rcode, resp, rheaders) -> NoReturn:
         error_data = resp.get("error")
 
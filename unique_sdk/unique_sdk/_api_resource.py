@@ -11,6 +11,7 @@ from urllib.parse import quote_plus
 from unique_sdk._api_requestor import APIRequestor
 from unique_sdk._error import InvalidRequestError
 from unique_sdk._unique_object import UniqueObject
+from unique_sdk._unique_response import TypedResponseModelT
 from unique_sdk._util import (
     RetryOptions,
     classproperty,
@@ -230,3 +231,46 @@ class APIResource(UniqueObject, Generic[T]):
                 method_, url_, params, supplied_headers
             )
         return convert_to_unique_object(response, user_id, company_id, params)
+
+    # Typed variants of `_static_request`: the raw response body is validated
+    # straight into `response_model` (e.g. a pydantic model) without building
+    # the intermediate `UniqueObject` graph.
+    @classmethod
+    @retry_on_error(**retry_dict)
+    def _static_request_typed(
+        cls,
+        method_,
+        url_,
+        response_model: type[TypedResponseModelT],
+        user_id: str | None = None,
+        company_id: str | None = None,
+        params=None,
+        supplied_headers: Mapping[str, str] | None = None,
+    ) -> TypedResponseModelT:
+        params = None if params is None else params.copy()
+
+        requestor = APIRequestor(user_id=user_id, company_id=company_id)
+
+        return requestor.request_typed(
+            method_, url_, response_model, params, supplied_headers
+        )
+
+    @classmethod
+    @retry_on_error(**retry_dict)
+    async def _static_request_typed_async(
+        cls,
+        method_,
+        url_,
+        response_model: type[TypedResponseModelT],
+        user_id: str | None = None,
+        company_id: str | None = None,
+        params=None,
+        supplied_headers: Mapping[str, str] | None = None,
+    ) -> TypedResponseModelT:
+        params = None if params is None else params.copy()
+
+        requestor = APIRequestor(user_id=user_id, company_id=company_id)
+
+        return await requestor.request_typed_async(
+            method_, url_, response_model, params, supplied_headers
+        )
@@ -21,7 +21,7 @@ except ImportError:
     aiohttp = None
 
 import unique_sdk
-from unique_sdk import _error
+from unique_sdk import _error, _http_pool
 
 
 def new_default_http_client(*args, **kwargs) -> "HTTPClient":
@@ -103,7 +103,7 @@ class RequestsClient(HTTPClient):
         kwargs = {}
 
         if getattr(self._thread_local, "session", None) is None:
-            self._thread_local.session = self._session or self.requests.Session()
+            self._thread_local.session = self._session or _http_pool.get_http_session()
 
         verify = unique_sdk.api_verify_mode
 
@@ -142,8 +142,10 @@ class RequestsClient(HTTPClient):
         return content, status_code, result.headers
 
     def close(self):
-        if getattr(self._thread_local, "session", None) is not None:
-            self._thread_local.session.close()
+        session = getattr(self._thread_local, "session", None)
+        # The shared pool outlives individual clients; see _http_pool.close_http_pool.
+        if session is not None and not _http_pool.is_shared_session(session):
+            session.close()
 
 
 class HTTPXClient(HTTPClient):
@@ -162,7 +164,9 @@ class HTTPXClient(HTTPClient):
         self.httpx = httpx
         self.anyio = anyio
 
-        self._client_async = httpx.AsyncClient(**kwargs)
+        # Without custom client options, async requests go through the shared
+        # per-event-loop pool instead of a client bound to the first loop used.
+        self._client_async = httpx.AsyncClient(**kwargs) if kwargs else None
         self._client = httpx.Client(**kwargs)
         self._timeout = timeout
 
@@ -213,8 +217,9 @@ class HTTPXClient(HTTPClient):
         post_data=None,
     ) -> tuple[bytes, int, Mapping[str, str]]:
         args, kwargs = self._get_request_args_kwargs(method, url, headers, post_data)
+        client = self._client_async or _http_pool.get_async_http_client()
         try:
-            response = await self._client_async.request(*args, **kwargs)
+            response = await client.request(*args, **kwargs)
         except Exception as e:
             raise _error.APIConnectionError(
                 "Unexpected error communicating with Unique. "
@@ -232,7 +237,8 @@ class HTTPXClient(HTTPClient):
         self._client.close()
 
     async def close_async(self):
-        await self._client_async.aclose()
+        if self._client_async is not None:
+            await self._client_async.aclose()
 
 
 class AIOHTTPClient(HTTPClient):
@@ -0,0 +1,248 @@
+"""Process-wide pooled HTTP transport.
+
+Every HTTP path that talks to Unique outside the typed API resources —
+content downloads, blob uploads, the toolkit's endpoint requestors, MCP
+user-info lookups — used to open a fresh client (or call bare
+``requests.get``) per request and so paid a TCP + TLS handshake every time.
+This module owns one keep-alive pool per process that all of them share:
+
+* :func:`get_http_session` returns a shared :class:`requests.Session`.
+* :func:`get_async_http_client` returns a shared :class:`httpx.AsyncClient`
+  for the running event loop (httpx connections cannot cross loops).
+
+The shared clients never store cookies: they serve many users and tenants,
+so a ``Set-Cookie`` answered to one caller must not be replayed on another
+caller's requests. Requests through the async client time out after
+``unique_sdk.http_pool_timeout`` unless they pass their own ``timeout``.
+
+Pool sizing is read from the ``unique_sdk.http_pool_*`` globals when the
+pool is first created; call :func:`close_http_pool` (or
+:func:`close_http_pool_async`) after changing them. HTTP/2 is negotiated
+for async requests when ``unique_sdk.http_pool_http2`` is set and the
+optional ``h2`` package is installed (``pip install httpx[http2]``).
+
+The shared clients are owned by this module: callers must not close them.
+"""
+
+import asyncio
+import importlib.util
+import threading
+import weakref
+from collections import defaultdict
+from collections.abc import AsyncIterator, Awaitable, Callable
+from http.cookiejar import CookieJar, DefaultCookiePolicy
+from typing import Any, TypedDict
+
+import httpx
+import requests
+from requests.adapters import HTTPAdapter
+
+import unique_sdk
+
+# Number of per-host connection pools kept by the sync session.
+_MAX_SYNC_HOST_POOLS = 32
+
+
+class HostPoolStats(TypedDict):
+    requests: int
+    connections_opened: int
+
+
+class HTTPPoolStats(TypedDict):
+    sync_hosts: dict[str, HostPoolStats]
+    async_hosts: dict[str, HostPoolStats]
+
+
+# Accepts no cookie from any domain, so the shared jars stay empty.
+_NO_COOKIES_POLICY = DefaultCookiePolicy(allowed_domains=[])
+
+_lock = threading.Lock()
+_session: requests.Session | None = None
+_async_clients: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, httpx.AsyncClient
+] = weakref.WeakKeyDictionary()
+_async_stats: defaultdict[str, HostPoolStats] = defaultdict(
+    lambda: HostPoolStats(requests=0, connections_opened=0)
+)
+
+
+def _http2_enabled() -> bool:
+    return unique_sdk.http_pool_http2 and importlib.util.find_spec("h2") is not None
+
+
+def get_http_session() -> requests.Session:
+    """Return the process-wide pooled :class:`requests.Session`."""
+    global _session
+    with _lock:
+        if _session is None:
+            session = requests.Session()
+            session.cookies.set_policy(_NO_COOKIES_POLICY)
+            adapter = HTTPAdapter(
+                pool_connections=_MAX_SYNC_HOST_POOLS,
+                pool_maxsize=unique_sdk.http_pool_max_connections_per_host,
+            )
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _session = session
+        return _session
+
+
+def is_shared_session(session: requests.Session) -> bool:
+    """Whether ``session`` is the pool owned by this module."""
+    return session is _session
+
+
+class _ReleasingStream(httpx.AsyncByteStream):
+    """Response body that releases its per-host slot once closed."""
+
+    def __init__(self, stream: httpx.AsyncByteStream, release: Callable[[], None]):
+        self._stream = stream
+        self._release: Callable[[], None] | None = release
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            if self._release is not None:
+                self._release()
+                self._release = None
+
+
+class _PerHostLimitedTransport(httpx.AsyncBaseTransport):
+    """Caps concurrent requests per host and records pool statistics.
+
+    httpx only limits connections globally; the semaphore per host keeps a
+    burst of downloads from one host from starving every other host.
+    """
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, max_per_host: int):
+        self._transport = transport
+        self._max_per_host = max_per_host
+        self._semaphores: dict[str, asyncio.Semaphore] = {}
+
+    def _trace_for(
+        self, host: str, inner: Callable[[str, dict[str, Any]], Awaitable[None]] | None
+    ) -> Callable[[str, dict[str, Any]], Awaitable[None]]:
+        async def trace(event_name: str, info: dict[str, Any]) -> None:
+            if event_name == "connection.connect_tcp.complete":
+                _async_stats[host]["connections_opened"] += 1
+            if inner is not None:
+                await inner(event_name, info)
+
+        return trace
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        host = request.url.host
+        semaphore = self._semaphores.get(host)
+        if semaphore is None:
+            semaphore = self._semaphores[host] = asyncio.Semaphore(self._max_per_host)
+
+        _async_stats[host]["requests"] += 1
+        request.extensions["trace"] = self._trace_for(
+            host, request.extensions.get("trace")
+        )
+
+        await semaphore.acquire()
+        try:
+            response = await self._transport.handle_async_request(request)
+        except BaseException:
+            semaphore.release()
+            raise
+
+        assert isinstance(response.stream, httpx.AsyncByteStream)
+        return httpx.Response(
+            status_code=response.status_code,
+            headers=response.headers,
+            stream=_ReleasingStream(response.stream, semaphore.release),
+            extensions=response.extensions,
+        )
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+def _new_async_client() -> httpx.AsyncClient:
+    transport = httpx.AsyncHTTPTransport(
+        limits=httpx.Limits(
+            max_connections=unique_sdk.http_pool_max_connections,
+            max_keepalive_connections=unique_sdk.http_pool_max_connections,
+            keepalive_expiry=unique_sdk.http_pool_keepalive_expiry,
+        ),
+        http2=_http2_enabled(),
+    )
+    return httpx.AsyncClient(
+        transport=_PerHostLimitedTransport(
+            transport, unique_sdk.http_pool_max_connections_per_host
+        ),
+        timeout=unique_sdk.http_pool_timeout,
+        cookies=CookieJar(policy=_NO_COOKIES_POLICY),
+    )
+
+
+def get_async_http_client() -> httpx.AsyncClient:
+    """Return the pooled :class:`httpx.AsyncClient` for the running event loop.
+
+    Must be called from within a coroutine.
+    """
+    loop = asyncio.get_running_loop()
+    with _lock:
+        client = _async_clients.get(loop)
+        if client is None or client.is_closed:
+            client = _async_clients[loop] = _new_async_client()
+        return client
+
+
+def http_pool_stats() -> HTTPPoolStats:
+    """Per-host request and new-connection counts of the shared pools.
+
+    ``connections_opened`` well below ``requests`` means keep-alive works;
+    the sync counts cover the host pools currently held by the session.
+    """
+    sync: dict[str, HostPoolStats] = {}
+    with _lock:
+        session = _session
+    if session is not None:
+        for adapter in dict.fromkeys(session.adapters.values()):
+            if not isinstance(adapter, HTTPAdapter):
+                continue
+            pools = adapter.poolmanager.pools
+            for key in pools.keys():
+                pool = pools.get(key)
+                if pool is None:
+                    continue
+                stats = sync.setdefault(
+                    pool.host, HostPoolStats(requests=0, connections_opened=0)
+                )
+                stats["requests"] += pool.num_requests
+                stats["connections_opened"] += pool.num_connections
+
+    return HTTPPoolStats(
+        sync_hosts=sync,
+        async_hosts={
+            host: HostPoolStats(**stats) for host, stats in _async_stats.items()
+        },
+    )
+
+
+def close_http_pool() -> None:
+    """Close the shared sync session; the next call creates a fresh pool."""
+    global _session
+    with _lock:
+        session, _session = _session, None
+    if session is not None:
+        session.close()
+
+
+async def close_http_pool_async() -> None:
+    """Close the shared sync session and the running loop's async client."""
+    close_http_pool()
+    loop = asyncio.get_running_loop()
+    with _lock:
+        client = _async_clients.pop(loop, None)
+    if client is not None:
+        await client.aclose()
+    _async_stats.clear()
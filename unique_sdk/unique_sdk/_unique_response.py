@@ -1,6 +1,7 @@
 import json
 from collections import OrderedDict
 from collections.abc import Mapping
+from typing import Protocol, Self, TypeVar
 
 
 class UniqueResponseBase(object):
@@ -23,3 +24,13 @@ class UniqueResponse(UniqueResponseBase):
             self.data = OrderedDict()
         else:
             self.data = json.loads(body, object_pairs_hook=OrderedDict)
+
+
+class TypedResponseModel(Protocol):
+    """A model that validates a raw JSON response body, e.g. a pydantic model."""
+
+    @classmethod
+    def model_validate_json(cls, json_data: str | bytes, /) -> Self: ...
+
+
+TypedResponseModelT = TypeVar("TypedResponseModelT", bound=TypedResponseModel)
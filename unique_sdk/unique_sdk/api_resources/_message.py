@@ -13,6 +13,7 @@ from urllib.parse import quote_plus
 from unique_sdk._api_resource import APIResource
 from unique_sdk._list_object import ListObject
 from unique_sdk._request_options import RequestOptions
+from unique_sdk._unique_response import TypedResponseModelT
 from unique_sdk._util import class_method_variant, classproperty
 
 
@@ -138,6 +139,50 @@ class Message(APIResource["Message"]):
 
         return result
 
+    @classmethod
+    def list_typed(
+        cls,
+        response_model: type[TypedResponseModelT],
+        user_id: str,
+        company_id: str,
+        **params: Unpack["Message.ListParams"],
+    ) -> TypedResponseModelT:
+        """
+        Returns the messages of a given chat validated into `response_model`.
+
+        The model receives the raw list response (`{"object": "list", "data":
+        [...]}`) and is validated with its `model_validate_json`, skipping the
+        `ListObject` and `Message` objects `list` builds.
+        """
+        return cls._static_request_typed(
+            "get",
+            cls.class_url(),
+            response_model,
+            user_id,
+            company_id,
+            params=params,
+        )
+
+    @classmethod
+    async def list_typed_async(
+        cls,
+        response_model: type[TypedResponseModelT],
+        user_id: str,
+        company_id: str,
+        **params: Unpack["Message.ListParams"],
+    ) -> TypedResponseModelT:
+        """
+        Returns the messages of a given chat validated into `response_model`.
+        """
+        return await cls._static_request_typed_async(
+            "get",
+            cls.class_url(),
+            response_model,
+            user_id,
+            company_id,
+            params=params,
+        )
+
     @classmethod
     def retrieve(
         cls,
@@ -1,5 +1,5 @@
 """Allow running as `python -m unique_sdk.cli`."""
 
-from unique_sdk.cli.cli import main
+from unique_sdk.cli.daemon import entry
 
-main()
+entry()
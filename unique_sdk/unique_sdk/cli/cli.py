@@ -2,103 +2,184 @@
 
 from __future__ import annotations
 
+import importlib
 import json
 from collections.abc import Callable
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import click
 
 from unique_sdk.cli import __version__
-from unique_sdk.cli.commands.agentic_table import (
-    cmd_cell_history,
-    cmd_get_cell,
-    cmd_get_sheet,
-    cmd_list_exports,
-)
-from unique_sdk.cli.commands.agentic_table import (
-    is_error_output as _is_agentic_table_error_output,
-)
-from unique_sdk.cli.commands.agentic_table_write import (
-    cmd_create_sheet,
-    cmd_export,
-    cmd_import,
-    cmd_rerun_row,
-)
-from unique_sdk.cli.commands.browser import (
-    cmd_browser_action,
-    cmd_browser_control,
-    cmd_browser_download,
-    cmd_browser_status,
-)
-from unique_sdk.cli.commands.browser import (
-    is_error_output as _is_browser_error_output,
-)
-from unique_sdk.cli.commands.cite_file import cmd_cite_file
-from unique_sdk.cli.commands.cite_file import (
-    is_error_output as _is_cite_error_output,
-)
-from unique_sdk.cli.commands.elicitation import (
-    DEFAULT_WAIT_TIMEOUT_SECONDS,
-    cmd_elicit_ask,
-    cmd_elicit_create,
-    cmd_elicit_get,
-    cmd_elicit_pending,
-    cmd_elicit_respond,
-    cmd_elicit_wait,
-)
-from unique_sdk.cli.commands.files import (
-    cmd_download,
-    cmd_mv_file,
-    cmd_restore_version,
-    cmd_rm,
-    cmd_upload,
-    cmd_versions,
-)
-from unique_sdk.cli.commands.files import (
-    is_permission_denied_output as _is_permission_denied_output,
-)
-from unique_sdk.cli.commands.folders import cmd_mkdir, cmd_mvdir, cmd_rmdir
-from unique_sdk.cli.commands.mcp import cmd_mcp
-from unique_sdk.cli.commands.navigation import cmd_cd, cmd_ls, cmd_pwd
-from unique_sdk.cli.commands.read import cmd_read
-from unique_sdk.cli.commands.read import (
-    is_error_output as _is_read_error_output,
-)
-from unique_sdk.cli.commands.scheduled_tasks import (
-    cmd_schedule_create,
-    cmd_schedule_delete,
-    cmd_schedule_get,
-    cmd_schedule_list,
-    cmd_schedule_update,
-)
-from unique_sdk.cli.commands.search import (
-    cmd_search,
-    cmd_uploaded_search,
-)
-from unique_sdk.cli.commands.search import (
-    is_error_output as _is_search_error_output,
-)
-from unique_sdk.cli.commands.search import (
-    is_uploaded_search_error_output as _is_uploaded_search_error_output,
-)
-from unique_sdk.cli.commands.subagent import cmd_subagent
-from unique_sdk.cli.commands.subagent import (
-    is_error_output as _is_subagent_error_output,
-)
-from unique_sdk.cli.commands.web_search import (
-    cmd_web_crawl,
-    cmd_web_search,
-)
-from unique_sdk.cli.commands.web_search import (
-    is_error_output as _is_web_search_error_output,
-)
+from unique_sdk.cli.commands.elicitation import DEFAULT_WAIT_TIMEOUT_SECONDS
 from unique_sdk.cli.commands.web_search_config import ENV_CONFIG_PATH
 from unique_sdk.cli.config import load_config
+from unique_sdk.cli.daemon import (
+    DAEMON_SOCKET_ENV,
+    DEFAULT_IDLE_TIMEOUT_SECONDS,
+    DEFAULT_STATE_TTL_SECONDS,
+    CliDaemon,
+    DaemonError,
+)
 from unique_sdk.cli.identity import TurnIdentityError, resolve_message_id
-from unique_sdk.cli.shell import UniqueShell
 from unique_sdk.cli.state import ShellState
 
 
+def _lazy(module: str, name: str) -> Callable[..., Any]:
+    """Return a stand-in for ``commands.<module>.<name>`` that imports on call.
+
+    The CLI is spawned once per agent tool call, so startup must stay cheap:
+    a command module, and the SDK resources and HTTP clients it pulls in, is
+    only imported when one of its subcommands is dispatched.
+    """
+
+    def call(*args: Any, **kwargs: Any) -> Any:
+        command_module = importlib.import_module(f"unique_sdk.cli.commands.{module}")
+        return getattr(command_module, name)(*args, **kwargs)
+
+    call.__name__ = call.__qualname__ = name
+    return call
+
+
+if TYPE_CHECKING:
+    from unique_sdk.cli.commands.agentic_table import (
+        cmd_cell_history,
+        cmd_get_cell,
+        cmd_get_sheet,
+        cmd_list_exports,
+    )
+    from unique_sdk.cli.commands.agentic_table import (
+        is_error_output as _is_agentic_table_error_output,
+    )
+    from unique_sdk.cli.commands.agentic_table_write import (
+        cmd_create_sheet,
+        cmd_export,
+        cmd_import,
+        cmd_rerun_row,
+    )
+    from unique_sdk.cli.commands.browser import (
+        cmd_browser_action,
+        cmd_browser_control,
+        cmd_browser_download,
+        cmd_browser_status,
+    )
+    from unique_sdk.cli.commands.browser import (
+        is_error_output as _is_browser_error_output,
+    )
+    from unique_sdk.cli.commands.cite_file import cmd_cite_file
+    from unique_sdk.cli.commands.cite_file import (
+        is_error_output as _is_cite_error_output,
+    )
+    from unique_sdk.cli.commands.elicitation import (
+        cmd_elicit_ask,
+        cmd_elicit_create,
+        cmd_elicit_get,
+        cmd_elicit_pending,
+        cmd_elicit_respond,
+        cmd_elicit_wait,
+    )
+    from unique_sdk.cli.commands.files import (
+        cmd_download,
+        cmd_mv_file,
+        cmd_restore_version,
+        cmd_rm,
+        cmd_upload,
+        cmd_versions,
+    )
+    from unique_sdk.cli.commands.files import (
+        is_permission_denied_output as _is_permission_denied_output,
+    )
+    from unique_sdk.cli.commands.folders import cmd_mkdir, cmd_mvdir, cmd_rmdir
+    from unique_sdk.cli.commands.mcp import cmd_mcp
+    from unique_sdk.cli.commands.navigation import cmd_cd, cmd_ls, cmd_pwd
+    from unique_sdk.cli.commands.read import cmd_read
+    from unique_sdk.cli.commands.read import (
+        is_error_output as _is_read_error_output,
+    )
+    from unique_sdk.cli.commands.scheduled_tasks import (
+        cmd_schedule_create,
+        cmd_schedule_delete,
+        cmd_schedule_get,
+        cmd_schedule_list,
+        cmd_schedule_update,
+    )
+    from unique_sdk.cli.commands.search import (
+        cmd_search,
+        cmd_uploaded_search,
+    )
+    from unique_sdk.cli.commands.search import (
+        is_error_output as _is_search_error_output,
+    )
+    from unique_sdk.cli.commands.search import (
+        is_uploaded_search_error_output as _is_uploaded_search_error_output,
+    )
+    from unique_sdk.cli.commands.subagent import cmd_subagent
+    from unique_sdk.cli.commands.subagent import (
+        is_error_output as _is_subagent_error_output,
+    )
+    from unique_sdk.cli.commands.web_search import (
+        cmd_web_crawl,
+        cmd_web_search,
+    )
+    from unique_sdk.cli.commands.web_search import (
+        is_error_output as _is_web_search_error_output,
+    )
+else:
+    cmd_cell_history = _lazy("agentic_table", "cmd_cell_history")
+    cmd_get_cell = _lazy("agentic_table", "cmd_get_cell")
+    cmd_get_sheet = _lazy("agentic_table", "cmd_get_sheet")
+    cmd_list_exports = _lazy("agentic_table", "cmd_list_exports")
+    _is_agentic_table_error_output = _lazy("agentic_table", "is_error_output")
+    cmd_create_sheet = _lazy("agentic_table_write", "cmd_create_sheet")
+    cmd_export = _lazy("agentic_table_write", "cmd_export")
+    cmd_import = _lazy("agentic_table_write", "cmd_import")
+    cmd_rerun_row = _lazy("agentic_table_write", "cmd_rerun_row")
+    cmd_browser_action = _lazy("browser", "cmd_browser_action")
+    cmd_browser_control = _lazy("browser", "cmd_browser_control")
+    cmd_browser_download = _lazy("browser", "cmd_browser_download")
+    cmd_browser_status = _lazy("browser", "cmd_browser_status")
+    _is_browser_error_output = _lazy("browser", "is_error_output")
+    cmd_cite_file = _lazy("cite_file", "cmd_cite_file")
+    _is_cite_error_output = _lazy("cite_file", "is_error_output")
+    cmd_elicit_ask = _lazy("elicitation", "cmd_elicit_ask")
+    cmd_elicit_create = _lazy("elicitation", "cmd_elicit_create")
+    cmd_elicit_get = _lazy("elicitation", "cmd_elicit_get")
+    cmd_elicit_pending = _lazy("elicitation", "cmd_elicit_pending")
+    cmd_elicit_respond = _lazy("elicitation", "cmd_elicit_respond")
+    cmd_elicit_wait = _lazy("elicitation", "cmd_elicit_wait")
+    cmd_download = _lazy("files", "cmd_download")
+    cmd_mv_file = _lazy("files", "cmd_mv_file")
+    cmd_restore_version = _lazy("files", "cmd_restore_version")
+    cmd_rm = _lazy("files", "cmd_rm")
+    cmd_upload = _lazy("files", "cmd_upload")
+    cmd_versions = _lazy("files", "cmd_versions")
+    _is_permission_denied_output = _lazy("files", "is_permission_denied_output")
+    cmd_mkdir = _lazy("folders", "cmd_mkdir")
+    cmd_mvdir = _lazy("folders", "cmd_mvdir")
+    cmd_rmdir = _lazy("folders", "cmd_rmdir")
+    cmd_mcp = _lazy("mcp", "cmd_mcp")
+    cmd_cd = _lazy("navigation", "cmd_cd")
+    cmd_ls = _lazy("navigation", "cmd_ls")
+    cmd_pwd = _lazy("navigation", "cmd_pwd")
+    cmd_read = _lazy("read", "cmd_read")
+    _is_read_error_output = _lazy("read", "is_error_output")
+    cmd_schedule_create = _lazy("scheduled_tasks", "cmd_schedule_create")
+    cmd_schedule_delete = _lazy("scheduled_tasks", "cmd_schedule_delete")
+    cmd_schedule_get = _lazy("scheduled_tasks", "cmd_schedule_get")
+    cmd_schedule_list = _lazy("scheduled_tasks", "cmd_schedule_list")
+    cmd_schedule_update = _lazy("scheduled_tasks", "cmd_schedule_update")
+    cmd_search = _lazy("search", "cmd_search")
+    cmd_uploaded_search = _lazy("search", "cmd_uploaded_search")
+    _is_search_error_output = _lazy("search", "is_error_output")
+    _is_uploaded_search_error_output = _lazy(
+        "search", "is_uploaded_search_error_output"
+    )
+    cmd_subagent = _lazy("subagent", "cmd_subagent")
+    _is_subagent_error_output = _lazy("subagent", "is_error_output")
+    cmd_web_crawl = _lazy("web_search", "cmd_web_crawl")
+    cmd_web_search = _lazy("web_search", "cmd_web_search")
+    _is_web_search_error_output = _lazy("web_search", "is_error_output")
+
+
 def _resolve_cli_message_id(
     ctx: click.Context,
     explicit: str | None,
@@ -179,13 +260,19 @@ Examples:
 
 
 class LazyState:
-    """Lazily initializes ShellState on first access so --help works without env vars."""
+    """Lazily initializes ShellState on first access so --help works without env vars.
+
+    ``ctx.obj`` may also be a zero-argument factory (``unique-cli daemon``
+    passes one that reuses warm state); it is called on first access instead.
+    """
 
     @staticmethod
     def get(ctx: click.Context) -> ShellState:
         if ctx.obj is None:
             config = load_config()
             ctx.obj = ShellState(config)
+        elif callable(ctx.obj):
+            ctx.obj = ctx.obj()
         return ctx.obj
 
 
@@ -213,6 +300,8 @@ def emit(
 @click.pass_context
 def main(ctx: click.Context) -> None:
     if ctx.invoked_subcommand is None:
+        from unique_sdk.cli.shell import UniqueShell
+
         state = LazyState.get(ctx)
         shell = UniqueShell(state)
         shell.intro = (
@@ -2679,3 +2768,52 @@ def agentic_table_export(
         ),
         is_error=_is_agentic_table_error_output,
     )
+
+
+@main.command(name="daemon")
+@click.option(
+    "--socket",
+    "socket_path",
+    envvar=DAEMON_SOCKET_ENV,
+    required=True,
+    type=click.Path(dir_okay=False),
+    help=f"Unix socket to listen on (default: ${DAEMON_SOCKET_ENV}).",
+)
+@click.option(
+    "--idle-timeout",
+    type=click.FloatRange(min=0, min_open=True),
+    default=DEFAULT_IDLE_TIMEOUT_SECONDS,
+    show_default=True,
+    help="Exit after this many seconds without a call.",
+)
+@click.option(
+    "--state-ttl",
+    type=click.FloatRange(min=0),
+    default=DEFAULT_STATE_TTL_SECONDS,
+    show_default=True,
+    help="Seconds a warm shell state is reused.",
+)
+def daemon(socket_path: str, idle_timeout: float, state_ttl: float) -> None:
+    """Serve unique-cli calls from one warm process over a Unix socket.
+
+    \b
+    With UNIQUE_CLI_DAEMON_SOCKET set to the same path, every unique-cli
+    call is forwarded to this process, which keeps the HTTP connections
+    and the parsed workspace config files warm.
+    Output and exit codes are the same as without the daemon; calls fall
+    back to running in-process while no daemon is listening.
+
+    \b
+    Examples:
+      export UNIQUE_CLI_DAEMON_SOCKET=/tmp/unique-cli.sock
+      unique-cli daemon &
+      unique-cli search "quarterly revenue"
+    """
+    server = CliDaemon(socket_path, idle_timeout=idle_timeout, state_ttl=state_ttl)
+    try:
+        server.bind()
+    except (DaemonError, OSError) as exc:
+        click.echo(f"Error: {exc}", err=True)
+        raise SystemExit(1)
+    click.echo(f"unique-cli daemon listening on {socket_path}", err=True)
+    server.serve()
@@ -0,0 +1,418 @@
+"""Optional long-lived ``unique-cli`` server and the thin client in front of it.
+
+Agent loops spawn ``unique-cli`` once per tool call. Each call pays for the
+interpreter start, the SDK imports, re-reading the workspace config files and
+new TLS connections. ``unique-cli daemon`` keeps one warm process listening on
+a Unix socket instead: when ``UNIQUE_CLI_DAEMON_SOCKET`` points at it, the
+``unique-cli`` entry point only forwards its arguments, working directory and
+environment, then replays the captured stdout, stderr and exit code.
+
+The server runs one command at a time with the client's working directory and
+environment applied, so commands behave exactly as in a fresh process. Across
+calls it keeps the pooled HTTP connections and a ``ShellState`` per
+configuration, working directory and workspace config files, with the parsed
+config files. The folder and content resolutions a state caches are dropped
+before every call, since an earlier call may have renamed, moved or deleted
+what they describe. A state is rebuilt after ``state_ttl`` seconds.
+
+Without a reachable daemon, and for commands that read stdin, block for a long
+time (``elicit``, ``subagent``) or open the interactive shell, the entry point
+runs the command in-process as before. Apart from the ``unique_sdk`` package
+it lives in, this module only imports the standard library at the top so the
+client path stays cheap.
+"""
+
+from __future__ import annotations
+
+import importlib
+import io
+import json
+import os
+import socket
+import struct
+import sys
+import time
+import traceback
+from collections import OrderedDict
+from collections.abc import Sequence
+from contextlib import redirect_stderr, redirect_stdout
+from typing import TYPE_CHECKING, Any
+
+import unique_sdk
+
+if TYPE_CHECKING:
+    from unique_sdk.cli.state import ShellState
+
+DAEMON_SOCKET_ENV = "UNIQUE_CLI_DAEMON_SOCKET"
+DEFAULT_IDLE_TIMEOUT_SECONDS = 900.0
+DEFAULT_STATE_TTL_SECONDS = 300.0
+_MAX_WARM_STATES = 16
+_CONNECT_TIMEOUT_SECONDS = 1.0
+_FRAME_HEADER = struct.Struct("!I")
+
+# Environment variables ``load_config`` reads; warm states are keyed by their
+# raw values so a call never inherits settings resolved for an earlier call.
+_CONFIG_ENV_VARS = (
+    "UNIQUE_USER_ID",
+    "UNIQUE_COMPANY_ID",
+    "UNIQUE_API_KEY",
+    "UNIQUE_APP_ID",
+    "UNIQUE_API_BASE",
+    "INGESTION_UPLOAD_API_URL_INTERNAL",
+)
+
+# ``unique_sdk`` module settings ``load_config`` assigns. ``load_config`` falls
+# back to the current ``unique_sdk.api_base``, so they are reset to their
+# import-time values before every call.
+_SDK_CONFIG_ATTRIBUTES = (
+    "api_key",
+    "app_id",
+    "api_base",
+    "ingestion_upload_api_url_internal",
+)
+_SDK_DEFAULTS = {name: getattr(unique_sdk, name) for name in _SDK_CONFIG_ATTRIBUTES}
+
+# Commands that must run in the caller's process: the daemon serves one
+# command at a time, so commands that wait for a user or another agent would
+# block every other call.
+_LOCAL_ONLY_COMMANDS = frozenset({"daemon", "elicit", "subagent"})
+
+# Command modules imported when the daemon starts so the first call is warm.
+_WARM_MODULES = (
+    "unique_sdk.cli.commands.agentic_table",
+    "unique_sdk.cli.commands.agentic_table_write",
+    "unique_sdk.cli.commands.cite_file",
+    "unique_sdk.cli.commands.files",
+    "unique_sdk.cli.commands.folders",
+    "unique_sdk.cli.commands.mcp",
+    "unique_sdk.cli.commands.navigation",
+    "unique_sdk.cli.commands.read",
+    "unique_sdk.cli.commands.search",
+    "unique_sdk.cli.commands.web_search",
+)
+
+
+class DaemonError(Exception):
+    """Raised when the daemon cannot start or a forwarded call breaks off."""
+
+
+def _send_frame(sock: socket.socket, payload: bytes) -> None:
+    sock.sendall(_FRAME_HEADER.pack(len(payload)) + payload)
+
+
+def _recv_exact(sock: socket.socket, size: int) -> bytes:
+    chunks: list[bytes] = []
+    while size:
+        chunk = sock.recv(min(size, 1 << 20))
+        if not chunk:
+            raise ConnectionError("connection closed mid-frame")
+        chunks.append(chunk)
+        size -= len(chunk)
+    return b"".join(chunks)
+
+
+def _recv_frame(sock: socket.socket) -> bytes:
+    (size,) = _FRAME_HEADER.unpack(_recv_exact(sock, _FRAME_HEADER.size))
+    return _recv_exact(sock, size)
+
+
+# ── Client ──────────────────────────────────────────────────────────────────
+
+
+def is_forwardable(argv: Sequence[str]) -> bool:
+    """Whether ``argv`` may run in the daemon rather than in this process."""
+    if not argv or "--stdin" in argv:
+        return False
+    command = next((arg for arg in argv if not arg.startswith("-")), None)
+    return command not in _LOCAL_ONLY_COMMANDS
+
+
+def _program_name() -> str:
+    """The program name click derives for usage messages in this process."""
+    name = os.path.basename(sys.argv[0]) if sys.argv else "unique-cli"
+    package = getattr(sys.modules.get("__main__"), "__package__", None)
+    if not package:
+        return name
+    module = os.path.splitext(name)[0]
+    return f"python -m {package if module == '__main__' else f'{package}.{module}'}"
+
+
+def run_via_daemon(socket_path: str, argv: Sequence[str]) -> int | None:
+    """Run ``argv`` in the daemon at ``socket_path`` and replay its output.
+
+    Returns the command's exit code, or ``None`` when no daemon accepted the
+    call, in which case the caller should run the command itself. Once the
+    request is sent the command may have had effects, so a broken connection
+    raises ``DaemonError`` instead of asking for a second run.
+    """
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.settimeout(_CONNECT_TIMEOUT_SECONDS)
+        try:
+            sock.connect(socket_path)
+        except OSError:
+            return None
+        sock.settimeout(None)
+        request = {
+            "argv": list(argv),
+            "prog_name": _program_name(),
+            "cwd": os.getcwd(),
+            "env": dict(os.environ),
+        }
+        try:
+            _send_frame(sock, json.dumps(request).encode("utf-8"))
+        except OSError:
+            return None
+        try:
+            header = json.loads(_recv_frame(sock))
+            stdout = _recv_frame(sock)
+            stderr = _recv_frame(sock)
+        except (OSError, ValueError) as exc:
+            raise DaemonError(f"lost connection to unique-cli daemon: {exc}") from exc
+    finally:
+        sock.close()
+
+    sys.stdout.flush()
+    sys.stdout.buffer.write(stdout)
+    sys.stdout.buffer.flush()
+    sys.stderr.flush()
+    sys.stderr.buffer.write(stderr)
+    sys.stderr.buffer.flush()
+    return int(header["exit_code"])
+
+
+def entry() -> None:
+    """``unique-cli`` console entry point: use the daemon when one is configured."""
+    argv = sys.argv[1:]
+    socket_path = os.environ.get(DAEMON_SOCKET_ENV)
+    if socket_path and is_forwardable(argv):
+        try:
+            exit_code = run_via_daemon(socket_path, argv)
+        except DaemonError as exc:
+            print(f"Error: {exc}", file=sys.stderr)
+            sys.exit(1)
+        if exit_code is not None:
+            sys.exit(exit_code)
+
+    from unique_sdk.cli.cli import main
+
+    main()
+
+
+# ── Server ──────────────────────────────────────────────────────────────────
+
+
+class _WarmStates:
+    """``ShellState`` objects reused across calls with the same context.
+
+    A state is keyed by the raw configuration variables of the call's
+    environment, the working directory and the fingerprint of the workspace
+    config files, and handed out reset to ``/`` and without cached folder and
+    content resolutions, like the state of a fresh process. The configuration is loaded on every call, since it also sets
+    the ``unique_sdk`` module settings the commands use.
+    """
+
+    def __init__(self, ttl: float) -> None:
+        self._ttl = ttl
+        self._states: OrderedDict[tuple[Any, ...], tuple[float, ShellState]] = (
+            OrderedDict()
+        )
+
+    def get(self) -> ShellState:
+        from unique_sdk.cli.config import load_config
+        from unique_sdk.cli.state import ShellState, workspace_config_fingerprint
+
+        config = load_config()
+        key = (
+            *(os.environ.get(var) for var in _CONFIG_ENV_VARS),
+            os.getcwd(),
+            workspace_config_fingerprint(),
+        )
+        now = time.monotonic()
+        cached = self._states.get(key)
+        if cached is not None and now - cached[0] < self._ttl:
+            self._states.move_to_end(key)
+            state = cached[1]
+            state.cd("/")
+            state.clear_resolution_caches()
+            return state
+
+        state = ShellState(config)
+        self._states[key] = (now, state)
+        self._states.move_to_end(key)
+        while len(self._states) > _MAX_WARM_STATES:
+            self._states.popitem(last=False)
+        return state
+
+
+class CliDaemon:
+    """Serve ``unique-cli`` calls on a Unix socket, one at a time."""
+
+    def __init__(
+        self,
+        socket_path: str,
+        *,
+        idle_timeout: float = DEFAULT_IDLE_TIMEOUT_SECONDS,
+        state_ttl: float = DEFAULT_STATE_TTL_SECONDS,
+    ) -> None:
+        self.socket_path = socket_path
+        self._idle_timeout = idle_timeout
+        self._states = _WarmStates(state_ttl)
+        self._sock: socket.socket | None = None
+
+    def bind(self) -> None:
+        """Listen on ``socket_path``, replacing a stale socket file.
+
+        Raises ``DaemonError`` when another daemon already serves the path.
+        """
+        if os.path.exists(self.socket_path):
+            probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            try:
+                probe.connect(self.socket_path)
+            except OSError:
+                os.unlink(self.socket_path)
+            else:
+                raise DaemonError(
+                    f"a unique-cli daemon is already listening on {self.socket_path}"
+                )
+            finally:
+                probe.close()
+
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        # The socket runs commands with the caller's credentials: only the
+        # owner may connect.
+        old_umask = os.umask(0o177)
+        try:
+            sock.bind(self.socket_path)
+        finally:
+            os.umask(old_umask)
+        sock.listen()
+        sock.settimeout(self._idle_timeout)
+        self._sock = sock
+
+    def serve(self) -> None:
+        """Handle calls until no call arrives for ``idle_timeout`` seconds."""
+        if self._sock is None:
+            self.bind()
+        sock = self._sock
+        assert sock is not None
+        for module in _WARM_MODULES:
+            importlib.import_module(module)
+        try:
+            while True:
+                try:
+                    conn, _ = sock.accept()
+                except TimeoutError:
+                    return
+                except OSError:
+                    # Closed by close() from another thread.
+                    return
+                with conn:
+                    self._handle(conn)
+        finally:
+            self.close()
+
+    def close(self) -> None:
+        """Stop listening; wakes up a ``serve()`` blocked in another thread."""
+        sock, self._sock = self._sock, None
+        if sock is None:
+            return
+        try:
+            sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        sock.close()
+        try:
+            os.unlink(self.socket_path)
+        except FileNotFoundError:
+            pass
+
+    def _handle(self, conn: socket.socket) -> None:
+        conn.settimeout(None)
+        try:
+            request = json.loads(_recv_frame(conn))
+        except (OSError, ValueError):
+            return
+        exit_code, stdout, stderr = self.run(
+            request["argv"],
+            cwd=request["cwd"],
+            env=request["env"],
+            prog_name=request.get("prog_name", "unique-cli"),
+        )
+        try:
+            _send_frame(conn, json.dumps({"exit_code": exit_code}).encode("utf-8"))
+            _send_frame(conn, stdout)
+            _send_frame(conn, stderr)
+        except OSError:
+            pass
+
+    def run(
+        self,
+        argv: Sequence[str],
+        *,
+        cwd: str,
+        env: dict[str, str],
+        prog_name: str = "unique-cli",
+    ) -> tuple[int, bytes, bytes]:
+        """Run one ``unique-cli`` call as a fresh process would.
+
+        Returns ``(exit_code, stdout, stderr)``. The working directory and
+        environment of the process are swapped for the duration of the call,
+        and the ``unique_sdk`` settings start from their import-time values.
+        """
+        from unique_sdk.cli.cli import main
+
+        stdout_bytes, stderr_bytes = io.BytesIO(), io.BytesIO()
+        stdout = io.TextIOWrapper(stdout_bytes, encoding="utf-8", write_through=True)
+        stderr = io.TextIOWrapper(stderr_bytes, encoding="utf-8", write_through=True)
+        saved_cwd = os.getcwd()
+        saved_env = dict(os.environ)
+        saved_sdk = _sdk_settings()
+        exit_code = 0
+        try:
+            _apply_sdk_settings(_SDK_DEFAULTS)
+            os.environ.clear()
+            os.environ.update(env)
+            os.chdir(cwd)
+            with redirect_stdout(stdout), redirect_stderr(stderr):
+                try:
+                    main.main(
+                        args=list(argv),
+                        prog_name=prog_name,
+                        obj=self._states.get,
+                    )
+                except SystemExit as exc:
+                    exit_code = _exit_code(exc.code)
+                except Exception:
+                    traceback.print_exc()
+                    exit_code = 1
+        except OSError as exc:
+            print(f"Error: {exc}", file=stderr)
+            exit_code = 1
+        finally:
+            os.environ.clear()
+            os.environ.update(saved_env)
+            os.chdir(saved_cwd)
+            _apply_sdk_settings(saved_sdk)
+        stdout.flush()
+        stderr.flush()
+        return exit_code, stdout_bytes.getvalue(), stderr_bytes.getvalue()
+
+
+def _sdk_settings() -> dict[str, Any]:
+    return {name: getattr(unique_sdk, name) for name in _SDK_CONFIG_ATTRIBUTES}
+
+
+def _apply_sdk_settings(settings: dict[str, Any]) -> None:
+    for name, value in settings.items():
+        setattr(unique_sdk, name, value)
+
+
+def _exit_code(code: object) -> int:
+    """Exit status of ``SystemExit(code)``, as the interpreter would report it."""
+    if code is None:
+        return 0
+    if isinstance(code, int):
+        return code
+    print(code, file=sys.stderr)
+    return 1
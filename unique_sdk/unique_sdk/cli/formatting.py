@@ -7,9 +7,6 @@ from collections.abc import Mapping, Sequence
 from datetime import datetime
 from typing import TYPE_CHECKING, Any
 
-from unique_sdk.api_resources._content import Content
-from unique_sdk.api_resources._folder import Folder
-
 if TYPE_CHECKING:
     from unique_sdk.api_resources._agentic_table import (
         AgenticTableCell,
@@ -18,6 +15,8 @@ if TYPE_CHECKING:
         MagicTableActionResult,
         MagicTableArtifact,
     )
+    from unique_sdk.api_resources._content import Content
+    from unique_sdk.api_resources._folder import Folder
     from unique_sdk.api_resources._mcp import MCP
     from unique_sdk.api_resources._scheduled_task import ScheduledTask
 
@@ -17,6 +17,28 @@ _MCP_TOOLS_CONFIG_FILENAME = ".unique-mcp-tools.json"
 _CHAT_FILES_MANIFEST_PATH = Path(".unique") / "chat-files.json"
 
 
+def workspace_config_fingerprint() -> tuple[tuple[int, int] | None, ...]:
+    """``(mtime_ns, size)`` of each cwd file ``ShellState`` reads, ``None`` if absent.
+
+    Lets a long-lived process (``unique-cli daemon``) tell whether a cached
+    ``ShellState`` still reflects the workspace files the runner wrote.
+    """
+    fingerprint: list[tuple[int, int] | None] = []
+    for name in (
+        _SEARCH_CONFIG_FILENAME,
+        _UPLOADED_CONFIG_FILENAME,
+        _MCP_TOOLS_CONFIG_FILENAME,
+        _CHAT_FILES_MANIFEST_PATH,
+    ):
+        try:
+            stat = (Path.cwd() / name).stat()
+        except OSError:
+            fingerprint.append(None)
+        else:
+            fingerprint.append((stat.st_mtime_ns, stat.st_size))
+    return tuple(fingerprint)
+
+
 def _load_search_config() -> dict[str, Any]:
     """Load ``.unique-search.json`` from the cwd, or ``{}`` when absent/invalid."""
     config_path = Path.cwd() / _SEARCH_CONFIG_FILENAME
@@ -180,6 +202,22 @@ class ShellState:
             _load_mcp_tool_configs()
         )
 
+    def clear_resolution_caches(self) -> None:
+        """Drop the per-turn folder and content resolutions.
+
+        For a ``ShellState`` reused across calls (``unique-cli daemon``): an
+        earlier call may have renamed, moved or deleted the documents and
+        folders these caches describe, so each call resolves them again, as a
+        fresh process would. The parsed workspace config files are kept.
+        """
+        self._workspace_scope_paths = None
+        self._scope_path_cache.clear()
+        self._content_owner_path_cache.clear()
+        self._chat_file_content_ids_cache = None
+        self._content_info_cache.clear()
+        # Rebuilds the MetadataFilter, dropping its per-content verdicts.
+        self.workspace_metadata_filter = self._workspace_metadata_filter
+
     @property
     def uploaded_search_available(self) -> bool:
         """True when this task has per-row uploaded documents to search.
@@ -1,12 +1,18 @@
 from __future__ import annotations
 
-import asyncio
 import warnings
 from collections.abc import Awaitable, Callable, Sequence
 from typing import Any, Literal
 
 from unique_sdk.api_resources._message import Message
 from unique_sdk.api_resources._space import Space
+from unique_sdk.utils.completion_waiter import (
+    DEFAULT_MAX_POLL_INTERVAL,
+    AdaptiveInterval,
+    fetch_latest_messages,
+    get_completion_waiter,
+    latest_message_key,
+)
 from unique_sdk.utils.file_io import upload_file
 from unique_sdk.utils.file_io import (
     wait_for_ingestion_completion as _wait_for_ingestion_completion,
@@ -41,6 +47,7 @@ async def send_message_and_wait_for_completion(
     language_model: str | None = None,
     on_message_update: Callable[[Space.Message], Awaitable[None]] | None = None,
     wait_for_invocations: bool = False,
+    max_poll_interval: float | None = None,
 ) -> Space.Message:
     """
     Sends a prompt asynchronously and polls for completion. (until stoppedStreamingAt is not None)
@@ -54,7 +61,7 @@ async def send_message_and_wait_for_completion(
         skill_choices: Sequence of selected skill objects to use.
         scope_rules: Scope rules for filtering content.
         chat_id: Optional chat ID to continue an existing chat.
-        poll_interval: Seconds between polls.
+        poll_interval: Seconds between polls while the assistant makes progress.
         max_wait: Maximum seconds to wait for completion.
         stop_condition: Defines when to expect a response back, when the assistant stop streaming or when it completes the message. (default: "stoppedStreamingAt")
             Note: `debugInfo.llm_invocations` (see `get_message_invocations`) is written
@@ -74,6 +81,9 @@ async def send_message_and_wait_for_completion(
             message changes while waiting for completion.
         wait_for_invocations: When True, briefly wait for the orchestrator's final
             ``debugInfo.llm_invocations`` write after the visible response completes.
+        max_poll_interval: Upper bound in seconds the poll interval backs off to
+            while the latest message does not change. Defaults to
+            ``DEFAULT_MAX_POLL_INTERVAL`` (5s) or ``poll_interval`` if larger.
 
     Returns:
         The completed Space.Message.
@@ -101,56 +111,78 @@ async def send_message_and_wait_for_completion(
     chat_id = response.get("chatId")
     message_id = response.get("id")
 
-    max_attempts = int(max_wait // poll_interval)
+    # Polls go through the loop's shared waiter: they back off from
+    # `poll_interval` towards `max_poll_interval` while the chat shows no
+    # progress and are batched with the polls of other waits.
+    watch = get_completion_waiter().watch(
+        fetch_latest_messages,
+        latest_message_key(user_id, company_id, chat_id),
+        interval=AdaptiveInterval(
+            poll_interval, max_poll_interval or DEFAULT_MAX_POLL_INTERVAL
+        ),
+        max_wait=max_wait,
+    )
     # The final up-to-3 polls spent waiting for `llm_invocations_complete`
     # happen after the stop condition is already met, so they must not eat
     # into the same budget as the wait for the stop condition itself --
     # otherwise a response that completes near the max_wait deadline would
     # spuriously time out while only debugInfo bookkeeping is still pending.
     if wait_for_invocations:
-        max_attempts += 3
+        watch.extend(3 * poll_interval)
     last_update_signature: tuple[str | None, str | None] | None = None
     invocation_wait_attempts = 0
-    for _ in range(max_attempts):
-        answer = await Space.get_latest_message_async(user_id, company_id, chat_id)
-        if (
-            on_message_update is not None
-            and answer.get("role") == "ASSISTANT"
-            and answer.get("text") is not None
-        ):
-            update_signature = (
-                answer.get("id"),
-                answer.get("text"),
+    async with watch:
+        while not watch.expired:
+            answer: Space.Message = await watch.poll()
+            watch.observe(
+                (
+                    answer.get("id"),
+                    answer.get("text"),
+                    answer.get("stoppedStreamingAt"),
+                    answer.get("completedAt"),
+                )
             )
-            if update_signature != last_update_signature:
-                await on_message_update(answer)
-                last_update_signature = update_signature
-        if answer.get(stop_condition) is not None:
-            try:
-                # debugInfo/llm_invocations is written via update_debug_info_async(),
-                # which always targets the original USER message, not the
-                # assistant reply (assistant=False in
-                # ChatService._construct_message_modify_params) — re-fetch by
-                # `message_id`, not the polled assistant message's own id.
-                user_message = await Message.retrieve_async(
-                    user_id, company_id, message_id, chatId=chat_id
+            if (
+                on_message_update is not None
+                and answer.get("role") == "ASSISTANT"
+                and answer.get("text") is not None
+            ):
+                update_signature = (
+                    answer.get("id"),
+                    answer.get("text"),
                 )
-                debug_info = user_message.get("debugInfo")
-                answer["debugInfo"] = debug_info
-                answer["triggeringUserMessageId"] = message_id
-                if (
-                    wait_for_invocations
-                    and not (debug_info or {}).get("llm_invocations_complete", False)
-                    and invocation_wait_attempts < 3
-                ):
-                    invocation_wait_attempts += 1
-                    await asyncio.sleep(poll_interval)
-                    continue
-            except Exception as e:
-                print(f"Failed to load debug info from user message: {e}")
+                if update_signature != last_update_signature:
+                    await on_message_update(answer)
+                    last_update_signature = update_signature
+            if answer.get(stop_condition) is not None:
+                try:
+                    # debugInfo/llm_invocations is written via
+                    # update_debug_info_async(), which always targets the
+                    # original USER message, not the assistant reply
+                    # (assistant=False in
+                    # ChatService._construct_message_modify_params) — re-fetch
+                    # by `message_id`, not the polled assistant message's id.
+                    user_message = await Message.retrieve_async(
+                        user_id, company_id, message_id, chatId=chat_id
+                    )
+                    debug_info = user_message.get("debugInfo")
+                    answer["debugInfo"] = debug_info
+                    answer["triggeringUserMessageId"] = message_id
+                    if (
+                        wait_for_invocations
+                        and not (debug_info or {}).get(
+                            "llm_invocations_complete", False
+                        )
+                        and invocation_wait_attempts < 3
+                    ):
+                        invocation_wait_attempts += 1
+                        # Poll again at the base interval, not backed off.
+                        watch.interval.reset()
+                        continue
+                except Exception as e:
+                    print(f"Failed to load debug info from user message: {e}")
 
-            return answer
-        await asyncio.sleep(poll_interval)
+                return answer
 
     raise TimeoutError("Timed out waiting for prompt completion.")
 
@@ -0,0 +1,351 @@
+"""Shared, adaptive polling for long-running operations.
+
+Sub-agent replies and content ingestion are awaited by polling their status.
+Polling every wait on its own fixed interval sends a steady stream of identical
+requests while nothing changes, multiplied by every sub-agent or upload that is
+in flight. ``CompletionWaiter`` multiplexes the pending waits of an event loop
+instead:
+
+- Each wait polls on an ``AdaptiveInterval``: it starts at the caller's
+  interval, backs off while the status stays the same and snaps back as soon
+  as it changes, e.g. while an answer is streaming.
+- Polls that fall due within a short window of each other are coalesced into
+  one batched status query per source. Waits on the same key share a single
+  request, and the ingestion source looks up all pending contents of a chat
+  with one search.
+- ``notify_status_change`` lets a push signal, such as a webhook handler,
+  short-circuit the backoff: waits on the key poll again right away.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+import weakref
+from collections.abc import Awaitable, Callable, Hashable, Mapping
+from typing import Any
+
+from unique_sdk.api_resources._content import Content
+from unique_sdk.api_resources._space import Space
+
+DEFAULT_MAX_POLL_INTERVAL = 5.0
+DEFAULT_BACKOFF_FACTOR = 1.5
+# Polls due within this many seconds of each other share one batched query.
+DEFAULT_COALESCE_WINDOW = 0.05
+
+BatchFetch = Callable[[list[Any]], Awaitable[Mapping[Any, Any]]]
+"""Fetch the status of several keys at once.
+
+Returns a mapping from key to status; a missing key reads as ``None``. A value
+that is an exception is raised in the waits on that key only.
+"""
+
+
+class AdaptiveInterval:
+    """Poll interval that backs off while nothing changes.
+
+    Starts at ``initial`` and grows by ``factor`` after every poll that
+    observed the same status as the one before, up to ``maximum``. Observing a
+    different status resets it to ``initial``.
+    """
+
+    def __init__(
+        self,
+        initial: float,
+        maximum: float,
+        factor: float = DEFAULT_BACKOFF_FACTOR,
+    ) -> None:
+        self.initial = initial
+        self.maximum = max(initial, maximum)
+        self.factor = factor
+        self.current = initial
+        self._last: Hashable | None = None
+        self._observed = False
+
+    def observe(self, signature: Hashable) -> None:
+        if self._observed and signature == self._last:
+            self.current = min(self.current * self.factor, self.maximum)
+        else:
+            self.current = self.initial
+        self._last = signature
+        self._observed = True
+
+    def reset(self) -> None:
+        self.current = self.initial
+
+
+class _Batch:
+    def __init__(self) -> None:
+        self.futures: dict[Hashable, asyncio.Future[Any]] = {}
+
+
+class CompletionWaiter:
+    """Multiplexes the status polls of one event loop.
+
+    Use ``get_completion_waiter()`` rather than creating instances, so that
+    all waits of a loop share batches.
+    """
+
+    def __init__(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        *,
+        coalesce_window: float = DEFAULT_COALESCE_WINDOW,
+    ) -> None:
+        self._loop = loop
+        self._coalesce_window = coalesce_window
+        self._batches: dict[BatchFetch, _Batch] = {}
+        self._running: set[asyncio.Task[None]] = set()
+        self._watches: dict[Hashable, set[StatusWatch]] = {}
+
+    def watch(
+        self,
+        fetch: BatchFetch,
+        key: Hashable,
+        *,
+        interval: AdaptiveInterval,
+        max_wait: float,
+    ) -> StatusWatch:
+        """Start a wait on ``key``, see ``StatusWatch``."""
+        return StatusWatch(self, fetch, key, interval, max_wait)
+
+    async def fetch(self, fetch: BatchFetch, key: Hashable) -> Any:
+        """Status of ``key``, fetched in the next batch of ``fetch``."""
+        batch = self._batches.get(fetch)
+        if batch is None:
+            batch = self._batches[fetch] = _Batch()
+            self._loop.call_later(self._coalesce_window, self._flush, fetch, batch)
+        future = batch.futures.get(key)
+        if future is None:
+            future = batch.futures[key] = self._loop.create_future()
+        # Shielded: a cancelled wait must not cancel the result other waits on
+        # the same key are sharing.
+        return await asyncio.shield(future)
+
+    def notify(self, key: Hashable) -> None:
+        """Make the waits on ``key`` poll now; safe to call from any thread."""
+        if _running_loop() is self._loop:
+            self._wake(key)
+        else:
+            self._loop.call_soon_threadsafe(self._wake, key)
+
+    def _wake(self, key: Hashable) -> None:
+        for watch in self._watches.get(key, ()):
+            watch._nudge()
+
+    def _register(self, watch: StatusWatch) -> None:
+        self._watches.setdefault(watch.key, set()).add(watch)
+
+    def _unregister(self, watch: StatusWatch) -> None:
+        watches = self._watches.get(watch.key)
+        if watches is not None:
+            watches.discard(watch)
+            if not watches:
+                del self._watches[watch.key]
+
+    def _flush(self, fetch: BatchFetch, batch: _Batch) -> None:
+        if self._batches.get(fetch) is batch:
+            del self._batches[fetch]
+        task = self._loop.create_task(self._run_batch(fetch, batch))
+        self._running.add(task)
+        task.add_done_callback(self._running.discard)
+
+    async def _run_batch(self, fetch: BatchFetch, batch: _Batch) -> None:
+        pending = {k: f for k, f in batch.futures.items() if not f.cancelled()}
+        if not pending:
+            return
+        try:
+            results = await fetch(list(pending))
+        except Exception as e:
+            for future in pending.values():
+                _resolve(future, e)
+            return
+        for key, future in pending.items():
+            _resolve(future, results.get(key))
+
+
+class StatusWatch:
+    """One wait registered with a ``CompletionWaiter``.
+
+    Use it as an async context manager and call ``poll`` until the status is
+    final or the watch has ``expired``. The first poll happens immediately,
+    later ones after the adaptive interval; pass a signature of each status
+    to ``observe`` so the interval can follow progress.
+    """
+
+    def __init__(
+        self,
+        waiter: CompletionWaiter,
+        fetch: BatchFetch,
+        key: Hashable,
+        interval: AdaptiveInterval,
+        max_wait: float,
+    ) -> None:
+        self.key = key
+        self.interval = interval
+        self._waiter = waiter
+        self._fetch = fetch
+        self._deadline = time.monotonic() + max_wait
+        self._nudged = asyncio.Event()
+        self._polled = False
+
+    async def __aenter__(self) -> StatusWatch:
+        self._waiter._register(self)
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        self._waiter._unregister(self)
+
+    @property
+    def expired(self) -> bool:
+        return time.monotonic() >= self._deadline
+
+    def extend(self, seconds: float) -> None:
+        """Move the deadline ``seconds`` further out."""
+        self._deadline += seconds
+
+    def observe(self, signature: Hashable) -> None:
+        self.interval.observe(signature)
+
+    async def poll(self) -> Any:
+        """Wait for the next poll, then return the fetched status."""
+        if self._polled:
+            await self._sleep()
+        self._polled = True
+        return await self._waiter.fetch(self._fetch, self.key)
+
+    async def _sleep(self) -> None:
+        delay = min(self.interval.current, self._deadline - time.monotonic())
+        if delay > 0:
+            try:
+                await asyncio.wait_for(self._nudged.wait(), delay)
+            except TimeoutError:
+                pass
+        self._nudged.clear()
+
+    def _nudge(self) -> None:
+        self.interval.reset()
+        self._nudged.set()
+
+
+_waiters: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, CompletionWaiter] = (
+    weakref.WeakKeyDictionary()
+)
+_waiters_lock = threading.Lock()
+
+
+def get_completion_waiter() -> CompletionWaiter:
+    """The ``CompletionWaiter`` of the running event loop."""
+    loop = asyncio.get_running_loop()
+    with _waiters_lock:
+        waiter = _waiters.get(loop)
+        if waiter is None:
+            waiter = _waiters[loop] = CompletionWaiter(loop)
+        return waiter
+
+
+def notify_status_change(key: Hashable) -> None:
+    """Short-circuit polling: waits on ``key`` in any event loop poll now.
+
+    Meant for push signals, e.g. a webhook handler that learns a chat got a
+    new message can call ``notify_status_change(latest_message_key(...))``.
+    """
+    with _waiters_lock:
+        waiters = list(_waiters.values())
+    for waiter in waiters:
+        if not waiter._loop.is_closed():
+            waiter.notify(key)
+
+
+# ── Status sources ──────────────────────────────────────────────────────────
+
+
+def latest_message_key(
+    user_id: str, company_id: str, chat_id: str
+) -> tuple[str, str, str, str]:
+    return ("latest_message", user_id, company_id, chat_id)
+
+
+def ingestion_key(
+    user_id: str, company_id: str, chat_id: str | None, content_id: str
+) -> tuple[str, str, str, str | None, str]:
+    return ("ingestion", user_id, company_id, chat_id, content_id)
+
+
+async def fetch_latest_messages(
+    keys: list[tuple[str, str, str, str]],
+) -> dict[tuple[str, str, str, str], Any]:
+    """Latest message of each chat; there is no bulk endpoint, so one GET each."""
+    messages = await asyncio.gather(
+        *(
+            Space.get_latest_message_async(user_id, company_id, chat_id)
+            for _, user_id, company_id, chat_id in keys
+        ),
+        return_exceptions=True,
+    )
+    return dict(zip(keys, messages))
+
+
+async def fetch_ingestion_states(
+    keys: list[tuple[str, str, str, str | None, str]],
+) -> dict[tuple[str, str, str, str | None, str], Any]:
+    """Content info of each key, one search per user, company and chat."""
+    groups: dict[tuple[str, str, str | None], list[str]] = {}
+    for _, user_id, company_id, chat_id, content_id in keys:
+        groups.setdefault((user_id, company_id, chat_id), []).append(content_id)
+
+    async def search(
+        user_id: str, company_id: str, chat_id: str | None, content_ids: list[str]
+    ) -> dict[str, Any]:
+        if len(content_ids) == 1:
+            contents = await Content.search_async(
+                user_id=user_id,
+                company_id=company_id,
+                where={"id": {"equals": content_ids[0]}},
+                chatId=chat_id,
+                includeFailedContent=True,
+            )
+            return {content_ids[0]: contents[0]} if contents else {}
+        contents = await Content.search_async(
+            user_id=user_id,
+            company_id=company_id,
+            where={"id": {"in_": content_ids}},
+            chatId=chat_id,
+            includeFailedContent=True,
+        )
+        return {content.get("id"): content for content in contents}
+
+    found = await asyncio.gather(
+        *(search(*group, content_ids) for group, content_ids in groups.items()),
+        return_exceptions=True,
+    )
+    results: dict[tuple[str, str, str, str | None, str], Any] = {}
+    for (group, content_ids), contents in zip(groups.items(), found):
+        for content_id in content_ids:
+            key = ("ingestion", *group, content_id)
+            results[key] = (
+                contents
+                if isinstance(contents, BaseException)
+                else contents.get(content_id)
+            )
+    return results
+
+
+def _resolve(future: asyncio.Future[Any], result: Any) -> None:
+    if future.done():
+        return
+    if isinstance(result, BaseException):
+        future.set_exception(result)
+        # Retrieved by every wait still listening; mark it handled so a batch
+        # nobody awaits anymore does not log "exception was never retrieved".
+        future.exception()
+    else:
+        future.set_result(result)
+
+
+def _running_loop() -> asyncio.AbstractEventLoop | None:
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
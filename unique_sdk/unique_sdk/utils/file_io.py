@@ -1,14 +1,20 @@
-import asyncio
 import os
+import secrets
 import tempfile
 from pathlib import Path
 from typing import Any, TypedDict
 from urllib.parse import urlparse
 
-import requests
-
 import unique_sdk
+from unique_sdk._http_pool import get_http_session
 from unique_sdk.api_resources._content import Content
+from unique_sdk.utils.completion_waiter import (
+    DEFAULT_MAX_POLL_INTERVAL,
+    AdaptiveInterval,
+    fetch_ingestion_states,
+    get_completion_waiter,
+    ingestion_key,
+)
 
 
 class _PreviewKwargs(TypedDict, total=False):
@@ -34,6 +40,29 @@ class _VersioningKwargs(TypedDict, total=False):
     versioningEnabled: bool
 
 
+# Downloads are streamed to disk in chunks of this size so that memory use
+# does not grow with the file size.
+_DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+
+def _write_response(response: Any, file_path: Path) -> None:
+    """Stream the body into a sibling temporary file and move it into place
+    once complete, so a download that breaks off mid-stream neither leaves a
+    truncated file at ``file_path`` nor destroys a file already there."""
+    # Truncate long names so the temporary name stays within NAME_MAX.
+    part_path = file_path.with_name(
+        f".{file_path.name[:200]}.{secrets.token_hex(4)}.part"
+    )
+    try:
+        with open(part_path, "xb") as file:
+            for chunk in response.iter_content(_DOWNLOAD_CHUNK_SIZE):
+                file.write(chunk)
+        os.replace(part_path, file_path)
+    except BaseException:
+        part_path.unlink(missing_ok=True)
+        raise
+
+
 # download readUrl a random directory in /tmp
 def download_file(url: str, filename: str):
     # Guard for callers without a type checker: fail fast with a clear error before reaching requests.
@@ -46,12 +75,17 @@ def download_file(url: str, filename: str):
     file_path = Path(random_dir) / filename
 
     # Download the file and save it to the random directory
-    response = requests.get(url, timeout=unique_sdk.blob_transfer_timeout)
-    if response.status_code == 200:
-        with open(file_path, "wb") as file:
-            file.write(response.content)
-    else:
-        raise Exception(f"Error downloading file: Status code {response.status_code}")
+    response = get_http_session().get(
+        url, timeout=unique_sdk.blob_transfer_timeout, stream=True
+    )
+    try:
+        if response.status_code != 200:
+            raise Exception(
+                f"Error downloading file: Status code {response.status_code}"
+            )
+        _write_response(response, file_path)
+    finally:
+        response.close()
 
     return file_path
 
@@ -93,7 +127,7 @@ def _apply_ingestion_upload_url_override(write_url: str) -> str:
 def _put_preview_pdf(write_url: str, preview_pdf_path: str) -> None:
     """PUT *preview_pdf_path* bytes to the SAS URL returned by upsert."""
     with open(preview_pdf_path, "rb") as preview_file:
-        response = requests.put(
+        response = get_http_session().put(
             write_url,
             data=preview_file,
             headers={
@@ -220,7 +254,7 @@ def upload_file(
         raise ValueError("createdContent.writeUrl is None")
     uploadUrl = _apply_ingestion_upload_url_override(uploadUrl)
     with open(path_to_file, "rb") as file:
-        response = requests.put(
+        response = get_http_session().put(
             uploadUrl,
             data=file,
             headers={
@@ -369,21 +403,25 @@ def download_content(
     # Issue the request before resolving the destination. A non-200
     # response should never leave a half-created directory or empty
     # file behind for callers who supplied ``target_path``.
-    response = requests.get(
-        url, headers=headers, timeout=unique_sdk.blob_transfer_timeout
+    response = get_http_session().get(
+        url, headers=headers, timeout=unique_sdk.blob_transfer_timeout, stream=True
     )
-    if response.status_code != 200:
-        raise Exception(f"Error downloading file: Status code {response.status_code}")
+    try:
+        if response.status_code != 200:
+            raise Exception(
+                f"Error downloading file: Status code {response.status_code}"
+            )
 
-    if target_path is not None:
-        file_path = Path(target_path)
-        file_path.parent.mkdir(parents=True, exist_ok=True)
-    else:
-        random_dir = tempfile.mkdtemp(dir="/tmp")
-        file_path = Path(random_dir) / filename
+        if target_path is not None:
+            file_path = Path(target_path)
+            file_path.parent.mkdir(parents=True, exist_ok=True)
+        else:
+            random_dir = tempfile.mkdtemp(dir="/tmp")
+            file_path = Path(random_dir) / filename
 
-    with open(file_path, "wb") as file:
-        file.write(response.content)
+        _write_response(response, file_path)
+    finally:
+        response.close()
 
     return file_path
 
@@ -399,22 +437,25 @@ async def wait_for_ingestion_completion(
     """
     Polls until the content ingestion is finished or the maximum wait time is reached and throws in case ingestion fails. The function assumes that the content exists.
     """
-    max_attempts = int(max_wait // poll_interval)
-    for _ in range(max_attempts):
-        searched_content = await Content.search_async(
-            user_id=user_id,
-            company_id=company_id,
-            where={"id": {"equals": content_id}},
-            chatId=chat_id,
-            includeFailedContent=True,
-        )
-        if searched_content:
-            ingestion_state = searched_content[0].get("ingestionState")
+    # Polls go through the loop's shared waiter, which backs off while the
+    # state does not change and looks up concurrent waits in one search.
+    watch = get_completion_waiter().watch(
+        fetch_ingestion_states,
+        ingestion_key(user_id, company_id, chat_id, content_id),
+        interval=AdaptiveInterval(poll_interval, DEFAULT_MAX_POLL_INTERVAL),
+        max_wait=max_wait,
+    )
+    async with watch:
+        while not watch.expired:
+            searched_content = await watch.poll()
+            ingestion_state = (
+                searched_content.get("ingestionState") if searched_content else None
+            )
+            watch.observe(ingestion_state)
             if ingestion_state == "FINISHED":
                 return ingestion_state
             if isinstance(ingestion_state, str) and ingestion_state.startswith(
                 "FAILED"
             ):
                 raise RuntimeError(f"Ingestion failed with state: {ingestion_state}")
-        await asyncio.sleep(poll_interval)
     raise TimeoutError("Timed out waiting for file ingestion to finish.")
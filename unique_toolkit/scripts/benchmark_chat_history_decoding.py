@@ -0,0 +1,125 @@
+"""
+Micro-benchmark for decoding a chat history into ``ChatMessage`` objects.
+
+Compares ``get_full_history`` decoding the raw ``Message.list`` response body
+straight into ``ChatMessageList`` against the previous behaviour: parse the
+body into a ``UniqueResponse``, convert it to ``ListObject``/``Message``
+objects and validate every remaining message with ``ChatMessage.model_validate``.
+Only decoding is measured, no HTTP request is made.
+
+Usage:
+    python scripts/benchmark_chat_history_decoding.py [RESPONSE_FILE ...]
+
+Each RESPONSE_FILE is a recorded ``GET /messages`` response body. Without
+arguments a synthetic history of long messages with references is used. Both
+implementations must produce identical messages; the script exits with code 1
+otherwise.
+"""
+
+import json
+import pathlib
+import sys
+import timeit
+import tracemalloc
+
+from unique_sdk import UniqueResponse, convert_to_unique_object
+
+from unique_toolkit.chat.functions import (
+    filter_valid_chat_messages,
+    filter_valid_messages,
+)
+from unique_toolkit.chat.schemas import ChatMessage, ChatMessageList
+
+REPEAT = 5
+NUMBER = 10
+
+_SYNTHETIC_TEXT = (
+    "The company reported a 12% increase in revenue for the fiscal year "
+    "<sup>1</sup>. Operating margins improved as a result of lower input costs "
+    "and a leaner cost structure, while free cash flow reached a record high. "
+)
+
+
+def _synthetic_body(message_count: int = 400) -> bytes:
+    messages = [
+        {
+            "id": f"msg_{i:024d}",
+            "object": "message",
+            "chatId": "chat_000000000000000000000001",
+            "text": _SYNTHETIC_TEXT * 20,
+            "originalText": _SYNTHETIC_TEXT * 20,
+            "role": "USER" if i % 2 == 0 else "ASSISTANT",
+            "debugInfo": {"step": i, "tools": ["InternalSearch", "WebSearch"]},
+            "createdAt": "2026-01-01T12:00:00.000Z",
+            "updatedAt": "2026-01-01T12:00:05.000Z",
+            "completedAt": "2026-01-01T12:00:05.000Z",
+            "references": [
+                {
+                    "id": f"ref_{i}_{j}",
+                    "messageId": f"msg_{i:024d}",
+                    "name": f"Annual report {j}.pdf",
+                    "sequenceNumber": j + 1,
+                    "sourceId": f"cont_{j:024d}_chunk_{j:024d}",
+                    "source": "node-ingestion-chunks",
+                    "url": f"unique://content/cont_{j:024d}",
+                }
+                for j in range(5)
+            ],
+        }
+        for i in range(message_count)
+    ]
+    return json.dumps({"object": "list", "data": messages}).encode("utf-8")
+
+
+def _load_bodies(paths: list[str]) -> list[bytes]:
+    if paths:
+        return [pathlib.Path(p).read_bytes() for p in paths]
+    return [_synthetic_body()]
+
+
+def _previous(body: bytes) -> list[ChatMessage]:
+    response = UniqueResponse(body.decode("utf-8"), 200, {})
+    messages = convert_to_unique_object(response, "user", "company")
+    return [
+        ChatMessage.model_validate(msg)
+        for msg in filter_valid_messages(messages)  # pyright: ignore[reportArgumentType]
+    ]
+
+
+def _typed(body: bytes) -> list[ChatMessage]:
+    return filter_valid_chat_messages(ChatMessageList.model_validate_json(body).data)
+
+
+def _peak_allocation(run, body: bytes) -> int:
+    tracemalloc.start()
+    try:
+        run(body)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def main() -> int:
+    implementations = {"previous": _previous, "typed": _typed}
+    for body in _load_bodies(sys.argv[1:]):
+        expected = [m.model_dump() for m in _previous(body)]
+        if [m.model_dump() for m in _typed(body)] != expected:
+            print("typed decoding does not match the previous output")
+            return 1
+
+        print(f"{len(body) / 1e6:.2f} MB body, {len(expected)} messages kept")
+        results: dict[str, float] = {}
+        for label, run in implementations.items():
+            timings = timeit.repeat(lambda: run(body), repeat=REPEAT, number=NUMBER)
+            results[label] = min(timings) / NUMBER
+            peak = _peak_allocation(run, body)
+            print(
+                f"{label:>10}: {results[label] * 1e3:8.2f} ms per decode, "
+                f"{peak / 1e6:7.2f} MB peak allocation"
+            )
+        print(f"{'typed':>10}: {results['previous'] / results['typed']:.1f}x speedup")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
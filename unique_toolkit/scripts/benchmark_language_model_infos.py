@@ -0,0 +1,76 @@
+"""
+Micro-benchmark for ``LanguageModelInfo.from_name``.
+
+Compares the previous behaviour against the memoized registry, both for the
+first lookup of every model in a fresh process ("startup") and for repeated
+lookups. Previously every call scanned all ``LanguageModelName`` values,
+built the info from its definition and applied the token-limit multiplier.
+
+Usage:
+    python scripts/benchmark_language_model_infos.py
+"""
+
+import sys
+import time
+import timeit
+
+from unique_toolkit.language_model.infos import LanguageModelInfo, LanguageModelName
+from unique_toolkit.language_model.settings import env_settings
+
+REPEAT = 5
+NUMBER = 20
+
+
+def _previous_from_name(model_name: LanguageModelName | str) -> LanguageModelInfo:
+    if model_name in [name.value for name in LanguageModelName]:
+        model_name = LanguageModelName(model_name)
+    # The memoized builder without its cache, i.e. one full construction.
+    info = LanguageModelInfo._builtin_from_name.__wrapped__(  # type: ignore[attr-defined]
+        LanguageModelInfo, model_name
+    )
+    multiplier = env_settings.token_limit_multiplier.get(info.family, 1.0)
+    if multiplier != 1.0:
+        info.token_limits.token_limit_input = int(
+            info.token_limits.token_limit_input * multiplier
+        )
+    return info
+
+
+def main() -> int:
+    names = list(LanguageModelName)
+
+    start = time.perf_counter()
+    for name in names:
+        _previous_from_name(name)
+    previous_startup = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for name in names:
+        LanguageModelInfo.from_name(name)
+    memoized_startup = time.perf_counter() - start
+
+    print(
+        f"{'startup':>10}: {previous_startup * 1e3:8.2f} ms previous, "
+        f"{memoized_startup * 1e3:8.2f} ms memoized for {len(names)} models"
+    )
+
+    implementations = {
+        "previous": lambda: [_previous_from_name(name) for name in names],
+        "memoized": lambda: [LanguageModelInfo.from_name(name) for name in names],
+    }
+    results: dict[str, float] = {}
+    for label, run in implementations.items():
+        timings = timeit.repeat(run, repeat=REPEAT, number=NUMBER)
+        results[label] = min(timings) / NUMBER
+        per_call_us = results[label] / len(names) * 1e6
+        print(
+            f"{label:>10}: {results[label] * 1e3:8.2f} ms per run, "
+            f"{per_call_us:6.2f} µs per lookup"
+        )
+
+    print(f"{'memoized':>10}: {results['previous'] / results['memoized']:.1f}x speedup")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,126 @@
+"""
+Micro-benchmark for the streaming citation normalizer.
+
+Compares ``StreamingPatternReplacer`` (``CompiledNormalizer`` with the merged
+scan and with ``NORMALIZATION_TRIGGER_LITERALS``) against the previous
+behaviour of running every pattern in ``NORMALIZATION_PATTERNS`` over the
+retained buffer on each delta.
+
+Usage:
+    python scripts/benchmark_pattern_replacer.py [STREAM_FILE ...]
+
+Each STREAM_FILE is a recorded model stream: a JSON list of text deltas.
+Without arguments a synthetic answer with citations is streamed in
+4-character deltas. All implementations must produce identical output;
+the script exits with code 1 otherwise.
+"""
+
+import json
+import pathlib
+import re
+import sys
+import timeit
+
+from unique_toolkit.experimental._internal.streaming.pattern_replacer import (
+    NORMALIZATION_MAX_MATCH_LENGTH,
+    NORMALIZATION_PATTERNS,
+    NORMALIZATION_TRIGGER_LITERALS,
+    StreamingPatternReplacer,
+)
+
+REPEAT = 5
+NUMBER = 20
+
+_SYNTHETIC_PARAGRAPH = (
+    "The company reported a 12% increase in revenue for the fiscal year [source1]. "
+    "Operating margins improved as a result of lower input costs and a leaner "
+    "cost structure, while free cash flow reached a record high [source 2]. "
+    "Management reiterated its guidance for the coming quarters and highlighted "
+    "continued investment in research and development. Analysts expect the "
+    "trend to continue, although currency headwinds remain a risk [source: 3, 4]. "
+)
+
+
+class _SequentialStreamingPatternReplacer(StreamingPatternReplacer):
+    """Previous implementation: one full regex scan per pattern and delta."""
+
+    def __init__(self) -> None:
+        super().__init__(
+            NORMALIZATION_PATTERNS, max_match_length=NORMALIZATION_MAX_MATCH_LENGTH
+        )
+        self._patterns = [
+            (re.compile(p) if isinstance(p, str) else p, r)
+            for p, r in NORMALIZATION_PATTERNS
+        ]
+
+    def _apply_replacements(self, text: str) -> str:
+        for pattern, replacement in self._patterns:
+            text = pattern.sub(replacement, text)
+        return text
+
+
+def _load_streams(paths: list[str]) -> list[list[str]]:
+    if paths:
+        return [json.loads(pathlib.Path(p).read_text("utf-8")) for p in paths]
+    text = _SYNTHETIC_PARAGRAPH * 40
+    return [[text[i : i + 4] for i in range(0, len(text), 4)]]
+
+
+def _run(replacer: StreamingPatternReplacer, deltas: list[str]) -> str:
+    released = [replacer.process(delta) for delta in deltas]
+    released.append(replacer.flush())
+    return "".join(released)
+
+
+def _merged_scan_replacer() -> StreamingPatternReplacer:
+    return StreamingPatternReplacer(
+        NORMALIZATION_PATTERNS, max_match_length=NORMALIZATION_MAX_MATCH_LENGTH
+    )
+
+
+def _trigger_literal_replacer() -> StreamingPatternReplacer:
+    return StreamingPatternReplacer(
+        NORMALIZATION_PATTERNS,
+        max_match_length=NORMALIZATION_MAX_MATCH_LENGTH,
+        trigger_literals=NORMALIZATION_TRIGGER_LITERALS,
+    )
+
+
+def main(argv: list[str]) -> int:
+    streams = _load_streams(argv)
+    total_deltas = sum(len(deltas) for deltas in streams)
+
+    implementations = {
+        "sequential": _SequentialStreamingPatternReplacer,
+        "merged": _merged_scan_replacer,
+        "trigger": _trigger_literal_replacer,
+    }
+
+    for deltas in streams:
+        expected = _run(_SequentialStreamingPatternReplacer(), deltas)
+        for name, factory in implementations.items():
+            if _run(factory(), deltas) != expected:
+                print(f"Output mismatch for {name}", file=sys.stderr)
+                return 1
+
+    results: dict[str, float] = {}
+    for name, factory in implementations.items():
+        timings = timeit.repeat(
+            lambda factory=factory: [_run(factory(), deltas) for deltas in streams],
+            repeat=REPEAT,
+            number=NUMBER,
+        )
+        results[name] = min(timings) / NUMBER
+        per_delta_us = results[name] / total_deltas * 1e6
+        print(
+            f"{name:>10}: {results[name] * 1e3:8.2f} ms per run, "
+            f"{per_delta_us:6.2f} µs per delta"
+        )
+
+    for name in ("merged", "trigger"):
+        print(f"{name:>10}: {results['sequential'] / results[name]:.1f}x speedup")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,145 @@
+import uuid
+
+import pytest
+
+from unique_toolkit._common.token.message_token_cache import (
+    REPLY_PRIMING_TOKENS,
+    MessageTokenCounter,
+)
+from unique_toolkit._common.token.token_counting import (
+    num_token_for_language_model_messages,
+    num_tokens_per_language_model_message,
+)
+from unique_toolkit.language_model.schemas import (
+    LanguageModelAssistantMessage,
+    LanguageModelMessage,
+    LanguageModelSystemMessage,
+    LanguageModelToolMessage,
+    LanguageModelUserMessage,
+)
+
+
+class _CountingEncoder:
+    """Whitespace tokenizer that records how often it was invoked."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def __call__(self, text: str) -> list[int]:
+        self.calls += 1
+        return [len(word) for word in text.split()]
+
+
+@pytest.fixture
+def encoder() -> _CountingEncoder:
+    return _CountingEncoder()
+
+
+@pytest.fixture
+def counter(encoder: _CountingEncoder) -> MessageTokenCounter:
+    # A fresh key per test keeps the process-wide cache from leaking between tests.
+    return MessageTokenCounter(encode=encoder, encoder_key=str(uuid.uuid4()))
+
+
+@pytest.fixture
+def messages() -> list[LanguageModelMessage]:
+    return [
+        LanguageModelSystemMessage(content="You are a helpful assistant"),
+        LanguageModelUserMessage(content="What is the weather like today"),
+        LanguageModelAssistantMessage(content="Let me check that for you"),
+        LanguageModelToolMessage(
+            content="Sunny with a high of 25 degrees",
+            tool_call_id="call_1",
+            name="weather",
+        ),
+    ]
+
+
+@pytest.mark.ai
+def test_count_messages__matches_uncached_count(
+    counter: MessageTokenCounter, messages: list[LanguageModelMessage]
+) -> None:
+    """
+    Purpose: Cached totals must be identical to the uncached reference implementation.
+    """
+    encode = _CountingEncoder()
+
+    assert counter.count_messages(messages) == num_token_for_language_model_messages(
+        messages, encode
+    )
+    assert counter.count_per_message(messages) == num_tokens_per_language_model_message(
+        messages, encode
+    )
+
+
+@pytest.mark.ai
+def test_count__reuses_cached_count__for_unchanged_content(
+    counter: MessageTokenCounter,
+    encoder: _CountingEncoder,
+    messages: list[LanguageModelMessage],
+) -> None:
+    """
+    Purpose: Re-counting the same history must not re-encode any message.
+    """
+    first = counter.count_messages(messages)
+    calls_after_first_count = encoder.calls
+
+    second = counter.count_messages(messages)
+
+    assert first == second
+    assert encoder.calls == calls_after_first_count
+    assert counter.hits == len(messages)
+    assert counter.misses == len(messages)
+
+
+@pytest.mark.ai
+def test_count__only_encodes_changed_message(
+    counter: MessageTokenCounter,
+    messages: list[LanguageModelMessage],
+) -> None:
+    """
+    Purpose: Replacing one message only costs a single cache miss.
+    """
+    counter.count_messages(messages)
+    misses_before = counter.misses
+
+    messages[-1] = LanguageModelToolMessage(
+        content="Sunny",
+        tool_call_id="call_1",
+        name="weather",
+    )
+    total = counter.count_messages(messages)
+
+    assert counter.misses == misses_before + 1
+    assert total == sum(counter.count_per_message(messages)) + REPLY_PRIMING_TOKENS
+
+
+@pytest.mark.ai
+def test_count__detects_in_place_content_mutation(
+    counter: MessageTokenCounter,
+) -> None:
+    """
+    Purpose: The cache is keyed by content, not identity, so mutated messages are re-counted.
+    """
+    message = LanguageModelUserMessage(content="short")
+    short_count = counter.count(message)
+
+    message.content = "a considerably longer message than before"
+
+    assert counter.count(message) > short_count
+
+
+@pytest.mark.ai
+def test_count__separates_counts_by_encoder_key() -> None:
+    """
+    Purpose: Counts produced by one encoder must never be served for another.
+    """
+    message = LanguageModelUserMessage(content="one two three four")
+    word_counter = MessageTokenCounter(
+        encode=lambda text: text.split(), encoder_key=str(uuid.uuid4())
+    )
+    char_counter = MessageTokenCounter(
+        encode=lambda text: list(text), encoder_key=str(uuid.uuid4())
+    )
+
+    assert word_counter.count(message) < char_counter.count(message)
@@ -0,0 +1,32 @@
+import pytest
+from jinja2 import Template
+
+from unique_toolkit._common.utils.jinja.render import (
+    get_compiled_template,
+    render_template,
+)
+
+
+@pytest.mark.ai
+def test_get_compiled_template__returns_shared_instance__for_same_source() -> None:
+    source = "Hello {{ name }}"
+
+    assert get_compiled_template(source) is get_compiled_template(source)
+
+
+@pytest.mark.ai
+def test_get_compiled_template__compiles_separately__per_options() -> None:
+    source = "{% if true %}\n  x{% endif %}"
+
+    plain = get_compiled_template(source)
+    stripped = get_compiled_template(source, lstrip_blocks=True)
+
+    assert plain is not stripped
+    assert plain.render() == Template(source).render()
+    assert stripped.render() == Template(source, lstrip_blocks=True).render()
+
+
+@pytest.mark.ai
+def test_render_template__renders_with_cached_template() -> None:
+    assert render_template("{{ a }}-{{ b }}", {"a": 1}, b=2) == "1-2"
+    assert render_template("{{ a }}-{{ b }}", {"a": 3}, b=4) == "3-4"
@@ -578,6 +578,66 @@ def test_count_message_tokens__scales_with_content_length_AI(
     assert long_count > short_count
 
 
+@pytest.mark.ai
+def test_update_loop_token_counts__recounts_only_replaced_messages_AI(
+    mock_logger: Logger,
+    test_event: ChatEvent,
+    mock_reference_manager: ReferenceManager,
+    language_model_info: LanguageModelInfo,
+) -> None:
+    """
+    Purpose: Verify a reduction round only re-counts the tool messages it replaced.
+    Why this matters: The token budget loop must cost O(changed messages), not O(history).
+    Setup summary: Reducer with a whitespace encoder; one of two tool messages is replaced.
+    """
+    # Arrange
+    with patch.object(
+        LoopTokenReducer, "_get_encoder", return_value=lambda text: text.split()
+    ):
+        loop_token_reducer = LoopTokenReducer(
+            logger=mock_logger,
+            event=test_event,
+            max_history_tokens=4000,
+            reference_manager=mock_reference_manager,
+            language_model=language_model_info,
+        )
+    loop_history: list[LanguageModelMessage] = [
+        LanguageModelAssistantMessage(content="Calling tools"),
+        LanguageModelToolMessage(
+            content="long result " * 50, tool_call_id="call_1", name="search"
+        ),
+        LanguageModelToolMessage(
+            content="other result " * 50, tool_call_id="call_2", name="search"
+        ),
+    ]
+    loop_token_counts = loop_token_reducer._token_counter.count_per_message(
+        loop_history
+    )
+    total_before = sum(loop_token_counts)
+    reduced_history = list(loop_history)
+    reduced_history[1] = LanguageModelToolMessage(
+        content="short result", tool_call_id="call_1", name="search"
+    )
+
+    # Act
+    with patch.object(
+        loop_token_reducer._token_counter,
+        "count",
+        wraps=loop_token_reducer._token_counter.count,
+    ) as count_spy:
+        delta = loop_token_reducer._update_loop_token_counts(
+            loop_history, reduced_history, loop_token_counts
+        )
+
+    # Assert
+    count_spy.assert_called_once_with(reduced_history[1])
+    assert delta < 0
+    assert sum(loop_token_counts) == total_before + delta
+    assert loop_token_counts == loop_token_reducer._token_counter.count_per_message(
+        reduced_history
+    )
+
+
 # Message Classification Tests
 @pytest.mark.ai
 def test_should_reduce_message__returns_true__for_tool_message_AI(
@@ -1455,6 +1515,156 @@ async def test_get_history_for_model_call__appends_image_urls_to_user_message__w
     )
 
 
+# History snapshot tests
+@pytest.fixture
+def whitespace_loop_token_reducer(
+    mock_logger: Logger,
+    test_event: ChatEvent,
+    mock_reference_manager: ReferenceManager,
+    language_model_info: LanguageModelInfo,
+) -> LoopTokenReducer:
+    """
+    Purpose: Provide a LoopTokenReducer that counts tokens without a tiktoken download.
+    Why this matters: Snapshot tests exercise the history window, which counts tokens.
+    """
+    with patch.object(
+        LoopTokenReducer, "_get_encoder", return_value=lambda text: text.split()
+    ):
+        return LoopTokenReducer(
+            logger=mock_logger,
+            event=test_event,
+            max_history_tokens=4000,
+            reference_manager=mock_reference_manager,
+            language_model=language_model_info,
+        )
+
+
+@pytest.mark.ai
+@patch(
+    "unique_toolkit.agentic.history_manager.loop_token_reducer.get_full_history_with_contents_async"
+)
+async def test_get_history_for_model_call__fetches_db_history_once_per_turn_AI(
+    mock_get_history: "Mock",
+    whitespace_loop_token_reducer: LoopTokenReducer,
+) -> None:
+    """
+    Purpose: Verify repeated loop iterations reuse the DB history snapshot.
+    Why this matters: The DB history cannot change during a turn; re-fetching it
+        every iteration costs Message.list round-trips and content resolution.
+    """
+    # Arrange
+    mock_get_history.return_value = LanguageModelMessages(
+        root=[LanguageModelUserMessage(content="Test user message")]
+    )
+
+    async def noop(text: str) -> str:
+        return text
+
+    # Act
+    for _ in range(3):
+        await whitespace_loop_token_reducer.get_history_for_model_call(
+            original_user_message="Test user message",
+            rendered_user_message_string="Rendered user message",
+            rendered_system_message_string="System prompt",
+            loop_history=[],
+            remove_from_text=noop,
+        )
+
+    # Assert
+    mock_get_history.assert_called_once()
+
+
+@pytest.mark.ai
+@patch(
+    "unique_toolkit.agentic.history_manager.loop_token_reducer.get_full_history_with_contents_async"
+)
+async def test_get_history_from_db__returns_independent_copies_of_snapshot_AI(
+    mock_get_history: "Mock",
+    whitespace_loop_token_reducer: LoopTokenReducer,
+) -> None:
+    """
+    Purpose: Verify mutations of a returned history do not leak into the snapshot.
+    Why this matters: The user message is rewritten in place with the rendered prompt
+        on every iteration; the next iteration must start from the original text.
+    """
+    # Arrange
+    mock_get_history.return_value = LanguageModelMessages(
+        root=[LanguageModelUserMessage(content="original")]
+    )
+    first = await whitespace_loop_token_reducer.get_history_from_db()
+
+    # Act
+    first[-1].content = "mutated"
+    second = await whitespace_loop_token_reducer.get_history_from_db()
+
+    # Assert
+    assert second[-1].content == "original"
+
+
+@pytest.mark.ai
+@patch(
+    "unique_toolkit.agentic.history_manager.loop_token_reducer.get_full_history_with_contents_async"
+)
+async def test_invalidate_history_snapshot__refetches_db_history_AI(
+    mock_get_history: "Mock",
+    whitespace_loop_token_reducer: LoopTokenReducer,
+) -> None:
+    """
+    Purpose: Verify invalidating the snapshot forces a fresh DB fetch.
+    Why this matters: Explicit events such as new uploads change the persisted history.
+    """
+    # Arrange
+    mock_get_history.side_effect = [
+        LanguageModelMessages(root=[LanguageModelUserMessage(content="before")]),
+        LanguageModelMessages(root=[LanguageModelUserMessage(content="after")]),
+    ]
+    await whitespace_loop_token_reducer.get_history_from_db()
+
+    # Act
+    whitespace_loop_token_reducer.invalidate_history_snapshot()
+    history = await whitespace_loop_token_reducer.get_history_from_db()
+
+    # Assert
+    assert mock_get_history.call_count == 2
+    assert history[-1].content == "after"
+
+
+@pytest.mark.ai
+@patch(
+    "unique_toolkit.agentic.history_manager.loop_token_reducer.get_chat_upload_generation"
+)
+@patch(
+    "unique_toolkit.agentic.history_manager.loop_token_reducer.get_full_history_with_contents_async"
+)
+async def test_get_history_from_db__refetches__after_upload_to_chat_AI(
+    mock_get_history: "Mock",
+    mock_upload_generation: "Mock",
+    whitespace_loop_token_reducer: LoopTokenReducer,
+) -> None:
+    """
+    Purpose: Verify the snapshot is refetched once the chat's upload generation changes.
+    Why this matters: Files uploaded by tools mid-turn must show up in the history.
+    Setup summary: Change the upload generation between two reads, assert a second fetch.
+    """
+    # Arrange
+    mock_get_history.side_effect = [
+        LanguageModelMessages(root=[LanguageModelUserMessage(content="before")]),
+        LanguageModelMessages(root=[LanguageModelUserMessage(content="after")]),
+    ]
+    mock_upload_generation.return_value = 1
+    await whitespace_loop_token_reducer.get_history_from_db()
+    await whitespace_loop_token_reducer.get_history_from_db()
+    assert mock_get_history.call_count == 1
+
+    # Act
+    mock_upload_generation.return_value = 2
+    history = await whitespace_loop_token_reducer.get_history_from_db()
+
+    # Assert
+    assert mock_get_history.call_count == 2
+    assert history[-1].content == "after"
+
+
 # Feature flag path tests
 @pytest.mark.ai
 @patch(
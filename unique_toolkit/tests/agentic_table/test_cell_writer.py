@@ -0,0 +1,169 @@
+"""Tests for diff-only, batched cell writes with ``AgenticTableCellWriter``."""
+
+import asyncio
+import json
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from unique_toolkit.agentic_table import AgenticTableCellWriter
+from unique_toolkit.agentic_table.schemas import MagicTableCell
+from unique_toolkit.agentic_table.service import AgenticTableService
+
+
+class _FakeTransport:
+    """Records every batch sent and the bytes it would put on the wire."""
+
+    def __init__(self, delay: float = 0.0, fail_times: int = 0) -> None:
+        self.delay = delay
+        self.fail_times = fail_times
+        self.batches: list[list[dict]] = []
+        self.bytes_sent = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def send(self, cells: list) -> None:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.in_flight -= 1
+        if self.fail_times:
+            self.fail_times -= 1
+            raise RuntimeError("write failed")
+        self.batches.append(cells)
+        self.bytes_sent += len(json.dumps(cells))
+
+    @property
+    def cells(self) -> list[tuple[int, int, str]]:
+        return [
+            (cell["rowOrder"], cell["columnOrder"], cell["text"])
+            for batch in self.batches
+            for cell in batch
+        ]
+
+
+def _cell(row: int, column: int, text: str) -> MagicTableCell:
+    return MagicTableCell(
+        sheet_id="sheet-1", row_order=row, column_order=column, text=text
+    )
+
+
+def _table(rows: int, columns: int, version: int = 0) -> list[MagicTableCell]:
+    return [
+        _cell(row, column, f"r{row}c{column}v{version}")
+        for row in range(rows)
+        for column in range(columns)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_writer_skips_seeded_and_unchanged_cells() -> None:
+    transport = _FakeTransport()
+    writer = AgenticTableCellWriter(transport.send, flush_window=None)
+    writer.seed([_cell(0, 0, "same"), _cell(0, 1, "old")])
+
+    writer.write(0, 0, "same")
+    writer.write(0, 1, "new")
+    writer.write(1, 0, "added")
+    await writer.flush()
+
+    assert transport.cells == [(0, 1, "new"), (1, 0, "added")]
+    assert writer.stats.unchanged_skipped == 1
+    assert writer.pending == 0
+
+
+@pytest.mark.asyncio
+async def test_writer_coalesces_writes_and_flushes_after_window() -> None:
+    transport = _FakeTransport()
+    writer = AgenticTableCellWriter(transport.send, flush_window=0.01)
+
+    for i in range(5):
+        writer.write(0, 0, f"progress {i}")
+    await asyncio.sleep(0.05)
+
+    assert transport.cells == [(0, 0, "progress 4")]
+    assert writer.stats.coalesced == 4
+    assert writer.stats.requests_sent == 1
+
+
+@pytest.mark.asyncio
+async def test_writer_sends_batches_concurrently_up_to_limit() -> None:
+    transport = _FakeTransport(delay=0.01)
+    async with AgenticTableCellWriter(
+        transport.send, batch_size=10, max_concurrent_batches=3, flush_window=None
+    ) as writer:
+        writer.write_cells(_table(rows=10, columns=10))
+
+    assert len(transport.batches) == 10
+    assert transport.max_in_flight == 3
+    assert len(transport.cells) == 100
+
+
+@pytest.mark.asyncio
+async def test_writer_sends_nothing_when_table_is_re_emitted_unchanged() -> None:
+    transport = _FakeTransport()
+    writer = AgenticTableCellWriter(transport.send, flush_window=None)
+    writer.write_cells(_table(rows=20, columns=5))
+    await writer.flush()
+    bytes_first_pass = transport.bytes_sent
+
+    writer.write_cells(_table(rows=20, columns=5))
+    await writer.flush()
+    assert transport.bytes_sent == bytes_first_pass
+
+    changed = _table(rows=20, columns=5)
+    changed[7] = _cell(1, 2, "edited")
+    writer.write_cells(changed)
+    await writer.flush()
+
+    assert transport.cells[-1] == (1, 2, "edited")
+    assert writer.stats.requests_sent == 2
+    assert writer.stats.unchanged_skipped == 199
+
+
+@pytest.mark.asyncio
+async def test_writer_requeues_failed_batch_and_raises() -> None:
+    transport = _FakeTransport(fail_times=1)
+    writer = AgenticTableCellWriter(transport.send, flush_window=None)
+    writer.write(0, 0, "text")
+
+    with pytest.raises(RuntimeError, match="write failed"):
+        await writer.flush()
+    assert writer.pending == 1
+
+    await writer.flush()
+    assert transport.cells == [(0, 0, "text")]
+
+
+@pytest.mark.asyncio
+async def test_writer_raises_background_flush_error_on_next_flush() -> None:
+    transport = _FakeTransport(fail_times=1)
+    writer = AgenticTableCellWriter(transport.send, flush_window=0.01)
+    writer.write(0, 0, "text")
+    await asyncio.sleep(0.05)
+
+    with pytest.raises(RuntimeError, match="write failed"):
+        await writer.flush()
+    await writer.flush()
+    assert transport.cells == [(0, 0, "text")]
+
+
+@pytest.mark.asyncio
+async def test_service_cell_writer_sends_through_set_multiple_cells() -> None:
+    service = AgenticTableService("user-1", "company-1", "table-1")
+    with patch(
+        "unique_toolkit.agentic_table.service.AgenticTable.set_multiple_cells",
+        new_callable=AsyncMock,
+    ) as set_multiple_cells:
+        async with service.cell_writer(flush_window=None) as writer:
+            writer.seed([_cell(0, 0, "same")])
+            writer.write_cells([_cell(0, 0, "same"), _cell(0, 1, "new")])
+
+    set_multiple_cells.assert_awaited_once_with(
+        user_id="user-1",
+        company_id="company-1",
+        tableId="table-1",
+        cells=[{"rowOrder": 0, "columnOrder": 1, "text": "new"}],
+    )
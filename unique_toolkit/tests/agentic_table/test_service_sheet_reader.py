@@ -0,0 +1,142 @@
+"""Tests for concurrent sheet paging: ``get_sheet``, ``iter_sheet_rows`` and
+``get_sheet_dataframe``."""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from unique_toolkit.agentic_table.schemas import MagicTableCell
+from unique_toolkit.agentic_table.service import AgenticTableService
+
+_GET_SHEET_DATA = "unique_toolkit.agentic_table.service.AgenticTable.get_sheet_data"
+
+
+class _FakeSheet:
+    """Serves ``get_sheet_data`` for a sheet of ``rows`` x ``columns`` cells.
+
+    Earlier pages answer more slowly so out-of-order completion is exercised;
+    records how many page requests were in flight at once.
+    """
+
+    def __init__(self, rows: int, columns: int = 2) -> None:
+        self.rows = rows
+        self.columns = columns
+        self.page_requests: list[tuple[int, int]] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.header = {
+            "sheetId": "sheet-1",
+            "name": "Test",
+            "state": "IDLE",
+            "magicTableRowCount": rows,
+            "createdBy": "user-1",
+            "companyId": "company-1",
+            "createdAt": "2020-01-01T00:00:00Z",
+        }
+
+    async def get_sheet_data(self, *_args: object, **kwargs: object) -> dict:
+        if kwargs.get("includeCells") is False:
+            return dict(self.header)
+        start, end = kwargs["startRow"], kwargs["endRow"]
+        assert isinstance(start, int) and isinstance(end, int)
+        self.page_requests.append((start, end))
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.02 / (1 + start))
+        finally:
+            self.in_flight -= 1
+        cells = [
+            {
+                "sheetId": "sheet-1",
+                "rowOrder": row,
+                "columnOrder": col,
+                "text": f"r{row}c{col}",
+            }
+            for row in range(start, end + 1)
+            for col in reversed(range(self.columns))
+        ]
+        return {**self.header, "magicTableCells": cells}
+
+
+def _patched(sheet: _FakeSheet):
+    return patch(
+        _GET_SHEET_DATA, new_callable=AsyncMock, side_effect=sheet.get_sheet_data
+    )
+
+
+def _service() -> AgenticTableService:
+    return AgenticTableService("user-1", "company-1", "table-1")
+
+
+@pytest.mark.asyncio
+async def test_get_sheet_fetches_pages_concurrently_in_a_bounded_window() -> None:
+    sheet = _FakeSheet(rows=10)
+    with _patched(sheet):
+        result = await _service().get_sheet(batch_size=2, max_concurrent_pages=3)
+
+    assert sheet.max_in_flight == 3
+    assert sorted(sheet.page_requests) == [(0, 1), (2, 3), (4, 5), (6, 7), (8, 9)]
+    assert [c.row_order for c in result.magic_table_cells][::2] == list(range(10))
+    assert result.magic_table_cells[0].text == "r0c1"
+
+
+@pytest.mark.asyncio
+async def test_iter_sheet_rows_yields_rows_in_order_with_sorted_cells() -> None:
+    sheet = _FakeSheet(rows=5)
+    with _patched(sheet):
+        rows = [
+            row
+            async for row in _service().iter_sheet_rows(
+                start_row=1, batch_size=2, max_concurrent_pages=2
+            )
+        ]
+
+    assert [row.row_order for row in rows] == [1, 2, 3, 4]
+    assert [cell.text for cell in rows[0].cells] == ["r1c0", "r1c1"]
+    assert sheet.max_in_flight == 2
+
+
+@pytest.mark.asyncio
+async def test_iter_sheet_rows_stops_prefetching_when_consumer_stops() -> None:
+    sheet = _FakeSheet(rows=100)
+    with _patched(sheet):
+        async for row in _service().iter_sheet_rows(
+            batch_size=10, max_concurrent_pages=2
+        ):
+            if row.row_order == 3:
+                break
+        await asyncio.sleep(0.05)
+
+    assert len(sheet.page_requests) <= 3
+    assert sheet.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_get_sheet_dataframe_builds_grid_without_cell_models() -> None:
+    sheet = _FakeSheet(rows=3, columns=3)
+    with (
+        _patched(sheet),
+        patch.object(
+            MagicTableCell, "model_validate", side_effect=AssertionError
+        ) as model_validate,
+    ):
+        df = await _service().get_sheet_dataframe(batch_size=2)
+
+    model_validate.assert_not_called()
+    assert df.shape == (3, 3)
+    assert list(df.index) == [0, 1, 2]
+    assert list(df.columns) == [0, 1, 2]
+    assert df.loc[2, 1] == "r2c1"
+    assert df.index.name == "row_order"
+
+
+@pytest.mark.asyncio
+async def test_get_sheet_dataframe_returns_empty_frame_for_empty_sheet() -> None:
+    sheet = _FakeSheet(rows=0)
+    with _patched(sheet):
+        df = await _service().get_sheet_dataframe()
+
+    assert df.empty
+    assert sheet.page_requests == []
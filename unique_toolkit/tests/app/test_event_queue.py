@@ -0,0 +1,277 @@
+"""Tests for event_queue module."""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from unique_toolkit.app.event_queue import (
+    EventQueueSettings,
+    EventRejectedError,
+    EventWorkerQueue,
+)
+
+
+def _event(company_id: str, id: str = "event") -> SimpleNamespace:
+    return SimpleNamespace(id=id, company_id=company_id)
+
+
+def _settings(**overrides) -> EventQueueSettings:
+    return EventQueueSettings(**{"concurrency": 1, "max_depth": 10, **overrides})
+
+
+class _BlockingHandler:
+    """Async handler that records events and blocks until released."""
+
+    def __init__(self) -> None:
+        self.started: list[str] = []
+        self.running = 0
+        self.max_running = 0
+        self.release = asyncio.Event()
+
+    async def __call__(self, event) -> int:
+        self.started.append(event.id)
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        try:
+            await self.release.wait()
+        finally:
+            self.running -= 1
+        return 200
+
+
+@pytest.mark.ai
+@pytest.mark.asyncio
+async def test_event_worker_queue__limits_concurrency() -> None:
+    """
+    Purpose: Verify no more than `concurrency` events are handled at the same time.
+    Why this matters: Bounding concurrent agent loops is the point of the queue.
+    Setup summary: Submit five blocking events with concurrency 2, assert two run and three wait.
+    """
+    # Arrange
+    handler = _BlockingHandler()
+    queue = EventWorkerQueue(handler, _settings(concurrency=2))
+    # Act
+    for i in range(5):
+        queue.submit(_event("company", id=f"e{i}"))
+    await asyncio.sleep(0.01)
+    # Assert
+    assert handler.running == 2
+    assert queue.active == 2
+    assert queue.depth == 3
+    handler.release.set()
+    await queue.drain()
+    assert handler.max_running == 2
+    assert len(handler.started) == 5
+
+
+@pytest.mark.ai
+@pytest.mark.asyncio
+async def test_event_worker_queue__rejects__when_queue_full() -> None:
+    """
+    Purpose: Verify events beyond max_depth are rejected with the configured status code.
+    Why this matters: Rejecting lets the platform retry instead of overloading this process.
+    Setup summary: Fill a depth-1 queue behind a blocked worker, assert the next submit raises with 503.
+    """
+    # Arrange
+    handler = _BlockingHandler()
+    queue = EventWorkerQueue(handler, _settings(max_depth=1, reject_status_code=503))
+    queue.submit(_event("company", id="running"))
+    await asyncio.sleep(0.01)
+    queue.submit(_event("company", id="waiting"))
+    # Act / Assert
+    with pytest.raises(EventRejectedError) as exc_info:
+        queue.submit(_event("company", id="rejected"))
+    assert exc_info.value.reason == "queue_full"
+    assert exc_info.value.status_code == 503
+    handler.release.set()
+    await queue.drain()
+
+
+@pytest.mark.ai
+@pytest.mark.asyncio
+async def test_event_worker_queue__zero_depth__admits_events_for_free_workers() -> None:
+    """
+    Purpose: Verify max_depth=0 still admits events that an idle worker can take.
+    Why this matters: A zero depth means "no waiting", not "reject everything".
+    Setup summary: Submit to a zero-depth queue with two workers, assert two are admitted and the third is rejected.
+    """
+    # Arrange
+    handler = _BlockingHandler()
+    queue = EventWorkerQueue(
+        handler, _settings(concurrency=2, max_depth=0, max_depth_per_tenant=0)
+    )
+    # Act
+    queue.submit(_event("company", id="first"))
+    queue.submit(_event("company", id="second"))
+    await asyncio.sleep(0.01)
+    # Assert
+    assert handler.started == ["first", "second"]
+    with pytest.raises(EventRejectedError) as exc_info:
+        queue.submit(_event("company", id="rejected"))
+    assert exc_info.value.reason == "queue_full"
+    handler.release.set()
+    await queue.drain()
+
+
+@pytest.mark.ai
+@pytest.mark.asyncio
+async def test_event_worker_queue__rejects__when_tenant_full() -> None:
+    """
+    Purpose: Verify max_depth_per_tenant limits one company without affecting others.
+    Why this matters: One company's burst must not take all the queue slots.
+    Setup summary: Queue two events of company a with a per-tenant limit of 2, assert a third is rejected but company b is admitted.
+    """
+    # Arrange
+    handler = _BlockingHandler()
+    queue = EventWorkerQueue(handler, _settings(max_depth_per_tenant=2))
+    queue.submit(_event("a", id="running"))
+    await asyncio.sleep(0.01)
+    queue.submit(_event("a"))
+    queue.submit(_event("a"))
+    # Act / Assert
+    with pytest.raises(EventRejectedError) as exc_info:
+        queue.submit(_event("a"))
+    assert exc_info.value.reason == "tenant_full"
+    assert exc_info.value.status_code == 429
+    queue.submit(_event("b"))
+    handler.release.set()
+    await queue.drain()
+
+
+@pytest.mark.ai
+@pytest.mark.asyncio
+async def test_event_worker_queue__dispatches_round_robin_per_tenant() -> None:
+    """
+    Purpose: Verify waiting events are dispatched alternating between companies.
+    Why this matters: A burst from one company must not starve the others.
+    Setup summary: Queue three events of company a then two of b behind one worker, assert handling order alternates.
+    """
+    # Arrange
+    order: list[str] = []
+
+    async def handler(event) -> int:
+        order.append(event.id)
+        return 200
+
+    queue = EventWorkerQueue(handler, _settings())
+    # Act
+    for id in ("a1", "a2", "a3"):
+        queue.submit(_event("a", id=id))
+    for id in ("b1", "b2"):
+        queue.submit(_event("b", id=id))
+    await queue.drain()
+    # Assert
+    assert order == ["a1", "b1", "a2", "b2", "a3"]
+
+
+@pytest.mark.ai
+@pytest.mark.asyncio
+async def test_event_worker_queue__drain__finishes_admitted_events() -> None:
+    """
+    Purpose: Verify drain handles every admitted event and rejects new ones with 503.
+    Why this matters: Graceful shutdown must not lose accepted events.
+    Setup summary: Queue sync handler events, drain, assert all handled and a later submit is rejected.
+    """
+    # Arrange
+    handled: list[str] = []
+
+    def handler(event) -> int:
+        handled.append(event.id)
+        return 200
+
+    queue = EventWorkerQueue(handler, _settings(concurrency=2))
+    for i in range(4):
+        queue.submit(_event("company", id=f"e{i}"))
+    # Act
+    await queue.drain()
+    # Assert
+    assert sorted(handled) == ["e0", "e1", "e2", "e3"]
+    with pytest.raises(EventRejectedError) as exc_info:
+        queue.submit(_event("company"))
+    assert exc_info.value.status_code == 503
+
+
+@pytest.mark.ai
+@pytest.mark.asyncio
+async def test_event_worker_queue__drain__cancels_after_timeout() -> None:
+    """
+    Purpose: Verify drain cancels running events and drops queued ones after its timeout.
+    Why this matters: Shutdown must finish even if a handler hangs.
+    Setup summary: Block the only worker, drain with a short timeout, assert the queue is empty and the handler was cancelled.
+    """
+    # Arrange
+    handler = _BlockingHandler()
+    queue = EventWorkerQueue(handler, _settings())
+    queue.submit(_event("company", id="hanging"))
+    queue.submit(_event("company", id="queued"))
+    await asyncio.sleep(0.01)
+    # Act
+    await queue.drain(timeout=0.05)
+    # Assert
+    assert handler.started == ["hanging"]
+    assert handler.running == 0
+    assert queue.depth == 0
+
+
+@pytest.mark.ai
+@pytest.mark.asyncio
+async def test_event_worker_queue__keeps_working__when_handler_raises() -> None:
+    """
+    Purpose: Verify a failing handler does not stop its worker.
+    Why this matters: One bad event must not shrink the worker pool.
+    Setup summary: Submit a failing and a succeeding event to one worker, assert the second is handled.
+    """
+    # Arrange
+    handled: list[str] = []
+
+    async def handler(event) -> int:
+        if event.id == "bad":
+            raise RuntimeError("boom")
+        handled.append(event.id)
+        return 200
+
+    queue = EventWorkerQueue(handler, _settings())
+    # Act
+    queue.submit(_event("company", id="bad"))
+    queue.submit(_event("company", id="good"))
+    await queue.drain()
+    # Assert
+    assert handled == ["good"]
+
+
+@pytest.mark.ai
+@pytest.mark.asyncio
+async def test_event_worker_queue__publishes_metrics() -> None:
+    """
+    Purpose: Verify the queue reports depth, wait time and rejections to Prometheus.
+    Why this matters: Operators need these metrics to size concurrency and depth.
+    Setup summary: Queue and reject events, assert the gauges, histogram and counter in the registry changed.
+    """
+    pytest.importorskip("prometheus_client")
+    from unique_toolkit.monitoring import REGISTRY
+
+    def sample(name: str, labels: dict | None = None) -> float:
+        return REGISTRY.get_sample_value(name, labels or {}) or 0.0
+
+    rejections = sample("python_event_queue_rejections_total", {"reason": "queue_full"})
+    waits = sample("python_event_queue_wait_seconds_count")
+    handler = _BlockingHandler()
+    queue = EventWorkerQueue(handler, _settings(max_depth=1))
+    # Act
+    queue.submit(_event("company", id="running"))
+    await asyncio.sleep(0.01)
+    queue.submit(_event("company", id="waiting"))
+    with pytest.raises(EventRejectedError):
+        queue.submit(_event("company"))
+    # Assert
+    assert sample("python_event_queue_depth") == 1
+    assert sample("python_event_queue_in_progress") == 1
+    assert (
+        sample("python_event_queue_rejections_total", {"reason": "queue_full"})
+        == rejections + 1
+    )
+    handler.release.set()
+    await queue.drain()
+    assert sample("python_event_queue_depth") == 0
+    assert sample("python_event_queue_wait_seconds_count") == waits + 2
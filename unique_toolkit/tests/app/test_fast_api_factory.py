@@ -1,5 +1,6 @@
 """Tests for fast_api_factory module."""
 
+import asyncio
 from typing import Any
 from unittest.mock import MagicMock
 
@@ -448,3 +449,88 @@ def test_metrics_endpoint__returns_prometheus_format__bytes(
     # Prometheus text format uses "# HELP" and "# TYPE" declarations
     assert "# HELP" in response.text
     assert "# TYPE" in response.text
+
+
+@pytest.mark.ai
+def test_webhook_handler__queues_event__when_event_queue_configured(
+    mocker, base_settings: UniqueSettings, sample_chat_event: ChatEvent
+) -> None:
+    """
+    Purpose: Verify the webhook hands events to the bounded queue when configured.
+    Why this matters: Admission control only works if events bypass unbounded background tasks.
+    Setup summary: Build app with event_queue_settings, post an event within the app lifespan, assert the handler ran.
+    """
+    pytest.importorskip("fastapi")
+    # Arrange
+    from fastapi.testclient import TestClient
+
+    from unique_toolkit.app.event_queue import EventQueueSettings
+
+    handled: list[str] = []
+
+    async def handler(event: ChatEvent) -> int:
+        handled.append(event.id)
+        return 200
+
+    app = build_unique_custom_app(
+        settings=base_settings,
+        event_handler=handler,
+        event_queue_settings=EventQueueSettings(concurrency=1, max_depth=5),
+    )
+    mocker.patch(
+        "unique_toolkit.app.webhook.is_webhook_signature_valid",
+        return_value=True,
+    )
+    # Act
+    with TestClient(app) as client:
+        response = client.post(
+            "/webhook", json=sample_chat_event.model_dump(mode="json")
+        )
+    # Assert
+    assert response.status_code == 200
+    assert handled == [sample_chat_event.id]
+
+
+@pytest.mark.ai
+def test_webhook_handler__returns_429_with_retry_after__when_event_queue_full(
+    mocker, base_settings: UniqueSettings, sample_chat_event: ChatEvent
+) -> None:
+    """
+    Purpose: Verify the webhook rejects events with 429 and Retry-After when the queue is full.
+    Why this matters: The platform needs a retryable status instead of a silently overloaded app.
+    Setup summary: Build app with one worker and a zero-depth queue, keep the worker busy, post a second event, assert 429 and the Retry-After header.
+    """
+    pytest.importorskip("fastapi")
+    # Arrange
+    from fastapi.testclient import TestClient
+
+    from unique_toolkit.app.event_queue import EventQueueSettings
+
+    async def blocking_handler(event: ChatEvent) -> int:
+        await asyncio.Event().wait()
+        return 200
+
+    app = build_unique_custom_app(
+        settings=base_settings,
+        event_handler=blocking_handler,
+        event_queue_settings=EventQueueSettings(
+            concurrency=1,
+            max_depth=0,
+            retry_after_seconds=7,
+            drain_timeout_seconds=0,
+        ),
+    )
+    mocker.patch(
+        "unique_toolkit.app.webhook.is_webhook_signature_valid",
+        return_value=True,
+    )
+    payload = sample_chat_event.model_dump(mode="json")
+    # Act
+    with TestClient(app) as client:
+        admitted = client.post("/webhook", json=payload)
+        response = client.post("/webhook", json=payload)
+    # Assert
+    assert admitted.status_code == 200
+    assert response.status_code == 429
+    assert response.headers["retry-after"] == "7"
+    assert "queue_full" in response.json()["error"]
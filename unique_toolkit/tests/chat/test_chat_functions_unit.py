@@ -1,3 +1,4 @@
+import json
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -10,8 +11,10 @@ from unique_toolkit.chat.functions import (
     create_message_async,
     create_message_tools,
     create_message_tools_async,
+    filter_valid_chat_messages,
     filter_valid_messages,
     get_full_history,
+    get_full_history_async,
     get_message_tools,
     get_message_tools_async,
     get_selection_from_history,
@@ -23,7 +26,11 @@ from unique_toolkit.chat.functions import (
     stream_complete_to_chat,
     stream_complete_to_chat_async,
 )
-from unique_toolkit.chat.schemas import ChatMessageTool, ChatMessageToolResponse
+from unique_toolkit.chat.schemas import (
+    ChatMessageList,
+    ChatMessageTool,
+    ChatMessageToolResponse,
+)
 from unique_toolkit.content.schemas import ContentReference
 from unique_toolkit.language_model.infos import LanguageModelName
 from unique_toolkit.language_model.schemas import LanguageModelMessages
@@ -125,14 +132,86 @@ def test_get_full_history(mock_sdk):
             },
         ]
     }
-    mock_sdk.Message.list.return_value = mock_messages
+    mock_sdk.Message.list_typed.side_effect = (
+        lambda response_model, **params: response_model.model_validate_json(
+            json.dumps(mock_messages)
+        )
+    )
 
     # Execute
     result = get_full_history("user123", "company123", "chat123")
 
     # Assert
+    mock_sdk.Message.list_typed.assert_called_once_with(
+        ChatMessageList,
+        user_id="user123",
+        company_id="company123",
+        chatId="chat123",
+    )
     assert len(result) == 1  # Only first message should remain after filtering
     assert all(isinstance(msg, ChatMessage) for msg in result)
+    assert result[0].content == "Message 1"
+
+
+@pytest.mark.asyncio
+async def test_get_full_history_async(mock_sdk):
+    # Setup
+    mock_messages = {
+        "object": "list",
+        "data": [
+            {"id": f"msg{i}", "chatId": "chat123", "text": f"Message {i}"}
+            | {"role": "USER" if i % 2 else "ASSISTANT"}
+            for i in range(1, 5)
+        ],
+    }
+
+    async def list_typed_async(response_model, **params):
+        return response_model.model_validate_json(json.dumps(mock_messages))
+
+    mock_sdk.Message.list_typed_async.side_effect = list_typed_async
+
+    # Execute
+    result = await get_full_history_async("user123", "company123", "chat123")
+
+    # Assert
+    assert [msg.id for msg in result] == ["msg1", "msg2"]
+    assert [msg.role for msg in result] == [
+        ChatMessageRole.USER,
+        ChatMessageRole.ASSISTANT,
+    ]
+
+
+@pytest.mark.asyncio
+async def test_get_full_history_async__ignores_unknown_values_in_dropped_messages(
+    mock_sdk,
+):
+    # Setup
+    mock_messages = {
+        "object": "list",
+        "data": [
+            {"id": "msg1", "chatId": "chat123", "text": "Kept", "role": "USER"},
+            {
+                "id": "msg2",
+                "chatId": "chat123",
+                "text": "Hidden",
+                "role": "SYSTEM",
+                "assessment": [{"id": "a1", "type": "UNKNOWN_TYPE"}],
+            },
+            {"id": "msg3", "chatId": "chat123", "text": "Current", "role": "USER"},
+            {"id": "msg4", "chatId": "chat123", "text": None, "role": "NEW_ROLE"},
+        ],
+    }
+
+    async def list_typed_async(response_model, **params):
+        return response_model.model_validate_json(json.dumps(mock_messages))
+
+    mock_sdk.Message.list_typed_async.side_effect = list_typed_async
+
+    # Execute
+    result = await get_full_history_async("user123", "company123", "chat123")
+
+    # Assert
+    assert [msg.id for msg in result] == ["msg1"]
 
 
 def test_get_selection_from_history():
@@ -466,6 +545,28 @@ def test_filter_valid_messages():
     assert result[0]["text"] == "Valid message 1"
 
 
+def test_filter_valid_chat_messages():
+    # Setup
+    messages = ChatMessageList.model_validate(
+        {
+            "data": [
+                {"id": "msg1", "chatId": "c", "text": "Valid", "role": "USER"},
+                {"id": "msg2", "chatId": "c", "text": None, "role": "USER"},
+                {"id": "msg3", "chatId": "c", "text": "[SYSTEM] x", "role": "USER"},
+                {"id": "msg4", "chatId": "c", "text": "Hidden", "role": "SYSTEM"},
+                {"id": "msg5", "chatId": "c", "text": "Current", "role": "USER"},
+                {"id": "msg6", "chatId": "c", "text": None, "role": "ASSISTANT"},
+            ]
+        }
+    )
+
+    # Execute
+    result = filter_valid_chat_messages(messages.data)
+
+    # Assert
+    assert [msg.id for msg in result] == ["msg1"]
+
+
 def test_pick_messages_in_reverse_for_token_window():
     # Setup
     messages = [
@@ -20,6 +20,7 @@ from unique_toolkit.chat.schemas import (
     ChatMessageAssessmentLabel,
     ChatMessageAssessmentStatus,
     ChatMessageAssessmentType,
+    ChatMessageList,
     ChatMessageRole,
 )
 from unique_toolkit.chat.service import ChatService
@@ -312,9 +313,9 @@ class TestChatServiceUnit:
         ]
         mock_modify.assert_has_calls(expected_calls)
 
-    @patch.object(unique_sdk.Message, "list", autospec=True)
+    @patch.object(unique_sdk.Message, "list_typed", autospec=True)
     def test_get_history(self, mock_list):
-        mock_list.return_value = {
+        history = {
             "object": "list",
             "data": [
                 {
@@ -359,6 +360,9 @@ class TestChatServiceUnit:
                 },
             ],
         }
+        mock_list.side_effect = lambda response_model, **params: (
+            response_model.model_validate(history)
+        )
 
         full_history, selected_history = self.service.get_full_and_selected_history(
             token_limit=100,
@@ -373,6 +377,7 @@ class TestChatServiceUnit:
         )
 
         mock_list.assert_called_once_with(
+            ChatMessageList,
             user_id="test_user",
             company_id="test_company",
             chatId="test_chat",
@@ -466,7 +471,9 @@ class TestChatServiceUnit:
         with pytest.raises(Exception, match="API Error"):
             self.service.modify_assistant_message("Modified message")
 
-    @patch.object(unique_sdk.Message, "list", side_effect=Exception("History Error"))
+    @patch.object(
+        unique_sdk.Message, "list_typed", side_effect=Exception("History Error")
+    )
     def test_error_handling_get_history(self, mock_list):
         with pytest.raises(Exception, match="History Error"):
             self.service.get_full_and_selected_history(100, 0.8, 10)
@@ -608,9 +615,9 @@ class TestChatServiceUnit:
         mock_modify.assert_has_calls(expected_calls)
 
     @pytest.mark.asyncio
-    @patch.object(unique_sdk.Message, "list_async", autospec=True)
+    @patch.object(unique_sdk.Message, "list_typed_async", autospec=True)
     async def test_get_history_async(self, mock_list):
-        mock_list.return_value = {
+        history = {
             "object": "list",
             "data": [
                 {
@@ -655,6 +662,9 @@ class TestChatServiceUnit:
                 },
             ],
         }
+        mock_list.side_effect = lambda response_model, **params: (
+            response_model.model_validate(history)
+        )
 
         (
             full_history,
@@ -672,6 +682,7 @@ class TestChatServiceUnit:
         )
 
         mock_list.assert_called_once_with(
+            ChatMessageList,
             user_id="test_user",
             company_id="test_company",
             chatId="test_chat",
@@ -890,7 +901,9 @@ class TestChatServiceUnit:
 
     @pytest.mark.asyncio
     @patch.object(
-        unique_sdk.Message, "list_async", side_effect=Exception("History Error")
+        unique_sdk.Message,
+        "list_typed_async",
+        side_effect=Exception("History Error"),
     )
     async def test_error_handling_get_history_async(self, mock_list):
         with pytest.raises(Exception, match="History Error"):
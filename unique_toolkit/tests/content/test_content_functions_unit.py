@@ -1,5 +1,7 @@
+import io
 from unittest.mock import AsyncMock, Mock, patch
 
+import httpx
 import pytest
 
 from unique_toolkit.content.functions import (
@@ -8,6 +10,10 @@ from unique_toolkit.content.functions import (
     download_content_to_bytes,
     download_content_to_bytes_async,
     download_content_to_file_by_id,
+    download_content_to_path,
+    download_content_to_path_async,
+    get_chat_upload_generation,
+    iter_content_by_id_async,
     request_content_by_id,
     request_content_by_id_async,
     search_content_chunks,
@@ -16,6 +22,7 @@ from unique_toolkit.content.functions import (
     search_contents_async,
     upload_content,
     upload_content_from_bytes,
+    upload_content_from_bytes_async,
 )
 from unique_toolkit.content.schemas import (
     Content,
@@ -148,7 +155,7 @@ async def test_search_contents_async(mock_sdk, sample_content_data):
     mock_sdk.Content.search_async.assert_called_once()
 
 
-@patch("unique_toolkit.content.functions.requests.put")
+@patch("requests.Session.put")
 @patch("unique_toolkit.content.functions._upsert_content")
 def test_upload_content(mock_upsert, mock_put, mock_sdk, sample_content_data, tmp_path):
     # Setup
@@ -180,7 +187,7 @@ def test_upload_content(mock_upsert, mock_put, mock_sdk, sample_content_data, tm
     assert call_kwargs["input_data"]["ingestionConfig"] == ingestion_config
 
 
-@patch("unique_toolkit.content.functions.requests.put")
+@patch("requests.Session.put")
 @patch("unique_toolkit.content.functions._upsert_content")
 def test_upload_content_from_bytes(mock_upsert, mock_put, sample_content_data):
     # Setup
@@ -209,7 +216,7 @@ def test_upload_content_from_bytes(mock_upsert, mock_put, sample_content_data):
     assert call_kwargs["input_data"]["ingestionConfig"] == ingestion_config
 
 
-@patch("unique_toolkit.content.functions.requests.put")
+@patch("requests.Session.put")
 @patch("unique_toolkit.content.functions._upsert_content")
 def test_upload_content_from_bytes_uses_ingestion_upload_url_internal_when_set(
     mock_upsert, mock_put, sample_content_data
@@ -234,12 +241,13 @@ def test_upload_content_from_bytes_uses_ingestion_upload_url_internal_when_set(
     assert mock_put.call_args[1]["url"].startswith(internal_base)
 
 
-@patch("unique_toolkit.content.functions.requests.get")
+@patch("requests.Session.get")
 def test_download_content_to_file_by_id(mock_get, tmp_path):
     # Setup
     mock_response = Mock()
     mock_response.status_code = 200
     mock_response.content = b"test content"
+    mock_response.iter_content.return_value = [b"test content"]
     mock_response.headers = {"Content-Disposition": 'filename="test.txt"'}
     mock_get.return_value = mock_response
 
@@ -263,6 +271,7 @@ def test_download_content(mock_sdk, tmp_path):
     mock_response = Mock()
     mock_response.status_code = 200
     mock_response.content = b"test content"
+    mock_response.iter_content.return_value = [b"test content"]
 
     with patch(
         "unique_toolkit.content.functions.request_content_by_id",
@@ -371,7 +380,7 @@ def test_upload_content_error_handling(mock_sdk, tmp_path):
         )
 
 
-@patch("unique_toolkit.content.functions.requests.put")
+@patch("requests.Session.put")
 @patch("unique_toolkit.content.functions._upsert_content")
 def test_upload_content_with_metadata(
     mock_upsert, mock_put, mock_sdk, sample_content_data, tmp_path
@@ -403,7 +412,7 @@ def test_upload_content_with_metadata(
 
 def test_request_content_by_id(mock_sdk):
     # Setup
-    with patch("unique_toolkit.content.functions.requests.get") as mock_get:
+    with patch("requests.Session.get") as mock_get:
         mock_response = Mock()
         mock_response.status_code = 200
         mock_response.content = b"test content"
@@ -457,6 +466,7 @@ def test_download_content_to_file_by_id_no_filename(mock_sdk):
         mock_response = Mock()
         mock_response.status_code = 200
         mock_response.content = b"test content"
+        mock_response.iter_content.return_value = [b"test content"]
         mock_response.headers = {}  # No Content-Disposition header
         mock_request.return_value = mock_response
 
@@ -549,18 +559,19 @@ async def test_request_content_by_id_async__returns_response__with_valid_params(
     """
     Purpose: Verify async content request builds correct URL with chat_id and auth headers.
     Why this matters: Incorrect URL or headers would silently fail content downloads.
-    Setup summary: Mock httpx.AsyncClient, call request_content_by_id_async, assert URL and headers.
+    Setup summary: Mock the pooled async client, call request_content_by_id_async, assert URL and headers.
     """
-    with patch("unique_toolkit.content.functions.httpx.AsyncClient") as mock_client_cls:
+    with patch(
+        "unique_toolkit.content.functions.get_async_http_client"
+    ) as mock_get_client:
         # Arrange
         mock_response = Mock()
         mock_response.status_code = 200
         mock_response.content = b"test content"
 
         mock_client = AsyncMock()
-        mock_client.__aenter__.return_value = mock_client
         mock_client.get.return_value = mock_response
-        mock_client_cls.return_value = mock_client
+        mock_get_client.return_value = mock_client
 
         # Act
         response = await request_content_by_id_async(
@@ -660,17 +671,17 @@ async def test_trigger_upload_content_async_uses_generous_timeout(
     sample_content_data,
 ) -> None:
     """
-    Purpose: Verify AsyncClient is created with read/write timeouts well above the 5 s default.
+    Purpose: Verify the blob PUT is sent with read/write timeouts well above the 5 s default.
     Why this matters: Large HTML files (~4 MB) reliably timeout at 5 s waiting for the Azure
     Blob Storage commit response; without an explicit timeout the upload silently fails.
-    Setup summary: Patch _upsert_content_async and httpx.AsyncClient, call the private helper,
-    assert the timeout kwarg has read >= 60 and write >= 60.
+    Setup summary: Patch _upsert_content_async and the pooled async client, call the private
+    helper, assert the timeout kwarg has read >= 60 and write >= 60.
     """
     import httpx
 
     from unique_toolkit.content.functions import _trigger_upload_content_async
 
-    captured_timeout: httpx.Timeout | None = None
+    captured_timeout: httpx.Timeout | None
 
     with patch(
         "unique_toolkit.content.functions._upsert_content_async",
@@ -679,21 +690,13 @@ async def test_trigger_upload_content_async_uses_generous_timeout(
         mock_upsert.return_value = sample_content_data
 
         with patch(
-            "unique_toolkit.content.functions.httpx.AsyncClient"
-        ) as mock_client_cls:
+            "unique_toolkit.content.functions.get_async_http_client"
+        ) as mock_get_client:
             mock_client = AsyncMock()
-            mock_client.__aenter__.return_value = mock_client
             mock_response = Mock()
             mock_response.raise_for_status = Mock()
             mock_client.put.return_value = mock_response
-            mock_client_cls.return_value = mock_client
-
-            def capture_timeout(*args, **kwargs):
-                nonlocal captured_timeout
-                captured_timeout = kwargs.get("timeout")
-                return mock_client
-
-            mock_client_cls.side_effect = capture_timeout
+            mock_get_client.return_value = mock_client
 
             await _trigger_upload_content_async(
                 user_id="user123",
@@ -703,10 +706,9 @@ async def test_trigger_upload_content_async_uses_generous_timeout(
                 mime_type="text/html",
                 chat_id="chat123",
             )
+            captured_timeout = mock_client.put.call_args.kwargs.get("timeout")
 
-    assert captured_timeout is not None, (
-        "httpx.AsyncClient must receive a timeout= kwarg"
-    )
+    assert captured_timeout is not None, "the blob PUT must receive a timeout= kwarg"
     assert isinstance(captured_timeout, httpx.Timeout)
     assert captured_timeout.read is not None and captured_timeout.read >= 60, (
         f"read timeout {captured_timeout.read} must be >= 60 s to survive large blob uploads"
@@ -722,7 +724,7 @@ async def test_trigger_upload_content_async_timeout_not_default_5s(
 ) -> None:
     """
     Purpose: Guard against accidental regression back to the 5 s httpx default.
-    Why this matters: A plain httpx.AsyncClient() has read=write=5 s which causes ReadTimeout
+    Why this matters: httpx's default timeout has read=write=5 s which causes ReadTimeout
     for ~4 MB HTML artifacts (observed in production, chat chat_n2ww1gbf0bti31gh8dt95hox).
     """
     import httpx
@@ -736,14 +738,13 @@ async def test_trigger_upload_content_async_timeout_not_default_5s(
         mock_upsert.return_value = sample_content_data
 
         with patch(
-            "unique_toolkit.content.functions.httpx.AsyncClient"
-        ) as mock_client_cls:
+            "unique_toolkit.content.functions.get_async_http_client"
+        ) as mock_get_client:
             mock_client = AsyncMock()
-            mock_client.__aenter__.return_value = mock_client
             mock_response = Mock()
             mock_response.raise_for_status = Mock()
             mock_client.put.return_value = mock_response
-            mock_client_cls.return_value = mock_client
+            mock_get_client.return_value = mock_client
 
             await _trigger_upload_content_async(
                 user_id="user123",
@@ -754,12 +755,10 @@ async def test_trigger_upload_content_async_timeout_not_default_5s(
                 chat_id="chat123",
             )
 
-            call_kwargs = mock_client_cls.call_args[1]
+            call_kwargs = mock_client.put.call_args[1]
             timeout = call_kwargs.get("timeout")
 
-    assert timeout is not None, (
-        "timeout= must be passed explicitly to httpx.AsyncClient"
-    )
+    assert timeout is not None, "timeout= must be passed explicitly to the blob PUT"
     assert not isinstance(timeout, httpx.Timeout) or timeout.read != 5.0, (
         "read timeout must not be the default 5 s"
     )
@@ -802,11 +801,12 @@ class TestExtractFilename:
         assert _extract_filename(header) == "übersicht.pdf"
 
 
-@patch("unique_toolkit.content.functions.requests.get")
+@patch("requests.Session.get")
 def test_download_content_to_file_by_id_utf8_filename(mock_get, tmp_path):
     mock_response = Mock()
     mock_response.status_code = 200
     mock_response.content = b"file bytes"
+    mock_response.iter_content.return_value = [b"file bytes"]
     mock_response.headers = {
         "Content-Disposition": (
             'attachment; filename="??? ???????.pptx"; '
@@ -826,3 +826,342 @@ def test_download_content_to_file_by_id_utf8_filename(mock_get, tmp_path):
     assert result.exists()
     assert result.name == "ИКТ УРЕЂАЈИ.pptx"
     assert result.read_bytes() == b"file bytes"
+
+
+# ---------------------------------------------------------------------------
+# Streaming transfers
+# ---------------------------------------------------------------------------
+
+
+def _configure_sdk(mock_sdk) -> None:
+    mock_sdk.api_base = "https://api.test/public"
+    mock_sdk.api_version = "2023-12-06"
+    mock_sdk.app_id = "app123"
+    mock_sdk.api_key = "key123"
+
+
+def _mock_async_client(handler) -> httpx.AsyncClient:
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+@pytest.mark.ai
+@patch("requests.Session.get")
+def test_download_content_to_path__writes_chunks__with_successful_response(
+    mock_get, tmp_path
+) -> None:
+    """
+    Purpose: Verify the streaming download writes every chunk to the target path.
+    Why this matters: Large files must not be buffered in memory before they hit disk.
+    Setup summary: Mock a streamed 200 response, download into a missing directory, assert content.
+    """
+    # Arrange
+    mock_response = Mock()
+    mock_response.status_code = 200
+    mock_response.iter_content.return_value = [b"chunk1", b"chunk2"]
+    mock_get.return_value = mock_response
+    target = tmp_path / "nested" / "file.bin"
+
+    # Act
+    result = download_content_to_path(
+        user_id="user123",
+        company_id="company123",
+        content_id="content123",
+        path=target,
+        chunk_size=6,
+    )
+
+    # Assert
+    assert result == target
+    assert target.read_bytes() == b"chunk1chunk2"
+    assert mock_get.call_args.kwargs["stream"] is True
+    mock_response.iter_content.assert_called_once_with(6)
+    mock_response.close.assert_called_once()
+
+
+@pytest.mark.ai
+@patch("requests.Session.get")
+def test_download_content_to_path__creates_no_file__when_response_not_successful(
+    mock_get, tmp_path
+) -> None:
+    """
+    Purpose: Verify a failed streaming download raises before any file is created.
+    Why this matters: An empty file at the target path would look like a valid download.
+    Setup summary: Mock a 404 response, assert the error and that the path does not exist.
+    """
+    # Arrange
+    mock_response = Mock()
+    mock_response.status_code = 404
+    mock_get.return_value = mock_response
+    target = tmp_path / "file.bin"
+
+    # Act & Assert
+    with pytest.raises(Exception, match="Status code 404"):
+        download_content_to_path(
+            user_id="user123",
+            company_id="company123",
+            content_id="content123",
+            path=target,
+        )
+    assert not target.exists()
+    mock_response.close.assert_called_once()
+
+
+@pytest.mark.ai
+@patch("requests.Session.get")
+def test_download_content_to_path__removes_partial_file__when_stream_fails(
+    mock_get, tmp_path
+) -> None:
+    """
+    Purpose: Verify a download that fails mid-stream leaves no file behind.
+    Why this matters: A truncated file at the target path would be mistaken for the content.
+    Setup summary: Yield one chunk then raise from iter_content, assert the error and no file.
+    """
+
+    # Arrange
+    def broken_stream(_chunk_size: int):
+        yield b"chunk1"
+        raise ConnectionError("connection reset")
+
+    mock_response = Mock()
+    mock_response.status_code = 200
+    mock_response.iter_content.side_effect = broken_stream
+    mock_get.return_value = mock_response
+    target = tmp_path / "file.bin"
+
+    # Act & Assert
+    with pytest.raises(ConnectionError, match="connection reset"):
+        download_content_to_path(
+            user_id="user123",
+            company_id="company123",
+            content_id="content123",
+            path=target,
+        )
+    assert not target.exists()
+    mock_response.close.assert_called_once()
+
+
+@pytest.mark.ai
+@pytest.mark.asyncio
+async def test_iter_content_by_id_async__yields_bounded_chunks__with_successful_response(
+    mock_sdk,
+) -> None:
+    """
+    Purpose: Verify the async content iterator yields chunks no larger than chunk_size.
+    Why this matters: Peak memory of streamed downloads is bounded by the chunk size.
+    Setup summary: Serve 10 bytes from a mock transport, iterate with chunk_size=4, assert chunks.
+    """
+    # Arrange
+    _configure_sdk(mock_sdk)
+    requests_seen: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests_seen.append(request)
+        return httpx.Response(200, content=b"0123456789")
+
+    with patch(
+        "unique_toolkit.content.functions.get_async_http_client",
+        return_value=_mock_async_client(handler),
+    ):
+        # Act
+        chunks = [
+            chunk
+            async for chunk in iter_content_by_id_async(
+                user_id="user123",
+                company_id="company123",
+                content_id="content123",
+                chat_id="chat123",
+                chunk_size=4,
+            )
+        ]
+
+    # Assert
+    assert chunks == [b"0123", b"4567", b"89"]
+    assert str(requests_seen[0].url) == (
+        "https://api.test/public/content/content123/file?chatId=chat123"
+    )
+    assert requests_seen[0].headers["x-user-id"] == "user123"
+
+
+@pytest.mark.ai
+@pytest.mark.asyncio
+async def test_download_content_to_path_async__removes_partial_file__when_response_not_successful(
+    mock_sdk, tmp_path
+) -> None:
+    """
+    Purpose: Verify a failed async streaming download raises and leaves no file behind.
+    Why this matters: A truncated file at the target path would be mistaken for the content.
+    Setup summary: Serve a 500 from a mock transport, assert HTTPStatusError and no file.
+    """
+    # Arrange
+    _configure_sdk(mock_sdk)
+    target = tmp_path / "file.bin"
+
+    with patch(
+        "unique_toolkit.content.functions.get_async_http_client",
+        return_value=_mock_async_client(lambda request: httpx.Response(500)),
+    ):
+        # Act & Assert
+        with pytest.raises(httpx.HTTPStatusError):
+            await download_content_to_path_async(
+                user_id="user123",
+                company_id="company123",
+                content_id="content123",
+                path=target,
+            )
+
+    assert not target.exists()
+
+
+@pytest.mark.ai
+@pytest.mark.asyncio
+async def test_download_content_to_path_async__writes_file__with_successful_response(
+    mock_sdk, tmp_path
+) -> None:
+    """
+    Purpose: Verify the async streaming download writes the full body to the target path.
+    Why this matters: Chunked writes must reassemble to the exact downloaded content.
+    Setup summary: Serve bytes from a mock transport, download with a small chunk size, compare.
+    """
+    # Arrange
+    _configure_sdk(mock_sdk)
+    body = bytes(range(256)) * 10
+    target = tmp_path / "nested" / "file.bin"
+
+    with patch(
+        "unique_toolkit.content.functions.get_async_http_client",
+        return_value=_mock_async_client(
+            lambda request: httpx.Response(200, content=body)
+        ),
+    ):
+        # Act
+        result = await download_content_to_path_async(
+            user_id="user123",
+            company_id="company123",
+            content_id="content123",
+            path=target,
+            chunk_size=100,
+        )
+
+    # Assert
+    assert result == target
+    assert target.read_bytes() == body
+
+
+@pytest.mark.ai
+@patch("requests.Session.put")
+@patch("unique_toolkit.content.functions._upsert_content")
+def test_upload_content_from_bytes__streams_file_object__when_given_binary_io(
+    mock_upsert, mock_put, sample_content_data
+) -> None:
+    """
+    Purpose: Verify a file-like object is passed to the blob PUT as-is and its size reported.
+    Why this matters: Reading the file into bytes first would defeat streaming uploads.
+    Setup summary: Upload a BytesIO positioned past a prefix, assert PUT data and byteSize.
+    """
+    # Arrange
+    mock_upsert.return_value = sample_content_data
+    mock_put.return_value = Mock(status_code=200)
+    file = io.BytesIO(b"skip:payload")
+    file.seek(5)
+
+    # Act
+    upload_content_from_bytes(
+        user_id="user123",
+        company_id="company123",
+        content=file,
+        content_name="test.txt",
+        mime_type="text/plain",
+        scope_id="scope123",
+    )
+
+    # Assert
+    assert mock_put.call_args.kwargs["data"] is file
+    input_data = mock_upsert.call_args_list[1].kwargs["input_data"]
+    assert input_data["byteSize"] == len(b"payload")
+
+
+@pytest.mark.ai
+@pytest.mark.asyncio
+async def test_upload_content_from_bytes_async__streams_file_object__with_content_length(
+    sample_content_data,
+) -> None:
+    """
+    Purpose: Verify async uploads of file-like objects stream the body with a Content-Length.
+    Why this matters: Azure Blob Storage rejects chunked transfer encoding on block blob PUTs.
+    Setup summary: Upload a BytesIO through a mock transport, assert body and headers received.
+    """
+    # Arrange
+    received: list[httpx.Request] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        await request.aread()
+        received.append(request)
+        return httpx.Response(201)
+
+    with (
+        patch(
+            "unique_toolkit.content.functions._upsert_content_async",
+            new_callable=AsyncMock,
+            return_value=sample_content_data,
+        ) as mock_upsert,
+        patch(
+            "unique_toolkit.content.functions.get_async_http_client",
+            return_value=_mock_async_client(handler),
+        ),
+    ):
+        # Act
+        await upload_content_from_bytes_async(
+            user_id="user123",
+            company_id="company123",
+            content=io.BytesIO(b"payload"),
+            content_name="test.txt",
+            mime_type="text/plain",
+            scope_id="scope123",
+        )
+
+    # Assert
+    assert received[0].content == b"payload"
+    assert received[0].headers["Content-Length"] == "7"
+    assert "Transfer-Encoding" not in received[0].headers
+    assert mock_upsert.call_args_list[1].kwargs["input_data"]["byteSize"] == 7
+
+
+@pytest.mark.ai
+@patch("requests.Session.put")
+@patch("unique_toolkit.content.functions._upsert_content")
+def test_upload_content_from_bytes__bumps_chat_upload_generation__when_chat_id_given(
+    mock_upsert, mock_put, sample_content_data
+) -> None:
+    """
+    Purpose: Verify uploading into a chat changes that chat's upload generation only.
+    Why this matters: The loop token reducer uses it to refetch history after in-turn uploads.
+    Setup summary: Upload with and without a chat id, compare generations before and after.
+    """
+    # Arrange
+    mock_upsert.return_value = sample_content_data
+    before = get_chat_upload_generation("chat-generation")
+    other_before = get_chat_upload_generation("chat-other")
+
+    # Act
+    upload_content_from_bytes(
+        user_id="user123",
+        company_id="company123",
+        content=b"test",
+        content_name="test.txt",
+        mime_type="text/plain",
+        chat_id="chat-generation",
+    )
+    after_chat_upload = get_chat_upload_generation("chat-generation")
+    upload_content_from_bytes(
+        user_id="user123",
+        company_id="company123",
+        content=b"test",
+        content_name="test.txt",
+        mime_type="text/plain",
+        scope_id="scope123",
+    )
+
+    # Assert
+    assert after_chat_upload != before
+    assert get_chat_upload_generation("chat-generation") == after_chat_upload
+    assert get_chat_upload_generation("chat-other") == other_before
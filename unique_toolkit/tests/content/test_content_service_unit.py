@@ -267,7 +267,7 @@ class TestContentServiceUnit:
                 scope_ids=[""],
             )
 
-    @patch("requests.put")
+    @patch("requests.Session.put")
     def test_upload_content(self, mock_put):
         with patch.object(unique_sdk.Content, "upsert") as mock_upsert:
             mock_upsert.return_value = {
@@ -343,7 +343,7 @@ class TestContentServiceUnit:
             # Clean up the temporary file
             os.unlink(temp_content_path)
 
-    @patch("requests.put")
+    @patch("requests.Session.put")
     def test_upload_content_from_bytes(self, mock_put):
         with patch.object(unique_sdk.Content, "upsert") as mock_upsert:
             mock_upsert.return_value = {
@@ -415,7 +415,7 @@ class TestContentServiceUnit:
                 },
             )
 
-    @patch("requests.put")
+    @patch("requests.Session.put")
     def test_upload_with_skip_ingestion_content(self, mock_put):
         with patch.object(unique_sdk.Content, "upsert") as mock_upsert:
             # Create a temporary file for testing
@@ -509,11 +509,12 @@ class TestContentServiceUnit:
             # Clean up the temporary file
             os.unlink(temp_content_path)
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_download_content(self, mock_get):
         mock_response = Mock()
         mock_response.status_code = 200
         mock_response.content = b"Test content"
+        mock_response.iter_content.return_value = [b"Test content"]
         mock_get.return_value = mock_response
 
         result = self.service.download_content(
@@ -531,7 +532,7 @@ class TestContentServiceUnit:
         result.unlink()
         result.parent.rmdir()
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_download_content_to_memory(self, mock_get):
         mock_response = Mock()
         mock_response.status_code = 200
@@ -609,11 +610,12 @@ class TestContentServiceUnit:
                 chat_id="test_chat",
             )
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_download_content_with_dir(self, mock_get):
         mock_response = Mock()
         mock_response.status_code = 200
         mock_response.content = b"Test content"
+        mock_response.iter_content.return_value = [b"Test content"]
         mock_get.return_value = mock_response
 
         root_dir = Path("./tmp_root_dir")
@@ -679,7 +681,7 @@ class TestContentServiceUnit:
                 includeFailedContent=False,
             )
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_download_content_to_file_by_id(self, mock_get):
         mock_response = Mock()
         mock_response.status_code = 200
@@ -687,6 +689,7 @@ class TestContentServiceUnit:
             "Content-Disposition": 'attachment; filename="test.txt"'
         }
         mock_response.content = b"Test content"
+        mock_response.iter_content.return_value = [b"Test content"]
         mock_get.return_value = mock_response
 
         result = self.service.download_content_to_file_by_id(
@@ -707,9 +710,10 @@ class TestContentServiceUnit:
                 "x-company-id": "test_company",
                 "Authorization": "Bearer %s" % (unique_sdk.api_key,),
             },
+            stream=True,
         )
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_request_content_by_id(self, mock_get):
         mock_response = Mock()
         mock_response.status_code = 200
@@ -732,9 +736,10 @@ class TestContentServiceUnit:
                 "x-company-id": "test_company",
                 "Authorization": "Bearer %s" % (unique_sdk.api_key,),
             },
+            stream=False,
         )
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_request_content_by_id_invalid_id(self, mock_get):
         mock_response = Mock()
         mock_response.status_code = 404
@@ -757,9 +762,10 @@ class TestContentServiceUnit:
                 "x-company-id": "test_company",
                 "Authorization": "Bearer %s" % (unique_sdk.api_key,),
             },
+            stream=False,
         )
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_request_content_by_id_server_error(self, mock_get):
         mock_response = Mock()
         mock_response.status_code = 500
@@ -782,9 +788,10 @@ class TestContentServiceUnit:
                 "x-company-id": "test_company",
                 "Authorization": "Bearer %s" % (unique_sdk.api_key,),
             },
+            stream=False,
         )
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_request_content_by_id_without_chat_id(self, mock_get):
         mock_response = Mock()
         mock_response.status_code = 200
@@ -805,9 +812,10 @@ class TestContentServiceUnit:
                 "x-company-id": "test_company",
                 "Authorization": "Bearer %s" % (unique_sdk.api_key,),
             },
+            stream=False,
         )
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_download_content_to_file_by_id_with_filename(self, mock_get):
         mock_response = Mock()
         mock_response.status_code = 200
@@ -815,6 +823,7 @@ class TestContentServiceUnit:
             "Content-Disposition": 'attachment; filename="custom_name.txt"'
         }
         mock_response.content = b"Test content"
+        mock_response.iter_content.return_value = [b"Test content"]
         mock_get.return_value = mock_response
 
         result = self.service.download_content_to_file_by_id(
@@ -835,13 +844,15 @@ class TestContentServiceUnit:
                 "x-company-id": "test_company",
                 "Authorization": "Bearer %s" % (unique_sdk.api_key,),
             },
+            stream=True,
         )
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_download_content_to_file_by_id_exception(self, mock_get):
         mock_response = Mock()
         mock_response.status_code = 404
         mock_response.content = b"Not Found"
+        mock_response.iter_content.return_value = [b"Not Found"]
         mock_get.return_value = mock_response
 
         with pytest.raises(Exception, match="Error downloading file: Status code 404"):
@@ -856,6 +867,7 @@ class TestContentServiceUnit:
                 "x-company-id": "test_company",
                 "Authorization": "Bearer %s" % (unique_sdk.api_key,),
             },
+            stream=True,
         )
 
     def test_init_with_chat_event(self):
@@ -11,6 +11,9 @@ from unique_toolkit.experimental._internal.streaming.pattern_replacer import (
     BATCH_NORMALIZATION_PATTERNS,
     NORMALIZATION_MAX_MATCH_LENGTH,
     NORMALIZATION_PATTERNS,
+    NORMALIZATION_TRIGGER_LITERALS,
+    CitationTracker,
+    CompiledNormalizer,
     StreamingPatternReplacer,
     chunks_to_sdk_references,
     extract_cited_sequence_numbers,
@@ -250,3 +253,164 @@ def test_streaming_pattern_replacer__compiled_pattern__accepted_in_init():
     """
     replacer = StreamingPatternReplacer([(re.compile("x"), "y")], max_match_length=0)
     assert replacer.process("xx") == "yy"
+
+
+def _apply_sequentially(text: str, patterns) -> str:
+    for pattern, replacement in patterns:
+        text = re.sub(pattern, replacement, text)
+    return text
+
+
+_NORMALIZER_SAMPLES = [
+    "Plain prose without any citation at all.",
+    "Revenue grew [source1] and margins [Source 2] improved.",
+    "See source_3, SOURCE4 and [source: 1, 2, 3].",
+    "Nested [[1], [2]] and list [4, 5] and bold [**6**].",
+    '<source source_number="7"> and [<source8>] and [\\<source9>]',
+    "As discussed [user] in the [previous conversation] [none].",
+    "source[conversation] says SOURCE n°10 and [[<[11]]>]",
+    "[[user]1] cascades after stripping",
+    "[sour",
+    "",
+]
+
+
+@pytest.mark.ai
+@pytest.mark.parametrize("text", _NORMALIZER_SAMPLES)
+@pytest.mark.parametrize(
+    "patterns",
+    [NORMALIZATION_PATTERNS, BATCH_NORMALIZATION_PATTERNS],
+    ids=["streaming", "batch"],
+)
+@pytest.mark.parametrize(
+    "trigger_literals",
+    [None, NORMALIZATION_TRIGGER_LITERALS],
+    ids=["merged-scan", "trigger-literals"],
+)
+def test_compiled_normalizer__matches_sequential_application(
+    text: str, patterns, trigger_literals
+) -> None:
+    """
+    Purpose: The prefiltered normalizer must produce exactly the sequential output.
+    Why this matters: It replaces per-pattern scans on every streamed delta.
+    """
+    normalizer = CompiledNormalizer(patterns, trigger_literals=trigger_literals)
+
+    assert normalizer.apply(text) == _apply_sequentially(text, patterns)
+
+
+@pytest.mark.ai
+def test_compiled_normalizer__has_candidate__only_for_matching_text() -> None:
+    """
+    Purpose: The merged scanner reports a candidate iff any pattern matches.
+    """
+    normalizer = CompiledNormalizer([(r"foo", "x"), (r"(?i)bar(\d)", r"\1")])
+
+    assert not normalizer.has_candidate("nothing here")
+    assert not normalizer.has_candidate("bar without digit")
+    assert normalizer.has_candidate("a BAR1 here")
+    assert normalizer.has_candidate("foo")
+
+
+@pytest.mark.ai
+def test_compiled_normalizer__trigger_literals__skip_text_without_literal() -> None:
+    """
+    Purpose: Trigger literals are matched case-insensitively as a cheap prefilter.
+    """
+    normalizer = CompiledNormalizer(
+        NORMALIZATION_PATTERNS, trigger_literals=NORMALIZATION_TRIGGER_LITERALS
+    )
+
+    assert not normalizer.has_candidate("plain text")
+    assert normalizer.has_candidate("SOURCE 1")
+    assert normalizer.has_candidate("a [ bracket")
+
+
+@pytest.mark.ai
+def test_compiled_normalizer__supports_compiled_patterns_with_flags() -> None:
+    """
+    Purpose: Pre-compiled patterns keep their flags inside the merged scanner.
+    """
+    normalizer = CompiledNormalizer([(re.compile(r"ref(\d)", re.IGNORECASE), r"<\1>")])
+
+    assert normalizer.apply("see REF1") == "see <1>"
+
+
+class _SequentialStreamingPatternReplacer(StreamingPatternReplacer):
+    """Reference implementation: one full scan per pattern on every delta."""
+
+    def _apply_replacements(self, text: str) -> str:
+        return _apply_sequentially(text, NORMALIZATION_PATTERNS)
+
+
+@pytest.mark.ai
+@pytest.mark.parametrize("chunk_size", [1, 3, 7, 50])
+def test_streaming_pattern_replacer__chunked_stream__matches_sequential_replacer(
+    chunk_size: int,
+) -> None:
+    """
+    Purpose: Chunk-boundary hold-back behaves exactly as with per-pattern scanning.
+    Setup summary: Stream all samples in fixed-size deltas through both replacers.
+    """
+    text = " ".join(_NORMALIZER_SAMPLES)
+    deltas = [text[i : i + chunk_size] for i in range(0, len(text), chunk_size)]
+    replacer = StreamingPatternReplacer(
+        NORMALIZATION_PATTERNS,
+        max_match_length=NORMALIZATION_MAX_MATCH_LENGTH,
+        trigger_literals=NORMALIZATION_TRIGGER_LITERALS,
+    )
+    reference = _SequentialStreamingPatternReplacer(
+        NORMALIZATION_PATTERNS, max_match_length=NORMALIZATION_MAX_MATCH_LENGTH
+    )
+
+    for delta in deltas:
+        assert replacer.process(delta) == reference.process(delta)
+    assert replacer.flush() == reference.flush()
+
+
+@pytest.mark.ai
+@pytest.mark.parametrize("chunk_size", [1, 4, 9])
+def test_citation_tracker__growing_text__matches_full_rescan(chunk_size: int) -> None:
+    """
+    Purpose: Incremental citation tracking yields the same references as a full rescan.
+    Why this matters: Tags are often split across deltas (``<su`` + ``p>2</sup>``);
+      the incremental scan must still find them without rescanning the whole answer.
+    Setup summary: Feed growing prefixes of a cited answer; compare against
+      ``filter_cited_sdk_references`` after every update.
+    """
+    chunks = [_make_chunk(i) for i in range(1, 13)]
+    text = "Intro <sup>2</sup> more text " * 3 + "end <sup>12</sup> and <sup>1</sup>."
+    tracker = CitationTracker(chunks)
+
+    for end in range(chunk_size, len(text) + chunk_size, chunk_size):
+        prefix = text[:end]
+        tracker.update(prefix)
+        assert tracker.references() == filter_cited_sdk_references(chunks, prefix)
+    assert tracker.cited == {1, 2, 12}
+
+
+@pytest.mark.ai
+def test_citation_tracker__update__returns_only_newly_cited_numbers() -> None:
+    """
+    Purpose: ``update`` reports each citation once, the first time it appears.
+    """
+    tracker = CitationTracker([_make_chunk(1), _make_chunk(2)])
+
+    assert tracker.update("a <sup>1</sup>") == {1}
+    assert tracker.update("a <sup>1</sup> b <sup>1</sup>") == set()
+    assert tracker.update("a <sup>1</sup> b <sup>1</sup> <sup>2</sup>") == {2}
+
+
+@pytest.mark.ai
+def test_citation_tracker__rewritten_text__falls_back_to_full_scan() -> None:
+    """
+    Purpose: Text that is not an extension of the previous text is rescanned from scratch.
+    Setup summary: Track a citation, then update with unrelated text; expect no references.
+    """
+    tracker = CitationTracker([_make_chunk(1)])
+    tracker.update("cited <sup>1</sup>")
+
+    tracker.update("something else entirely")
+
+    assert tracker.cited == frozenset()
+    assert tracker.references() == []
@@ -418,3 +418,100 @@ async def test_AI_persister__persist_every_n_deltas__throttles_intermediate_writ
         )
         assert modify.await_count == 1
         assert modify.call_args.kwargs["text"] == "final"
+
+
+@pytest.mark.ai
+@pytest.mark.asyncio
+async def test_AI_persister__persist_min_interval_ms__coalesces_writes_within_window():
+    """
+    Purpose: ``persist_min_interval_ms`` skips deltas arriving within the window
+      after the previous write and resumes once it has elapsed.
+    Why this matters: Fast token streams would otherwise issue one SDK write per
+      flush; the time window bounds write frequency independent of delta size.
+    Setup summary: Patch ``time.monotonic`` to a controlled clock; drive three
+      deltas at t=0, t=0.05 s and t=0.2 s with a 100 ms window; expect two writes.
+    """
+    persister = MessagePersistingSubscriber(
+        _settings_with_chat(), persist_min_interval_ms=100
+    )
+    clock = iter([10.0, 10.05, 10.2])
+    with (
+        patch(_CREATE_EVENT, new_callable=AsyncMock) as create_event,
+        patch(
+            "unique_toolkit.experimental.integrations.openai.streaming.event_routing."
+            "subscribers.message_persister.time.monotonic",
+            side_effect=lambda: next(clock),
+        ),
+    ):
+        for text in ("a", "ab", "abc"):
+            await persister.on_text_delta(
+                TextUpdate(
+                    message_id="amsg-1",
+                    chat_id="chat-1",
+                    full_text=text,
+                    original_text=text,
+                )
+            )
+
+    assert [c.kwargs["text"] for c in create_event.call_args_list] == ["a", "abc"]
+
+
+@pytest.mark.ai
+@pytest.mark.asyncio
+async def test_AI_persister__text_delta__skips_unchanged_text():
+    """
+    Purpose: A delta whose text and citations equal the last successful write is not re-sent.
+    Why this matters: Flush boundaries without new released text (e.g. while the
+      normaliser holds back a partial citation) must not cost an SDK round-trip.
+    Setup summary: Publish the same TextUpdate twice; expect a single write.
+    """
+    persister = MessagePersistingSubscriber(_settings_with_chat())
+    event = TextUpdate(
+        message_id="amsg-1", chat_id="chat-1", full_text="same", original_text="same"
+    )
+    with patch(_CREATE_EVENT, new_callable=AsyncMock) as create_event:
+        await persister.on_text_delta(event)
+        await persister.on_text_delta(event)
+
+    assert create_event.await_count == 1
+
+
+@pytest.mark.ai
+@pytest.mark.asyncio
+async def test_AI_persister__text_delta__references_accumulate_incrementally():
+    """
+    Purpose: References on each write reflect every citation in the text so far,
+      including ones cited in earlier deltas.
+    Why this matters: Citations are tracked incrementally instead of rescanning
+      the full answer, so earlier citations must not be lost between writes.
+    Setup summary: Seed three chunks; publish a delta citing <sup>2</sup>, then an
+      extended delta citing <sup>1</sup>; expect references [2] then [1, 2].
+    """
+    persister = MessagePersistingSubscriber(_settings_with_chat())
+    with patch(_MODIFY, new_callable=AsyncMock):
+        await persister.on_started(
+            StreamStarted(
+                message_id="amsg-1",
+                chat_id="chat-1",
+                content_chunks=(_chunk(0), _chunk(1), _chunk(2)),
+            )
+        )
+
+    first = "One <sup>2</sup>"
+    second = first + " two <sup>1</sup>"
+    with patch(_CREATE_EVENT, new_callable=AsyncMock) as create_event:
+        for text in (first, second):
+            await persister.on_text_delta(
+                TextUpdate(
+                    message_id="amsg-1",
+                    chat_id="chat-1",
+                    full_text=text,
+                    original_text=text,
+                )
+            )
+
+    sequence_numbers = [
+        [ref["sequenceNumber"] for ref in c.kwargs["references"]]
+        for c in create_event.call_args_list
+    ]
+    assert sequence_numbers == [[2], [1, 2]]
@@ -2,15 +2,25 @@
 
 from __future__ import annotations
 
+import threading
 from datetime import UTC, datetime
 from unittest.mock import AsyncMock, patch
 
 import pytest
+from rapidfuzz import fuzz
 
 from unique_toolkit.content.schemas import ContentInfo
+from unique_toolkit.experimental.components.content_tree.fuzzy_index import (
+    FuzzyPathIndex,
+    _tokenize_for_fuzzy_scoring,
+)
+from unique_toolkit.experimental.components.content_tree.service import (
+    _MAX_FUZZY_INDEXES,
+)
 from unique_toolkit.experimental.content_tree import (
     ContentTree,
     FuzzyMatch,
+    MatchTarget,
     extract_scope_ids_from_content_infos,
     format_path_trie,
 )
@@ -461,6 +471,189 @@ async def test_AI_search_visible_files_fuzzy_reuses_cached_snapshot() -> None:
     assert mock_core.await_count == 1
 
 
+# ── Fuzzy index ────────────────────────────────────────────────────────────
+
+_TOKENIZE_TARGET = "unique_toolkit.experimental.components.content_tree.fuzzy_index._tokenize_for_fuzzy_scoring"
+
+
+def _fuzzy_rows() -> list[tuple[ContentInfo, list[str]]]:
+    return [
+        _resolved_row(key="contract_2024.pdf", segments=["legal", "contract_2024.pdf"]),
+        _resolved_row(
+            key="Contract-Draft.docx", segments=["legal", "Contract-Draft.docx"]
+        ),
+        _resolved_row(key="invoice_may.pdf", segments=["finance", "invoice_may.pdf"]),
+        _resolved_row(
+            key="q3_budget.xlsx", segments=["finance", "2024", "q3_budget.xlsx"]
+        ),
+        _resolved_row(key="___.pdf", segments=["misc", "___.pdf"]),
+        _resolved_row(key="notes.txt", segments=["notes.txt"]),
+    ]
+
+
+def _brute_force_scores(
+    rows: list[tuple[ContentInfo, list[str]]],
+    query: str,
+    *,
+    min_score: float,
+    match_on: MatchTarget,
+    case_sensitive: bool,
+) -> list[tuple[str, float, str]]:
+    """Score every row with ``token_set_ratio`` the way the service used to."""
+    normalized_query = _tokenize_for_fuzzy_scoring(query, case_sensitive)
+    out = []
+    for content_info, segments in rows:
+        key_score = (
+            fuzz.token_set_ratio(
+                normalized_query,
+                _tokenize_for_fuzzy_scoring(
+                    content_info.key, case_sensitive, strip_extension=True
+                ),
+            )
+            / 100.0
+        )
+        path_score = (
+            fuzz.token_set_ratio(
+                normalized_query,
+                _tokenize_for_fuzzy_scoring("/".join(segments), case_sensitive),
+            )
+            / 100.0
+        )
+        if match_on == "key" or (match_on == "both" and key_score >= path_score):
+            score, matched_on = key_score, "key"
+        else:
+            score, matched_on = path_score, "path"
+        if score >= min_score:
+            out.append((content_info.key, score, matched_on))
+    out.sort(key=lambda hit: hit[1], reverse=True)
+    return out
+
+
+@pytest.mark.parametrize("match_on", ["key", "path", "both"])
+@pytest.mark.parametrize("min_score", [0.0, 0.4, 0.6, 1.0])
+@pytest.mark.parametrize("query", ["contract 2024", "Finance/Q3", "draf", "___"])
+def test_AI_fuzzy_path_index_matches_brute_force_scoring(
+    query: str, min_score: float, match_on: MatchTarget
+) -> None:
+    """The prefiltered index returns exactly what scoring every file returns."""
+    rows = _fuzzy_rows()
+    index = FuzzyPathIndex()
+    index.sync(rows)
+
+    for case_sensitive in (False, True):
+        hits = index.search(
+            query,
+            limit=len(rows),
+            min_score=min_score,
+            match_on=match_on,
+            case_sensitive=case_sensitive,
+        )
+        assert [
+            (hit.content_info.key, hit.score, hit.matched_on) for hit in hits
+        ] == _brute_force_scores(
+            rows,
+            query,
+            min_score=min_score,
+            match_on=match_on,
+            case_sensitive=case_sensitive,
+        )
+
+
+def test_AI_fuzzy_path_index_sync_only_retokenizes_changed_files() -> None:
+    """A new snapshot re-indexes added/renamed files and drops removed ones."""
+    rows = _fuzzy_rows()
+    index = FuzzyPathIndex()
+    index.sync(rows)
+    index.search("contract", match_on="key")
+
+    renamed = rows[2][0].model_copy(update={"key": "invoice_june.pdf"})
+    updated = [
+        *rows[:2],
+        (renamed, ["finance", "invoice_june.pdf"]),
+        *rows[4:],
+        _resolved_row(key="contract_2025.pdf", segments=["legal", "contract_2025.pdf"]),
+    ]
+    with patch(_TOKENIZE_TARGET, wraps=_tokenize_for_fuzzy_scoring) as tokenize:
+        index.sync(updated)
+        index.sync(updated)
+    assert tokenize.call_count == 2
+
+    hits = index.search("invoice june contract 2025", min_score=0.0, limit=10)
+    keys = {hit.content_info.key for hit in hits}
+    assert len(index) == len(updated)
+    assert {"invoice_june.pdf", "contract_2025.pdf"} <= keys
+    assert "invoice_may.pdf" not in keys
+    assert "q3_budget.xlsx" not in keys
+
+
+@pytest.mark.asyncio
+async def test_AI_search_visible_files_fuzzy_tokenizes_snapshot_once() -> None:
+    """Repeated searches on one instance reuse the index instead of re-tokenizing."""
+    svc = _tree()
+    rows = _fuzzy_rows()
+    with (
+        patch(_PATCH_TARGET, _patch_core(rows)),
+        patch(_TOKENIZE_TARGET, wraps=_tokenize_for_fuzzy_scoring) as tokenize,
+    ):
+        await svc.search_visible_files_fuzzy_async("contract")
+        first_search_calls = tokenize.call_count
+        await svc.search_visible_files_fuzzy_async("invoice")
+        await svc.search_visible_files_fuzzy_async("budget")
+
+    # Each file's key and path once, plus one call per query.
+    assert first_search_calls == 2 * len(rows) + 1
+    assert tokenize.call_count == first_search_calls + 2
+
+
+@pytest.mark.asyncio
+async def test_AI_search_visible_files_fuzzy_indexes_off_the_event_loop() -> None:
+    """Indexing the snapshot and scoring run in a worker thread, not on the loop."""
+    svc = _tree()
+    loop_thread = threading.get_ident()
+    sync_threads: list[int] = []
+    original_sync = FuzzyPathIndex.sync
+
+    def recording_sync(self: FuzzyPathIndex, rows) -> None:
+        sync_threads.append(threading.get_ident())
+        original_sync(self, rows)
+
+    with (
+        patch(_PATCH_TARGET, _patch_core(_fuzzy_rows())),
+        patch.object(FuzzyPathIndex, "sync", recording_sync),
+    ):
+        hits = await svc.search_visible_files_fuzzy_async("contract")
+
+    assert hits
+    assert sync_threads and loop_thread not in sync_threads
+
+
+@pytest.mark.asyncio
+async def test_AI_search_visible_files_fuzzy_keeps_only_recent_filter_indexes() -> None:
+    """One index per metadata filter, evicting the least recently searched one."""
+    svc = _tree()
+    filters = [{"n": i} for i in range(_MAX_FUZZY_INDEXES + 1)]
+    with patch(_PATCH_TARGET, _patch_core(_fuzzy_rows())):
+        await svc.search_visible_files_fuzzy_async(
+            "contract", metadata_filter=filters[0]
+        )
+        first_index = next(iter(svc._fuzzy_indexes.values()))
+        for metadata_filter in filters[1:_MAX_FUZZY_INDEXES]:
+            await svc.search_visible_files_fuzzy_async(
+                "contract", metadata_filter=metadata_filter
+            )
+        # Searching the first filter again makes the second the oldest.
+        await svc.search_visible_files_fuzzy_async(
+            "contract", metadata_filter=filters[0]
+        )
+        await svc.search_visible_files_fuzzy_async(
+            "contract", metadata_filter=filters[-1]
+        )
+
+    assert len(svc._fuzzy_indexes) == _MAX_FUZZY_INDEXES
+    assert first_index in svc._fuzzy_indexes.values()
+    assert '{"n": 1}' not in svc._fuzzy_indexes
+
+
 @pytest.mark.ai
 async def test_translate_scope_id_async__returns_none__when_folder_lookup_fails() -> (
     None
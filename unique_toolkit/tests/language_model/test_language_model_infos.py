@@ -4,6 +4,7 @@ from datetime import date
 from unittest.mock import patch
 
 import pytest
+from pydantic import BaseModel
 
 from unique_toolkit.language_model.infos import (
     EncoderName,
@@ -11,6 +12,7 @@ from unique_toolkit.language_model.infos import (
     LanguageModelInfo,
     LanguageModelName,
     LanguageModelProvider,
+    ModelCapabilities,
 )
 from unique_toolkit.language_model.schemas import LanguageModelTokenLimits
 
@@ -225,6 +227,59 @@ class TestLanguageModelInfos:
         with pytest.raises(ValueError):
             LanguageModelTokenLimits(token_limit_input=1000, fraction_input=0.5)  # type: ignore[call-arg]
 
+    def test_from_name_returns_equal_but_independent_infos(self):
+        """Test that mutating a looked-up model info does not affect later lookups."""
+        first = LanguageModelInfo.from_name(LanguageModelName.AZURE_GPT_4o_2024_1120)
+        second = LanguageModelInfo.from_name(LanguageModelName.AZURE_GPT_4o_2024_1120)
+
+        assert first == second
+        assert first is not second
+
+        first.token_limits.token_limit_input = 1
+        first.capabilities.append(ModelCapabilities.VISION)
+        first.default_options["temperature"] = 0.1
+
+        third = LanguageModelInfo.from_name(LanguageModelName.AZURE_GPT_4o_2024_1120)
+        assert third == second
+        assert third.token_limits is not second.token_limits
+
+    @pytest.mark.parametrize("model_name", list(LanguageModelName))
+    def test_copy_shares_no_mutable_state_with_memoized_info(self, model_name):
+        """Test that a copy of a memoized model info shares no mutable object.
+
+        ``_copy`` only copies the fields it knows to be mutable, so this walks
+        every field of every built-in model: a new list, dict or model field
+        that ``_copy`` does not copy fails here instead of leaking mutations
+        into the cached definition.
+        """
+
+        def mutable_ids(value, ids):
+            if isinstance(value, BaseModel):
+                ids.add(id(value))
+                for field_value in value.__dict__.values():
+                    mutable_ids(field_value, ids)
+            elif isinstance(value, (list, dict, set)):
+                ids.add(id(value))
+                items = value.values() if isinstance(value, dict) else value
+                for item in items:
+                    mutable_ids(item, ids)
+            return ids
+
+        original = LanguageModelInfo._builtin_from_name(model_name)
+        copied = original._copy()
+
+        assert copied == original
+        assert mutable_ids(copied, set()).isdisjoint(mutable_ids(original, set()))
+
+    def test_from_name_resolves_string_to_model_name(self):
+        """Test that from_name accepts the string value of a built-in model."""
+        model = LanguageModelInfo.from_name(
+            LanguageModelName.AZURE_GPT_4o_2024_1120.value
+        )
+
+        assert model.name is LanguageModelName.AZURE_GPT_4o_2024_1120
+        assert model.provider == LanguageModelProvider.AZURE
+
 
 class TestLoadLanguageModelInfosFromEnv:
     """Tests for the _load_from_env classmethod."""
@@ -385,6 +440,26 @@ class TestLanguageModelInfoFromEnv:
             assert model.token_limits.token_limit_input == 1000
             assert model.token_limits.token_limit_output == 100
 
+    def test_from_name_env_takes_precedence_over_memoized_default(self):
+        """Test that env model info is honoured after the default was looked up."""
+        LanguageModelInfo.from_name(LanguageModelName.AZURE_GPT_4o_2024_1120)
+        LanguageModelInfo._load_from_env.cache_clear()
+        model_infos = {
+            "AZURE_GPT_4o_2024_1120": {
+                "name": "AZURE_GPT_4o_2024_1120",
+                "provider": "AZURE",
+                "version": "overridden",
+                "token_limits": {"token_limit_input": 1000, "token_limit_output": 100},
+            }
+        }
+        with patch.dict(
+            os.environ, {LanguageModelInfo._ENV_VAR: json.dumps(model_infos)}
+        ):
+            model = LanguageModelInfo.from_name(
+                LanguageModelName.AZURE_GPT_4o_2024_1120
+            )
+            assert model.version == "overridden"
+
     def test_from_name_falls_back_to_default_when_key_not_in_env(self):
         """Test that from_name falls back to default when model not in env."""
         model_infos = {
@@ -976,6 +976,39 @@ class TestKnowledgeBaseServiceDownload:
             chat_id=None,
         )
 
+    @pytest.mark.ai
+    @patch("unique_toolkit.services.knowledge_base.download_content_to_path")
+    def test_download_content_to_path__streams_to_path__with_content_id(
+        self,
+        mock_download: Mock,
+        base_kb_service: KnowledgeBaseService,
+        tmp_path: Path,
+    ) -> None:
+        """
+        Purpose: Verify download_content_to_path forwards to the streaming download.
+        Why this matters: Large knowledge base files must be written to disk in chunks.
+        Setup summary: Mock the streaming function, call service method, assert forwarded args.
+        """
+        # Arrange
+        target = tmp_path / "file.bin"
+        mock_download.return_value = target
+
+        # Act
+        result = base_kb_service.download_content_to_path(
+            content_id="cont_test123", path=target, chunk_size=1024
+        )
+
+        # Assert
+        assert result == target
+        mock_download.assert_called_once_with(
+            user_id="test_user",
+            company_id="test_company",
+            content_id="cont_test123",
+            path=target,
+            chat_id=None,
+            chunk_size=1024,
+        )
+
 
 class TestKnowledgeBaseServiceBatchUpload:
     """Test cases for batch_file_upload method."""
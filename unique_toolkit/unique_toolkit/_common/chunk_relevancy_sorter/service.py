@@ -1,6 +1,7 @@
 import logging
 import time
 from collections import Counter
+from collections.abc import Sequence
 from typing import Any, overload
 
 from typing_extensions import Self, deprecated
@@ -49,6 +50,10 @@ _default_prompts_config = EvaluationMetricPromptsConfig(
 )
 
 
+def _chunk_key(chunk: ContentChunk) -> tuple[str, str]:
+    return (chunk.id, chunk.chunk_id or chunk.text)
+
+
 class ChunkRelevancySorter:
     @deprecated(
         "Use __init__ with company_id and user_id instead or use the classmethod `from_event`"
@@ -119,6 +124,106 @@ class ChunkRelevancySorter:
         self.logger.info("Running chunk relevancy sort.")
         return await self._run_chunk_relevancy_sort(input_text, chunks, config)
 
+    async def run_batch(
+        self,
+        inputs: Sequence[tuple[str, list[ContentChunk]]],
+        config: ChunkRelevancySortConfig,
+    ) -> list[ChunkRelevancySorterResult | ChunkRelevancySorterException]:
+        """
+        Resorts the chunks of several inputs at once, e.g. the results of multiple search strings.
+
+        All chunks are evaluated in one pass that shares the `config.max_tasks` concurrency budget.
+        Each chunk is evaluated once per distinct input text, so results rank exactly as `run` would
+        for each input, and inputs with the same text share their evaluations.
+
+        Args:
+            inputs (Sequence[tuple[str, list[ContentChunk]]]): Pairs of input text and the chunks to resort for it.
+            config (ChunkRelevancySortConfig): The chunk relevancy sort configuration.
+
+        Returns:
+            list[ChunkRelevancySorterResult | ChunkRelevancySorterException]: One entry per input, in input order.
+                Inputs that could not be resorted get the exception instead of a result.
+        """
+
+        if not config.enabled:
+            self.logger.info("Chunk relevancy sort is disabled.")
+            return [
+                ChunkRelevancySorterResult.from_chunks(chunks) for _, chunks in inputs
+            ]
+
+        start_time = time.time()
+
+        chunks_to_evaluate: dict[tuple[str, str, str], tuple[str, ContentChunk]] = {}
+        for input_text, chunks in inputs:
+            for chunk in chunks:
+                chunks_to_evaluate.setdefault(
+                    (input_text, *_chunk_key(chunk)), (input_text, chunk)
+                )
+
+        total_chunks = sum(len(chunks) for _, chunks in inputs)
+        self.logger.info(
+            f"Resorting {total_chunks} chunks of {len(inputs)} inputs "
+            f"({len(chunks_to_evaluate)} distinct) based on relevancy..."
+        )
+        evaluations = await run_async_tasks_parallel(
+            tasks=[
+                self._process_relevancy_evaluation(
+                    input_text, chunk=chunk, config=config
+                )
+                for input_text, chunk in chunks_to_evaluate.values()
+            ],
+            max_tasks=config.max_tasks,
+            logger=self.logger,
+        )
+        evaluation_by_key = dict(zip(chunks_to_evaluate, evaluations))
+
+        results: list[ChunkRelevancySorterResult | ChunkRelevancySorterException] = []
+        for input_text, chunks in inputs:
+            try:
+                chunk_evaluations = [
+                    evaluation_by_key[(input_text, *_chunk_key(chunk))]
+                    for chunk in chunks
+                ]
+                self._collect_chunk_relevancies(chunk_evaluations)
+                # Shared evaluations carry the chunk of the input that was
+                # evaluated, so pair each relevancy with this input's chunk.
+                chunk_relevancies = [
+                    ChunkRelevancy(chunk=chunk, relevancy=evaluation.relevancy)
+                    for chunk, evaluation in zip(chunks, chunk_evaluations)
+                    if isinstance(evaluation, ChunkRelevancy)
+                ]
+                resorted_relevancies = await self._validate_and_sort_relevant_chunks(
+                    config,
+                    chunk_relevancies,
+                )
+            except ChunkRelevancySorterException as e:
+                self.logger.error(e.error_message)
+                results.append(e)
+                continue
+            except Exception as e:
+                unknown_error_msg = (
+                    "Unknown error occurred while resorting search results."
+                )
+                results.append(
+                    ChunkRelevancySorterException(
+                        user_message=f"{unknown_error_msg}. Fallback to original search results.",
+                        error_message=f"{unknown_error_msg}: {e}",
+                    )
+                )
+                continue
+            results.append(ChunkRelevancySorterResult(relevancies=resorted_relevancies))
+
+        duration = time.time() - start_time
+        success_msg = (
+            f"Resorted {total_chunks} chunks of {len(inputs)} inputs "
+            f"in {duration:.2f} seconds."
+        )
+        self.logger.info(success_msg)
+        for result in results:
+            if isinstance(result, ChunkRelevancySorterResult):
+                result.user_message = success_msg
+        return results
+
     async def _run_chunk_relevancy_sort(
         self,
         input_text: str,
@@ -185,8 +290,16 @@ class ChunkRelevancySorter:
             logger=self.logger,
         )
 
+        return self._collect_chunk_relevancies(chunk_relevancies)
+
+    def _collect_chunk_relevancies(
+        self, evaluations: Sequence[Any]
+    ) -> list[ChunkRelevancy]:
+        """
+        Raises on failed evaluations and drops results that are not a ChunkRelevancy.
+        """
         # handle exceptions
-        for chunk_relevancy in chunk_relevancies:
+        for chunk_relevancy in evaluations:
             if isinstance(chunk_relevancy, Exception):
                 error_msg = "Error occurred while evaluating context relevancy of a specific chunk"
                 raise ChunkRelevancySorterException(
@@ -198,14 +311,12 @@ class ChunkRelevancySorter:
         # This check is currently necessary for typing purposes only
         # as the run_async_tasks_parallel function does not enforce the return type
         # TODO fix return type in run_async_tasks_parallel
-        chunk_relevancies = [
+        return [
             chunk_relevancy
-            for chunk_relevancy in chunk_relevancies
+            for chunk_relevancy in evaluations
             if isinstance(chunk_relevancy, ChunkRelevancy)
         ]
 
-        return chunk_relevancies
-
     async def _evaluate_chunk_relevancy(
         self,
         input_text: str,
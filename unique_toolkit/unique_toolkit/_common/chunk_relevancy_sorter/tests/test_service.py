@@ -273,3 +273,90 @@ def test_count_distinct_values(chunk_relevancy_sorter, mock_chunks):
 
     assert value_counts["high"] == 2
     assert value_counts["medium"] == 1
+
+
+@pytest.mark.asyncio
+async def test_run_batch_disabled_config(chunk_relevancy_sorter, mock_chunks, config):
+    config.enabled = False
+    results = await chunk_relevancy_sorter.run_batch(
+        [("query 1", mock_chunks), ("query 2", mock_chunks[:1])], config
+    )
+
+    assert [r.content_chunks for r in results] == [mock_chunks, mock_chunks[:1]]
+
+
+@pytest.mark.asyncio
+async def test_run_batch_evaluates_chunks_once_per_input_text(
+    chunk_relevancy_sorter, mock_chunks, config
+):
+    levels = {
+        ("query 1", "chunk_0"): "low",
+        ("query 1", "chunk_1"): "high",
+        ("query 2", "chunk_1"): "low",
+        ("query 2", "chunk_2"): "medium",
+    }
+
+    async def fake_process(input_text, chunk, config):
+        return ChunkRelevancy(
+            chunk=chunk,
+            relevancy=EvaluationMetricResult(
+                value=levels[(input_text, chunk.chunk_id)],
+                name=EvaluationMetricName.CONTEXT_RELEVANCY,
+                reason=input_text,
+            ),
+        )
+
+    with patch.object(
+        chunk_relevancy_sorter,
+        "_process_relevancy_evaluation",
+        side_effect=fake_process,
+    ) as mock_process:
+        results = await chunk_relevancy_sorter.run_batch(
+            [
+                ("query 1", mock_chunks[:2]),
+                ("query 2", mock_chunks[1:]),
+                ("query 1", mock_chunks[1:2]),
+            ],
+            config,
+        )
+
+    evaluated = sorted(
+        (call.args[0], call.kwargs["chunk"].chunk_id)
+        for call in mock_process.call_args_list
+    )
+    assert evaluated == sorted(levels)
+    assert [c.chunk_id for c in results[0].content_chunks] == ["chunk_1", "chunk_0"]
+    # chunk_1 is ranked by its relevancy to query 2, not to query 1
+    assert [c.chunk_id for c in results[1].content_chunks] == ["chunk_2", "chunk_1"]
+    assert results[1].content_chunks[1] is mock_chunks[1]
+    assert [c.chunk_id for c in results[2].content_chunks] == ["chunk_1"]
+
+
+@pytest.mark.asyncio
+async def test_run_batch_isolates_failed_evaluations(
+    chunk_relevancy_sorter, mock_chunks, config
+):
+    async def fake_process(input_text, chunk, config):
+        if chunk.chunk_id == "chunk_2":
+            raise RuntimeError("evaluation failed")
+        return ChunkRelevancy(
+            chunk=chunk,
+            relevancy=EvaluationMetricResult(
+                value="high",
+                name=EvaluationMetricName.CONTEXT_RELEVANCY,
+                reason="Test reason",
+            ),
+        )
+
+    with patch.object(
+        chunk_relevancy_sorter,
+        "_process_relevancy_evaluation",
+        side_effect=fake_process,
+    ):
+        results = await chunk_relevancy_sorter.run_batch(
+            [("query 1", mock_chunks[:2]), ("query 2", mock_chunks[2:])], config
+        )
+
+    assert isinstance(results[0], ChunkRelevancySorterResult)
+    assert results[0].content_chunks == mock_chunks[:2]
+    assert isinstance(results[1], ChunkRelevancySorterException)
@@ -204,6 +204,7 @@ def build_httpx_requestor(
     combined_model: Callable[CombinedParamsSpec, CombinedParamsType],
 ) -> type[EndpointRequestorProtocol[CombinedParamsSpec, ResponseType]]:
     import httpx
+    from unique_sdk import get_async_http_client
 
     # TODO(UN-19505): tighten EndpointRequestorProtocol generic parameters away from Any
     class HttpxRequestor(EndpointRequestorProtocol[Any, Any]):
@@ -289,27 +290,27 @@ def build_httpx_requestor(
                 model_dump_options=cls._operation.payload_dump_options(),
             )
 
-            async with httpx.AsyncClient() as client:
-                # For GET requests, send payload as params; for others, send as json
-                if cls._operation.request_method() == HttpMethods.GET:
-                    response = await client.request(
-                        method=cls._operation.request_method(),
-                        url=url,
-                        headers=headers,
-                        params=payload,
-                    )
-                else:
-                    response = await client.request(
-                        method=cls._operation.request_method(),
-                        url=url,
-                        headers=headers,
-                        json=payload,
-                    )
-                response_json = response.json()
-                return cls._operation.handle_response(
-                    response_json,
-                    model_validate_options=cls._operation.response_validate_options(),
+            client = get_async_http_client()
+            # For GET requests, send payload as params; for others, send as json
+            if cls._operation.request_method() == HttpMethods.GET:
+                response = await client.request(
+                    method=cls._operation.request_method(),
+                    url=url,
+                    headers=headers,
+                    params=payload,
+                )
+            else:
+                response = await client.request(
+                    method=cls._operation.request_method(),
+                    url=url,
+                    headers=headers,
+                    json=payload,
                 )
+            response_json = response.json()
+            return cls._operation.handle_response(
+                response_json,
+                model_validate_options=cls._operation.response_validate_options(),
+            )
 
     return HttpxRequestor
 
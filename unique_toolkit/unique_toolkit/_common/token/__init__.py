@@ -1,5 +1,6 @@
 """Token counting utilities."""
 
+from unique_toolkit._common.token.message_token_cache import MessageTokenCounter
 from unique_toolkit._common.token.token_counting import (
     count_tokens,
     num_token_for_language_model_messages,
@@ -9,6 +10,7 @@ from unique_toolkit._common.token.token_counting import (
 )
 
 __all__ = [
+    "MessageTokenCounter",
     "count_tokens",
     "num_token_for_language_model_messages",
     "num_tokens_from_messages",
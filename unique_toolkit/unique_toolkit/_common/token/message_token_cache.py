@@ -0,0 +1,92 @@
+"""Per-message token counting with a content-addressed cache.
+
+Counting tokens for a whole ``LanguageModelMessages`` list re-encodes every
+message, even when only one of them changed since the last count. The
+:class:`MessageTokenCounter` below memoises the token count of each message,
+keyed by the encoder and a hash of the message's serialized payload, so that
+re-counting a history where a single tool response was reduced only encodes
+that one message.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+from typing import Any, Callable, Sequence
+
+from cachetools import LRUCache
+
+from unique_toolkit._common.token.token_counting import (
+    messages_to_openai_messages,
+    num_tokens_per_messages,
+)
+from unique_toolkit.language_model import LanguageModelMessage
+
+# Extra tokens added once per request on top of the per-message counts
+# (mirrors ``num_tokens_from_messages``).
+REPLY_PRIMING_TOKENS = 3
+
+DEFAULT_MAX_CACHED_MESSAGES = 8_192
+
+_CACHE: LRUCache[tuple[str, str], int] = LRUCache(maxsize=DEFAULT_MAX_CACHED_MESSAGES)
+_CACHE_LOCK = threading.Lock()
+
+
+def _hash_openai_message(openai_message: dict[str, Any]) -> str:
+    payload = json.dumps(openai_message, sort_keys=True, ensure_ascii=False)
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def clear_message_token_cache() -> None:
+    """Drop all cached per-message token counts."""
+    with _CACHE_LOCK:
+        _CACHE.clear()
+
+
+class MessageTokenCounter:
+    """Counts tokens of language model messages, one message at a time.
+
+    Results are cached process-wide under ``(encoder_key, content_hash)``;
+    ``encoder_key`` must uniquely identify the tokenizer behind ``encode``
+    (e.g. the model's ``encoder_name``), since counts are only valid for the
+    encoder that produced them.
+
+    The totals are identical to
+    :func:`~unique_toolkit._common.token.token_counting.num_token_for_language_model_messages`.
+    """
+
+    def __init__(
+        self,
+        encode: Callable[[str], list[int]],
+        encoder_key: str,
+    ) -> None:
+        self._encode = encode
+        self._encoder_key = encoder_key
+        self.hits = 0
+        self.misses = 0
+
+    def count(self, message: LanguageModelMessage) -> int:
+        """Return the token count of a single message (without reply priming)."""
+        openai_message = messages_to_openai_messages([message])[0]
+        key = (self._encoder_key, _hash_openai_message(openai_message))
+
+        with _CACHE_LOCK:
+            cached = _CACHE.get(key)
+        if cached is not None:
+            self.hits += 1
+            return cached
+
+        self.misses += 1
+        token_count = num_tokens_per_messages([openai_message], self._encode)[0]
+        with _CACHE_LOCK:
+            _CACHE[key] = token_count
+        return token_count
+
+    def count_per_message(self, messages: Sequence[LanguageModelMessage]) -> list[int]:
+        """Return the token count of each message in ``messages``."""
+        return [self.count(message) for message in messages]
+
+    def count_messages(self, messages: Sequence[LanguageModelMessage]) -> int:
+        """Return the token count of ``messages`` as sent in one request."""
+        return sum(self.count_per_message(messages)) + REPLY_PRIMING_TOKENS
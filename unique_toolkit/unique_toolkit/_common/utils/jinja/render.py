@@ -1,3 +1,4 @@
+from functools import lru_cache
 from typing import Any
 
 from jinja2 import Template
@@ -5,6 +6,17 @@ from jinja2 import Template
 from unique_toolkit._common.utils.jinja.schema import Jinja2PromptParams
 
 
+@lru_cache(maxsize=256)
+def get_compiled_template(template: str, lstrip_blocks: bool = False) -> Template:
+    """Return the compiled Jinja template for ``template``.
+
+    Parsing and compiling a template is far more expensive than rendering it,
+    so compiled templates are cached process-wide by source and shared by all
+    callers. Jinja templates are safe to render concurrently.
+    """
+    return Template(template, lstrip_blocks=lstrip_blocks)
+
+
 def render_template(
     template: str, params: Jinja2PromptParams | dict[str, Any] | None = None, **kwargs
 ) -> str:
@@ -15,4 +27,4 @@ def render_template(
 
     params.update(kwargs)
 
-    return Template(template, lstrip_blocks=True).render(**params)
+    return get_compiled_template(template, lstrip_blocks=True).render(**params)
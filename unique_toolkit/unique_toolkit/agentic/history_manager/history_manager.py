@@ -253,6 +253,16 @@ class HistoryManager:
 
         return messages
 
+    def invalidate_history_snapshot(self) -> None:
+        """Force the next history request to re-fetch the chat history from the DB.
+
+        The DB history is loaded once per turn and reused across loop
+        iterations. Files uploaded to the chat by this process (e.g. by a tool)
+        are picked up automatically; call this when the history changed by
+        other means mid-turn.
+        """
+        self._token_reducer.invalidate_history_snapshot()
+
     async def get_user_visible_chat_history(
         self,
         assistant_message_text: str | None = None,
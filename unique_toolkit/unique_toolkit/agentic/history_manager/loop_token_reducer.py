@@ -4,8 +4,9 @@ from typing import Awaitable, Callable, TypeGuard
 
 from pydantic import BaseModel
 
-from unique_toolkit._common.token.token_counting import (
-    num_token_for_language_model_messages,
+from unique_toolkit._common.token.message_token_cache import (
+    REPLY_PRIMING_TOKENS,
+    MessageTokenCounter,
 )
 from unique_toolkit._common.validators import LMI
 from unique_toolkit.agentic.history_manager.history_construction_with_contents import (
@@ -21,6 +22,7 @@ from unique_toolkit.agentic.history_manager.utils import (
 from unique_toolkit.agentic.reference_manager.reference_manager import ReferenceManager
 from unique_toolkit.app.schemas import ChatEvent
 from unique_toolkit.app.unique_settings import UniqueSettings
+from unique_toolkit.content.functions import get_chat_upload_generation
 from unique_toolkit.content.schemas import ContentChunk
 from unique_toolkit.content.service import ContentService
 from unique_toolkit.language_model.schemas import (
@@ -96,6 +98,10 @@ class LoopTokenReducer:
         self._reference_manager = reference_manager
         self._language_model = language_model
         self._encoder = self._get_encoder(language_model)
+        self._token_counter = MessageTokenCounter(
+            encode=self._encoder,
+            encoder_key=str(language_model.encoder_name),
+        )
         self._chat_service = UniqueServiceFactory(
             settings=UniqueSettings.from_chat_event(event)
         ).chat_service()
@@ -114,6 +120,11 @@ class LoopTokenReducer:
         # `_resolved` distinguishes "not yet checked" from a resolved `None` (flag off).
         self._selected_content_ids: set[str] | None = None
         self._selected_content_ids_resolved = False
+        # The DB history only changes during a turn when files are uploaded to
+        # the chat, so it is fetched once and reused until such an upload (seen
+        # through the chat's upload generation) or an explicit invalidation.
+        self._db_history_snapshot: list[LanguageModelMessage] | None = None
+        self._db_history_upload_generation = 0
 
     async def _get_selected_content_ids(self) -> set[str] | None:
         if not self._selected_content_ids_resolved:
@@ -123,6 +134,14 @@ class LoopTokenReducer:
             self._selected_content_ids_resolved = True
         return self._selected_content_ids
 
+    def invalidate_history_snapshot(self) -> None:
+        """Drop the cached DB history so the next call re-fetches it.
+
+        Uploads to the chat made by this process are picked up automatically;
+        call this when the persisted chat history changed by other means.
+        """
+        self._db_history_snapshot = None
+
     @property
     def max_db_source_number(self) -> int:
         return self._max_db_source_number
@@ -158,27 +177,33 @@ class LoopTokenReducer:
             loop_history,
         )
 
-        token_count = self._count_message_tokens(messages)
+        # Token counts are tracked per message so that a reduction round only
+        # re-encodes the tool messages it actually replaced.
+        db_token_count = sum(self._token_counter.count_per_message(history_from_db))
+        loop_token_counts = self._token_counter.count_per_message(loop_history)
+        token_count = db_token_count + sum(loop_token_counts) + REPLY_PRIMING_TOKENS
         self._log_token_usage(token_count)
 
         while self._exceeds_token_limit(token_count) and self._can_reduce_history(
             loop_history
         ):
             token_count_before_reduction = token_count
+            previous_loop_history = list(loop_history)
             loop_history[:] = self._handle_token_limit_exceeded(
                 loop_history, token_count
             )
+            token_count += self._update_loop_token_counts(
+                previous_loop_history, loop_history, loop_token_counts
+            )
             messages = self._construct_history(
                 history_from_db,
                 loop_history,
             )
-            token_count = self._count_message_tokens(messages)
             self._log_token_usage(token_count)
             token_count_after_reduction = token_count
             if token_count_after_reduction >= token_count_before_reduction:
                 break
 
-        token_count = self._count_message_tokens(messages)
         self._logger.info(
             f"Final token count after reduction: {token_count} of model_capacity {self._language_model.token_limits.token_limit_input}"
         )
@@ -213,10 +238,40 @@ class LoopTokenReducer:
 
     def _count_message_tokens(self, messages: LanguageModelMessages) -> int:
         """Count tokens in messages using the configured encoding model."""
-        return num_token_for_language_model_messages(
-            messages=messages,
-            encode=self._encoder,
-        )
+        return self._token_counter.count_messages(messages.root)
+
+    def _count_single_message_tokens(self, message: LanguageModelMessage) -> int:
+        """Count tokens of a message as if it were sent on its own."""
+        return self._token_counter.count(message) + REPLY_PRIMING_TOKENS
+
+    def _update_loop_token_counts(
+        self,
+        previous_loop_history: list[LanguageModelMessage],
+        loop_history: list[LanguageModelMessage],
+        loop_token_counts: list[int],
+    ) -> int:
+        """Re-count only the messages replaced by a reduction round.
+
+        Updates ``loop_token_counts`` in place and returns the change in the
+        total token count. Reduction never adds or removes messages, so
+        messages are compared position by position.
+        """
+        if len(previous_loop_history) != len(loop_history):
+            new_counts = self._token_counter.count_per_message(loop_history)
+            delta = sum(new_counts) - sum(loop_token_counts)
+            loop_token_counts[:] = new_counts
+            return delta
+
+        delta = 0
+        for index, (before, after) in enumerate(
+            zip(previous_loop_history, loop_history)
+        ):
+            if after is before:
+                continue
+            new_count = self._token_counter.count(after)
+            delta += new_count - loop_token_counts[index]
+            loop_token_counts[index] = new_count
+        return delta
 
     def _log_token_usage(self, token_count: int) -> None:
         """Log token usage and update debug info."""
@@ -366,6 +421,47 @@ class LoopTokenReducer:
         Returns:
             list[LanguageModelMessage]: The history
         """
+        full_history = await self._get_db_history_snapshot()
+
+        if remove_from_text is not None:
+            full_history = await self._clean_messages(full_history, remove_from_text)
+
+        limited_history_messages = self._limit_to_token_window(
+            full_history, self._max_history_tokens
+        )
+
+        if len(limited_history_messages) == 0:
+            limited_history_messages = full_history[-1:]
+
+        self._logger.info(
+            f"Reduced history to {len(limited_history_messages)} messages from {len(full_history)}",
+        )
+
+        return self.ensure_last_message_is_user_message(limited_history_messages)
+
+    async def _get_db_history_snapshot(self) -> list[LanguageModelMessage]:
+        """Return a private copy of the DB history, fetching it on first use.
+
+        Callers mutate the returned messages (cleaning, user message
+        replacement), so every call hands out deep copies of the snapshot.
+        """
+        upload_generation = get_chat_upload_generation(self._chat_id)
+        if (
+            self._db_history_snapshot is not None
+            and upload_generation != self._db_history_upload_generation
+        ):
+            self._logger.debug("Content was uploaded to the chat, refetching history")
+            self._db_history_snapshot = None
+
+        if self._db_history_snapshot is None:
+            self._db_history_snapshot = await self._fetch_db_history()
+            self._db_history_upload_generation = upload_generation
+        else:
+            self._logger.debug("Reusing DB history snapshot for this turn")
+
+        return [message.model_copy(deep=True) for message in self._db_history_snapshot]
+
+    async def _fetch_db_history(self) -> list[LanguageModelMessage]:
         selected_content_ids = await self._get_selected_content_ids()
         if self._enable_tool_call_persistence:
             (
@@ -391,24 +487,7 @@ class LoopTokenReducer:
                 file_content_serializer=self._file_content_serializer,
                 selected_content_ids=selected_content_ids,
             )
-
-        if remove_from_text is not None:
-            full_history.root = await self._clean_messages(
-                full_history.root, remove_from_text
-            )
-
-        limited_history_messages = self._limit_to_token_window(
-            full_history.root, self._max_history_tokens
-        )
-
-        if len(limited_history_messages) == 0:
-            limited_history_messages = full_history.root[-1:]
-
-        self._logger.info(
-            f"Reduced history to {len(limited_history_messages)} messages from {len(full_history.root)}",
-        )
-
-        return self.ensure_last_message_is_user_message(limited_history_messages)
+        return full_history.root
 
     def _limit_to_token_window(
         self,
@@ -432,9 +511,7 @@ class LoopTokenReducer:
             selected: list[LanguageModelMessage] = []
             token_count = 0
             for msg in messages[::-1]:
-                msg_tokens = self._count_message_tokens(
-                    LanguageModelMessages(root=[msg])
-                )
+                msg_tokens = self._count_single_message_tokens(msg)
                 if token_count + msg_tokens > token_limit:
                     break
                 selected.append(msg)
@@ -456,10 +533,7 @@ class LoopTokenReducer:
         selected_turns: list[list[LanguageModelMessage]] = []
         token_count = 0
         for turn in turns[::-1]:
-            turn_tokens = sum(
-                self._count_message_tokens(LanguageModelMessages(root=[msg]))
-                for msg in turn
-            )
+            turn_tokens = sum(self._count_single_message_tokens(msg) for msg in turn)
             if token_count + turn_tokens > token_limit:
                 break
             selected_turns.append(turn)
@@ -190,6 +190,11 @@ class SubAgentToolConfig(BaseToolConfig):
         description="Time interval in seconds between polling attempts when waiting for sub-agent response.",
         gt=0,
     )
+    max_poll_interval: Annotated[float, RJSFMetaTag.NumberWidget.updown()] = Field(
+        default=5.0,
+        description="Upper bound in seconds the polling interval backs off to while the sub-agent response does not change.",
+        gt=0,
+    )
     max_wait: Annotated[float, RJSFMetaTag.NumberWidget.updown()] = Field(
         default=120.0,
         description="Maximum time in seconds to wait for the sub-agent response before timing out.",
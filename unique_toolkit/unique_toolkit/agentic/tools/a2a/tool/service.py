@@ -454,6 +454,7 @@ class SubAgentTool(Tool[SubAgentToolConfig]):
                 text=tool_user_message,
                 chat_id=chat_id,
                 poll_interval=self.config.poll_interval,
+                max_poll_interval=self.config.max_poll_interval,
                 tool_choices=self.config.forced_tools or None,
                 max_wait=self.config.max_wait,
                 stop_condition=self.config.stop_condition,
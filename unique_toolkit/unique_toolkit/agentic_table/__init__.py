@@ -9,6 +9,7 @@ from unique_sdk.api_resources._agentic_table import (
     RowVerificationStatus,
 )
 
+from .cell_writer import AgenticTableCellWriter, CellWriteStats
 from .schemas import (
     AgenticTableSheetState,
     AgreementStatus,
@@ -26,6 +27,7 @@ from .schemas import (
     MagicTableGenerateArtifactPayload,
     MagicTableLibrarySheetRowVerifiedPayload,
     MagicTableRerunRowPayload,
+    MagicTableRow,
     MagicTableSheet,
     MagicTableSheetCompletedPayload,
     MagicTableSheetCreatedPayload,
@@ -47,6 +49,7 @@ from .service import (
 
 __all__ = [
     "AgenticTableService",
+    "AgenticTableCellWriter",
     "AgenticTableArtifactError",
     "AgenticTableRunNotStartedError",
     "AgenticTableRunTimeoutError",
@@ -55,6 +58,7 @@ __all__ = [
     "AgreementStatus",
     "ArtifactType",
     "CellRendererTypes",
+    "CellWriteStats",
     "CreatedMagicTableSheet",
     "FilterTypes",
     "LockedAgenticTableError",
@@ -74,6 +78,7 @@ __all__ = [
     "MagicTableGenerateArtifactPayload",
     "MagicTableLibrarySheetRowVerifiedPayload",
     "MagicTableRerunRowPayload",
+    "MagicTableRow",
     "MagicTableSheet",
     "MagicTableSheetCompletedPayload",
     "MagicTableSheetCreatedPayload",
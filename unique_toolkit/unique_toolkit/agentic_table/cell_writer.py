@@ -0,0 +1,182 @@
+"""Diff-only, batched cell writes for the Agentic Table.
+
+Agents often re-emit a whole table in which only a few cells changed.
+``AgenticTableCellWriter`` keeps a shadow of the last value written (or read)
+per cell and only sends cells whose text differs from it. Writes are buffered:
+repeated writes to a cell before the next flush collapse into one, and a flush
+splits the changed cells into batches that are sent concurrently up to a limit.
+"""
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable, Iterable
+from dataclasses import dataclass
+
+from unique_sdk import AgenticTableCell as SDKAgenticTableCell
+
+from .schemas import MagicTableCell
+
+CellWriteTransport = Callable[[list[SDKAgenticTableCell]], Awaitable[object]]
+"""Sends one batch of cells, e.g. ``AgenticTable.set_multiple_cells`` bound to a
+table."""
+
+_CellKey = tuple[int, int]
+
+
+@dataclass
+class CellWriteStats:
+    cells_sent: int = 0
+    requests_sent: int = 0
+    unchanged_skipped: int = 0
+    coalesced: int = 0
+
+
+class AgenticTableCellWriter:
+    """
+    Buffers cell writes and sends only the cells that changed.
+
+    Use ``AgenticTableService.cell_writer`` to create one for a table. Writes are
+    flushed ``flush_window`` seconds after the first buffered write, or explicitly
+    with ``flush``; leaving the writer as an async context manager flushes too.
+    With ``flush_window=None`` only explicit flushes send.
+
+    A failed batch is put back into the buffer (unless the cell was written again
+    in the meantime) and its error is raised by the next ``flush``.
+
+    Args:
+        transport (CellWriteTransport): Sends one batch of cells.
+        batch_size (int): Maximum number of cells per request.
+        max_concurrent_batches (int): Maximum number of requests in flight.
+        flush_window (float | None): Seconds to collect writes before flushing.
+        logger (logging.Logger): The logger object.
+    """
+
+    def __init__(
+        self,
+        transport: CellWriteTransport,
+        *,
+        batch_size: int = 4000,
+        max_concurrent_batches: int = 4,
+        flush_window: float | None = 0.1,
+        logger: logging.Logger = logging.getLogger(__name__),
+    ):
+        if batch_size <= 0 or max_concurrent_batches <= 0:
+            raise ValueError("batch_size and max_concurrent_batches must be positive")
+        self._transport = transport
+        self._batch_size = batch_size
+        self._max_concurrent_batches = max_concurrent_batches
+        self._flush_window = flush_window
+        self.logger = logger
+        self.stats = CellWriteStats()
+        self._shadow: dict[_CellKey, str] = {}
+        self._pending: dict[_CellKey, str] = {}
+        # Serializes flushes so an older value in flight cannot land after a
+        # newer one for the same cell.
+        self._lock = asyncio.Lock()
+        self._timer: asyncio.TimerHandle | None = None
+        self._background: set[asyncio.Task[None]] = set()
+        self._errors: list[BaseException] = []
+
+    @property
+    def pending(self) -> int:
+        """Number of buffered cells not sent yet."""
+        return len(self._pending)
+
+    def seed(self, cells: Iterable[MagicTableCell]) -> None:
+        """Record cells as already stored, e.g. the result of ``get_sheet``."""
+        for cell in cells:
+            self._shadow[(cell.row_order, cell.column_order)] = cell.text
+
+    def write(self, row: int, column: int, text: str) -> None:
+        """Buffer the text of one cell."""
+        key = (row, column)
+        if key in self._pending:
+            self.stats.coalesced += 1
+        self._pending[key] = text
+        self._schedule_flush()
+
+    def write_cells(self, cells: Iterable[MagicTableCell]) -> None:
+        """Buffer the texts of several cells."""
+        for cell in cells:
+            self.write(cell.row_order, cell.column_order, cell.text)
+
+    async def flush(self) -> None:
+        """Send all buffered changes and wait for earlier flushes to finish."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        try:
+            await self._flush()
+        finally:
+            await asyncio.gather(*self._background, return_exceptions=True)
+        if self._errors:
+            error, self._errors = self._errors[0], []
+            raise error
+
+    async def __aenter__(self) -> "AgenticTableCellWriter":
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.flush()
+
+    def _schedule_flush(self) -> None:
+        if self._flush_window is None or self._timer is not None:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        self._timer = loop.call_later(self._flush_window, self._flush_in_background)
+
+    def _flush_in_background(self) -> None:
+        self._timer = None
+        task = asyncio.ensure_future(self._flush())
+        self._background.add(task)
+        task.add_done_callback(self._background_done)
+
+    def _background_done(self, task: "asyncio.Task[None]") -> None:
+        self._background.discard(task)
+        if not task.cancelled() and (error := task.exception()) is not None:
+            self.logger.error(f"Error writing agentic table cells: {error}.")
+            self._errors.append(error)
+
+    async def _flush(self) -> None:
+        async with self._lock:
+            pending, self._pending = self._pending, {}
+            changed = sorted(
+                (key, text)
+                for key, text in pending.items()
+                if self._shadow.get(key) != text
+            )
+            self.stats.unchanged_skipped += len(pending) - len(changed)
+            batches = [
+                changed[i : i + self._batch_size]
+                for i in range(0, len(changed), self._batch_size)
+            ]
+            semaphore = asyncio.Semaphore(self._max_concurrent_batches)
+
+            async def send(batch: list[tuple[_CellKey, str]]) -> None:
+                async with semaphore:
+                    await self._transport(
+                        [
+                            SDKAgenticTableCell(
+                                rowOrder=row, columnOrder=column, text=text
+                            )
+                            for (row, column), text in batch
+                        ]
+                    )
+                self._shadow.update(batch)
+                self.stats.requests_sent += 1
+                self.stats.cells_sent += len(batch)
+
+            results = await asyncio.gather(
+                *(send(batch) for batch in batches), return_exceptions=True
+            )
+            errors = []
+            for batch, result in zip(batches, results):
+                if isinstance(result, BaseException):
+                    errors.append(result)
+                    for key, text in batch:
+                        self._pending.setdefault(key, text)
+            if errors:
+                raise errors[0]
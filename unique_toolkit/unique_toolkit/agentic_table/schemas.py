@@ -384,6 +384,16 @@ class MagicTableCell(BaseModel):
     )
 
 
+class MagicTableRow(BaseModel):
+    """The cells of one sheet row, ordered by column."""
+
+    model_config = get_configuration_dict()
+    row_order: int = Field(description="The row index.")
+    cells: list[MagicTableCell] = Field(
+        default_factory=list, description="The cells of the row"
+    )
+
+
 class MagicTableSheet(BaseModel):
     model_config = get_configuration_dict()
     sheet_id: str
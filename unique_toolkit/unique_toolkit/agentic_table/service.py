@@ -1,8 +1,11 @@
 import asyncio
 import logging
 import time
+from collections import deque
+from collections.abc import AsyncIterator
+from contextlib import aclosing
 from datetime import datetime
-from typing import Any, NamedTuple, cast
+from typing import TYPE_CHECKING, Any, NamedTuple, cast
 
 from typing_extensions import deprecated
 from unique_sdk import (
@@ -19,21 +22,30 @@ from unique_sdk import (
 from unique_sdk import AgenticTableCell as SDKAgenticTableCell
 from unique_sdk.api_resources._agentic_table import (
     ActivityStatus,
+    AgenticTableSheet,
     MagicTableMetadataEntry,
 )
 
+from .cell_writer import AgenticTableCellWriter
 from .schemas import (
     CreatedMagicTableSheet,
     LogEntry,
     MagicTableAction,
     MagicTableArtifact,
     MagicTableCell,
+    MagicTableRow,
     MagicTableSheet,
     RowMetadataEntry,
     RowMetadataEntryInput,
     SheetMetadataEntryInput,
 )
 
+if TYPE_CHECKING:
+    import pandas as pd
+
+# Concurrent get_cell calls per page when hydrating legacy row metadata.
+_ROW_METADATA_HYDRATION_CONCURRENCY = 10
+
 
 def _sheet_batch_cells_include_row_metadata_from_api(
     cells: list[SDKAgenticTableCell],
@@ -263,20 +275,61 @@ class AgenticTableService:
         """
         for i in range(0, len(cells), batch_size):
             batch = cells[i : i + batch_size]
-            await AgenticTable.set_multiple_cells(
-                user_id=self._user_id,
-                company_id=self._company_id,
-                tableId=self.table_id,
-                cells=[
+            await self._upsert_cells(
+                [
                     SDKAgenticTableCell(
                         rowOrder=cell.row_order,
                         columnOrder=cell.column_order,
                         text=cell.text,
                     )
                     for cell in batch
-                ],
+                ]
             )
 
+    async def _upsert_cells(self, cells: list[SDKAgenticTableCell]) -> None:
+        await AgenticTable.set_multiple_cells(
+            user_id=self._user_id,
+            company_id=self._company_id,
+            tableId=self.table_id,
+            cells=cells,
+        )
+
+    def cell_writer(
+        self,
+        batch_size: int = 4000,
+        max_concurrent_batches: int = 4,
+        flush_window: float | None = 0.1,
+    ) -> AgenticTableCellWriter:
+        """
+        Creates a writer that only sends cells whose text changed.
+
+        Unlike ``set_multiple_cells``, the writer remembers what it wrote (seed it
+        with ``get_sheet`` cells to include existing values), collapses repeated
+        writes to a cell within ``flush_window`` seconds and sends batches
+        concurrently.
+
+        Args:
+            batch_size (int): Number of cells to set in a single request.
+            max_concurrent_batches (int): Maximum number of requests in flight.
+            flush_window (float | None): Seconds to collect writes before flushing;
+                None to flush only explicitly.
+
+        Returns:
+            AgenticTableCellWriter: The writer.
+
+        Example:
+            async with service.cell_writer() as writer:
+                writer.seed(sheet.magic_table_cells)
+                writer.write_cells(cells)
+        """
+        return AgenticTableCellWriter(
+            self._upsert_cells,
+            batch_size=batch_size,
+            max_concurrent_batches=max_concurrent_batches,
+            flush_window=flush_window,
+            logger=self.logger,
+        )
+
     async def set_activity(
         self,
         text: str,
@@ -435,6 +488,156 @@ class AgenticTableService:
             )
         return row_count
 
+    async def _get_sheet_header(
+        self, start_row: int, end_row: int | None
+    ) -> tuple[AgenticTableSheet, int, int]:
+        """Fetch the sheet without cells and clamp the requested row range."""
+        sheet_info = await AgenticTable.get_sheet_data(
+            user_id=self._user_id,
+            company_id=self._company_id,
+            tableId=self.table_id,
+            includeRowCount=True,
+            includeCells=False,
+            includeLogHistory=False,
+            includeCellMetaData=False,
+        )
+        total_rows = sheet_info.get("magicTableRowCount")
+        if total_rows is None:
+            raise RuntimeError(
+                "Expected magicTableRowCount in sheet response when includeRowCount=True"
+            )
+        if end_row is None or end_row > total_rows:
+            end_row = total_rows
+        if start_row > end_row:
+            raise Exception("Start row is greater than end row")
+        if start_row < 0 or end_row < 0:
+            raise Exception("Start row or end row is negative")
+        return sheet_info, start_row, end_row
+
+    async def _get_sheet_page(
+        self,
+        start_row: int,
+        end_row: int,
+        include_log_history: bool,
+        include_cell_meta_data: bool,
+        include_row_metadata: bool,
+    ) -> list[SDKAgenticTableCell]:
+        """Fetch the cells of rows ``start_row`` to ``end_row`` (not inclusive)."""
+        if include_row_metadata:
+            sheet_partial = await AgenticTable.get_sheet_data(
+                user_id=self._user_id,
+                company_id=self._company_id,
+                tableId=self.table_id,
+                includeCells=True,
+                includeLogHistory=include_log_history,
+                includeRowCount=False,
+                includeCellMetaData=include_cell_meta_data,  # renderer, selection, agreement status
+                startRow=start_row,
+                endRow=end_row - 1,
+                includeRowMetadata=True,
+            )
+        else:
+            sheet_partial = await AgenticTable.get_sheet_data(
+                user_id=self._user_id,
+                company_id=self._company_id,
+                tableId=self.table_id,
+                includeCells=True,
+                includeLogHistory=include_log_history,
+                includeRowCount=False,
+                includeCellMetaData=include_cell_meta_data,  # renderer, selection, agreement status
+                startRow=start_row,
+                endRow=end_row - 1,
+            )
+        batch_cells = sheet_partial.get("magicTableCells", [])
+        if (
+            include_row_metadata
+            and not _sheet_batch_cells_include_row_metadata_from_api(batch_cells)
+        ):
+            await self._hydrate_row_metadata(batch_cells)
+        return batch_cells
+
+    async def _hydrate_row_metadata(
+        self, batch_cells: list[SDKAgenticTableCell]
+    ) -> None:
+        # Legacy: gateways before UN-19884 omit rowMetadata on sheet cells; hydrate
+        # via get_cell until all environments expose rowMetadata on GET sheet. This
+        # branch can be removed after an agreed deprecation window.
+        self.logger.debug(
+            "Magic table sheet cells lack rowMetadata; hydrating row metadata via get_cell."
+        )
+        first_cell_of_row: dict[int, SDKAgenticTableCell] = {}
+        for cell in batch_cells:
+            row_order = cell.get("rowOrder")  # type: ignore[assignment]
+            if row_order is not None and row_order not in first_cell_of_row:  # pyright: ignore[reportUnnecessaryComparison]
+                first_cell_of_row[row_order] = cell
+        semaphore = asyncio.Semaphore(_ROW_METADATA_HYDRATION_CONCURRENCY)
+
+        async def hydrate(row_order: int, column_order: int) -> MagicTableCell:
+            async with semaphore:
+                return await self.get_cell(row_order, column_order)
+
+        hydrated_cells = await asyncio.gather(
+            *(
+                hydrate(row_order, cell.get("columnOrder"))  # type: ignore[arg-type]
+                for row_order, cell in first_cell_of_row.items()
+            )
+        )
+        row_metadata_map: dict[int, list[RowMetadataEntry]] = {
+            hydrated.row_order: hydrated.row_metadata
+            for hydrated in hydrated_cells
+            if hydrated.row_metadata
+        }
+        for cell in batch_cells:
+            row_order = cell.get("rowOrder")  # type: ignore[assignment]
+            if row_order is not None and row_order in row_metadata_map:  # pyright: ignore[reportUnnecessaryComparison]
+                cell["rowMetadata"] = row_metadata_map[  # pyright: ignore[reportGeneralTypeIssues]
+                    row_order
+                ]
+
+    async def _iter_sheet_pages(
+        self,
+        start_row: int,
+        end_row: int,
+        batch_size: int,
+        max_concurrent_pages: int,
+        include_log_history: bool = False,
+        include_cell_meta_data: bool = False,
+        include_row_metadata: bool = False,
+    ) -> AsyncIterator[list[SDKAgenticTableCell]]:
+        """Yield the cells of each page in row order.
+
+        Up to ``max_concurrent_pages`` pages are requested at a time, so later
+        pages load while the caller processes earlier ones.
+        """
+        if batch_size <= 0 or max_concurrent_pages <= 0:
+            raise ValueError("batch_size and max_concurrent_pages must be positive")
+        pages = deque(
+            (row, min(row + batch_size, end_row))
+            for row in range(start_row, end_row, batch_size)
+        )
+        in_flight: deque[asyncio.Task[list[SDKAgenticTableCell]]] = deque()
+        try:
+            while pages or in_flight:
+                while pages and len(in_flight) < max_concurrent_pages:
+                    page_start, page_end = pages.popleft()
+                    in_flight.append(
+                        asyncio.ensure_future(
+                            self._get_sheet_page(
+                                page_start,
+                                page_end,
+                                include_log_history,
+                                include_cell_meta_data,
+                                include_row_metadata,
+                            )
+                        )
+                    )
+                yield await in_flight.popleft()
+        finally:
+            # The consumer stopped early or a page failed: drop the prefetch.
+            for task in in_flight:
+                task.cancel()
+            await asyncio.gather(*in_flight, return_exceptions=True)
+
     async def get_sheet(
         self,
         start_row: int = 0,
@@ -443,6 +646,7 @@ class AgenticTableService:
         include_log_history: bool = False,
         include_cell_meta_data: bool = False,
         include_row_metadata: bool = False,
+        max_concurrent_pages: int = 4,
     ) -> MagicTableSheet:
         """
         Gets the sheet data from the Agentic Table paginated by batch_size.
@@ -454,102 +658,109 @@ class AgenticTableService:
             include_log_history (bool): Whether to include the log history.
             include_cell_meta_data (bool): Whether to include the cell metadata (renderer, selection, agreement status).
             include_row_metadata (bool): Whether to include the row metadata (key value pairs).
+            max_concurrent_pages (int): How many pages are fetched at the same time.
         Returns:
             MagicTableSheet: The sheet data.
         """
-        # Find the total number of rows
-        sheet_info = await AgenticTable.get_sheet_data(
-            user_id=self._user_id,
-            company_id=self._company_id,
-            tableId=self.table_id,
-            includeRowCount=True,
-            includeCells=False,
-            includeLogHistory=False,
-            includeCellMetaData=False,
+        sheet_info, start_row, end_row = await self._get_sheet_header(
+            start_row, end_row
         )
-        total_rows = sheet_info.get("magicTableRowCount")
-        if total_rows is None:
-            raise RuntimeError(
-                "Expected magicTableRowCount in sheet response when includeRowCount=True"
-            )
-        if end_row is None or end_row > total_rows:
-            end_row = total_rows
-        if start_row > end_row:
-            raise Exception("Start row is greater than end row")
-        if start_row < 0 or end_row < 0:
-            raise Exception("Start row or end row is negative")
 
-        # Get the cells
-        cells = []
-        for row in range(start_row, end_row, batch_size):
-            end_row_batch = min(row + batch_size, end_row)
-            if include_row_metadata:
-                sheet_partial = await AgenticTable.get_sheet_data(
-                    user_id=self._user_id,
-                    company_id=self._company_id,
-                    tableId=self.table_id,
-                    includeCells=True,
-                    includeLogHistory=include_log_history,
-                    includeRowCount=False,
-                    includeCellMetaData=include_cell_meta_data,  # renderer, selection, agreement status
-                    startRow=row,
-                    endRow=end_row_batch - 1,
-                    includeRowMetadata=True,
-                )
-            else:
-                sheet_partial = await AgenticTable.get_sheet_data(
-                    user_id=self._user_id,
-                    company_id=self._company_id,
-                    tableId=self.table_id,
-                    includeCells=True,
-                    includeLogHistory=include_log_history,
-                    includeRowCount=False,
-                    includeCellMetaData=include_cell_meta_data,  # renderer, selection, agreement status
-                    startRow=row,
-                    endRow=end_row_batch - 1,
-                )
-            if "magicTableCells" in sheet_partial:
-                batch_cells = sheet_partial["magicTableCells"]
-                if (
-                    include_row_metadata
-                    and not _sheet_batch_cells_include_row_metadata_from_api(
-                        batch_cells
-                    )
-                ):
-                    # Legacy: gateways before UN-19884 omit rowMetadata on sheet cells; hydrate
-                    # via get_cell until all environments expose rowMetadata on GET sheet. This
-                    # branch can be removed after an agreed deprecation window.
-                    self.logger.debug(
-                        "Magic table sheet cells lack rowMetadata; hydrating row metadata via get_cell."
-                    )
-                    row_metadata_map: dict[int, list[RowMetadataEntry]] = {}
-                    for cell in batch_cells:
-                        row_order = cell.get("rowOrder")  # type: ignore[assignment]
-                        if row_order is not None and row_order not in row_metadata_map:  # pyright: ignore[reportUnnecessaryComparison]
-                            column_order = cell.get("columnOrder")  # type: ignore[assignment]
-                            cell_with_row_metadata = await self.get_cell(
-                                row_order,
-                                column_order,
-                            )
-                            if cell_with_row_metadata.row_metadata:
-                                row_metadata_map[cell_with_row_metadata.row_order] = (
-                                    cell_with_row_metadata.row_metadata
-                                )
-                                cell["rowMetadata"] = (  # pyright: ignore[reportGeneralTypeIssues]
-                                    cell_with_row_metadata.row_metadata
-                                )
-                    for cell in batch_cells:
-                        row_order = cell.get("rowOrder")  # type: ignore[assignment]
-                        if row_order is not None and row_order in row_metadata_map:  # pyright: ignore[reportUnnecessaryComparison]
-                            cell["rowMetadata"] = row_metadata_map[  # pyright: ignore[reportGeneralTypeIssues]
-                                row_order
-                            ]
-
-                cells.extend(batch_cells)
+        cells: list[SDKAgenticTableCell] = []
+        async for batch_cells in self._iter_sheet_pages(
+            start_row,
+            end_row,
+            batch_size,
+            max_concurrent_pages,
+            include_log_history=include_log_history,
+            include_cell_meta_data=include_cell_meta_data,
+            include_row_metadata=include_row_metadata,
+        ):
+            cells.extend(batch_cells)
 
         sheet_info["magicTableCells"] = cells
         return MagicTableSheet.model_validate(sheet_info)
 
+    async def iter_sheet_rows(
+        self,
+        start_row: int = 0,
+        end_row: int | None = None,
+        batch_size: int = 100,
+        include_log_history: bool = False,
+        include_cell_meta_data: bool = False,
+        include_row_metadata: bool = False,
+        max_concurrent_pages: int = 4,
+    ) -> AsyncIterator[MagicTableRow]:
+        """
+        Streams the rows of the Agentic Table in row order.
+
+        Takes the same arguments as ``get_sheet``, but yields each row as soon as
+        its page arrived, so processing can start before the whole sheet is
+        loaded. Rows without any cell are skipped.
+
+        Returns:
+            AsyncIterator[MagicTableRow]: The rows of the sheet.
+        """
+        _, start_row, end_row = await self._get_sheet_header(start_row, end_row)
+
+        # aclosing: a consumer that stops early cancels the pending prefetch now
+        # rather than when the page iterator is garbage collected.
+        async with aclosing(
+            self._iter_sheet_pages(
+                start_row,
+                end_row,
+                batch_size,
+                max_concurrent_pages,
+                include_log_history=include_log_history,
+                include_cell_meta_data=include_cell_meta_data,
+                include_row_metadata=include_row_metadata,
+            )
+        ) as pages:
+            async for batch_cells in pages:
+                rows: dict[int, list[MagicTableCell]] = {}
+                for cell in batch_cells:
+                    parsed = MagicTableCell.model_validate(cell)
+                    rows.setdefault(parsed.row_order, []).append(parsed)
+                for row_order in sorted(rows):
+                    yield MagicTableRow(
+                        row_order=row_order,
+                        cells=sorted(rows[row_order], key=lambda c: c.column_order),
+                    )
+
+    async def get_sheet_dataframe(
+        self,
+        start_row: int = 0,
+        end_row: int | None = None,
+        batch_size: int = 100,
+        max_concurrent_pages: int = 4,
+    ) -> "pd.DataFrame":
+        """
+        Gets the cell texts of the Agentic Table as a pandas DataFrame.
+
+        Built straight from the API payload without creating a ``MagicTableCell``
+        per cell, which keeps exporting large sheets cheap.
+
+        Returns:
+            pd.DataFrame: One row per sheet row (index ``row_order``) and one column
+                per sheet column (``column_order``); missing cells are NaN.
+        """
+        import pandas as pd
+
+        _, start_row, end_row = await self._get_sheet_header(start_row, end_row)
+
+        columns: dict[int, dict[int, str]] = {}
+        async for batch_cells in self._iter_sheet_pages(
+            start_row, end_row, batch_size, max_concurrent_pages
+        ):
+            for cell in batch_cells:
+                column = columns.setdefault(cell["columnOrder"], {})
+                column[cell["rowOrder"]] = cell.get("text")
+
+        df = pd.DataFrame(columns).sort_index().sort_index(axis=1)
+        df.index.name = "row_order"
+        df.columns.name = "column_order"
+        return df
+
     async def get_sheet_metadata(self) -> list[RowMetadataEntry]:
         """
         Gets the sheet metadata from the Agentic Table.
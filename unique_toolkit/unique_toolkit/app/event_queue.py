@@ -0,0 +1,269 @@
+"""Bounded worker queue for webhook events.
+
+Without admission control every accepted webhook event starts its handler
+right away, so a burst of chat events runs an unbounded number of agent loops
+in one process, all competing for the event loop, memory and the LLM rate
+limit. ``EventWorkerQueue`` runs at most ``concurrency`` handlers at a time and
+holds at most ``max_depth`` events for them; events beyond that are rejected so
+the platform can retry them later or on another replica.
+
+Waiting events are dispatched round-robin per tenant (company), so a single
+company sending a burst cannot starve the others.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import inspect
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from logging import getLogger
+from typing import Any, Awaitable, Callable, Literal
+
+from pydantic import Field
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+from unique_toolkit.app.find_env_file import find_env_file
+from unique_toolkit.monitoring import _MONITORING_AVAILABLE
+
+if _MONITORING_AVAILABLE:
+    from unique_toolkit.monitoring.middleware import (
+        event_queue_depth,
+        event_queue_in_progress,
+        event_queue_rejections_total,
+        event_queue_wait_seconds,
+    )
+
+logger = getLogger(__name__)
+
+EventHandler = Callable[[Any], Awaitable[int]] | Callable[[Any], int]
+
+
+class EventQueueSettings(BaseSettings):
+    concurrency: int = Field(
+        default=8,
+        gt=0,
+        description="Maximum number of events handled at the same time.",
+    )
+    max_depth: int = Field(
+        default=100,
+        ge=0,
+        description="Maximum number of events waiting for a worker. Further events are rejected.",
+    )
+    max_depth_per_tenant: int | None = Field(
+        default=None,
+        ge=0,
+        description="Maximum number of waiting events of a single company. Default is no per-company limit.",
+    )
+    reject_status_code: Literal[429, 503] = Field(
+        default=429,
+        description="Status code returned when the queue is full. Events arriving during shutdown always get 503.",
+    )
+    retry_after_seconds: int = Field(
+        default=5,
+        ge=0,
+        description="Value of the Retry-After header sent with rejections.",
+    )
+    drain_timeout_seconds: float = Field(
+        default=30.0,
+        ge=0,
+        description="How long shutdown waits for queued and running events before cancelling them.",
+    )
+
+    model_config = SettingsConfigDict(
+        env_prefix="unique_event_queue_",
+        env_file_encoding="utf-8",
+        env_file=find_env_file("unique.env", ".env", required=False),
+        case_sensitive=False,
+        extra="ignore",
+    )
+
+
+class EventRejectedError(Exception):
+    """Raised by ``EventWorkerQueue.submit`` when an event is not admitted."""
+
+    def __init__(self, reason: str, status_code: int) -> None:
+        super().__init__(f"Event rejected: {reason}")
+        self.reason = reason
+        self.status_code = status_code
+
+
+@dataclass
+class _QueuedEvent:
+    event: Any
+    enqueued_at: float = field(default_factory=time.monotonic)
+
+
+class EventWorkerQueue:
+    """Runs an event handler for submitted events on a bounded set of workers.
+
+    Workers are started on the running event loop by the first ``submit``;
+    call ``drain`` on shutdown to stop admitting events and let the admitted
+    ones finish. Synchronous handlers run in a thread, like FastAPI background
+    tasks.
+    """
+
+    def __init__(
+        self,
+        handler: EventHandler,
+        settings: EventQueueSettings | None = None,
+    ) -> None:
+        self._handler = handler
+        self._handler_is_async = _is_async_callable(handler)
+        self.settings = settings or EventQueueSettings()
+        self._pending: dict[str, deque[_QueuedEvent]] = {}
+        self._tenants: deque[str] = deque()
+        self._depth = 0
+        self._active = 0
+        self._draining = False
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._ready: asyncio.Semaphore | None = None
+        self._idle: asyncio.Event | None = None
+        self._workers: set[asyncio.Task[None]] = set()
+
+    @property
+    def depth(self) -> int:
+        """Number of events waiting for a worker."""
+        return self._depth
+
+    @property
+    def active(self) -> int:
+        """Number of events being handled."""
+        return self._active
+
+    def submit(self, event: Any) -> None:
+        """Queue ``event`` for a worker or raise ``EventRejectedError``."""
+        if self._draining:
+            self._reject("draining", 503)
+        tenant = event.company_id
+        tenant_queue = self._pending.get(tenant)
+        # Queued events take the free workers first; the depth limits only
+        # apply to an event that has to wait for a worker.
+        waiting = self._depth + self._active - self.settings.concurrency
+        if waiting >= 0:
+            if waiting >= self.settings.max_depth:
+                self._reject("queue_full", self.settings.reject_status_code)
+            if (
+                self.settings.max_depth_per_tenant is not None
+                and len(tenant_queue or ()) >= self.settings.max_depth_per_tenant
+            ):
+                self._reject("tenant_full", self.settings.reject_status_code)
+
+        self._ensure_workers()
+        if tenant_queue is None:
+            tenant_queue = self._pending[tenant] = deque()
+            self._tenants.append(tenant)
+        tenant_queue.append(_QueuedEvent(event))
+        self._depth += 1
+        _set_depth(self._depth)
+        assert self._ready is not None and self._idle is not None
+        self._idle.clear()
+        self._ready.release()
+
+    async def drain(self, timeout: float | None = None) -> None:
+        """Stop admitting events and wait for the admitted ones to finish.
+
+        Events still queued or running after ``timeout`` (default
+        ``drain_timeout_seconds``) are cancelled.
+        """
+        self._draining = True
+        if self._loop is not asyncio.get_running_loop():
+            self._workers.clear()
+            return
+        assert self._ready is not None and self._idle is not None
+        if timeout is None:
+            timeout = self.settings.drain_timeout_seconds
+        try:
+            await asyncio.wait_for(self._idle.wait(), timeout)
+        except TimeoutError:
+            logger.warning(
+                f"Event queue did not drain within {timeout}s, cancelling "
+                f"{self._active} running and dropping {self._depth} queued events"
+            )
+            for worker in self._workers:
+                worker.cancel()
+            self._pending.clear()
+            self._tenants.clear()
+            self._depth = 0
+            _set_depth(0)
+        else:
+            # Wake the idle workers; they find nothing to do and stop.
+            for _ in self._workers:
+                self._ready.release()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers.clear()
+
+    def _reject(self, reason: str, status_code: int) -> None:
+        if _MONITORING_AVAILABLE:
+            event_queue_rejections_total.labels(reason=reason).inc()
+        raise EventRejectedError(reason, status_code)
+
+    def _ensure_workers(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._loop is loop:
+            return
+        # First submit, or the previous loop is gone (e.g. a test client that
+        # runs each request on its own loop): start workers on this one and let
+        # them pick up whatever is still queued.
+        self._loop = loop
+        self._ready = asyncio.Semaphore(self._depth)
+        self._idle = asyncio.Event()
+        self._workers = {
+            loop.create_task(self._work()) for _ in range(self.settings.concurrency)
+        }
+
+    def _pop(self) -> _QueuedEvent:
+        tenant = self._tenants.popleft()
+        tenant_queue = self._pending[tenant]
+        queued = tenant_queue.popleft()
+        if tenant_queue:
+            self._tenants.append(tenant)
+        else:
+            del self._pending[tenant]
+        self._depth -= 1
+        _set_depth(self._depth)
+        return queued
+
+    async def _work(self) -> None:
+        assert self._ready is not None and self._idle is not None
+        ready, idle = self._ready, self._idle
+        while True:
+            await ready.acquire()
+            if not self._tenants:
+                return
+            queued = self._pop()
+            if _MONITORING_AVAILABLE:
+                event_queue_wait_seconds.observe(time.monotonic() - queued.enqueued_at)
+                event_queue_in_progress.inc()
+            self._active += 1
+            try:
+                await self._handle(queued.event)
+            except Exception:
+                logger.exception("Error handling event from the event queue")
+            finally:
+                self._active -= 1
+                if _MONITORING_AVAILABLE:
+                    event_queue_in_progress.dec()
+                if not self._active and not self._depth:
+                    idle.set()
+
+    async def _handle(self, event: Any) -> None:
+        if self._handler_is_async:
+            await self._handler(event)  # type: ignore[misc]
+        else:
+            await asyncio.to_thread(self._handler, event)
+
+
+def _is_async_callable(obj: Any) -> bool:
+    while isinstance(obj, functools.partial):
+        obj = obj.func
+    return inspect.iscoroutinefunction(obj) or inspect.iscoroutinefunction(
+        getattr(obj, "__call__", None)
+    )
+
+
+def _set_depth(depth: int) -> None:
+    if _MONITORING_AVAILABLE:
+        event_queue_depth.set(depth)
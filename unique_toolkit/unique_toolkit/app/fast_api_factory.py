@@ -1,4 +1,5 @@
 import json
+from contextlib import asynccontextmanager
 from logging import getLogger
 from typing import TYPE_CHECKING, Any, Awaitable, Callable, TypeVar
 
@@ -23,6 +24,11 @@ else:
         JSONResponse = None  # type: ignore[assignment, misc]
         BackgroundTasks = None  # type: ignore[assignment, misc]
 
+from unique_toolkit.app.event_queue import (
+    EventQueueSettings,
+    EventRejectedError,
+    EventWorkerQueue,
+)
 from unique_toolkit.app.schemas import BaseEvent, ChatEvent, EventName
 from unique_toolkit.app.unique_settings import UniqueSettings
 
@@ -51,14 +57,35 @@ def build_unique_custom_app(
     event_handler: EventHandlerType[T] = default_event_handler,
     event_constructor: Callable[..., T] = ChatEvent,
     subscribed_event_names: list[str] | None = None,
+    event_queue_settings: EventQueueSettings | None = None,
 ) -> "FastAPI":
-    """Factory class for creating FastAPI apps with Unique webhook handling."""
+    """Factory class for creating FastAPI apps with Unique webhook handling.
+
+    By default every accepted event runs as a FastAPI background task. Pass
+    ``event_queue_settings`` to run events on a bounded ``EventWorkerQueue``
+    instead: at most ``concurrency`` events are handled at a time, events
+    beyond ``max_depth`` are rejected with 429/503 and a ``Retry-After``
+    header, and shutdown waits for admitted events to finish. The queue is
+    available as ``app.state.event_queue``.
+    """
     if FastAPI is None:
         raise ImportError(
             "FastAPI is not installed. Install it with: poetry install --with fastapi"
         )
 
-    app = FastAPI(title=title)
+    if event_queue_settings is None:
+        event_queue = None
+        app = FastAPI(title=title)
+    else:
+        event_queue = EventWorkerQueue(event_handler, event_queue_settings)
+
+        @asynccontextmanager
+        async def lifespan(_: "FastAPI"):
+            yield
+            await event_queue.drain()
+
+        app = FastAPI(title=title, lifespan=lifespan)
+        app.state.event_queue = event_queue
 
     if subscribed_event_names is None:
         subscribed_event_names = [EventName.EXTERNAL_MODULE_CHOSEN]
@@ -152,6 +179,22 @@ def build_unique_custom_app(
                 content={"error": "Invalid event"},
             )
 
+        if event_queue is not None:
+            try:
+                event_queue.submit(event)
+            except EventRejectedError as e:
+                logger.warning(f"Event {event.id} rejected: {e.reason}")
+                return JSONResponse(
+                    status_code=e.status_code,
+                    content={"error": f"Event rejected: {e.reason}"},
+                    headers={
+                        "Retry-After": str(event_queue.settings.retry_after_seconds)
+                    },
+                )
+            return JSONResponse(
+                status_code=status.HTTP_200_OK, content={"message": "Event received"}
+            )
+
         # Run the task in background so that we don't block for long running tasks
         background_tasks.add_task(event_handler, event)
         return JSONResponse(
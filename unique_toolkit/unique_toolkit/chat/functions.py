@@ -20,6 +20,7 @@ from unique_toolkit.chat.schemas import (
     ChatMessageAssessmentLabel,
     ChatMessageAssessmentStatus,
     ChatMessageAssessmentType,
+    ChatMessageList,
     ChatMessageRole,
     ChatMessageTool,
     MessageExecution,
@@ -545,15 +546,55 @@ async def list_messages_async(
         raise e
 
 
+def list_chat_messages(
+    event_user_id: str,
+    event_company_id: str,
+    chat_id: str,
+) -> list[dict[str, Any]]:
+    """Lists the messages of a chat as plain dicts decoded straight from JSON."""
+    try:
+        messages = unique_sdk.Message.list_typed(
+            ChatMessageList,
+            user_id=event_user_id,
+            company_id=event_company_id,
+            chatId=chat_id,
+        )
+        return messages.data
+    except Exception as e:
+        _LOGGER.error(f"Failed to list chat history: {e}")
+        raise e
+
+
+async def list_chat_messages_async(
+    event_user_id: str,
+    event_company_id: str,
+    chat_id: str,
+) -> list[dict[str, Any]]:
+    """Lists the messages of a chat as plain dicts decoded straight from JSON."""
+    try:
+        messages = await unique_sdk.Message.list_typed_async(
+            ChatMessageList,
+            user_id=event_user_id,
+            company_id=event_company_id,
+            chatId=chat_id,
+        )
+        return messages.data
+    except Exception as e:
+        _LOGGER.error(f"Failed to list chat history: {e}")
+        raise e
+
+
 def get_full_history(
     event_user_id: str,
     event_company_id: str,
     event_payload_chat_id: str,
 ) -> list[ChatMessage]:
-    messages = list_messages(event_user_id, event_company_id, event_payload_chat_id)
-    messages = filter_valid_messages(messages)
-
-    return [ChatMessage.model_validate(msg) for msg in messages]
+    messages = list_chat_messages(
+        event_user_id,
+        event_company_id,
+        event_payload_chat_id,
+    )
+    return filter_valid_chat_messages(messages)
 
 
 async def get_full_history_async(
@@ -561,18 +602,22 @@ async def get_full_history_async(
     event_company_id: str,
     event_payload_chat_id: str,
 ) -> list[ChatMessage]:
-    messages = await list_messages_async(
+    messages = await list_chat_messages_async(
         event_user_id,
         event_company_id,
         event_payload_chat_id,
     )
-    messages = filter_valid_messages(messages)
-
-    return [ChatMessage.model_validate(msg) for msg in messages]
+    return filter_valid_chat_messages(messages)
 
 
 def filter_valid_messages(
     messages: ListObject[unique_sdk.Message],
+) -> list[dict[str, Any]]:
+    return _filter_valid_message_dicts(messages["data"])  # pyright: ignore[reportArgumentType]
+
+
+def _filter_valid_message_dicts(
+    messages: list[dict[str, Any]],
 ) -> list[dict[str, Any]]:
     SYSTEM_MESSAGE_PREFIX = "[SYSTEM] "
     roles_to_filter = [
@@ -580,7 +625,7 @@ def filter_valid_messages(
     ]
 
     # Remove the last two messages
-    messages = messages["data"][:-2]  # pyright: ignore[reportArgumentType]
+    messages = messages[:-2]
     filtered_messages = []
     for message in messages:
         if (
@@ -594,6 +639,16 @@ def filter_valid_messages(
     return filtered_messages
 
 
+def filter_valid_chat_messages(messages: list[dict[str, Any]]) -> list[ChatMessage]:
+    """Applies ``filter_valid_messages`` to raw message dicts, then validates
+    only the kept messages, so a message that is dropped anyway cannot fail
+    the history with a value ``ChatMessage`` does not know."""
+    return [
+        ChatMessage.model_validate(message)
+        for message in _filter_valid_message_dicts(messages)
+    ]
+
+
 def create_message_assessment(
     user_id: str,
     company_id: str,
@@ -188,6 +188,20 @@ class ChatMessage(BaseModel):
                 )
 
 
+class ChatMessageList(BaseModel):
+    """Response of ``unique_sdk.Message.list`` decoded straight from JSON.
+
+    Used with ``unique_sdk.Message.list_typed`` so that a chat history is parsed
+    once instead of into SDK objects first. The messages stay plain dicts: the
+    in-flight and system messages are dropped before the rest is validated as
+    ``ChatMessage``, so unexpected values in those never fail the history.
+    """
+
+    model_config = model_config
+
+    data: list[dict[str, Any]] = []
+
+
 class MessageLogStatus(StrEnum):
     RUNNING = "RUNNING"
     COMPLETED = "COMPLETED"
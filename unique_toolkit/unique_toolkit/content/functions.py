@@ -1,14 +1,18 @@
+import itertools
 import logging
 import os
 import re
 import tempfile
 import urllib.parse
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Iterable
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO
 
 import httpx
 import requests
 import unique_sdk
+from unique_sdk import get_async_http_client, get_http_session
 
 from unique_toolkit.content import DOMAIN_NAME
 from unique_toolkit.content.constants import DEFAULT_SEARCH_LANGUAGE
@@ -30,6 +34,40 @@ from unique_toolkit.content.utils import (
 
 logger = logging.getLogger(f"toolkit.{DOMAIN_NAME}.{__name__}")
 
+# Chunk size for streamed downloads and uploads; bounds their peak memory.
+DEFAULT_TRANSFER_CHUNK_SIZE = 1024 * 1024
+
+# Upload generation per chat, taken from one process-wide counter so a value is
+# never reused. Bounded: a chat that was evicted reads as 0, which differs from
+# any generation seen before and so only causes a spurious history refetch.
+_MAX_TRACKED_CHATS = 10_000
+_upload_generation_counter = itertools.count(1)
+_chat_upload_generations: OrderedDict[str, int] = OrderedDict()
+
+
+def _record_chat_upload(chat_id: str) -> None:
+    _chat_upload_generations.pop(chat_id, None)
+    _chat_upload_generations[chat_id] = next(_upload_generation_counter)
+    if len(_chat_upload_generations) > _MAX_TRACKED_CHATS:
+        _chat_upload_generations.popitem(last=False)
+
+
+def get_chat_upload_generation(chat_id: str) -> int:
+    """
+    Returns a value that changes whenever this process uploads content to the chat.
+
+    Used to notice files added to a chat while a turn is running, e.g. by a
+    tool calling ``ChatService.upload_to_chat_from_bytes``. Uploads made by other
+    processes are not seen.
+
+    Args:
+        chat_id (str): The chat ID.
+
+    Returns:
+        int: The current upload generation, 0 if no upload was recorded.
+    """
+    return _chat_upload_generations.get(chat_id, 0)
+
 
 def search_content_chunks(
     user_id: str,
@@ -244,7 +282,7 @@ async def _upsert_content_async(
 async def upload_content_from_bytes_async(
     user_id: str,
     company_id: str,
-    content: bytes,
+    content: bytes | BinaryIO,
     content_name: str,
     mime_type: str,
     scope_id: str | None = None,
@@ -260,7 +298,7 @@ async def upload_content_from_bytes_async(
     Args:
         user_id (str): The user ID.
         company_id (str): The company ID.
-        content (bytes): The content to upload.
+        content (bytes | BinaryIO): The content to upload. A binary file-like object is streamed from its current position without being read into memory.
         content_name (str): The name of the content.
         mime_type (str): The MIME type of the content.
         scope_id (str | None): The scope ID. Defaults to None.
@@ -295,7 +333,7 @@ async def upload_content_from_bytes_async(
 def upload_content_from_bytes(
     user_id: str,
     company_id: str,
-    content: bytes,
+    content: bytes | BinaryIO,
     content_name: str,
     mime_type: str,
     scope_id: str | None = None,
@@ -311,7 +349,7 @@ def upload_content_from_bytes(
     Args:
         user_id (str): The user ID.
         company_id (str): The company ID.
-        content (bytes): The content to upload.
+        content (bytes | BinaryIO): The content to upload. A binary file-like object is streamed from its current position without being read into memory.
         content_name (str): The name of the content.
         mime_type (str): The MIME type of the content.
         scope_id (str | None): The scope ID. Defaults to None.
@@ -395,10 +433,27 @@ def upload_content(
         raise e
 
 
+def _content_byte_size(content: str | Path | bytes | BinaryIO) -> int:
+    """Size of the upload; for file-like objects, the bytes left to read."""
+    if isinstance(content, (Path, str)):
+        return os.path.getsize(content)
+    if isinstance(content, bytes):
+        return len(content)
+    position = content.tell()
+    end = content.seek(0, os.SEEK_END)
+    content.seek(position)
+    return end - position
+
+
+async def _aiter_file(file: BinaryIO, chunk_size: int) -> AsyncIterator[bytes]:
+    while chunk := file.read(chunk_size):
+        yield chunk
+
+
 def _trigger_upload_content(
     user_id: str,
     company_id: str,
-    content: str | Path | bytes,
+    content: str | Path | bytes | BinaryIO,
     content_name: str,
     mime_type: str,
     scope_id: str | None = None,
@@ -415,7 +470,7 @@ def _trigger_upload_content(
     Args:
         user_id (str): The user ID.
         company_id (str): The company ID.
-        content (str | Path | bytes): The content to upload. If string or Path, file will be read from disk.
+        content (str | Path | bytes | BinaryIO): The content to upload. If string or Path, file will be streamed from disk; file-like objects are streamed from their current position.
         content_name (str): The name of the content.
         mime_type (str): The MIME type of the content.
         scope_id (str | None): The scope ID. Defaults to None.
@@ -432,9 +487,7 @@ def _trigger_upload_content(
     if not chat_id and not scope_id:
         raise ValueError("chat_id or scope_id must be provided")
 
-    byte_size = (
-        os.path.getsize(content) if isinstance(content, (Path, str)) else len(content)
-    )
+    byte_size = _content_byte_size(content)
     created_content = _upsert_content(
         user_id=user_id,
         company_id=company_id,
@@ -461,19 +514,20 @@ def _trigger_upload_content(
         "X-Ms-Blob-Type": "BlockBlob",
     }
     # upload to azure blob storage SAS url uploadUrl the pdf file translatedFile make sure it is treated as a application/pdf
-    if isinstance(content, bytes):
-        requests.put(
-            url=write_url,
-            data=content,
-            headers=headers,
-        )
-    else:
+    session = get_http_session()
+    if isinstance(content, (Path, str)):
         with open(content, "rb") as file:
-            requests.put(
+            session.put(
                 url=write_url,
                 data=file,
                 headers=headers,
             )
+    else:
+        session.put(
+            url=write_url,
+            data=content,
+            headers=headers,
+        )
 
     read_url = created_content["readUrl"]
 
@@ -510,6 +564,7 @@ def _trigger_upload_content(
             file_url=read_url,
             chat_id=chat_id,
         )  # type: ignore
+        _record_chat_upload(chat_id)
     else:
         _upsert_content(
             user_id=user_id,
@@ -526,7 +581,7 @@ def _trigger_upload_content(
 async def _trigger_upload_content_async(
     user_id: str,
     company_id: str,
-    content: str | Path | bytes,
+    content: str | Path | bytes | BinaryIO,
     content_name: str,
     mime_type: str,
     scope_id: str | None = None,
@@ -543,7 +598,7 @@ async def _trigger_upload_content_async(
     Args:
         user_id (str): The user ID.
         company_id (str): The company ID.
-        content (str | Path | bytes): The content to upload. If string or Path, file will be read from disk.
+        content (str | Path | bytes | BinaryIO): The content to upload. If string or Path, file will be streamed from disk; file-like objects are streamed from their current position.
         content_name (str): The name of the content.
         mime_type (str): The MIME type of the content.
         scope_id (str | None): The scope ID. Defaults to None.
@@ -561,9 +616,7 @@ async def _trigger_upload_content_async(
     if not chat_id and not scope_id:
         raise ValueError("chat_id or scope_id must be provided")
 
-    byte_size = (
-        os.path.getsize(content) if isinstance(content, (Path, str)) else len(content)
-    )
+    byte_size = _content_byte_size(content)
     created_content = await _upsert_content_async(
         user_id=user_id,
         company_id=company_id,
@@ -595,21 +648,31 @@ async def _trigger_upload_content_async(
     _blob_upload_timeout = httpx.Timeout(
         connect=10.0, read=120.0, write=120.0, pool=10.0
     )
-    async with httpx.AsyncClient(timeout=_blob_upload_timeout) as client:
-        if isinstance(content, bytes):
+    client = get_async_http_client()
+    if isinstance(content, bytes):
+        response = await client.put(
+            url=write_url,
+            content=content,
+            headers=headers,
+            timeout=_blob_upload_timeout,
+        )
+    else:
+        # Stream file bodies in chunks. An explicit Content-Length keeps httpx
+        # from falling back to chunked transfer encoding, which Azure Blob
+        # Storage rejects.
+        headers["Content-Length"] = str(byte_size)
+        file = open(content, "rb") if isinstance(content, (Path, str)) else content
+        try:
             response = await client.put(
                 url=write_url,
-                content=content,
+                content=_aiter_file(file, DEFAULT_TRANSFER_CHUNK_SIZE),
                 headers=headers,
+                timeout=_blob_upload_timeout,
             )
-        else:
-            with open(content, "rb") as file:
-                response = await client.put(
-                    url=write_url,
-                    content=file,
-                    headers=headers,
-                )
-        response.raise_for_status()
+        finally:
+            if file is not content:
+                file.close()
+    response.raise_for_status()
 
     read_url = created_content["readUrl"]
 
@@ -646,6 +709,7 @@ async def _trigger_upload_content_async(
             file_url=read_url,
             chat_id=chat_id,
         )
+        _record_chat_upload(chat_id)
     else:
         await _upsert_content_async(
             user_id=user_id,
@@ -660,7 +724,11 @@ async def _trigger_upload_content_async(
 
 
 def request_content_by_id(
-    user_id: str, company_id: str, content_id: str, chat_id: str | None
+    user_id: str,
+    company_id: str,
+    content_id: str,
+    chat_id: str | None,
+    stream: bool = False,
 ) -> requests.Response:
     """
     Sends a request to download content from a chat.
@@ -670,6 +738,7 @@ def request_content_by_id(
         company_id (str): The company ID.
         content_id (str): The ID of the content to download.
         chat_id (str): The ID of the chat from which to download the content. Defaults to None to download from knowledge base.
+        stream (bool): Whether to defer downloading the body until it is iterated. The caller must close a streamed response. Defaults to False.
 
     Returns:
         requests.Response: The response object containing the downloaded content.
@@ -691,7 +760,7 @@ def request_content_by_id(
     if unique_sdk.api_key:
         headers["Authorization"] = "Bearer %s" % (unique_sdk.api_key,)
 
-    return requests.get(url, headers=headers)
+    return get_http_session().get(url, headers=headers, stream=stream)
 
 
 async def request_content_by_id_async(
@@ -711,6 +780,14 @@ async def request_content_by_id_async(
 
     """
     logger.info(f"Requesting content with content_id: {content_id}")
+    url, headers = _content_file_request(user_id, company_id, content_id, chat_id)
+    return await get_async_http_client().get(url, headers=headers)
+
+
+def _content_file_request(
+    user_id: str, company_id: str, content_id: str, chat_id: str | None
+) -> tuple[str, dict[str, str]]:
+    """URL and headers of the async content file download."""
     url = f"{unique_sdk.api_base}/content/{content_id}/file"
     if chat_id:
         url = f"{url}?chatId={chat_id}"
@@ -723,9 +800,13 @@ async def request_content_by_id_async(
         "Authorization": "Bearer %s" % (unique_sdk.api_key,),
     }
     headers: dict[str, str] = {k: v for k, v in raw_headers.items() if v is not None}
+    return url, headers
+
 
-    async with httpx.AsyncClient() as client:
-        return await client.get(url, headers=headers)
+def _write_chunks(path: Path, chunks: Iterable[bytes]) -> None:
+    with open(path, "wb") as file:
+        for chunk in chunks:
+            file.write(chunk)
 
 
 def _extract_filename(content_disposition: str) -> str | None:
@@ -775,33 +856,90 @@ def download_content_to_file_by_id(
     """
 
     logger.info(f"Downloading content to file with content_id: {content_id}")
-    response = request_content_by_id(user_id, company_id, content_id, chat_id)
-    random_dir = tempfile.mkdtemp(dir=tmp_dir_path)
+    response = request_content_by_id(
+        user_id, company_id, content_id, chat_id, stream=True
+    )
+    try:
+        random_dir = tempfile.mkdtemp(dir=tmp_dir_path)
 
-    if response.status_code == 200:
-        if filename:
-            content_path = Path(random_dir) / filename
-        else:
-            extracted = _extract_filename(
-                response.headers.get("Content-Disposition", "")
-            )
-            if extracted:
-                content_path = Path(random_dir) / extracted
+        if response.status_code == 200:
+            if filename:
+                content_path = Path(random_dir) / filename
             else:
-                error_msg = "Error downloading file: Filename could not be determined"
-                logger.error(error_msg)
-                raise Exception(error_msg)
-
-        with open(content_path, "wb") as file:
-            file.write(response.content)
-    else:
-        error_msg = f"Error downloading file: Status code {response.status_code}"
-        logger.error(error_msg)
-        raise Exception(error_msg)
+                extracted = _extract_filename(
+                    response.headers.get("Content-Disposition", "")
+                )
+                if extracted:
+                    content_path = Path(random_dir) / extracted
+                else:
+                    error_msg = (
+                        "Error downloading file: Filename could not be determined"
+                    )
+                    logger.error(error_msg)
+                    raise Exception(error_msg)
+
+            _write_chunks(
+                content_path, response.iter_content(DEFAULT_TRANSFER_CHUNK_SIZE)
+            )
+        else:
+            error_msg = f"Error downloading file: Status code {response.status_code}"
+            logger.error(error_msg)
+            raise Exception(error_msg)
+    finally:
+        response.close()
 
     return content_path
 
 
+def download_content_to_path(
+    user_id: str,
+    company_id: str,
+    content_id: str,
+    path: str | Path,
+    chat_id: str | None = None,
+    chunk_size: int = DEFAULT_TRANSFER_CHUNK_SIZE,
+) -> Path:
+    """
+    Streams content to ``path`` without holding the whole file in memory.
+
+    Args:
+        user_id (str): The user ID.
+        company_id (str): The company ID.
+        content_id (str): The ID of the content to download.
+        path (str | Path): The file to write. Missing parent directories are created.
+        chat_id (str | None): The chat ID, or None to download from the knowledge base.
+        chunk_size (int): The number of bytes read and written at a time.
+
+    Returns:
+        Path: The path to the downloaded file.
+
+    Raises:
+        Exception: If the download fails. No file is created in that case, and a
+            partially written file is removed.
+    """
+    logger.info(f"Streaming content with content_id: {content_id} to {path}")
+    path = Path(path)
+    response = request_content_by_id(
+        user_id, company_id, content_id, chat_id, stream=True
+    )
+    try:
+        if response.status_code != 200:
+            error_msg = f"Error downloading file: Status code {response.status_code}"
+            logger.error(error_msg)
+            raise Exception(error_msg)
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            _write_chunks(path, response.iter_content(chunk_size))
+        except BaseException:
+            path.unlink(missing_ok=True)
+            raise
+    finally:
+        response.close()
+
+    return path
+
+
 def download_content_to_bytes(
     user_id: str,
     company_id: str,
@@ -853,6 +991,84 @@ async def download_content_to_bytes_async(
     return response.content
 
 
+async def iter_content_by_id_async(
+    user_id: str,
+    company_id: str,
+    content_id: str,
+    chat_id: str | None = None,
+    chunk_size: int = DEFAULT_TRANSFER_CHUNK_SIZE,
+) -> AsyncIterator[bytes]:
+    """
+    Asynchronously streams content in chunks of at most ``chunk_size`` bytes.
+
+    Args:
+        user_id (str): The user ID.
+        company_id (str): The company ID.
+        content_id (str): The ID of the content to download.
+        chat_id (str | None): The chat ID, or None to download from the knowledge base.
+        chunk_size (int): The maximum number of bytes per yielded chunk.
+
+    raises:
+        httpx.HTTPStatusError: If the download fails.
+    """
+    logger.info(f"Streaming content with content_id: {content_id}")
+    url, headers = _content_file_request(user_id, company_id, content_id, chat_id)
+
+    async with get_async_http_client().stream(
+        "GET", url, headers=headers, timeout=unique_sdk.blob_transfer_timeout
+    ) as response:
+        if not response.is_success:
+            logger.error(
+                "Error downloading file %s: Status code %s",
+                content_id,
+                response.status_code,
+            )
+            response.raise_for_status()
+
+        async for chunk in response.aiter_bytes(chunk_size):
+            yield chunk
+
+
+async def download_content_to_path_async(
+    user_id: str,
+    company_id: str,
+    content_id: str,
+    path: str | Path,
+    chat_id: str | None = None,
+    chunk_size: int = DEFAULT_TRANSFER_CHUNK_SIZE,
+) -> Path:
+    """
+    Asynchronously streams content to ``path`` without holding the whole file in memory.
+
+    Args:
+        user_id (str): The user ID.
+        company_id (str): The company ID.
+        content_id (str): The ID of the content to download.
+        path (str | Path): The file to write. Missing parent directories are created.
+        chat_id (str | None): The chat ID, or None to download from the knowledge base.
+        chunk_size (int): The number of bytes read and written at a time.
+
+    Returns:
+        Path: The path to the downloaded file.
+
+    raises:
+        httpx.HTTPStatusError: If the download fails. A partially written file is removed.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        with open(path, "wb") as file:
+            async for chunk in iter_content_by_id_async(
+                user_id, company_id, content_id, chat_id, chunk_size
+            ):
+                file.write(chunk)
+    except BaseException:
+        path.unlink(missing_ok=True)
+        raise
+
+    return path
+
+
 # TODO: Discuss if we should deprecate this method due to unclear use by content_name
 def download_content(
     user_id: str,
@@ -881,18 +1097,23 @@ def download_content(
     """
 
     logger.info(f"Downloading content with content_id: {content_id}")
-    response = request_content_by_id(user_id, company_id, content_id, chat_id)
-
-    random_dir = tempfile.mkdtemp(dir=dir_path)
-    content_path = Path(random_dir) / content_name
+    response = request_content_by_id(
+        user_id, company_id, content_id, chat_id, stream=True
+    )
+    try:
+        random_dir = tempfile.mkdtemp(dir=dir_path)
+        content_path = Path(random_dir) / content_name
 
-    if response.status_code == 200:
-        with open(content_path, "wb") as file:
-            file.write(response.content)
-    else:
-        error_msg = f"Error downloading file: Status code {response.status_code}"
-        logger.error(error_msg)
-        raise Exception(error_msg)
+        if response.status_code == 200:
+            _write_chunks(
+                content_path, response.iter_content(DEFAULT_TRANSFER_CHUNK_SIZE)
+            )
+        else:
+            error_msg = f"Error downloading file: Status code {response.status_code}"
+            logger.error(error_msg)
+            raise Exception(error_msg)
+    finally:
+        response.close()
 
     return content_path
 
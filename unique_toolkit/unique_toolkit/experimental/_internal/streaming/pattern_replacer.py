@@ -95,6 +95,11 @@ BATCH_NORMALIZATION_PATTERNS: list[NormalizationPattern] = [
 """Normalisation rules that convert model-emitted citation formats
 to the canonical ``[N]`` bracket notation (for batch processing)."""
 
+NORMALIZATION_TRIGGER_LITERALS: tuple[str, ...] = ("[", "source")
+"""Every match of :data:`NORMALIZATION_PATTERNS` and
+:data:`BATCH_NORMALIZATION_PATTERNS` contains ``[`` or (case-insensitively)
+``source``; text with neither needs no normalisation."""
+
 NORMALIZATION_MAX_MATCH_LENGTH = 80
 """Upper bound on characters any single pattern can match.  Sized for
 multi-source patterns like ``[source: 1, 2, ..., 20]``."""
@@ -131,6 +136,154 @@ def filter_cited_sdk_references(
     return [ref for ref in all_refs if ref["sequenceNumber"] in cited]
 
 
+_CITED_SUP_MAX_LENGTH = len("<sup></sup>") + 9
+"""Longest ``<sup>N</sup>`` tag :class:`CitationTracker` re-scans across a
+scan boundary (sequence numbers of up to nine digits)."""
+
+
+class CitationTracker:
+    """Incrementally tracks ``<sup>N</sup>`` citations in a growing text.
+
+    Streaming text only ever grows at the end, so instead of re-running
+    :func:`filter_cited_sdk_references` over the whole answer on every
+    update, :meth:`update` scans only the suffix appended since the previous
+    call (plus a short overlap so a tag split across the boundary is still
+    found). If the text was rewritten rather than extended, it falls back to
+    a full scan.
+
+    The references are built once from ``chunks``; :meth:`references`
+    returns the same result as ``filter_cited_sdk_references(chunks, text)``
+    for the last text passed to :meth:`update`.
+    """
+
+    def __init__(self, chunks: Sequence[ContentChunk]) -> None:
+        self._references = chunks_to_sdk_references(list(chunks))
+        self._cited: set[int] = set()
+        self._text = ""
+        self._scan_from = 0
+
+    @property
+    def cited(self) -> frozenset[int]:
+        """Sequence numbers cited so far."""
+        return frozenset(self._cited)
+
+    def update(self, text: str) -> set[int]:
+        """Scan the new part of ``text`` and return the newly cited numbers."""
+        if not text.startswith(self._text):
+            self._cited.clear()
+            self._scan_from = 0
+
+        new: set[int] = set()
+        for match in _CITED_SUP_PATTERN.finditer(text, self._scan_from):
+            number = int(match.group(1))
+            if number not in self._cited:
+                self._cited.add(number)
+                new.add(number)
+            self._scan_from = match.end()
+
+        self._text = text
+        self._scan_from = max(self._scan_from, len(text) - _CITED_SUP_MAX_LENGTH)
+        return new
+
+    def references(self) -> list[Message.Reference]:
+        """SDK references for the chunks cited so far, in chunk order."""
+        if not self._cited:
+            return []
+        # Copies, because the SDK strips empty descriptions from the dicts it sends.
+        return [
+            ref.copy()
+            for ref in self._references
+            if ref["sequenceNumber"] in self._cited
+        ]
+
+
+_LEADING_GLOBAL_FLAGS = re.compile(r"^\(\?[aiLmsux]+\)")
+_SCOPED_FLAGS = (
+    (re.IGNORECASE, "i"),
+    (re.MULTILINE, "m"),
+    (re.DOTALL, "s"),
+    (re.VERBOSE, "x"),
+)
+
+
+def _as_scoped_alternative(pattern: re.Pattern[str]) -> str:
+    """Rewrite ``pattern`` so it can be embedded in a larger alternation.
+
+    Global inline flags such as a leading ``(?i)`` are only legal at the start
+    of a whole expression, so they are turned into a scoped ``(?i:...)`` group.
+    """
+    source = _LEADING_GLOBAL_FLAGS.sub("", pattern.pattern)
+    flags = "".join(letter for flag, letter in _SCOPED_FLAGS if pattern.flags & flag)
+    return f"(?{flags}:{source})" if flags else f"(?:{source})"
+
+
+class CompiledNormalizer:
+    """Applies an ordered list of regex replacements, skipping text without candidates.
+
+    Before any replacement runs, the text is checked once for a possible
+    match: with ``trigger_literals`` by plain (case-insensitive) substring
+    checks, otherwise with a single scan of all patterns merged into one
+    alternation. Text without a candidate — the common case for streamed
+    deltas — is returned unchanged. Text with a candidate gets every
+    replacement applied in order, exactly like calling each ``pattern.sub``
+    in sequence.
+
+    Ordered application is kept for text with candidates because patterns
+    interact — e.g. stripping ``[user]`` from ``[[user]1]`` produces ``[1]``,
+    which a later pattern then normalises — and a single left-to-right pass
+    would not reproduce that.
+
+    Args:
+        replacements: ``(pattern, replacement)`` pairs, as accepted by
+            :class:`StreamingPatternReplacer`.
+        trigger_literals: Optional substrings such that every possible match
+            of every pattern contains at least one of them (compared
+            case-insensitively). Much cheaper than the merged regex scan,
+            but the caller is responsible for the guarantee.
+    """
+
+    def __init__(
+        self,
+        replacements: Sequence[tuple[str | re.Pattern[str], Replacement]],
+        trigger_literals: Sequence[str] | None = None,
+    ) -> None:
+        self._replacements = [
+            (re.compile(p) if isinstance(p, str) else p, repl)
+            for p, repl in replacements
+        ]
+        self._trigger_literals = (
+            tuple(literal.lower() for literal in trigger_literals)
+            if trigger_literals is not None
+            else None
+        )
+        self._scanner = (
+            re.compile(
+                "|".join(
+                    _as_scoped_alternative(pattern) for pattern, _ in self._replacements
+                )
+            )
+            if self._replacements
+            else None
+        )
+
+    def has_candidate(self, text: str) -> bool:
+        """Return whether any replacement could match ``text``."""
+        if self._scanner is None:
+            return False
+        if self._trigger_literals is not None:
+            lowered = text.lower()
+            return any(literal in lowered for literal in self._trigger_literals)
+        return self._scanner.search(text) is not None
+
+    def apply(self, text: str) -> str:
+        """Apply all replacements to ``text`` in order."""
+        if not self.has_candidate(text):
+            return text
+        for pattern, replacement in self._replacements:
+            text = pattern.sub(replacement, text)
+        return text
+
+
 class StreamingReplacerProtocol(Protocol):
     def process(self, delta: str) -> str: ...
     def flush(self) -> str: ...
@@ -161,17 +314,19 @@ class StreamingPatternReplacer:
         max_match_length: Upper bound on the number of characters any
             single pattern can match.  Determines how many trailing
             characters are retained in the buffer between calls.
+        trigger_literals: Optional substrings, at least one of which every
+            match contains (e.g. :data:`NORMALIZATION_TRIGGER_LITERALS`).
+            Lets buffers without a candidate skip all regex work; see
+            :class:`CompiledNormalizer`.
     """
 
     def __init__(
         self,
         replacements: Sequence[tuple[str | re.Pattern[str], Replacement]],
         max_match_length: int,
+        trigger_literals: Sequence[str] | None = None,
     ) -> None:
-        self._replacements = [
-            (re.compile(p) if isinstance(p, str) else p, repl)
-            for p, repl in replacements
-        ]
+        self._normalizer = CompiledNormalizer(replacements, trigger_literals)
         self._max_match_length = max_match_length
         self._buffer = ""
 
@@ -217,6 +372,4 @@ class StreamingPatternReplacer:
         return released
 
     def _apply_replacements(self, text: str) -> str:
-        for pattern, replacement in self._replacements:
-            text = pattern.sub(replacement, text)
-        return text
+        return self._normalizer.apply(text)
@@ -13,7 +13,7 @@ Typical usage::
     print(await tree.render_visible_tree_async(max_depth=2))
     hits = await tree.search_visible_files_fuzzy_async("annual_report")
 
-The subpackage is split into three modules to mirror the rest of the
+The subpackage is split into four modules to mirror the rest of the
 ``content`` domain:
 
 - :mod:`unique_toolkit.experimental.components.content_tree.schemas` — data classes
@@ -21,6 +21,8 @@ The subpackage is split into three modules to mirror the rest of the
 - :mod:`unique_toolkit.experimental.components.content_tree.functions` — pure helpers
   for listing, scope-id resolution, trie construction, and ``tree(1)``-style
   formatting.
+- :mod:`unique_toolkit.experimental.components.content_tree.fuzzy_index` —
+  :class:`FuzzyPathIndex`, the precomputed index behind fuzzy file search.
 - :mod:`unique_toolkit.experimental.components.content_tree.service` —
   :class:`ContentTree`, the orchestrating service with per-instance caching.
 """
@@ -35,6 +37,9 @@ from unique_toolkit.experimental.components.content_tree.functions import (
     translate_scope_ids_async,
     translate_scope_ids_batch,
 )
+from unique_toolkit.experimental.components.content_tree.fuzzy_index import (
+    FuzzyPathIndex,
+)
 from unique_toolkit.experimental.components.content_tree.schemas import (
     FuzzyMatch,
     MatchTarget,
@@ -45,6 +50,7 @@ from unique_toolkit.experimental.components.content_tree.service import ContentT
 __all__ = [
     "ContentTree",
     "FuzzyMatch",
+    "FuzzyPathIndex",
     "MatchTarget",
     "PathTrieNode",
     "build_trie_from_resolved_paths",
@@ -0,0 +1,307 @@
+"""Precomputed fuzzy-search index over a content-tree snapshot.
+
+:meth:`~unique_toolkit.experimental.components.content_tree.service.ContentTree.search_visible_files_fuzzy_async`
+used to normalize every candidate name and path and score them one by one in a
+Python loop on each query. :class:`FuzzyPathIndex` normalizes each file once per
+snapshot and scores a query with a single :func:`rapidfuzz.process.extract`
+call per target, after a prefilter that drops candidates which provably cannot
+reach ``min_score``.
+
+The prefilter is exact for :func:`rapidfuzz.fuzz.token_set_ratio`: a candidate
+either shares a whole token with the query (found through an inverted token
+index) or its score is the plain indel ratio of the two sorted token strings,
+which is at most ``2 * min(len_a, len_b) / (len_a + len_b)`` — so only
+candidates whose token-string length lies in a window around the query's
+length (found through buckets of candidates by length) can still clear the
+cutoff.
+Character n-gram filters give no such bound for token-set scoring and would
+silently drop matches.
+
+The index is updated in place when the snapshot changes: only files that are
+new or whose key or path changed are re-tokenized.
+"""
+
+from __future__ import annotations
+
+import math
+import re
+import threading
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import TypeVar
+
+from rapidfuzz import fuzz, process
+
+from unique_toolkit.content.schemas import ContentInfo
+from unique_toolkit.experimental.components.content_tree.schemas import (
+    FuzzyMatch,
+    MatchTarget,
+)
+
+_NON_ALNUM_RE = re.compile(r"[^a-zA-Z0-9]+")
+_TRAILING_EXTENSION_RE = re.compile(r"\.[A-Za-z0-9]{1,8}$")
+
+# ``min_score`` is given in ``[0, 1]`` but rapidfuzz scores in ``[0, 100]``;
+# the cutoff passed to rapidfuzz is lowered by this much so float rounding in
+# the conversion never drops a boundary match. The exact ``score >= min_score``
+# check is applied to the returned scores.
+_SCORE_CUTOFF_SLACK = 1e-6
+
+_K = TypeVar("_K")
+
+
+def _tokenize_for_fuzzy_scoring(
+    value: str, case_sensitive: bool, *, strip_extension: bool = False
+) -> str:
+    """Normalize ``value`` into whitespace-separated tokens for
+    :func:`rapidfuzz.fuzz.token_set_ratio`, which only tokenizes on
+    whitespace — filenames/paths use ``_``/``-``/``/`` (and other
+    punctuation) as their real word separators, so those need converting to
+    spaces first or every candidate is scored as a single opaque token (no
+    better than a plain char-ratio). Mirrors what
+    :func:`rapidfuzz.utils.default_process` does, minus the unconditional
+    lowercasing it bundles in — kept as a local regex rather than that
+    helper (via ``fuzz.token_set_ratio``'s ``processor=`` argument) so
+    ``case_sensitive=True`` can still skip lowercasing while keeping
+    separator normalization.
+    """
+    if strip_extension:
+        value = _TRAILING_EXTENSION_RE.sub("", value)
+    if not case_sensitive:
+        value = value.lower()
+    return _NON_ALNUM_RE.sub(" ", value).strip()
+
+
+def _token_set(text: str) -> tuple[frozenset[str], int]:
+    """Return the distinct tokens of ``text`` and the length of their sorted,
+    space-joined form — the string ``token_set_ratio`` compares when two
+    sides share no token."""
+    tokens = frozenset(text.split())
+    return tokens, sum(map(len, tokens)) + max(len(tokens) - 1, 0)
+
+
+def _discard_from_bucket(buckets: dict[_K, set[int]], key: _K, slot: int) -> None:
+    bucket = buckets[key]
+    bucket.discard(slot)
+    if not bucket:
+        del buckets[key]
+
+
+@dataclass
+class _IndexedFile:
+    content_info: ContentInfo
+    path_segments: list[str]
+    position: int
+
+
+class _TargetIndex:
+    """Normalized texts of one target (key or path, one case mode) per slot,
+    with the token and length lookups used by the prefilter."""
+
+    def __init__(self, target: MatchTarget, case_sensitive: bool) -> None:
+        self._target = target
+        self._case_sensitive = case_sensitive
+        self.texts: list[str | None] = []
+        self._postings: dict[str, set[int]] = {}
+        self._by_length: dict[int, set[int]] = {}
+
+    def add(self, slot: int, file: _IndexedFile) -> None:
+        if self._target == "key":
+            text = _tokenize_for_fuzzy_scoring(
+                file.content_info.key, self._case_sensitive, strip_extension=True
+            )
+        else:
+            text = _tokenize_for_fuzzy_scoring(
+                "/".join(file.path_segments), self._case_sensitive
+            )
+        tokens, length = _token_set(text)
+        while len(self.texts) <= slot:
+            self.texts.append(None)
+        self.texts[slot] = text
+        for token in tokens:
+            self._postings.setdefault(token, set()).add(slot)
+        self._by_length.setdefault(length, set()).add(slot)
+
+    def remove(self, slot: int) -> None:
+        text = self.texts[slot]
+        if text is None:
+            return
+        tokens, length = _token_set(text)
+        for token in tokens:
+            _discard_from_bucket(self._postings, token, slot)
+        _discard_from_bucket(self._by_length, length, slot)
+        self.texts[slot] = None
+
+    def candidates(self, query: str, score_cutoff: float) -> dict[int, str]:
+        """Slots that can score at least ``score_cutoff`` (0-100) against
+        ``query``, mapped to their normalized text."""
+        tokens, length = _token_set(query)
+        slots: set[int] = set()
+        for token in tokens:
+            slots.update(self._postings.get(token, ()))
+        if tokens:
+            # Without a shared token the score is at most
+            # 200 * min(length, other) / (length + other).
+            lowest = math.floor(length * score_cutoff / (200.0 - score_cutoff))
+            highest = math.ceil(length * (200.0 - score_cutoff) / score_cutoff)
+            for other, bucket in self._by_length.items():
+                if lowest <= other <= highest:
+                    slots.update(bucket)
+        texts = self.texts
+        return {slot: texts[slot] or "" for slot in slots}
+
+    def score(self, query: str, score_cutoff: float) -> dict[int, float]:
+        """Score ``query`` against every candidate, keyed by slot."""
+        choices: Sequence[str | None] | dict[int, str]
+        if score_cutoff > 0:
+            choices = self.candidates(query, score_cutoff)
+        else:
+            choices = self.texts
+        return {
+            slot: score
+            for _text, score, slot in process.extract(
+                query,
+                choices,
+                scorer=fuzz.token_set_ratio,
+                processor=None,
+                score_cutoff=score_cutoff,
+                limit=None,
+            )
+        }
+
+
+class FuzzyPathIndex:
+    """Fuzzy-search index over a resolved content snapshot.
+
+    Call :meth:`sync` with the ``(content_info, path_segments)`` rows of the
+    current snapshot before searching; passing the same list again is free,
+    and a changed list only re-tokenizes the files whose key or path changed.
+    Normalized texts are built lazily per target and case mode on first use.
+
+    Scores are identical to calling :func:`rapidfuzz.fuzz.token_set_ratio` on
+    every file. :meth:`sync` and :meth:`search` may be called from different
+    threads; a lock keeps a search from seeing a half-synced index.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._files: list[_IndexedFile | None] = []
+        self._slot_by_id: dict[str, int] = {}
+        self._free_slots: list[int] = []
+        self._targets: dict[tuple[MatchTarget, bool], _TargetIndex] = {}
+        self._source: list[tuple[ContentInfo, list[str]]] | None = None
+
+    def __len__(self) -> int:
+        return len(self._slot_by_id)
+
+    def sync(self, rows: list[tuple[ContentInfo, list[str]]]) -> None:
+        """Bring the index in line with ``rows``, re-indexing only changes."""
+        with self._lock:
+            if rows is self._source:
+                return
+            seen: set[str] = set()
+            for position, (content_info, segments) in enumerate(rows):
+                seen.add(content_info.id)
+                slot = self._slot_by_id.get(content_info.id)
+                file = None if slot is None else self._files[slot]
+                if (
+                    file is not None
+                    and file.content_info.key == content_info.key
+                    and file.path_segments == segments
+                ):
+                    file.content_info = content_info
+                    file.position = position
+                    continue
+                if slot is not None:
+                    self._remove(slot)
+                self._add(_IndexedFile(content_info, list(segments), position))
+            for content_id in [c for c in self._slot_by_id if c not in seen]:
+                self._remove(self._slot_by_id[content_id])
+            self._source = rows
+
+    def search(
+        self,
+        query: str,
+        *,
+        limit: int = 10,
+        min_score: float = 0.6,
+        match_on: MatchTarget = "both",
+        case_sensitive: bool = False,
+    ) -> list[FuzzyMatch]:
+        """Return the best matches for ``query``; see
+        :meth:`ContentTree.search_visible_files_fuzzy_async` for the arguments."""
+        with self._lock:
+            normalized_query = _tokenize_for_fuzzy_scoring(query, case_sensitive)
+            score_cutoff = max(0.0, min_score * 100.0 - _SCORE_CUTOFF_SLACK)
+            key_scores = (
+                self._target("key", case_sensitive).score(
+                    normalized_query, score_cutoff
+                )
+                if match_on in ("key", "both")
+                else {}
+            )
+            path_scores = (
+                self._target("path", case_sensitive).score(
+                    normalized_query, score_cutoff
+                )
+                if match_on in ("path", "both")
+                else {}
+            )
+
+            matches: list[tuple[int, FuzzyMatch]] = []
+            for slot in key_scores.keys() | path_scores.keys():
+                key_score = key_scores.get(slot, 0.0) / 100.0
+                path_score = path_scores.get(slot, 0.0) / 100.0
+                if match_on != "path" and (
+                    match_on == "key" or key_score >= path_score
+                ):
+                    score, matched_on = key_score, "key"
+                else:
+                    score, matched_on = path_score, "path"
+                file = self._files[slot]
+                if score >= min_score and file is not None:
+                    matches.append(
+                        (
+                            file.position,
+                            FuzzyMatch(
+                                content_info=file.content_info,
+                                score=score,
+                                path_segments=list(file.path_segments),
+                                matched_on=matched_on,
+                            ),
+                        )
+                    )
+
+            matches.sort(key=lambda item: (-item[1].score, item[0]))
+            return [match for _position, match in matches[:limit]]
+
+    def _target(self, target: MatchTarget, case_sensitive: bool) -> _TargetIndex:
+        index = self._targets.get((target, case_sensitive))
+        if index is None:
+            index = _TargetIndex(target, case_sensitive)
+            for slot, file in enumerate(self._files):
+                if file is not None:
+                    index.add(slot, file)
+            self._targets[(target, case_sensitive)] = index
+        return index
+
+    def _add(self, file: _IndexedFile) -> None:
+        if self._free_slots:
+            slot = self._free_slots.pop()
+            self._files[slot] = file
+        else:
+            slot = len(self._files)
+            self._files.append(file)
+        self._slot_by_id[file.content_info.id] = slot
+        for index in self._targets.values():
+            index.add(slot, file)
+
+    def _remove(self, slot: int) -> None:
+        file = self._files[slot]
+        if file is None:
+            return
+        for index in self._targets.values():
+            index.remove(slot)
+        del self._slot_by_id[file.content_info.id]
+        self._files[slot] = None
+        self._free_slots.append(slot)
@@ -21,12 +21,10 @@ from __future__ import annotations
 import asyncio
 import functools
 import json
-import re
+from collections import OrderedDict
 from collections.abc import Callable
 from typing import TYPE_CHECKING, Any, Protocol, Self, overload
 
-from rapidfuzz import fuzz
-
 from unique_toolkit._common.validate_required_values import validate_required_values
 from unique_toolkit.app.unique_settings import UniqueSettings
 from unique_toolkit.content.schemas import ContentInfo
@@ -36,6 +34,9 @@ from unique_toolkit.experimental.components.content_tree.functions import (
     resolve_visible_file_paths_core,
     serialize_filter,
 )
+from unique_toolkit.experimental.components.content_tree.fuzzy_index import (
+    FuzzyPathIndex,
+)
 from unique_toolkit.experimental.components.content_tree.schemas import (
     FuzzyMatch,
     MatchTarget,
@@ -45,31 +46,9 @@ from unique_toolkit.experimental.components.content_tree.schemas import (
 if TYPE_CHECKING:
     from unique_toolkit.app.unique_settings import UniqueContext
 
-
-_NON_ALNUM_RE = re.compile(r"[^a-zA-Z0-9]+")
-_TRAILING_EXTENSION_RE = re.compile(r"\.[A-Za-z0-9]{1,8}$")
-
-
-def _tokenize_for_fuzzy_scoring(
-    value: str, case_sensitive: bool, *, strip_extension: bool = False
-) -> str:
-    """Normalize ``value`` into whitespace-separated tokens for
-    :func:`rapidfuzz.fuzz.token_set_ratio`, which only tokenizes on
-    whitespace — filenames/paths use ``_``/``-``/``/`` (and other
-    punctuation) as their real word separators, so those need converting to
-    spaces first or every candidate is scored as a single opaque token (no
-    better than a plain char-ratio). Mirrors what
-    :func:`rapidfuzz.utils.default_process` does, minus the unconditional
-    lowercasing it bundles in — kept as a local regex rather than that
-    helper (via ``fuzz.token_set_ratio``'s ``processor=`` argument) so
-    ``case_sensitive=True`` can still skip lowercasing while keeping
-    separator normalization.
-    """
-    if strip_extension:
-        value = _TRAILING_EXTENSION_RE.sub("", value)
-    if not case_sensitive:
-        value = value.lower()
-    return _NON_ALNUM_RE.sub(" ", value).strip()
+# Fuzzy indexes kept per instance, one per metadata filter; the least recently
+# searched filter's index is dropped first.
+_MAX_FUZZY_INDEXES = 8
 
 
 class _CachedResolveTaskFactory(Protocol):
@@ -110,6 +89,11 @@ class ContentTree:
     same in-flight fetch (single-flight) and subsequent callers reuse the
     already-resolved value. Call :meth:`invalidate_cache` after a known
     backend mutation (upload, delete, rename…) to force a re-fetch.
+
+    Fuzzy search runs against a :class:`FuzzyPathIndex` kept per effective
+    metadata filter (for the most recently searched filters), so every search
+    on a shared instance reuses the normalized names. After a re-fetch the
+    index is updated incrementally rather than rebuilt.
     """
 
     def __init__(
@@ -135,6 +119,9 @@ class ContentTree:
         self._resolve_task: _CachedResolveTaskFactory = functools.cache(
             self._create_resolve_task
         )
+        # Survives ``invalidate_cache`` on purpose: the next snapshot is synced
+        # into the existing index, re-tokenizing only the files that changed.
+        self._fuzzy_indexes: OrderedDict[str, FuzzyPathIndex] = OrderedDict()
 
     # ── Read-only identity (frozen via the property mechanic) ────────────
 
@@ -381,6 +368,12 @@ class ContentTree:
         Matching is case-insensitive by default since file names in a
         knowledge base tend to be noisy.
 
+        Names and paths are normalized once per snapshot into a
+        :class:`FuzzyPathIndex`, which only scores the candidates that can
+        still reach ``min_score``; results are the same as scoring every file.
+        Indexing a snapshot and scoring a broad query take seconds on large
+        knowledge bases, so both run in a worker thread.
+
         Args:
             query: The search string (typically a fragment of a filename or path).
             limit: Maximum number of matches to return, after sorting by score
@@ -405,44 +398,29 @@ class ContentTree:
             metadata_filter=metadata_filter,
             max_concurrent_scope_lookups=max_concurrent_scope_lookups,
         )
-        normalized_query = _tokenize_for_fuzzy_scoring(query, case_sensitive)
-
-        matches: list[FuzzyMatch] = []
-        for content_info, segments in rows:
-            key_candidate = _tokenize_for_fuzzy_scoring(
-                content_info.key, case_sensitive, strip_extension=True
-            )
-            path_candidate = _tokenize_for_fuzzy_scoring(
-                "/".join(segments), case_sensitive
-            )
-
-            score_key = match_on in ("key", "both")
-            score_path = match_on in ("path", "both")
-            key_score = (
-                fuzz.token_set_ratio(normalized_query, key_candidate) / 100.0
-                if score_key
-                else 0.0
-            )
-            path_score = (
-                fuzz.token_set_ratio(normalized_query, path_candidate) / 100.0
-                if score_path
-                else 0.0
+        effective_filter = (
+            metadata_filter if metadata_filter is not None else self._metadata_filter
+        )
+        index = self._fuzzy_index(serialize_filter(effective_filter))
+
+        def sync_and_search() -> list[FuzzyMatch]:
+            index.sync(rows)
+            return index.search(
+                query,
+                limit=limit,
+                min_score=min_score,
+                match_on=match_on,
+                case_sensitive=case_sensitive,
             )
 
-            if score_key and (not score_path or key_score >= path_score):
-                score, matched_on = key_score, "key"
-            else:
-                score, matched_on = path_score, "path"
-
-            if score >= min_score:
-                matches.append(
-                    FuzzyMatch(
-                        content_info=content_info,
-                        score=score,
-                        path_segments=list(segments),
-                        matched_on=matched_on,
-                    )
-                )
-
-        matches.sort(key=lambda m: m.score, reverse=True)
-        return matches[:limit]
+        return await asyncio.to_thread(sync_and_search)
+
+    def _fuzzy_index(self, filter_key: str) -> FuzzyPathIndex:
+        """Return the index for ``filter_key``, evicting the least recently used."""
+        index = self._fuzzy_indexes.pop(filter_key, None)
+        if index is None:
+            index = FuzzyPathIndex()
+        self._fuzzy_indexes[filter_key] = index
+        while len(self._fuzzy_indexes) > _MAX_FUZZY_INDEXES:
+            self._fuzzy_indexes.popitem(last=False)
+        return index
@@ -12,6 +12,9 @@ from unique_toolkit.experimental.components.content_tree.functions import (
     translate_scope_ids_async,
     translate_scope_ids_batch,
 )
+from unique_toolkit.experimental.components.content_tree.fuzzy_index import (
+    FuzzyPathIndex,
+)
 from unique_toolkit.experimental.components.content_tree.schemas import (
     FuzzyMatch,
     MatchTarget,
@@ -22,6 +25,7 @@ from unique_toolkit.experimental.components.content_tree.service import ContentT
 __all__ = [
     "ContentTree",
     "FuzzyMatch",
+    "FuzzyPathIndex",
     "MatchTarget",
     "PathTrieNode",
     "build_trie_from_resolved_paths",
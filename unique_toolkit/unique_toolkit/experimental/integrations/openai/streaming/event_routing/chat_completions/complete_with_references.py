@@ -26,6 +26,7 @@ from unique_toolkit.experimental._internal.streaming import TextFlushed
 from unique_toolkit.experimental._internal.streaming.pattern_replacer import (
     NORMALIZATION_MAX_MATCH_LENGTH,
     NORMALIZATION_PATTERNS,
+    NORMALIZATION_TRIGGER_LITERALS,
     StreamingPatternReplacer,
     StreamingReplacerProtocol,
     filter_cited_sdk_references,
@@ -107,6 +108,7 @@ def _build_default_router() -> ChatCompletionStreamEventRouter:
         StreamingPatternReplacer(
             replacements=NORMALIZATION_PATTERNS,
             max_match_length=NORMALIZATION_MAX_MATCH_LENGTH,
+            trigger_literals=NORMALIZATION_TRIGGER_LITERALS,
         )
     ]
     return ChatCompletionStreamEventRouter(
@@ -25,6 +25,7 @@ from unique_toolkit.experimental._internal.streaming import (
 from unique_toolkit.experimental._internal.streaming.pattern_replacer import (
     NORMALIZATION_MAX_MATCH_LENGTH,
     NORMALIZATION_PATTERNS,
+    NORMALIZATION_TRIGGER_LITERALS,
     StreamingPatternReplacer,
     StreamingReplacerProtocol,
 )
@@ -139,6 +140,7 @@ def _build_default_router() -> ResponsesStreamEventRouter:
         StreamingPatternReplacer(
             replacements=NORMALIZATION_PATTERNS,
             max_match_length=NORMALIZATION_MAX_MATCH_LENGTH,
+            trigger_literals=NORMALIZATION_TRIGGER_LITERALS,
         )
     ]
     return ResponsesStreamEventRouter(
@@ -22,21 +22,24 @@ Attach by calling :meth:`register` once on the owned bus:
     persister = MessagePersistingSubscriber(settings)
     persister.register(orchestrator.bus)
 
-No internal per-stream state is required beyond the per-message chunk
-lookup because every event carries the ``message_id``/``chat_id`` it
-targets; this makes the subscriber safe to reuse across overlapping
-streams within the same ``UniqueSettings``.
+No internal per-stream state is required beyond the per-message
+citation/throttle bookkeeping because every event carries the
+``message_id``/``chat_id`` it targets; this makes the subscriber safe to
+reuse across overlapping streams within the same ``UniqueSettings``.
 """
 
 from __future__ import annotations
 
 import logging
+import time
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import TYPE_CHECKING, Any, cast
 
 import unique_sdk
 
 from unique_toolkit.experimental._internal.streaming.pattern_replacer import (
+    CitationTracker,
     filter_cited_sdk_references,
 )
 
@@ -68,6 +71,17 @@ def _now_utc_iso() -> str:
     )
 
 
+@dataclass(slots=True)
+class _DeltaState:
+    """Per-message bookkeeping for the :class:`TextUpdate` hot path."""
+
+    citations: CitationTracker
+    delta_count: int = 0
+    # ``time.monotonic()`` of the last successful write; ``None`` before the first.
+    last_persisted_at: float | None = None
+    last_persisted: tuple[str, str, frozenset[int]] | None = None
+
+
 class MessagePersistingSubscriber:
     """Translates text lifecycle events into ``unique_sdk.Message`` SDK writes.
 
@@ -88,6 +102,16 @@ class MessagePersistingSubscriber:
     pressure needs reducing. The final :class:`StreamEnded` write is
     always performed and is authoritative, so throttling deltas only ever
     coarsens intermediate UI updates — it never drops data.
+
+    ``persist_min_interval_ms`` adds a time-based coalescing window on top:
+    a delta that clears the count throttle is still skipped if the previous
+    write for the same message happened less than that many milliseconds
+    ago. The default (``0``) disables the window.
+
+    Cited references are tracked incrementally per message (only the text
+    appended since the last write is scanned for ``<sup>N</sup>``), and a
+    delta whose text and citations match the last successful write is not
+    re-sent.
     """
 
     def __init__(
@@ -95,13 +119,15 @@ class MessagePersistingSubscriber:
         settings: UniqueSettings,
         *,
         persist_every_n_deltas: int = 1,
+        persist_min_interval_ms: int = 0,
     ) -> None:
         self._settings = settings
         self._chunks_by_message: dict[str, list[ContentChunk]] = {}
         self._persist_every_n_deltas = max(1, persist_every_n_deltas)
-        # Per-message counter so overlapping streams on the same subscriber
-        # instance don't share a throttle boundary.
-        self._delta_counter_by_message: dict[str, int] = {}
+        self._persist_min_interval_s = max(0, persist_min_interval_ms) / 1000
+        # Per-message state so overlapping streams on the same subscriber
+        # instance don't share a throttle boundary or citation set.
+        self._delta_state_by_message: dict[str, _DeltaState] = {}
 
     def register(self, bus: StreamEventBus) -> None:
         """Subscribe this persister to the text lifecycle channels on ``bus``.
@@ -115,6 +141,7 @@ class MessagePersistingSubscriber:
 
     async def on_started(self, event: StreamStarted) -> None:
         self._chunks_by_message[event.message_id] = list(event.content_chunks)
+        self._delta_state_by_message.pop(event.message_id, None)
 
         # References are intentionally empty here: we only attach a
         # reference once the model has actually cited it (detected via
@@ -130,14 +157,32 @@ class MessagePersistingSubscriber:
             startedStreamingAt=cast(Any, _now_utc_iso()),
         )
 
+    def _get_delta_state(self, message_id: str) -> _DeltaState:
+        state = self._delta_state_by_message.get(message_id)
+        if state is None:
+            chunks = self._chunks_by_message.get(message_id, [])
+            state = _DeltaState(citations=CitationTracker(chunks))
+            self._delta_state_by_message[message_id] = state
+        return state
+
     async def on_text_delta(self, event: TextUpdate) -> None:
-        chunks = self._chunks_by_message.get(event.message_id, [])
+        state = self._get_delta_state(event.message_id)
 
-        # Apply the per-subscriber throttle. We only skip intermediate
+        # Apply the per-subscriber throttles. We only skip intermediate
         # writes — the authoritative final state ships on :class:`StreamEnded`.
-        count = self._delta_counter_by_message.get(event.message_id, 0) + 1
-        self._delta_counter_by_message[event.message_id] = count
-        if count % self._persist_every_n_deltas != 0:
+        state.delta_count += 1
+        if state.delta_count % self._persist_every_n_deltas != 0:
+            return
+        now = time.monotonic()
+        if (
+            state.last_persisted_at is not None
+            and now - state.last_persisted_at < self._persist_min_interval_s
+        ):
+            return
+
+        state.citations.update(event.full_text)
+        snapshot = (event.full_text, event.original_text, state.citations.cited)
+        if snapshot == state.last_persisted:
             return
 
         # Incremental writes are the hot path: a transient SDK failure here
@@ -152,7 +197,7 @@ class MessagePersistingSubscriber:
                 company_id=self._settings.context.auth.company_id.get_secret_value(),
                 text=event.full_text or None,
                 originalText=event.original_text or None,
-                references=filter_cited_sdk_references(chunks, event.full_text),
+                references=state.citations.references(),
             )
         except Exception as exc:
             _LOGGER.warning(
@@ -161,10 +206,13 @@ class MessagePersistingSubscriber:
                 event.message_id,
                 exc,
             )
+            return
+        state.last_persisted_at = now
+        state.last_persisted = snapshot
 
     async def on_ended(self, event: StreamEnded) -> None:
         chunks = self._chunks_by_message.pop(event.message_id, [])
-        self._delta_counter_by_message.pop(event.message_id, None)
+        self._delta_state_by_message.pop(event.message_id, None)
         now_iso = _now_utc_iso()
 
         # Concatenate any appendices (e.g. a code-interpreter code block)
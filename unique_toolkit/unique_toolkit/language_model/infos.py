@@ -1,3 +1,4 @@
+import copy
 import json
 import logging
 import os
@@ -152,6 +153,9 @@ class LanguageModelName(StrEnum):
     VERTEX_CLAUDE_FABLE_5 = "litellm:vertex-claude-fable-5"
 
 
+_LANGUAGE_MODEL_NAMES: frozenset[str] = frozenset(LanguageModelName)
+
+
 class EncoderName(StrEnum):
     O200K_BASE = "o200k_base"
     CL100K_BASE = "cl100k_base"
@@ -574,7 +578,7 @@ class LanguageModelInfo(BaseModel):
 
     @classmethod
     def _construct_from_name(cls, model_name: LanguageModelName | str) -> Self:
-        if model_name in [name.value for name in LanguageModelName]:
+        if model_name in _LANGUAGE_MODEL_NAMES:
             model_name = LanguageModelName(model_name)
 
         # Check environment variable first - env definitions take precedence
@@ -594,6 +598,41 @@ class LanguageModelInfo(BaseModel):
                     exc_info=True,
                 )
 
+        return cls._builtin_from_name(model_name)._copy()
+
+    def _copy(self) -> Self:
+        """Copy that shares no mutable state with ``self``.
+
+        Much cheaper than ``model_copy(deep=True)``: only the mutable fields are
+        copied, all other values are immutable and can be shared. A new mutable
+        field must be added here; the model info tests check every field.
+        """
+        copied = self.model_copy()
+        copied.__dict__.update(
+            token_limits=self.token_limits.model_copy(),
+            capabilities=list(self.capabilities),
+            temperature_bounds=(
+                self.temperature_bounds.model_copy()
+                if self.temperature_bounds is not None
+                else None
+            ),
+            default_options=copy.deepcopy(self.default_options),
+            supported_reasoning_efforts=(
+                list(self.supported_reasoning_efforts)
+                if self.supported_reasoning_efforts is not None
+                else None
+            ),
+        )
+        return copied
+
+    @classmethod
+    @lru_cache(maxsize=1024)
+    def _builtin_from_name(cls, model_name: LanguageModelName | str) -> Self:
+        """
+        The built-in definition of ``model_name``, built once per model.
+
+        The returned instance is shared: never mutate it, hand out ``_copy()``.
+        """
         match model_name:
             case LanguageModelName.AZURE_GPT_35_TURBO_0125:
                 return cls(
@@ -25,6 +25,34 @@ _http_requests_in_progress = Gauge(
     multiprocess_mode="livesum",
 )
 
+# Admission control of webhook events (unique_toolkit.app.event_queue). The
+# webhook request itself returns immediately, so its latency above says nothing
+# about how long events wait for a worker; these do.
+event_queue_depth = Gauge(
+    "python_event_queue_depth",
+    "Webhook events waiting for a worker",
+    registry=REGISTRY,
+    multiprocess_mode="livesum",
+)
+event_queue_in_progress = Gauge(
+    "python_event_queue_in_progress",
+    "Webhook events being handled",
+    registry=REGISTRY,
+    multiprocess_mode="livesum",
+)
+event_queue_wait_seconds = Histogram(
+    "python_event_queue_wait_seconds",
+    "Time a webhook event waited for a worker",
+    registry=REGISTRY,
+    buckets=(0.01, 0.05, 0.1, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300),
+)
+event_queue_rejections_total = Counter(
+    "python_event_queue_rejections_total",
+    "Webhook events rejected by admission control",
+    ["reason"],
+    registry=REGISTRY,
+)
+
 # Created lazily on first MetricsMiddleware construction so services can choose the
 # bucket layout. Prometheus allows a metric name to be registered only once per
 # registry, so the buckets passed to the first middleware win for the process.
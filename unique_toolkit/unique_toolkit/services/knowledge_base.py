@@ -5,7 +5,7 @@ import logging
 import mimetypes
 import warnings
 from pathlib import Path, PurePath
-from typing import TYPE_CHECKING, Any, Callable, Self, overload
+from typing import TYPE_CHECKING, Any, BinaryIO, Callable, Self, overload
 
 import humps
 import unique_sdk
@@ -22,15 +22,19 @@ from unique_toolkit.content.constants import (
     DEFAULT_SEARCH_LANGUAGE,
 )
 from unique_toolkit.content.functions import (
+    DEFAULT_TRANSFER_CHUNK_SIZE,
     delete_content,
     delete_content_async,
     download_content_to_bytes,
     download_content_to_bytes_async,
     download_content_to_file_by_id,
+    download_content_to_path,
+    download_content_to_path_async,
     get_content_info,
     get_content_info_async,
     get_folder_info,
     get_folder_info_async,
+    iter_content_by_id_async,
     search_content_chunks,
     search_content_chunks_async,
     search_contents,
@@ -54,6 +58,8 @@ from unique_toolkit.content.schemas import (
 from unique_toolkit.content.smart_rules import Operator, Statement
 
 if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
     from unique_toolkit.app.unique_settings import UniqueContext
 
 _LOGGER = logging.getLogger(f"toolkit.knowledge_base.{__name__}")
@@ -397,7 +403,7 @@ class KnowledgeBaseService:
 
     def upload_content_from_bytes(
         self,
-        content: bytes,
+        content: bytes | BinaryIO,
         *,
         content_name: str,
         mime_type: str,
@@ -410,7 +416,7 @@ class KnowledgeBaseService:
         Uploads content to the knowledge base.
 
         Args:
-            content (bytes): The content to upload.
+            content (bytes | BinaryIO): The content to upload. File-like objects are streamed.
             content_name (str): The name of the content.
             mime_type (str): The MIME type of the content.
             scope_id (str | None): The scope ID. Defaults to None.
@@ -437,7 +443,7 @@ class KnowledgeBaseService:
 
     async def upload_content_from_bytes_async(
         self,
-        content: bytes,
+        content: bytes | BinaryIO,
         *,
         content_name: str,
         mime_type: str,
@@ -450,7 +456,7 @@ class KnowledgeBaseService:
         Uploads content to the knowledge base.
 
         Args:
-            content (bytes): The content to upload.
+            content (bytes | BinaryIO): The content to upload. File-like objects are streamed.
             content_name (str): The name of the content.
             mime_type (str): The MIME type of the content.
             scope_id (str | None): The scope ID. Defaults to None.
@@ -599,6 +605,96 @@ class KnowledgeBaseService:
             chat_id=None,
         )
 
+    def download_content_to_path(
+        self,
+        *,
+        content_id: str,
+        path: str | Path,
+        chunk_size: int = DEFAULT_TRANSFER_CHUNK_SIZE,
+    ) -> Path:
+        """
+        Streams content to a file without holding it in memory.
+
+        Args:
+            content_id (str): The id of the uploaded content.
+            path (str | Path): The file to write. Missing parent directories are created.
+            chunk_size (int): The number of bytes read and written at a time.
+
+        Returns:
+            Path: The path to the downloaded file.
+
+        Raises:
+            Exception: If the download fails.
+        """
+
+        return download_content_to_path(
+            user_id=self._user_id,
+            company_id=self._company_id,
+            content_id=content_id,
+            path=path,
+            chat_id=None,
+            chunk_size=chunk_size,
+        )
+
+    async def download_content_to_path_async(
+        self,
+        *,
+        content_id: str,
+        path: str | Path,
+        chunk_size: int = DEFAULT_TRANSFER_CHUNK_SIZE,
+    ) -> Path:
+        """
+        Asynchronously streams content to a file without holding it in memory.
+
+        Args:
+            content_id (str): The id of the uploaded content.
+            path (str | Path): The file to write. Missing parent directories are created.
+            chunk_size (int): The number of bytes read and written at a time.
+
+        Returns:
+            Path: The path to the downloaded file.
+
+        Raises:
+            httpx.HTTPStatusError: If the download fails.
+        """
+
+        return await download_content_to_path_async(
+            user_id=self._user_id,
+            company_id=self._company_id,
+            content_id=content_id,
+            path=path,
+            chat_id=None,
+            chunk_size=chunk_size,
+        )
+
+    def iter_content_async(
+        self,
+        *,
+        content_id: str,
+        chunk_size: int = DEFAULT_TRANSFER_CHUNK_SIZE,
+    ) -> AsyncIterator[bytes]:
+        """
+        Asynchronously streams content in chunks of at most ``chunk_size`` bytes.
+
+        Args:
+            content_id (str): The id of the uploaded content.
+            chunk_size (int): The maximum number of bytes per yielded chunk.
+
+        Returns:
+            AsyncIterator[bytes]: The content chunks.
+
+        Raises:
+            httpx.HTTPStatusError: If the download fails.
+        """
+
+        return iter_content_by_id_async(
+            user_id=self._user_id,
+            company_id=self._company_id,
+            content_id=content_id,
+            chat_id=None,
+            chunk_size=chunk_size,
+        )
+
     def batch_file_upload(
         self,
         *,
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import threading
 from pathlib import Path
 from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
@@ -328,3 +329,138 @@ def test_path_traversal_via_subfolder_is_rejected(
     assert exc.value.code == 1
     download.assert_not_called()
     assert not (tmp_path / "loot.txt").exists()
+
+
+@patch("uqadm.kb.download.download_content")
+@patch("uqadm.kb.download.Folder")
+@patch("uqadm.kb.download.Content")
+def test_resume_skips_files_already_downloaded(
+    content: MagicMock,
+    folder: MagicMock,
+    download: MagicMock,
+    tmp_path: Path,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    # A local file with the remote byte size is complete; a truncated one is
+    # fetched again.
+    folder.resolve_scope_id_from_folder_path.return_value = "scope1"
+    content.get_infos.return_value = {
+        "contentInfos": [
+            {"id": "cont_done", "key": "done.txt", "byteSize": 5},
+            {"id": "cont_partial", "key": "partial.txt", "byteSize": 10},
+        ],
+        "totalCount": 2,
+    }
+    out_dir = tmp_path / "out"
+    out_dir.mkdir()
+    (out_dir / "done.txt").write_text("12345")
+    (out_dir / "partial.txt").write_text("123")
+
+    cmd_download(
+        _cfg(),
+        local_dir=out_dir,
+        folder_path="/X",
+        scope_id=None,
+        recursive=False,
+        dry_run=False,
+        resume=True,
+    )
+
+    download.assert_called_once()
+    assert download.call_args.kwargs["content_id"] == "cont_partial"
+    out = capsys.readouterr().out
+    assert "skipped: done.txt (already downloaded)" in out
+    assert "Done: 1 downloaded, 1 skipped, 0 failed." in out
+    assert "files/s" in out
+
+
+@patch("uqadm.kb.download.download_content")
+@patch("uqadm.kb.download.Folder")
+@patch("uqadm.kb.download.Content")
+def test_without_resume_existing_files_are_downloaded_again(
+    content: MagicMock,
+    folder: MagicMock,
+    download: MagicMock,
+    tmp_path: Path,
+) -> None:
+    folder.resolve_scope_id_from_folder_path.return_value = "scope1"
+    content.get_infos.return_value = {
+        "contentInfos": [{"id": "cont_1", "key": "a.txt", "byteSize": 5}],
+        "totalCount": 1,
+    }
+    out_dir = tmp_path / "out"
+    out_dir.mkdir()
+    (out_dir / "a.txt").write_text("12345")
+
+    cmd_download(
+        _cfg(),
+        local_dir=out_dir,
+        folder_path="/X",
+        scope_id=None,
+        recursive=False,
+        dry_run=False,
+    )
+
+    download.assert_called_once()
+
+
+@patch("uqadm.kb.download.download_content")
+@patch("uqadm.kb.download.Folder")
+@patch("uqadm.kb.download.Content")
+def test_recursive_lists_sibling_folders_concurrently(
+    content: MagicMock,
+    folder: MagicMock,
+    download: MagicMock,
+    tmp_path: Path,
+) -> None:
+    # Both sibling listings must be in flight at the same time to pass the
+    # barrier; a sequential walk would time out on it.
+    folder.resolve_scope_id_from_folder_path.return_value = "scope1"
+    siblings = threading.Barrier(2, timeout=5)
+
+    def content_side_effect(
+        user_id: str,
+        company_id: str,
+        **kwargs: object,
+    ) -> dict[str, object]:
+        parent_id = kwargs.get("parentId")
+        if parent_id in ("scope_a", "scope_b"):
+            siblings.wait()
+            return {
+                "contentInfos": [{"id": f"cont_{parent_id}", "key": "f.txt"}],
+                "totalCount": 1,
+            }
+        return _no_content()
+
+    content.get_infos.side_effect = content_side_effect
+
+    def folder_side_effect(
+        user_id: str,
+        company_id: str,
+        **kwargs: object,
+    ) -> dict[str, object]:
+        if kwargs.get("parentId") == "scope1":
+            return {
+                "folderInfos": [
+                    {"id": "scope_a", "name": "a"},
+                    {"id": "scope_b", "name": "b"},
+                ],
+                "totalCount": 2,
+            }
+        return _no_folders()
+
+    folder.get_infos.side_effect = folder_side_effect
+    out_dir = tmp_path / "out"
+
+    cmd_download(
+        _cfg(),
+        local_dir=out_dir,
+        folder_path="/X",
+        scope_id=None,
+        recursive=True,
+        dry_run=False,
+        workers=2,
+    )
+
+    paths = {call.kwargs["target_path"] for call in download.call_args_list}
+    assert paths == {out_dir / "a" / "f.txt", out_dir / "b" / "f.txt"}
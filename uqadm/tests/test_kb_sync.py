@@ -13,7 +13,7 @@ from uqadm.kb.sync import cmd_sync
 
 
 def _cfg() -> SimpleNamespace:
-    return SimpleNamespace(user_id="u1", company_id="c1")
+    return SimpleNamespace(user_id="u1", company_id="c1", api_base="https://api")
 
 
 def _no_remote() -> dict[str, object]:
@@ -166,6 +166,36 @@ def test_recursive_mirrors_subdirs(
     assert resolved_paths == {"/X", "/X/sub"}
 
 
+@patch("uqadm.kb.sync.upload_file")
+@patch("uqadm.kb.sync.Content")
+@patch("uqadm.kb.sync.Folder")
+def test_skips_manifest_and_its_partial_write(
+    folder: MagicMock,
+    content: MagicMock,
+    upload: MagicMock,
+    tmp_path: Path,
+) -> None:
+    # A sync interrupted while saving the manifest leaves its ``.tmp`` next to
+    # it; neither file is content to upload.
+    (tmp_path / "a.txt").write_text("x", encoding="utf-8")
+    (tmp_path / ".uqadm-sync.json").write_text("{}", encoding="utf-8")
+    (tmp_path / ".uqadm-sync.json.tmp").write_text("{", encoding="utf-8")
+    folder.resolve_scope_id_from_folder_path_with_create.return_value = "scope1"
+    content.get_infos.return_value = _no_remote()
+
+    cmd_sync(
+        _cfg(),
+        local_dir=tmp_path,
+        folder_path="/X",
+        scope_id=None,
+        recursive=False,
+        dry_run=False,
+    )
+
+    uploaded = [call.args[3] for call in upload.call_args_list]
+    assert uploaded == ["a.txt"]
+
+
 @patch("uqadm.kb.sync.upload_file")
 @patch("uqadm.kb.sync.Content")
 @patch("uqadm.kb.sync.Folder")
@@ -552,3 +582,139 @@ def test_dry_run_shows_no_version_label(
 
     upload.assert_not_called()
     assert "[dry-run] replaced: a.txt (no-version)" in capsys.readouterr().out
+
+
+def _remote(key: str, byte_size: int) -> dict[str, object]:
+    return {"contentInfos": [{"key": key, "byteSize": byte_size}], "totalCount": 1}
+
+
+@patch("uqadm.kb.sync.upload_file")
+@patch("uqadm.kb.sync.Content")
+@patch("uqadm.kb.sync.Folder")
+def test_second_sync_skips_unchanged_file(
+    folder: MagicMock,
+    content: MagicMock,
+    upload: MagicMock,
+    tmp_path: Path,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    # The first run records the file in the manifest; once the remote file has
+    # the uploaded size, the next run skips it instead of re-uploading.
+    (tmp_path / "a.txt").write_text("hi", encoding="utf-8")
+    folder.resolve_scope_id_from_folder_path_with_create.return_value = "scope1"
+    content.get_infos.return_value = _no_remote()
+    kwargs = dict(folder_path="/X", scope_id=None, recursive=False, dry_run=False)
+
+    cmd_sync(_cfg(), local_dir=tmp_path, **kwargs)
+    content.get_infos.return_value = _remote("a.txt", 2)
+    cmd_sync(_cfg(), local_dir=tmp_path, **kwargs)
+
+    upload.assert_called_once()
+    assert (tmp_path / ".uqadm-sync.json").is_file()
+    assert "Done: 0 new, 0 replaced, 1 unchanged, 0 failed." in capsys.readouterr().out
+
+
+@patch("uqadm.kb.sync.upload_file")
+@patch("uqadm.kb.sync.Content")
+@patch("uqadm.kb.sync.Folder")
+def test_changed_file_is_replaced(
+    folder: MagicMock,
+    content: MagicMock,
+    upload: MagicMock,
+    tmp_path: Path,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    # Same size, different content: the hash differs, so the file is uploaded.
+    (tmp_path / "a.txt").write_text("hi", encoding="utf-8")
+    folder.resolve_scope_id_from_folder_path.return_value = "scope1"
+    folder.resolve_scope_id_from_folder_path_with_create.return_value = "scope1"
+    content.get_infos.return_value = _no_remote()
+    kwargs = dict(folder_path="/X", scope_id=None, recursive=False)
+    cmd_sync(_cfg(), local_dir=tmp_path, dry_run=False, **kwargs)
+    (tmp_path / "a.txt").write_text("ho", encoding="utf-8")
+    content.get_infos.return_value = _remote("a.txt", 2)
+    capsys.readouterr()
+
+    cmd_sync(_cfg(), local_dir=tmp_path, dry_run=True, **kwargs)
+
+    assert "[dry-run] replaced: a.txt (versioned)" in capsys.readouterr().out
+    upload.assert_called_once()
+
+
+@patch("uqadm.kb.sync.upload_file")
+@patch("uqadm.kb.sync.Content")
+@patch("uqadm.kb.sync.Folder")
+def test_force_uploads_unchanged_file(
+    folder: MagicMock,
+    content: MagicMock,
+    upload: MagicMock,
+    tmp_path: Path,
+) -> None:
+    (tmp_path / "a.txt").write_text("hi", encoding="utf-8")
+    folder.resolve_scope_id_from_folder_path_with_create.return_value = "scope1"
+    content.get_infos.return_value = _no_remote()
+    kwargs = dict(folder_path="/X", scope_id=None, recursive=False, dry_run=False)
+    cmd_sync(_cfg(), local_dir=tmp_path, **kwargs)
+    content.get_infos.return_value = _remote("a.txt", 2)
+
+    cmd_sync(_cfg(), local_dir=tmp_path, force=True, **kwargs)
+
+    assert upload.call_count == 2
+
+
+@patch("uqadm.kb.sync.upload_file")
+@patch("uqadm.kb.sync.Content")
+@patch("uqadm.kb.sync.Folder")
+def test_remote_size_change_forces_reupload(
+    folder: MagicMock,
+    content: MagicMock,
+    upload: MagicMock,
+    tmp_path: Path,
+) -> None:
+    # The remote file was replaced by someone else: its size no longer matches
+    # the manifest, so the local file is uploaded again.
+    (tmp_path / "a.txt").write_text("hi", encoding="utf-8")
+    folder.resolve_scope_id_from_folder_path_with_create.return_value = "scope1"
+    content.get_infos.return_value = _no_remote()
+    kwargs = dict(folder_path="/X", scope_id=None, recursive=False, dry_run=False)
+    cmd_sync(_cfg(), local_dir=tmp_path, **kwargs)
+    content.get_infos.return_value = _remote("a.txt", 99)
+
+    cmd_sync(_cfg(), local_dir=tmp_path, **kwargs)
+
+    assert upload.call_count == 2
+
+
+@patch("uqadm.kb.sync.upload_file")
+@patch("uqadm.kb.sync.Content")
+@patch("uqadm.kb.sync.Folder")
+def test_recursive_resolves_parents_before_children(
+    folder: MagicMock,
+    content: MagicMock,
+    upload: MagicMock,
+    tmp_path: Path,
+) -> None:
+    # Sibling folders share a parent without files; it is created one level
+    # earlier so the siblings do not race to create it.
+    for name in ("b", "c"):
+        (tmp_path / "a" / name).mkdir(parents=True)
+        (tmp_path / "a" / name / "f.txt").write_text("x", encoding="utf-8")
+    folder.resolve_scope_id_from_folder_path_with_create.return_value = "scope1"
+    content.get_infos.return_value = _no_remote()
+
+    cmd_sync(
+        _cfg(),
+        local_dir=tmp_path,
+        folder_path="/X",
+        scope_id=None,
+        recursive=True,
+        dry_run=False,
+    )
+
+    resolved = [
+        call.kwargs["folder_path"]
+        for call in folder.resolve_scope_id_from_folder_path_with_create.call_args_list
+    ]
+    assert resolved[:2] == ["/X", "/X/a"]
+    assert sorted(resolved[2:]) == ["/X/a/b", "/X/a/c"]
+    assert upload.call_count == 2
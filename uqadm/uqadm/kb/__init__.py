@@ -9,6 +9,7 @@ import typer
 
 from uqadm.core.env import MissingSlotEnvFileError, config_for_slot
 from uqadm.core.slot import MissingDefaultSlotError, resolve_slot
+from uqadm.kb._tree import DEFAULT_WORKERS
 from uqadm.kb.access import cmd_access_grant
 from uqadm.kb.download import cmd_download
 from uqadm.kb.ingestion import cmd_ingestion_set
@@ -178,15 +179,33 @@ def kb_sync(
             help="Upload without archiving prior blobs.",
         ),
     ] = False,
+    force: Annotated[
+        bool,
+        typer.Option(
+            "--force",
+            help="Upload every file, including files unchanged since the last sync.",
+        ),
+    ] = False,
+    workers: Annotated[
+        int,
+        typer.Option(
+            "--workers",
+            min=1,
+            help="Number of folders resolved and files uploaded in parallel.",
+        ),
+    ] = DEFAULT_WORKERS,
 ) -> None:
     """Upload the contents of LOCAL_DIR into a knowledge-base folder.
 
     Files already present (matched by filename) are replaced; new files are
-    created. Files present in the target scope but missing locally are left
-    untouched; ``sync`` never deletes remote files. Requires exactly one of
-    ``--folder-path`` or ``--scope-id`` to name the target scope. Without
-    ``--recursive`` only top-level files are synced; with it, subdirectories are
-    recreated as child folders under the target.
+    created. Files unchanged since the last sync are skipped: the content hash
+    of every uploaded file is recorded in ``LOCAL_DIR/.uqadm-sync.json`` and a
+    file is unchanged while its hash matches and the remote file still has the
+    uploaded size. ``--force`` uploads everything. Files present in the target
+    scope but missing locally are left untouched; ``sync`` never deletes remote
+    files. Requires exactly one of ``--folder-path`` or ``--scope-id`` to name
+    the target scope. Without ``--recursive`` only top-level files are synced;
+    with it, subdirectories are recreated as child folders under the target.
 
     By default, replaced files archive prior blobs (restorable via
     ``unique-cli versions`` / ``restore-version``). Pass ``--no-version`` to
@@ -199,6 +218,7 @@ def kb_sync(
       uqadm kb sync ./docs --folder-path /Dept/HR -r --dry-run
       uqadm kb sync ./docs --scope-id scope_abc -r --slot qa
       uqadm kb sync ./docs --scope-id scope_abc --no-version
+      uqadm kb sync ./docs --folder-path /Dept/HR -r --force --workers 16
     """
     resolved_slot = _resolve(slot)
     cfg = _load_cfg(resolved_slot, _get_cwd(ctx))
@@ -210,6 +230,8 @@ def kb_sync(
         recursive=recursive,
         dry_run=dry_run,
         versioning=not no_version,
+        force=force,
+        workers=workers,
     )
 
 
@@ -256,18 +278,36 @@ def kb_download(
             help="Show planned downloads without writing anything.",
         ),
     ] = False,
+    resume: Annotated[
+        bool,
+        typer.Option(
+            "--resume",
+            help="Skip files that already exist locally with the remote byte size.",
+        ),
+    ] = False,
+    workers: Annotated[
+        int,
+        typer.Option(
+            "--workers",
+            min=1,
+            help="Number of folders listed and files downloaded in parallel.",
+        ),
+    ] = DEFAULT_WORKERS,
 ) -> None:
     """Download files from a knowledge-base folder into LOCAL_DIR.
 
     Requires exactly one of ``--folder-path`` or ``--scope-id`` to name the
     source scope. Without ``--recursive`` only top-level files are downloaded;
     with it, subfolders are recreated as child directories under LOCAL_DIR.
+    Folders are listed and files downloaded by a pool of ``--workers`` threads;
+    ``--resume`` skips files a previous run already downloaded completely.
 
     Examples:
 
       uqadm kb download ./out --folder-path /Dept/HR
       uqadm kb download ./out --folder-path /Dept/HR -r --dry-run
       uqadm kb download ./out --scope-id scope_abc -r --slot qa
+      uqadm kb download ./out --scope-id scope_abc -r --resume --workers 16
     """
     resolved_slot = _resolve(slot)
     cfg = _load_cfg(resolved_slot, _get_cwd(ctx))
@@ -278,6 +318,8 @@ def kb_download(
         scope_id=scope_id,
         recursive=recursive,
         dry_run=dry_run,
+        resume=resume,
+        workers=workers,
     )
 
 
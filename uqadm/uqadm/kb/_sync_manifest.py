@@ -0,0 +1,103 @@
+"""Local manifest of the files ``kb sync`` uploaded, used to skip unchanged files."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+MANIFEST_FILENAME = ".uqadm-sync.json"
+_MANIFEST_VERSION = 1
+_HASH_CHUNK_SIZE = 1024 * 1024
+
+
+@dataclass(frozen=True)
+class ManifestEntry:
+    """What a local file looked like when it was last uploaded."""
+
+    sha256: str
+    size: int
+    mtime_ns: int
+
+
+def file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as f:
+        while chunk := f.read(_HASH_CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class SyncManifest:
+    """Manifest stored as ``.uqadm-sync.json`` in the synced local folder.
+
+    Entries are keyed by the remote file path (target folder path plus key) and
+    grouped per target, i.e. API base and company, so syncing the same folder
+    to several environments keeps separate records. The manifest file itself
+    is never synced.
+    """
+
+    def __init__(self, path: Path, target: str) -> None:
+        self.path = path
+        self._target = target
+        self._targets: dict[str, dict[str, dict[str, object]]] = {}
+        self._dirty = False
+
+    @classmethod
+    def load(cls, local_dir: Path, target: str) -> SyncManifest:
+        """Load the manifest of ``local_dir``; a missing or corrupt file is empty."""
+        manifest = cls(local_dir / MANIFEST_FILENAME, target)
+        try:
+            raw = json.loads(manifest.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return manifest
+        if isinstance(raw, dict) and raw.get("version") == _MANIFEST_VERSION:
+            targets = raw.get("targets")
+            if isinstance(targets, dict):
+                manifest._targets = targets
+        return manifest
+
+    def get(self, remote_path: str) -> ManifestEntry | None:
+        raw = self._targets.get(self._target, {}).get(remote_path)
+        if raw is None:
+            return None
+        try:
+            return ManifestEntry(**raw)  # pyright: ignore[reportArgumentType]
+        except TypeError:
+            return None
+
+    def set(self, remote_path: str, entry: ManifestEntry) -> None:
+        self._targets.setdefault(self._target, {})[remote_path] = asdict(entry)
+        self._dirty = True
+
+    def local_entry(self, remote_path: str, path: Path) -> ManifestEntry:
+        """Describe ``path``, reusing the recorded hash if size and mtime match."""
+        stat = path.stat()
+        recorded = self.get(remote_path)
+        if (
+            recorded is not None
+            and recorded.size == stat.st_size
+            and recorded.mtime_ns == stat.st_mtime_ns
+        ):
+            return recorded
+        return ManifestEntry(
+            sha256=file_sha256(path), size=stat.st_size, mtime_ns=stat.st_mtime_ns
+        )
+
+    def save(self) -> None:
+        """Write the manifest atomically if anything was recorded."""
+        if not self._dirty:
+            return
+        tmp = self.path.with_name(f"{self.path.name}.tmp")
+        tmp.write_text(
+            json.dumps(
+                {"version": _MANIFEST_VERSION, "targets": self._targets},
+                indent=2,
+                sort_keys=True,
+            ),
+            encoding="utf-8",
+        )
+        os.replace(tmp, self.path)
+        self._dirty = False
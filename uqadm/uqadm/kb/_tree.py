@@ -0,0 +1,69 @@
+"""Concurrent walk of a knowledge-base folder subtree."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+
+from unique_sdk import Content, Folder
+
+from uqadm.kb._paths import join_path_segments
+
+DEFAULT_WORKERS = 8
+
+
+@dataclass(frozen=True)
+class ScopeListing:
+    """Files and child folders of one scope in the walked subtree."""
+
+    scope_id: str
+    rel_path: str
+    contents: list[Content.ContentInfo]
+    folders: list[Folder.FolderInfo]
+
+
+def walk_subtree(
+    root_scope_id: str,
+    *,
+    list_contents: Callable[[str], list[Content.ContentInfo]],
+    list_folders: Callable[[str], list[Folder.FolderInfo]],
+    recursive: bool = True,
+    workers: int = DEFAULT_WORKERS,
+) -> Iterator[ScopeListing]:
+    """Yield the listing of every scope under ``root_scope_id``, root included.
+
+    Scopes are listed by a pool of ``workers`` threads: the children of a scope
+    are queued as soon as its listing arrives, so sibling scopes are listed
+    concurrently instead of one after the other. Listings are yielded in
+    completion order, ``rel_path`` being the scope's path relative to the root
+    (``""`` for the root itself). Without ``recursive`` only the root is listed
+    and its ``folders`` are left empty. A failing listing is re-raised and the
+    scopes not yet listed are cancelled.
+    """
+
+    def list_scope(scope_id: str, rel_path: str) -> ScopeListing:
+        contents = list_contents(scope_id)
+        folders = list_folders(scope_id) if recursive else []
+        return ScopeListing(scope_id, rel_path, contents, folders)
+
+    pool = ThreadPoolExecutor(max_workers=workers)
+    try:
+        pending: set[Future[ScopeListing]] = {
+            pool.submit(list_scope, root_scope_id, "")
+        }
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                listing = future.result()
+                for folder_info in listing.folders:
+                    pending.add(
+                        pool.submit(
+                            list_scope,
+                            folder_info["id"],
+                            join_path_segments(listing.rel_path, folder_info["name"]),
+                        )
+                    )
+                yield listing
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
@@ -3,7 +3,8 @@
 from __future__ import annotations
 
 import sys
-from collections import deque
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from pathlib import Path
 
 import typer
@@ -12,7 +13,7 @@ from unique_sdk.cli.config import Config
 from unique_sdk.utils.file_io import download_content
 
 from uqadm.core.auth_debug import echo_credential_debug_if_auth_failure
-from uqadm.kb._paths import join_path_segments
+from uqadm.kb._tree import DEFAULT_WORKERS, walk_subtree
 
 _PAGE_SIZE = 100
 
@@ -75,6 +76,27 @@ def _safe_local_path(local_dir: Path, *parts: str) -> Path | None:
     return None
 
 
+def _file_size(path: Path) -> int:
+    try:
+        return path.stat().st_size
+    except OSError:
+        return 0
+
+
+def _is_downloaded(local_path: Path, info: Content.ContentInfo) -> bool:
+    """Whether ``local_path`` already holds a file of the remote byte size.
+
+    Content infos carry no content hash, so the size is the only cheap signal
+    that an earlier (possibly interrupted) download of this file completed.
+    """
+    remote_size = info.get("byteSize")
+    return (
+        remote_size is not None
+        and local_path.is_file()
+        and local_path.stat().st_size == remote_size
+    )
+
+
 def cmd_download(
     cfg: Config,
     *,
@@ -83,6 +105,8 @@ def cmd_download(
     scope_id: str | None,
     recursive: bool,
     dry_run: bool,
+    resume: bool = False,
+    workers: int = DEFAULT_WORKERS,
 ) -> None:
     if bool(folder_path) == bool(scope_id):
         typer.echo("Specify exactly one of --folder-path or --scope-id.", err=True)
@@ -121,60 +145,90 @@ def cmd_download(
     if not dry_run:
         local_dir.mkdir(parents=True, exist_ok=True)
 
-    queue: deque[tuple[str, str]] = deque([(base_scope_id, "")])
-    counts = {"downloaded": 0, "failed": 0}
-
-    while queue:
-        current_scope_id, rel_subdir = queue.popleft()
-
-        for info in _list_content_infos(cfg, current_scope_id):
-            key = info["key"]
-            content_id = info["id"]
-            display = key if rel_subdir == "" else f"{rel_subdir}/{key}"
-            parts = (rel_subdir, key) if rel_subdir else (key,)
-            local_path = _safe_local_path(local_dir, *parts)
-            if local_path is None:
-                typer.echo(
-                    f"failed: {display}: refusing to write outside {local_dir}",
-                    err=True,
-                )
-                counts["failed"] += 1
-                continue
-
-            if dry_run:
-                typer.echo(f"[dry-run] downloaded: {display}")
-                counts["downloaded"] += 1
-                continue
+    counts = {"downloaded": 0, "skipped": 0, "failed": 0}
+    downloaded_bytes = 0
+    started = time.monotonic()
+    downloads: dict[Future[Path], tuple[str, Path]] = {}
 
-            try:
-                _ = download_content(
+    def report(future: Future[Path]) -> None:
+        nonlocal downloaded_bytes
+        display, local_path = downloads.pop(future)
+        try:
+            future.result()
+        except Exception as exc:
+            typer.echo(f"failed: {display}: {exc}", err=True)
+            echo_credential_debug_if_auth_failure(cfg, exc, label="kb download")
+            counts["failed"] += 1
+            return
+        typer.echo(f"downloaded: {display}")
+        counts["downloaded"] += 1
+        downloaded_bytes += _file_size(local_path)
+
+    # Listing and downloading use separate pools so queued downloads never
+    # hold up the walk that discovers more of them.
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for listing in walk_subtree(
+            base_scope_id,
+            list_contents=lambda scope: _list_content_infos(cfg, scope),
+            list_folders=lambda scope: _list_child_folders(cfg, scope),
+            recursive=recursive,
+            workers=workers,
+        ):
+            rel_subdir = listing.rel_path
+            for info in listing.contents:
+                key = info["key"]
+                content_id = info["id"]
+                display = key if rel_subdir == "" else f"{rel_subdir}/{key}"
+                parts = (rel_subdir, key) if rel_subdir else (key,)
+                local_path = _safe_local_path(local_dir, *parts)
+                if local_path is None:
+                    typer.echo(
+                        f"failed: {display}: refusing to write outside {local_dir}",
+                        err=True,
+                    )
+                    counts["failed"] += 1
+                    continue
+
+                if resume and _is_downloaded(local_path, info):
+                    typer.echo(f"skipped: {display} (already downloaded)")
+                    counts["skipped"] += 1
+                    continue
+
+                if dry_run:
+                    typer.echo(f"[dry-run] downloaded: {display}")
+                    counts["downloaded"] += 1
+                    continue
+
+                future = pool.submit(
+                    download_content,
                     companyId=cfg.company_id,
                     userId=cfg.user_id,
                     content_id=content_id,
                     filename=key,
                     target_path=local_path,
                 )
-            except Exception as exc:
-                typer.echo(f"failed: {display}: {exc}", err=True)
-                echo_credential_debug_if_auth_failure(cfg, exc, label="kb download")
-                counts["failed"] += 1
-                continue
-
-            typer.echo(f"downloaded: {display}")
-            counts["downloaded"] += 1
-
-        if recursive:
-            for folder_info in _list_child_folders(cfg, current_scope_id):
-                child_scope_id = folder_info["id"]
-                child_name = folder_info["name"]
-                queue.append(
-                    (child_scope_id, join_path_segments(rel_subdir, child_name))
-                )
+                downloads[future] = (display, local_path)
 
-    if counts["downloaded"] == 0 and counts["failed"] == 0:
+            for future in [f for f in downloads if f.done()]:
+                report(future)
+
+        for future in as_completed(list(downloads)):
+            report(future)
+
+    if not any(counts.values()):
         typer.echo("No files to download.")
         return
 
-    typer.echo(f"Done: {counts['downloaded']} downloaded, {counts['failed']} failed.")
+    skipped = f"{counts['skipped']} skipped, " if resume else ""
+    typer.echo(
+        f"Done: {counts['downloaded']} downloaded, {skipped}{counts['failed']} failed."
+    )
+    if not dry_run and counts["downloaded"]:
+        elapsed = max(time.monotonic() - started, 1e-6)
+        megabytes = downloaded_bytes / 1_000_000
+        typer.echo(
+            f"Throughput: {counts['downloaded'] / elapsed:.1f} files/s, "
+            f"{megabytes / elapsed:.2f} MB/s ({megabytes:.2f} MB in {elapsed:.1f}s)."
+        )
     if counts["failed"]:
         sys.exit(1)
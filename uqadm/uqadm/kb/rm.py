@@ -3,13 +3,14 @@
 from __future__ import annotations
 
 import sys
-from collections import deque
 
 import typer
 from unique_sdk import Content, Folder
 from unique_sdk.cli.config import Config
 
 from uqadm.core.auth_debug import echo_credential_debug_if_auth_failure
+from uqadm.kb._paths import join_path_segments
+from uqadm.kb._tree import walk_subtree
 
 _PAGE_SIZE = 100
 
@@ -57,22 +58,26 @@ def _list_child_folders(cfg: Config, scope_id: str) -> list[Folder.FolderInfo]:
 def _collect_subtree(cfg: Config, scope_id: str) -> tuple[list[str], list[str]]:
     """Return ``(file_paths, folder_paths)`` for the whole subtree under a scope.
 
-    Both lists hold display paths relative to the root scope (the root folder
-    itself is excluded). Used to render an accurate ``--recursive`` delete plan,
-    since ``Folder.delete(recursive=True)`` removes the entire subtree, not just
-    the top level.
+    Both sorted lists hold display paths relative to the root scope (the root
+    folder itself is excluded). Used to render an accurate ``--recursive`` delete
+    plan, since ``Folder.delete(recursive=True)`` removes the entire subtree, not
+    just the top level.
     """
     files: list[str] = []
     folders: list[str] = []
-    queue: deque[tuple[str, str]] = deque([(scope_id, "")])
-    while queue:
-        current_scope_id, rel = queue.popleft()
-        for info in _list_content_infos(cfg, current_scope_id):
-            files.append(f"{rel}/{info['key']}" if rel else info["key"])
-        for folder_info in _list_child_folders(cfg, current_scope_id):
-            child_rel = f"{rel}/{folder_info['name']}" if rel else folder_info["name"]
-            folders.append(child_rel)
-            queue.append((folder_info["id"], child_rel))
+    for listing in walk_subtree(
+        scope_id,
+        list_contents=lambda scope: _list_content_infos(cfg, scope),
+        list_folders=lambda scope: _list_child_folders(cfg, scope),
+    ):
+        rel = listing.rel_path
+        for info in listing.contents:
+            files.append(join_path_segments(rel, info["key"]))
+        for folder_info in listing.folders:
+            folders.append(join_path_segments(rel, folder_info["name"]))
+    # Sibling scopes are listed concurrently; sort for a stable plan.
+    files.sort()
+    folders.sort()
     return files, folders
 
 
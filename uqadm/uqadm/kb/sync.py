@@ -5,7 +5,10 @@ from __future__ import annotations
 import glob
 import mimetypes
 import sys
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
 from pathlib import Path
+from typing import Any
 
 import typer
 from unique_sdk import Content, Folder, InvalidRequestError
@@ -14,6 +17,8 @@ from unique_sdk.utils.file_io import upload_file
 
 from uqadm.core.auth_debug import echo_credential_debug_if_auth_failure
 from uqadm.kb._paths import join_path_segments
+from uqadm.kb._sync_manifest import MANIFEST_FILENAME, ManifestEntry, SyncManifest
+from uqadm.kb._tree import DEFAULT_WORKERS
 
 _PAGE_SIZE = 100
 
@@ -37,7 +42,10 @@ def _collect_files(folder: Path, recursive: bool) -> list[Path]:
         walker = (Path(p) for p in glob.glob(f"{folder}/**", recursive=True))
     else:
         walker = folder.iterdir()
-    return sorted(p for p in walker if p.is_file())
+    # Skip the sync manifest and the ``.tmp`` of an interrupted save, by name so
+    # that a subfolder's own manifest is skipped too.
+    manifest_names = {MANIFEST_FILENAME, f"{MANIFEST_FILENAME}.tmp"}
+    return sorted(p for p in walker if p.is_file() and p.name not in manifest_names)
 
 
 def _resolve_scope(cfg: Config, folder_path: str, *, create: bool) -> str | None:
@@ -62,9 +70,55 @@ def _resolve_scope(cfg: Config, folder_path: str, *, create: bool) -> str | None
         return None
 
 
-def _remote_keys(cfg: Config, scope_id: str) -> set[str]:
-    """Return the content keys already present in a folder scope."""
-    keys: set[str] = set()
+def _resolve_scopes(
+    cfg: Config,
+    base_path: str,
+    rel_parents: list[str],
+    *,
+    create: bool,
+    pool: ThreadPoolExecutor,
+) -> dict[str, str | None | Exception]:
+    """Resolve the target folder of every relative parent concurrently.
+
+    Folders of the same depth are resolved in parallel. When creating, the base
+    folder and every intermediate folder are resolved one level before their
+    children, so two siblings never race to create the same missing parent.
+    Each result is the scope id, ``None`` (dry run, folder missing) or the
+    exception the resolution raised.
+    """
+    wanted = set(rel_parents)
+    if create:
+        wanted.add("")
+        for rel in rel_parents:
+            parts = rel.split("/") if rel else []
+            wanted.update("/".join(parts[:i]) for i in range(1, len(parts)))
+
+    by_depth: dict[int, list[str]] = {}
+    for rel in wanted:
+        by_depth.setdefault(rel.count("/") + 1 if rel else 0, []).append(rel)
+
+    results: dict[str, str | None | Exception] = {}
+    for depth in sorted(by_depth):
+        futures = {
+            rel: pool.submit(
+                _resolve_scope,
+                cfg,
+                join_path_segments(base_path, rel),
+                create=create,
+            )
+            for rel in sorted(by_depth[depth])
+        }
+        for rel, future in futures.items():
+            try:
+                results[rel] = future.result()
+            except Exception as exc:
+                results[rel] = exc
+    return results
+
+
+def _remote_contents(cfg: Config, scope_id: str) -> dict[str, dict[str, Any]]:
+    """Return the content infos already present in a folder scope, by key."""
+    contents: dict[str, dict[str, Any]] = {}
     skip = 0
     while True:
         page = Content.get_infos(
@@ -75,11 +129,69 @@ def _remote_keys(cfg: Config, scope_id: str) -> set[str]:
             take=_PAGE_SIZE,
         )
         infos = page.get("contentInfos") or []
-        keys.update(info["key"] for info in infos)
+        contents.update((info["key"], info) for info in infos)
         skip += len(infos)
         if not infos or skip >= page.get("totalCount", 0):
             break
-    return keys
+    return contents
+
+
+@dataclass(frozen=True)
+class _PlannedUpload:
+    path: Path
+    display: str
+    mime: str
+    scope_id: str | None
+    remote_path: str
+    action: str
+
+
+def _plan_action(
+    manifest: SyncManifest,
+    *,
+    path: Path,
+    remote_path: str,
+    remote_info: dict[str, Any] | None,
+    force: bool,
+) -> str:
+    """Decide whether a file is ``new``, ``replaced`` or ``unchanged``.
+
+    A file is unchanged when the manifest recorded its current content hash at
+    the last upload and the remote content still has the uploaded byte size.
+    """
+    if remote_info is None:
+        return "new"
+    recorded = manifest.get(remote_path)
+    if force or recorded is None or remote_info.get("byteSize") != recorded.size:
+        return "replaced"
+    local = manifest.local_entry(remote_path, path)
+    if local.sha256 != recorded.sha256:
+        return "replaced"
+    if local != recorded:
+        # Same content with a new mtime: remember it to skip hashing next time.
+        manifest.set(remote_path, local)
+    return "unchanged"
+
+
+def _upload(
+    cfg: Config,
+    manifest: SyncManifest,
+    planned: _PlannedUpload,
+    *,
+    versioning: bool,
+) -> ManifestEntry:
+    # Describe the file before uploading it, so a concurrent edit is re-synced.
+    entry = manifest.local_entry(planned.remote_path, planned.path)
+    upload_file(
+        cfg.user_id,
+        cfg.company_id,
+        str(planned.path),
+        planned.path.name,
+        planned.mime,
+        scope_or_unique_path=planned.scope_id,
+        versioning_enabled=versioning,
+    )
+    return entry
 
 
 def cmd_sync(
@@ -91,6 +203,8 @@ def cmd_sync(
     recursive: bool,
     dry_run: bool,
     versioning: bool = True,
+    force: bool = False,
+    workers: int = DEFAULT_WORKERS,
 ) -> None:
     if bool(folder_path) == bool(scope_id):
         typer.echo("Specify exactly one of --folder-path or --scope-id.", err=True)
@@ -130,55 +244,96 @@ def cmd_sync(
         rel_parent = path.parent.relative_to(local_dir).as_posix()
         groups.setdefault("" if rel_parent == "." else rel_parent, []).append(path)
 
-    counts = {"new": 0, "replaced": 0, "failed": 0}
-    for rel_parent, paths in sorted(groups.items()):
-        target_path = join_path_segments(base_path, rel_parent)
-        try:
-            target_scope = _resolve_scope(cfg, target_path, create=not dry_run)
-        except Exception as exc:
-            typer.echo(f"failed to resolve folder {target_path!r}: {exc}", err=True)
-            echo_credential_debug_if_auth_failure(cfg, exc, label="kb sync")
-            counts["failed"] += len(paths)
-            continue
+    manifest = SyncManifest.load(local_dir, f"{cfg.api_base} {cfg.company_id}")
+    counts = {"new": 0, "replaced": 0, "unchanged": 0, "failed": 0}
+    version_label = "(versioned)" if versioning else "(no-version)"
+    planned: list[_PlannedUpload] = []
 
-        existing = _remote_keys(cfg, target_scope) if target_scope else set()
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        scopes = _resolve_scopes(
+            cfg, base_path, sorted(groups), create=not dry_run, pool=pool
+        )
+        listings: dict[str, Future[dict[str, dict[str, Any]]]] = {
+            rel: pool.submit(_remote_contents, cfg, scope)
+            for rel, scope in scopes.items()
+            if rel in groups and isinstance(scope, str)
+        }
 
-        for path in paths:
-            display = path.relative_to(local_dir).as_posix()
-            mime, _ = mimetypes.guess_type(path.name)
-            if mime is None:
+        for rel_parent, paths in sorted(groups.items()):
+            target_path = join_path_segments(base_path, rel_parent)
+            target_scope = scopes[rel_parent]
+            if isinstance(target_scope, Exception):
                 typer.echo(
-                    f"failed: {display}: could not determine MIME type", err=True
+                    f"failed to resolve folder {target_path!r}: {target_scope}",
+                    err=True,
                 )
-                counts["failed"] += 1
-                continue
-            action = "replaced" if path.name in existing else "new"
-            version_label = "(versioned)" if versioning else "(no-version)"
-            if dry_run:
-                typer.echo(f"[dry-run] {action}: {display} {version_label}")
-                counts[action] += 1
-                continue
-            try:
-                upload_file(
-                    cfg.user_id,
-                    cfg.company_id,
-                    str(path),
-                    path.name,
-                    mime,
-                    scope_or_unique_path=target_scope,
-                    versioning_enabled=versioning,
+                echo_credential_debug_if_auth_failure(
+                    cfg, target_scope, label="kb sync"
                 )
-            except Exception as exc:
-                typer.echo(f"failed: {display}: {exc}", err=True)
-                echo_credential_debug_if_auth_failure(cfg, exc, label="kb sync")
-                counts["failed"] += 1
+                counts["failed"] += len(paths)
                 continue
-            typer.echo(f"{action}: {display} {version_label}")
-            counts[action] += 1
+
+            existing = listings[rel_parent].result() if target_scope else {}
+
+            for path in paths:
+                display = path.relative_to(local_dir).as_posix()
+                mime, _ = mimetypes.guess_type(path.name)
+                if mime is None:
+                    typer.echo(
+                        f"failed: {display}: could not determine MIME type", err=True
+                    )
+                    counts["failed"] += 1
+                    continue
+                remote_path = join_path_segments(target_path, path.name)
+                action = _plan_action(
+                    manifest,
+                    path=path,
+                    remote_path=remote_path,
+                    remote_info=existing.get(path.name),
+                    force=force,
+                )
+                if action == "unchanged":
+                    counts[action] += 1
+                    continue
+                if dry_run:
+                    typer.echo(f"[dry-run] {action}: {display} {version_label}")
+                    counts[action] += 1
+                    continue
+                planned.append(
+                    _PlannedUpload(
+                        path=path,
+                        display=display,
+                        mime=mime,
+                        scope_id=target_scope,
+                        remote_path=remote_path,
+                        action=action,
+                    )
+                )
+
+        uploads = {
+            pool.submit(_upload, cfg, manifest, item, versioning=versioning): item
+            for item in planned
+        }
+        try:
+            for future in as_completed(uploads):
+                item = uploads[future]
+                try:
+                    entry = future.result()
+                except Exception as exc:
+                    typer.echo(f"failed: {item.display}: {exc}", err=True)
+                    echo_credential_debug_if_auth_failure(cfg, exc, label="kb sync")
+                    counts["failed"] += 1
+                    continue
+                manifest.set(item.remote_path, entry)
+                typer.echo(f"{item.action}: {item.display} {version_label}")
+                counts[item.action] += 1
+        finally:
+            if not dry_run:
+                manifest.save()
 
     typer.echo(
         f"Done: {counts['new']} new, {counts['replaced']} replaced, "
-        f"{counts['failed']} failed."
+        f"{counts['unchanged']} unchanged, {counts['failed']} failed."
     )
     if counts["failed"]:
         sys.exit(1)